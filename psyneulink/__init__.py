@@ -36,8 +36,12 @@ from . import core  # noqa: E402
 from . import library  # noqa: E402
 
 from . import _version # noqa: E402
-from .core import *  # noqa: E402
-from .library import *  # noqa: E402
+from ._lazy import import_eager_attributes, lazy_getattr  # noqa: E402
+
+# the subsystems that depend on heavy optional packages (e.g. torch) are
+# only imported when they are first used; see _lazy.py
+_lazy_attributes = import_eager_attributes(globals(), core)
+_lazy_attributes.update(import_eager_attributes(globals(), library))
 
 
 _pnl_global_names = [
@@ -50,6 +54,13 @@ __all__ = list(_pnl_global_names)
 __all__.extend(core.__all__)
 __all__.extend(library.__all__)
 
+__getattr__ = lazy_getattr(__name__, _lazy_attributes)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attributes))
+
+
 # set __version__ based on versioneer
 __version__ = _version.get_versions()['version']
 
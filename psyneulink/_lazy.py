@@ -0,0 +1,89 @@
+"""
+Helpers that defer importing heavy optional dependencies (e.g. torch) and the parts of psyneulink that use them until
+they are first used, so that ``import psyneulink`` does not pay for them.
+"""
+
+import importlib
+import importlib.util
+import sys
+
+__all__ = ['LazyModule', 'import_eager_attributes', 'lazy_getattr']
+
+
+class LazyModule:
+    """
+    Stand-in for the module **name** that imports it on first attribute access.  Evaluates to False if the module is
+    not installed, so that it can replace the ``try: import x / except ImportError: x = None`` pattern.
+    """
+    def __init__(self, name):
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+        self.__dict__['_available'] = None
+
+    def _load(self):
+        module = self._module
+        if module is None:
+            module = importlib.import_module(self._name)
+            self.__dict__['_module'] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __bool__(self):
+        if self._available is None:
+            if self._name in sys.modules:
+                available = sys.modules[self._name] is not None
+            else:
+                try:
+                    available = importlib.util.find_spec(self._name) is not None
+                except (ImportError, ValueError):
+                    available = False
+            self.__dict__['_available'] = available
+        return self._available
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        return '<lazy module {!r}>'.format(self._name)
+
+
+def lazy_getattr(module_name, lazy_attributes):
+    """
+    Return a module-level ``__getattr__`` (PEP 562) for the module **module_name**, that imports each attribute in
+    **lazy_attributes** (a dict mapping attribute names to the fully qualified names of the modules that define them)
+    on first access and caches it in the module.  Attributes mapped to a module name ending with the attribute name
+    itself are the submodules.
+    """
+    def __getattr__(name):
+        try:
+            source = lazy_attributes[name]
+        except KeyError:
+            raise AttributeError('module {!r} has no attribute {!r}'.format(module_name, name)) from None
+
+        source_module = importlib.import_module(source)
+        if source.rpartition('.')[2] == name:
+            value = source_module
+        else:
+            value = getattr(source_module, name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
+
+
+def import_eager_attributes(namespace, package):
+    """
+    Equivalent of ``from package import *`` into **namespace** that skips the lazy attributes of **package** (those in
+    its ``_lazy_attributes``), so that they are not imported until they are used.  Returns the skipped attributes,
+    in the format used by `lazy_getattr`.
+    """
+    package_lazy_attributes = getattr(package, '_lazy_attributes', {})
+    lazy_attributes = {}
+    for name in package.__all__:
+        if name in package_lazy_attributes:
+            lazy_attributes[name] = package_lazy_attributes[name]
+        else:
+            namespace[name] = getattr(package, name)
+    return lazy_attributes
@@ -1,3 +1,5 @@
+from psyneulink._lazy import import_eager_attributes, lazy_getattr
+
 from . import components
 from . import compositions
 from . import globals
@@ -5,12 +7,13 @@ from . import llvm
 from . import scheduling
 from . import rpc
 
-from .components import *
-from .compositions import *
-from .globals import *
-from .llvm import *
-from .scheduling import *
-from .rpc import *
+# vars() because the globals subpackage shadows the builtin globals()
+_lazy_attributes = import_eager_attributes(vars(), components)
+_lazy_attributes.update(import_eager_attributes(vars(), compositions))
+from .globals import *  # noqa: E402
+from .llvm import *  # noqa: E402
+from .scheduling import *  # noqa: E402
+from .rpc import *  # noqa: E402
 
 __all__ = list(components.__all__)
 __all__.extend(llvm.__all__)
@@ -18,3 +21,5 @@ __all__.extend(compositions.__all__)
 __all__.extend(globals.__all__)
 __all__.extend(scheduling.__all__)
 __all__.extend(rpc.__all__)
+
+__getattr__ = lazy_getattr(__name__, _lazy_attributes)
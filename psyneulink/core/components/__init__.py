@@ -23,6 +23,7 @@ https://princetonuniversity.github.io/PsyNeuLink/Component.html
 
 import inspect
 
+from psyneulink._lazy import import_eager_attributes, lazy_getattr
 from psyneulink.core.globals.keywords import PROJECTION_SENDER, PROJECTION_TYPE
 from psyneulink.core.globals.registry import register_category
 
@@ -34,14 +35,14 @@ from . import shellclasses
 from . import ports
 
 from .component import *
-from .functions import *
-from .mechanisms import *
-from .projections import *
-from .shellclasses import *
-from .ports import *
+_lazy_attributes = import_eager_attributes(globals(), functions)
+from .mechanisms import *  # noqa: E402
+from .projections import *  # noqa: E402
+from .shellclasses import *  # noqa: E402
+from .ports import *  # noqa: E402
 
-from psyneulink.library.components.mechanisms.processing.integrator.ddm import DDM
-from psyneulink.core.globals.preferences.basepreferenceset import BasePreferenceSet, ComponentDefaultPrefDicts, PreferenceLevel
+from psyneulink.library.components.mechanisms.processing.integrator.ddm import DDM  # noqa: E402
+from psyneulink.core.globals.preferences.basepreferenceset import BasePreferenceSet, ComponentDefaultPrefDicts, PreferenceLevel  # noqa: E402
 
 __all__ = [
     'InitError'
@@ -53,6 +54,8 @@ __all__.extend(projections.__all__)
 __all__.extend(shellclasses.__all__)
 __all__.extend(ports.__all__)
 
+__getattr__ = lazy_getattr(__name__, _lazy_attributes)
+
 
 class InitError(Exception):
     def __init__(self, error_value):
@@ -522,17 +522,18 @@ from psyneulink.core.globals.context import \
 from psyneulink.core.globals.mdf import MDFSerializable
 from psyneulink.core.globals.keywords import \
     CONTEXT, CONTROL_PROJECTION, DEFERRED_INITIALIZATION, EXECUTE_UNTIL_FINISHED, \
-    FUNCTION, FUNCTION_PARAMS, INIT_FULL_EXECUTE_METHOD, INPUT_PORTS, \
+    FUNCTION, FUNCTION_COMPONENT_CATEGORY, FUNCTION_PARAMS, INIT_FULL_EXECUTE_METHOD, INPUT_PORTS, \
     LEARNING, LEARNING_PROJECTION, MATRIX, MAX_EXECUTIONS_BEFORE_FINISHED, \
     MODEL_SPEC_ID_PSYNEULINK, MODEL_SPEC_ID_METADATA, \
     MODEL_SPEC_ID_INPUT_PORTS, MODEL_SPEC_ID_OUTPUT_PORTS, \
     MODEL_SPEC_ID_MDF_VARIABLE, \
     MODULATORY_SPEC_KEYWORDS, NAME, OUTPUT_PORTS, OWNER, PARAMS, PREFS_ARG, \
-    RESET_STATEFUL_FUNCTION_WHEN, SIZE, VALUE, VARIABLE, SHARED_COMPONENT_TYPES
+    RESET_STATEFUL_FUNCTION_WHEN, SINGLE, SIZE, VALUE, VARIABLE, SHARED_COMPONENT_TYPES
 from psyneulink.core.globals.log import LogCondition
 from psyneulink.core.globals.parameters import \
     Defaults, SharedParameter, Parameter, ParameterAlias, ParameterError, ParametersBase, check_user_specified, copy_parameter_value, is_array_like
 from psyneulink.core.globals.preferences.basepreferenceset import BasePreferenceSet, VERBOSE_PREF
+from psyneulink.core.globals.profiling import profiled
 from psyneulink.core.globals.preferences.preferenceset import \
     PreferenceLevel, PreferenceSet, _assign_prefs
 from psyneulink.core.globals.registry import register_category, _get_auto_name_prefix
@@ -1331,7 +1332,8 @@ class Component(MDFSerializable, metaclass=ComponentsMeta):
     def _get_compilation_state(self):
         # FIXME: MAGIC LIST, Use stateful tag for this
         whitelist = {"previous_time", "previous_value", "previous_v",
-                     "previous_w", "random_state",
+                     "previous_w", "previous_short_term_avg",
+                     "previous_long_term_avg", "random_state",
                      "input_ports", "output_ports",
                      "adjustment_cost", "intensity_cost", "duration_cost",
                      "intensity"}
@@ -1378,9 +1380,15 @@ class Component(MDFSerializable, metaclass=ComponentsMeta):
                 blacklist.add('duration_cost_fct')
 
         # Drop previous_value from MemoryFunctions
-        if hasattr(self.parameters, 'duplicate_keys'):
+        # (DictionaryMemory, ContentAddressableMemory and Buffer store it in a compiled ring buffer)
+        if (hasattr(self.parameters, 'duplicate_keys') or hasattr(self.parameters, 'duplicate_entries_allowed')
+                or hasattr(self.parameters, 'history')):
             blacklist.add("previous_value")
 
+        # ContentAddressableMemory selects single entries directly from the distances
+        if getattr(self, 'selection_type', None) == SINGLE:
+            blacklist.add('selection_function')
+
         # Matrices of learnable projections are stateful
         if getattr(self, 'owner', None) and getattr(self.owner, 'learnable', False):
             whitelist.add('matrix')
@@ -1446,7 +1454,8 @@ class Component(MDFSerializable, metaclass=ComponentsMeta):
         # FIXME: MAGIC LIST, detect used parameters automatically
         blacklist = {# Stateful parameters
                      "previous_time", "previous_value", "previous_v",
-                     "previous_w", "random_state", "is_finished_flag",
+                     "previous_w", "previous_short_term_avg",
+                     "previous_long_term_avg", "random_state", "is_finished_flag",
                      "num_executions_before_finished", "num_executions",
                      "variable", "value", "saved_values", "saved_samples",
                      "integrator_function_value", "termination_measure_value",
@@ -1485,6 +1494,11 @@ class Component(MDFSerializable, metaclass=ComponentsMeta):
                      "search_termination_function", "state_feature_function",
                      "search_function", "weight", "exponent", "gating_signal_params",
                      "retain_old_simulation_data",
+                     # GridSearch evaluation in Python
+                     "num_processes", "vectorized",
+                     # memory indices only narrow the search in Python;
+                     # compiled memory functions compare all entries
+                     "memory_index",
                      # not used in compiled learning
                      "learning_results", "learning_signal", "learning_signals",
                      "error_matrix", "error_signal", "activation_input",
@@ -2604,7 +2618,14 @@ class Component(MDFSerializable, metaclass=ComponentsMeta):
                     skip_log=True,
                 )
 
-    def _initialize_from_context(self, context, base_context=Context(execution_id=None), override=True, visited=None):
+    def _initialize_from_context(
+        self,
+        context,
+        base_context=Context(execution_id=None),
+        override=True,
+        visited=None,
+        copy_on_write=False,
+    ):
         if context.execution_id is base_context.execution_id:
             return
 
@@ -2614,12 +2635,14 @@ class Component(MDFSerializable, metaclass=ComponentsMeta):
         for comp in self._dependent_components:
             if comp not in visited:
                 visited.add(comp)
-                comp._initialize_from_context(context, base_context, override, visited=visited)
+                comp._initialize_from_context(
+                    context, base_context, override, visited=visited, copy_on_write=copy_on_write
+                )
 
         non_alias_params = [p for p in self.stateful_parameters if not isinstance(p, (ParameterAlias, SharedParameter))]
         for param in non_alias_params:
             if param.setter is None:
-                param._initialize_from_context(context, base_context, override)
+                param._initialize_from_context(context, base_context, override, copy_on_write=copy_on_write)
 
         # attempt to initialize any params with setters (some params with setters may depend on the
         # initialization of other params)
@@ -2628,7 +2651,7 @@ class Component(MDFSerializable, metaclass=ComponentsMeta):
         # initialization value
         for param in non_alias_params:
             if param.setter is not None:
-                param._initialize_from_context(context, base_context, override)
+                param._initialize_from_context(context, base_context, override, copy_on_write=copy_on_write)
 
     def _delete_contexts(self, *contexts, check_simulation_storage=False, visited=None):
         if visited is None:
@@ -3361,6 +3384,8 @@ class Component(MDFSerializable, metaclass=ComponentsMeta):
             raise ComponentError(f"Resetting {self.name} is not allowed because this Component is not stateful. "
                                  "(It does not have an accumulator to reset).")
 
+    # Functions are recorded by Function_Base.function
+    @profiled(exclude_categories={FUNCTION_COMPONENT_CATEGORY})
     @handle_external_context()
     def execute(self, variable=None, context=None, runtime_params=None):
         """Executes Component's `function <Component_Function>`.  See Component-specific execute method for details.
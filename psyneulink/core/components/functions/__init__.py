@@ -1,6 +1,8 @@
+from psyneulink._lazy import lazy_getattr
+
 from . import function
 from .nonstateful import selectionfunctions, objectivefunctions, optimizationfunctions, combinationfunctions, \
-    learningfunctions, transferfunctions, distributionfunctions, fitfunctions
+    learningfunctions, transferfunctions, distributionfunctions
 from . import stateful
 from .stateful import integratorfunctions, memoryfunctions
 from . import userdefinedfunction
@@ -12,7 +14,6 @@ from psyneulink.core.components.functions.nonstateful.selectionfunctions import
 from psyneulink.core.components.functions.nonstateful.distributionfunctions import *
 from psyneulink.core.components.functions.nonstateful.objectivefunctions import *
 from psyneulink.core.components.functions.nonstateful.optimizationfunctions import *
-from psyneulink.core.components.functions.nonstateful.fitfunctions import *
 from psyneulink.core.components.functions.nonstateful.learningfunctions import *
 from .stateful import *
 from psyneulink.core.components.functions.stateful.integratorfunctions import *
@@ -28,7 +29,17 @@ __all__.extend(stateful.__all__)
 __all__.extend(distributionfunctions.__all__)
 __all__.extend(objectivefunctions.__all__)
 __all__.extend(optimizationfunctions.__all__)
-__all__.extend(fitfunctions.__all__)
 __all__.extend(learningfunctions.__all__)
 __all__.extend(integratorfunctions.__all__)
 __all__.extend(memoryfunctions.__all__)
+
+# fitfunctions (and with it, optuna and fastkde) is only imported when it is first used
+_lazy_attributes = {
+    'fitfunctions': 'psyneulink.core.components.functions.nonstateful.fitfunctions',
+    'PECOptimizationFunction': 'psyneulink.core.components.functions.nonstateful.fitfunctions',
+    'BadLikelihoodWarning': 'psyneulink.core.components.functions.nonstateful.fitfunctions',
+    'PECObjectiveFuncWarning': 'psyneulink.core.components.functions.nonstateful.fitfunctions',
+}
+__all__.extend(['PECOptimizationFunction', 'BadLikelihoodWarning', 'PECObjectiveFuncWarning'])
+
+__getattr__ = lazy_getattr(__name__, _lazy_attributes)
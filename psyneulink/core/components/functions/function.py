@@ -148,12 +148,9 @@ import warnings
 from enum import Enum, IntEnum
 
 import numpy as np
-try:
-    import torch
-except ImportError:
-    torch = None
 from beartype import beartype
 
+from psyneulink._lazy import LazyModule
 from psyneulink._typing import Optional, Union, Callable
 
 from psyneulink.core.components.component import Component, ComponentError, DefaultsFlexibility
@@ -169,6 +166,7 @@ from psyneulink.core.globals.mdf import _get_variable_parameter_name
 from psyneulink.core.globals.parameters import Parameter, check_user_specified, copy_parameter_value
 from psyneulink.core.globals.preferences.basepreferenceset import REPORT_OUTPUT_PREF, ValidPrefSet
 from psyneulink.core.globals.preferences.preferenceset import PreferenceEntry, PreferenceLevel
+from psyneulink.core.globals.profiling import profiled
 from psyneulink.core.globals.registry import register_category
 from psyneulink.core.globals.utilities import (
     convert_all_elements_to_np_array, convert_to_np_array, get_global_seed, is_instance_or_subclass, object_has_single_value, parameter_spec, parse_valid_identifier, safe_len,
@@ -176,6 +174,8 @@ from psyneulink.core.globals.utilities import (
     random_matrix, array_from_matrix_string
 )
 
+torch = LazyModule('torch')
+
 __all__ = [
     'ArgumentTherapy', 'EPSILON', 'Function_Base', 'function_keywords', 'FunctionError', 'FunctionOutputType',
     'FunctionRegistry', 'get_param_value_for_function', 'get_param_value_for_keyword', 'is_Function',
@@ -698,6 +698,7 @@ class Function_Base(Function):
 
         return new
 
+    @profiled()
     @handle_external_context()
     def function(self,
                  variable=None,
@@ -22,6 +22,9 @@ Overview
 
 Functions that return one or more samples from a distribution.
 
+The module also provides `drift_diffusion_analytical_solution` and `drift_diffusion_rt_density`, that evaluate the
+solution of `DriftDiffusionAnalytical` for arrays of parameters using array operations.
+
 """
 
 import numpy as np
@@ -48,6 +51,7 @@ __all__ = [
     'DistributionFunction', 'DRIFT_RATE', 'DRIFT_RATE_VARIABILITY', 'DriftDiffusionAnalytical', 'ExponentialDist',
     'GammaDist', 'NON_DECISION_TIME', 'NormalDist', 'STARTING_VALUE', 'STARTING_VALUE_VARIABILITY',
     'THRESHOLD_VARIABILITY', 'UniformDist', 'UniformToNormalDist', 'WaldDist',
+    'drift_diffusion_analytical_solution', 'drift_diffusion_rt_density',
 ]
 
 
@@ -960,6 +964,9 @@ class DriftDiffusionAnalytical(DistributionFunction):  # -----------------------
 
     Return terminal value of decision variable, mean accuracy, and mean response time computed analytically for the
     drift diffusion process as described in `Bogacz et al (2006) <https://www.ncbi.nlm.nih.gov/pubmed/17014301>`_.
+    The same solution can be computed for arrays of parameters in a single call using
+    `drift_diffusion_analytical_solution`, and the full densities of response times using
+    `drift_diffusion_rt_density` (e.g., for parameter sweeps or fits that do not require executing a `Composition`).
 
     *Modulatory Parameters:*
 
@@ -1352,21 +1359,28 @@ class DriftDiffusionAnalytical(DistributionFunction):  # -----------------------
          skew_rt_minus: The skew of RT of negative responses.
         """
 
+        # Written with array operations, so that it also evaluates arrays of parameters elementwise
+        # (see drift_diffusion_analytical_solution);  scalars are evaluated as 1d arrays, since numpy
+        # computes some operations (e.g., power) on scalars and on arrays differently, and the
+        # expressions below amplify these differences for small values of drift_rate
+        shape = np.broadcast(drift_rate, noise, threshold, starting_value, non_decision_time).shape
+        drift_rate, noise, threshold, starting_value, non_decision_time = (
+            np.atleast_1d(p) for p in (drift_rate, noise, threshold, starting_value, non_decision_time)
+        )
+
         #  transform starting point to be centered at 0
         starting_value = (starting_value - 0.5) * 2.0 * threshold
 
-        if abs(drift_rate) < 0.01:
-            drift_rate = 0.01
+        drift_rate = np.where(np.abs(drift_rate) < 0.01, 0.01, drift_rate)
 
         X = drift_rate * starting_value / noise**2
         Z = drift_rate * threshold / noise**2
 
-        X = max(-100, min(100, X))
+        X = np.clip(X, -100, 100)
 
-        Z = max(-100, min(100, Z))
+        Z = np.clip(Z, -100, 100)
 
-        if abs(Z) < 0.0001:
-            Z = 0.0001
+        Z = np.where(np.abs(Z) < 0.0001, 0.0001, Z)
 
         def coth(x):
             return 1 / np.tanh(x)
@@ -1418,8 +1432,7 @@ class DriftDiffusionAnalytical(DistributionFunction):  # -----------------------
             moments['mean_rt_plus'] += non_decision_time
             moments['mean_rt_minus'] += non_decision_time
 
-
-        return moments
+        return {k: np.reshape(v, shape) for k, v in moments.items()}
 
     def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out, *, tags:frozenset):
 
@@ -1753,3 +1766,223 @@ class DriftDiffusionAnalytical(DistributionFunction):  # -----------------------
         dRR_dA = -Z / A ** 2 + (Z / A ** 2) * E - (2 * Z / c_sq) * E * D
 
         return [dRR_dZ, dRR_dA]
+
+
+# Magnitude of the exponent beyond which np.exp over- or underflows; the scalar computation in
+# DriftDiffusionAnalytical._function catches the resulting FloatingPointError to switch to the deterministic limit
+_EXP_LIMIT = -np.log(np.finfo(float).tiny)
+
+
+def _drift_diffusion_starting_point(drift_rate, threshold, starting_value, noise, shenhav_et_al_compat_mode):
+    """Return the bias and the starting point of the decision variable in the direction of the drift
+    (as computed by DriftDiffusionAnalytical._function) for arrays of parameters
+    """
+    bias = (starting_value + threshold) / (2 * threshold)
+
+    # Prevents div by 0 issue below:
+    bias = np.where(bias <= 0, 1e-8, np.where(bias >= 1, 1 - 1e-8, bias))
+
+    is_neg_drift = drift_rate < 0
+    bias_adj = np.where(is_neg_drift, 1 - bias, bias)
+    y0tilde = ((noise ** 2) / 2) * np.log(bias_adj / (1 - bias_adj))
+    if shenhav_et_al_compat_mode:
+        y0tilde_bound = np.where(y0tilde < 0, -threshold, threshold)
+    else:
+        y0tilde_bound = np.where(is_neg_drift, -threshold, threshold)
+    y0tilde = np.where(np.abs(y0tilde) > threshold, y0tilde_bound, y0tilde)
+
+    return bias, y0tilde
+
+
+def drift_diffusion_analytical_solution(drift_rate=1.0,
+                                        threshold=1.0,
+                                        starting_value=0.0,
+                                        non_decision_time=0.2,
+                                        noise=0.5,
+                                        shenhav_et_al_compat_mode=False):
+    """
+    drift_diffusion_analytical_solution(drift_rate=1.0, threshold=1.0, starting_value=0.0, non_decision_time=0.2, \
+    noise=0.5, shenhav_et_al_compat_mode=False)
+
+    Compute the solution of `DriftDiffusionAnalytical` for every combination of parameters in a single call.
+
+    The parameters can be scalars or arrays, that are `broadcast <https://numpy.org/doc/stable/user/basics.broadcasting.html>`_
+    against each other;  each element of the broadcast parameters is treated as the parameters of a separate drift
+    diffusion process (with **drift_rate** taking the place of the product of the `drift_rate
+    <DriftDiffusionAnalytical.drift_rate>` and the `variable <DriftDiffusionAnalytical.variable>` of
+    `DriftDiffusionAnalytical`), and evaluated using array operations, so that large grids of parameters (e.g.,
+    for a parameter sweep using `GridSearch` with `vectorized <GridSearch.vectorized>` set to True) can be evaluated
+    without executing the Function (or a `Composition`) for each set of parameters.  The values returned are the
+    same as those returned by `DriftDiffusionAnalytical` for each set of parameters.
+
+    Returns
+    -------
+
+    mean RT, mean ER, mean RT(+), variance RT(+), skew RT(+), mean RT(-), variance RT(-), skew RT(-) : ndarray
+        array with a first dimension of length 8, containing the outputs of `DriftDiffusionAnalytical` in the
+        same order, and remaining dimensions equal to the broadcast shape of the parameters.
+    """
+    drift_rate, threshold, starting_value, non_decision_time, noise = np.broadcast_arrays(
+        *(np.asarray(p, dtype=float) for p in (drift_rate, threshold, starting_value, non_decision_time, noise))
+    )
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore', under='ignore'):
+        bias, y0tilde = _drift_diffusion_starting_point(drift_rate, threshold, starting_value, noise,
+                                                        shenhav_et_al_compat_mode)
+
+        # drift_rate close to or at 0 (avoid float comparison);
+        # use expression for limit a->0 from Srivastava et al. 2016
+        is_zero_drift = np.abs(drift_rate) < 1e-8
+        bias_abs = bias * 2 * threshold - threshold
+        zero_drift_rt = non_decision_time + (threshold ** 2 - bias_abs ** 2) / (noise ** 2)
+        zero_drift_er = (threshold - bias_abs) / (2 * threshold)
+
+        drift_rate_normed = np.abs(drift_rate)
+        ztilde = threshold / drift_rate_normed
+        atilde = (drift_rate_normed / noise) ** 2
+
+        is_neg_drift = drift_rate < 0
+        x0tilde = y0tilde / drift_rate_normed
+
+        exp_neg2_x0tilde_atilde = np.exp(-2 * x0tilde * atilde)
+        exp_2_ztilde_atilde = np.exp(2 * ztilde * atilde)
+        exp_neg2_ztilde_atilde = np.exp(-2 * ztilde * atilde)
+
+        if shenhav_et_al_compat_mode:
+            exp_neg2_x0tilde_atilde = np.fmax(1e-12, exp_neg2_x0tilde_atilde)
+            exp_2_ztilde_atilde = np.fmin(1e12, exp_2_ztilde_atilde)
+            exp_neg2_ztilde_atilde = np.fmax(1e-12, exp_neg2_ztilde_atilde)
+
+        rt = ztilde * np.tanh(ztilde * atilde) + \
+             ((2 * ztilde * (1 - exp_neg2_x0tilde_atilde)) / (
+                     exp_2_ztilde_atilde - exp_neg2_ztilde_atilde) - x0tilde)
+        er = 1 / (1 + exp_2_ztilde_atilde) - \
+             ((1 - exp_neg2_x0tilde_atilde) / (exp_2_ztilde_atilde - exp_neg2_ztilde_atilde))
+
+        if shenhav_et_al_compat_mode:
+            rt = np.where(rt < 0, 0, rt)
+        else:
+            # Near-deterministic regime, in which DriftDiffusionAnalytical._function catches the over- or underflow
+            # of the exponentials above (see comment there)
+            is_deterministic = np.fmax(np.abs(2 * x0tilde * atilde), np.abs(2 * ztilde * atilde)) > _EXP_LIMIT
+            er = np.where(is_deterministic, 0, er)
+            rt = np.where(is_deterministic, ztilde / atilde - x0tilde, rt)
+
+        rt = rt + non_decision_time
+
+        # Report in terms of a fixed reference point (see DriftDiffusionAnalytical._function)
+        er = np.where(is_neg_drift, 1 - er, er)
+
+        rt = np.where(is_zero_drift, zero_drift_rt, rt)
+        er = np.where(is_zero_drift, zero_drift_er, er)
+
+        moments = DriftDiffusionAnalytical._compute_conditional_rt_moments(
+            drift_rate, noise, threshold, bias, non_decision_time
+        )
+
+    return np.stack(np.broadcast_arrays(
+        rt, er,
+        moments['mean_rt_plus'], moments['var_rt_plus'], moments['skew_rt_plus'],
+        moments['mean_rt_minus'], moments['var_rt_minus'], moments['skew_rt_minus']
+    ))
+
+
+def drift_diffusion_rt_density(t,
+                               drift_rate=1.0,
+                               threshold=1.0,
+                               starting_value=0.0,
+                               non_decision_time=0.2,
+                               noise=0.5,
+                               boundary='upper',
+                               error_tolerance=1e-10):
+    """
+    drift_diffusion_rt_density(t, drift_rate=1.0, threshold=1.0, starting_value=0.0, non_decision_time=0.2, \
+    noise=0.5, boundary='upper', error_tolerance=1e-10)
+
+    Compute the density of response times **t** at one of the boundaries of the drift diffusion process solved by
+    `DriftDiffusionAnalytical` (i.e., the joint density of responding at that boundary at time **t**).
+
+    The density of first passage times is computed using the large-time or small-time series of
+    `Navarro & Fuss (2009) <https://doi.org/10.1016/j.jmp.2009.02.003>`_, whichever requires fewer terms to
+    achieve **error_tolerance** (as described there).  **t** and the parameters can be scalars or arrays, that are
+    broadcast against each other (e.g., an array of times along one dimension and a grid of parameters along
+    others), and all elements are evaluated in a single call using array operations.  The process starts from the
+    same point as the one used by `DriftDiffusionAnalytical` to compute the mean RT and ER, so that the density
+    integrates to the probability of reaching the **boundary** (for the *lower* boundary this is the mean ER returned
+    by `DriftDiffusionAnalytical` and by `drift_diffusion_analytical_solution`), and the densities at both boundaries
+    together have the mean RT as their mean.
+
+    Arguments
+    ---------
+
+    t : float or array
+        response times (including `non_decision_time <DriftDiffusionAnalytical.non_decision_time>`) at which to
+        evaluate the density;  the density is 0 for times not greater than **non_decision_time**.
+
+    boundary : 'upper' or 'lower' : default 'upper'
+        the boundary for which the density is computed.
+
+    error_tolerance : float : default 1e-10
+        the maximum error of the series used to compute the density.
+
+    Returns
+    -------
+
+    density : ndarray
+        array with the broadcast shape of **t** and the parameters.
+    """
+    if boundary not in {'upper', 'lower'}:
+        raise ValueError(f"'boundary' argument of drift_diffusion_rt_density must be 'upper' or 'lower': {boundary}.")
+
+    t, drift_rate, threshold, starting_value, non_decision_time, noise = np.broadcast_arrays(
+        *(np.asarray(p, dtype=float) for p in (t, drift_rate, threshold, starting_value, non_decision_time, noise))
+    )
+
+    # Starting point of the decision variable used by DriftDiffusionAnalytical, relative to the midpoint
+    # between the boundaries;  the bias is used directly for drift_rate close to or at 0 (see _function there)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        bias, y0tilde = _drift_diffusion_starting_point(drift_rate, threshold, starting_value, noise, False)
+    y0 = np.where(drift_rate < 0, -y0tilde, y0tilde)
+    y0 = np.where(np.abs(drift_rate) < 1e-8, bias * 2 * threshold - threshold, y0)
+
+    # Standardize to a process with unit noise between boundaries at 0 and a;  the density at the upper
+    # boundary is the density at the lower boundary of the process reflected around its midpoint
+    a = 2 * threshold / noise
+    v = drift_rate / noise
+    w = (y0 + threshold) / (2 * threshold)
+    if boundary == 'upper':
+        v = -v
+        w = 1 - w
+
+    decision_time = t - non_decision_time
+    is_valid = decision_time > 0
+    u = np.where(is_valid, decision_time, 1) / a ** 2
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore', under='ignore'):
+        # Number of terms required by each series (Navarro & Fuss, 2009)
+        min_large_terms = 1 / (np.pi * np.sqrt(u))
+        large_arg = np.pi * u * error_tolerance
+        large_terms = np.where(large_arg < 1,
+                               np.fmax(np.sqrt(-2 * np.log(large_arg) / (np.pi ** 2 * u)), min_large_terms),
+                               min_large_terms)
+        small_arg = 2 * np.sqrt(2 * np.pi * u) * error_tolerance
+        small_terms = np.where(small_arg < 1,
+                               np.fmax(2 + np.sqrt(-2 * u * np.log(small_arg)), np.sqrt(u) + 1),
+                               2)
+        use_small_time = small_terms < large_terms
+
+        # Evaluate both series with enough terms for every element, and select the one that converges faster
+        required_terms = np.fmin(small_terms, large_terms)
+        num_terms = int(np.ceil(np.max(required_terms[np.isfinite(required_terms)], initial=1)))
+        k_shape = (-1,) + (1,) * u.ndim
+
+        k = np.arange(1, num_terms + 1).reshape(k_shape)
+        large_time = np.pi * np.sum(k * np.exp(-(k * np.pi) ** 2 * u / 2) * np.sin(k * np.pi * w), axis=0)
+
+        k = np.arange(-num_terms, num_terms + 1).reshape(k_shape)
+        small_time = np.sum((w + 2 * k) * np.exp(-(w + 2 * k) ** 2 / (2 * u)), axis=0) / np.sqrt(2 * np.pi * u ** 3)
+
+        density = np.where(use_small_time, small_time, large_time) * \
+                  np.exp(-v * a * w - v ** 2 * decision_time / 2) / a ** 2
+
+    return np.where(is_valid, density, 0.0)
@@ -1,4 +1,7 @@
+import concurrent.futures
 import copy
+import itertools
+import threading
 
 import optuna.samplers
 from fastkde import fastKDE
@@ -79,8 +82,67 @@ class BadLikelihoodWarning(PECObjectiveFuncWarning):
     pass
 
 
+def _fit_trial_kdes(sim_trial_data, cat_sim_trial_data, categories):
+    """
+    Compute the KDE of the simulation data of a single trial for each combination of categorical variables.
+
+    Parameters
+    ----------
+    sim_trial_data: The continuous dimensions of the simulation data for the trial.
+
+    cat_sim_trial_data: The categorical dimensions of the simulation data for the trial.
+
+    categories: The unique values of the categorical dimensions.
+
+    Returns
+    -------
+    A dict mapping each category to a tuple of the (scaled) pdf and the axes of its KDE, or (None, None) if the KDE
+    could not be computed, and a list of the data ranges of categories for which the KDE was skipped because the
+    range of simulation data was 0 for at least one dimension. Warnings for these are left to the caller, since this
+    may be executed in a worker process.
+    """
+    s = sim_trial_data
+
+    dens_u = {}
+    zero_ranges = []
+    for category in categories:
+        # Get the subset of simulations that correspond to this category
+        dsub = s[cat_sim_trial_data == category]
+
+        # If we didn't get enough simulation results for this category, don't do
+        # a KDE
+        if len(dsub) < 10:
+            dens_u[category] = (None, None)
+            continue
+
+        # If any dimension of the data has a 0 range (all are same value) then
+        # this will cause problems doing the KDE, skip.
+        data_range = (
+            np.max(dsub) - np.min(dsub)
+            if dsub.ndim == 1
+            else np.amax(dsub, 1) - np.amin(dsub, 1)
+        )
+        if np.any(data_range == 0):
+            dens_u[category] = (None, None)
+            zero_ranges.append(data_range)
+            continue
+
+        # Do KDE
+        fKDE = fastKDE.fastKDE(dsub, doSaveMarginals=False)
+        pdf = fKDE.pdf
+        axes = fKDE.axes
+
+        # Scale the pdf by the fraction of simulations that fall within this category
+        pdf = pdf * (len(dsub) / len(s))
+
+        # Save the KDE values and axes for this category
+        dens_u[category] = (pdf, axes)
+
+    return dens_u, zero_ranges
+
+
 def simulation_likelihood(
-    sim_data, exp_data=None, categorical_dims=None, combine_trials=False
+    sim_data, exp_data=None, categorical_dims=None, combine_trials=False, n_jobs=None
 ):
     """
     Compute the likelihood of a simulation dataset (or the parameters that generated it) conditional
@@ -125,7 +187,13 @@ def simulation_likelihood(
         the same length as last dimension of sim_data and exp_data.
 
     combine_trials: Combine data across all trials into a single likelihood estimate, this assumes
-        that the parameters of the simulations are identical across trials.
+        that the parameters of the simulations are identical across trials. The KDE for each category is
+        then computed once, and evaluated at the experimental data points of all trials in that category
+        in a single interpolation.
+
+    n_jobs: If greater than 1, the (independent) KDEs for each trial of simulation data are computed by
+        a pool of this many worker processes. This is only useful if trials are not combined, and there
+        are many trials.
 
     Returns
     -------
@@ -152,50 +220,27 @@ def simulation_likelihood(
     if len(categories) > 10:
         raise ValueError("Too many unique values present for a categorical dimension.")
 
+    # Compute a separate KDE for each trial and combination of categorical variables.
+    if n_jobs is not None and n_jobs > 1 and len(con_sim_data) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(n_jobs, len(con_sim_data))) as executor:
+            trial_kdes = list(executor.map(_fit_trial_kdes,
+                                           con_sim_data,
+                                           cat_sim_data,
+                                           itertools.repeat(categories),
+                                           chunksize=max(1, len(con_sim_data) // (4 * n_jobs))))
+    else:
+        trial_kdes = [_fit_trial_kdes(con_sim_data[trial], cat_sim_data[trial], categories)
+                      for trial in range(len(con_sim_data))]
+
     kdes = []
-    for trial in range(len(con_sim_data)):
-        s = con_sim_data[trial]
-
-        # Compute a separate KDE for each combination of categorical variables.
-        dens_u = {}
-        for category in categories:
-            # Get the subset of simulations that correspond to this category
-            dsub = s[cat_sim_data[trial] == category]
-
-            # If we didn't get enough simulation results for this category, don't do
-            # a KDE
-            if len(dsub) < 10:
-                dens_u[category] = (None, None)
-                continue
-
-            # If any dimension of the data has a 0 range (all are same value) then
-            # this will cause problems doing the KDE, skip.
-            data_range = (
-                np.max(dsub) - np.min(dsub)
-                if dsub.ndim == 1
-                else np.amax(dsub, 1) - np.amin(dsub, 1)
-            )
-            if np.any(data_range == 0):
-                dens_u[category] = (None, None)
-                warnings.warn(
-                    BadLikelihoodWarning(
-                        f"Could not perform kernel density estimate. Range of simulation data was 0 for at least "
-                        f"one dimension. Range={data_range}"
-                    )
+    for dens_u, zero_ranges in trial_kdes:
+        for data_range in zero_ranges:
+            warnings.warn(
+                BadLikelihoodWarning(
+                    f"Could not perform kernel density estimate. Range of simulation data was 0 for at least "
+                    f"one dimension. Range={data_range}"
                 )
-                continue
-
-            # Do KDE
-            fKDE = fastKDE.fastKDE(dsub, doSaveMarginals=False)
-            pdf = fKDE.pdf
-            axes = fKDE.axes
-
-            # Scale the pdf by the fraction of simulations that fall within this category
-            pdf = pdf * (len(dsub) / len(s))
-
-            # Save the KDE values and axes for this category
-            dens_u[category] = (pdf, axes)
-
+            )
         kdes.append(dens_u)
 
     # If we are passed experimental data, evaluate the KDE at the experimental data points
@@ -204,34 +249,40 @@ def simulation_likelihood(
         # of the probabilities at the end.
         ZERO_PROB = 1e-10
 
-        kdes_eval = np.zeros((len(exp_data),))
-        for trial in range(len(exp_data)):
-            # Extract the categorical values for this experimental trial
-            exp_trial_cat = exp_data[trial, categorical_dims]
+        kdes_eval = np.full((len(exp_data),), ZERO_PROB)
+
+        exp_con_data = exp_data[:, ~categorical_dims]
+
+        # Group the trials of experimental data by the values of their categorical variables, so that
+        # all of the trials that use the same KDE can be evaluated in a single interpolation.
+        exp_cats, exp_cat_indices = np.unique(exp_data[:, categorical_dims], axis=0, return_inverse=True)
+        exp_cat_indices = exp_cat_indices.reshape(-1)
+
+        for i, exp_trial_cat in enumerate(exp_cats):
+            trials = np.flatnonzero(exp_cat_indices == i)
 
             if len(exp_trial_cat) == 1:
                 exp_trial_cat = exp_trial_cat[0]
 
-            # Get the right KDE for this trial, if all simulation trials have been combined
+            # Get the right KDE for these trials, if all simulation trials have been combined
             # use that KDE for all trials of experimental data.
             if len(kdes) == 1:
-                kde, axes = kdes[0].get(exp_trial_cat, (None, None))
-            else:
-                kde, axes = kdes[trial].get(exp_trial_cat, (None, None))
-
-            # Linear interpolation using the grid we computed the KDE
-            # on.
-            if kde is not None:
-                kdes_eval[trial] = interpn(
-                    axes,
-                    kde,
-                    exp_data[trial, ~categorical_dims],
-                    method="linear",
-                    bounds_error=False,
-                    fill_value=ZERO_PROB,
-                )
+                groups = [(kdes[0].get(exp_trial_cat, (None, None)), trials)]
             else:
-                kdes_eval[trial] = ZERO_PROB
+                groups = [(kdes[trial].get(exp_trial_cat, (None, None)), trial) for trial in trials]
+
+            for (kde, axes), group in groups:
+                # Linear interpolation using the grid we computed the KDE
+                # on.
+                if kde is not None:
+                    kdes_eval[group] = interpn(
+                        axes,
+                        kde,
+                        exp_con_data[group],
+                        method="linear",
+                        bounds_error=False,
+                        fill_value=ZERO_PROB,
+                    )
 
         # Check to see if any of the trials have non-zero likelihood, if not, something is probably wrong
         # and we should warn the user.
@@ -358,6 +409,10 @@ class PECOptimizationFunction(OptimizationFunction):
         # Keep track of the best parameters
         self._best_params = {}
 
+        # Compiled executions of the agent_rep that are reused across calls to the objective function during a fit,
+        # keyed by execution_id and thread; None when not fitting (see _get_evaluate_execution).
+        self._evaluate_sessions = None
+
         super().__init__(
             search_space=search_space,
             save_samples=save_samples,
@@ -470,6 +525,24 @@ class PECOptimizationFunction(OptimizationFunction):
 
         return all_values
 
+    def _get_evaluate_execution(self, ocm, context):
+        """
+        Return the CompExecution used to evaluate the agent_rep in compiled mode. During a fit, only the values of
+        the search space change between calls to the objective function, so the execution (with its compiled
+        evaluate function and parameter, state and data structures) is created once for each thread and reused,
+        with only the search space slots of its parameter structure updated for each call.
+        """
+        if self._evaluate_sessions is None:
+            return super()._get_evaluate_execution(ocm, context)
+
+        key = (context.execution_id, threading.get_ident())
+        session = self._evaluate_sessions.get(key)
+        if session is None or not session._update_evaluate_search_space():
+            session = super()._get_evaluate_execution(ocm, context)
+            self._evaluate_sessions[key] = session
+
+        return session
+
     def _make_objective_func(self, context=None):
         """
         Make an objective function to pass to an optimization algorithm. Creates a function that runs simulations and
@@ -508,8 +581,12 @@ class PECOptimizationFunction(OptimizationFunction):
             # Get the objective function that we are trying to minimize
             f = self._make_objective_func(context=context)
 
-            # Run the MLE optimization
-            results = self._fit(obj_func=f, context=context)
+            # Run the MLE optimization, reusing compiled evaluations across calls to the objective function
+            self._evaluate_sessions = {}
+            try:
+                results = self._fit(obj_func=f, context=context)
+            finally:
+                self._evaluate_sessions = None
 
             # Get the optimal function value and sample
             optimal_value = results["optimal_value"]
@@ -27,19 +27,17 @@ import types
 from collections import namedtuple
 
 import numpy as np
-try:
-    import torch
-except ImportError:
-    torch = None
 from beartype import beartype
 
+from psyneulink._lazy import LazyModule
 from psyneulink._typing import Optional, Union, Literal, Callable
 
+from psyneulink.core import llvm as pnlvm
 from psyneulink.core.components.component import ComponentError
 from psyneulink.core.components.functions.function import (
     DEFAULT_SEED, Function_Base, FunctionError, _random_state_getter, _seed_setter,
 )
-from psyneulink.core.components.functions.nonstateful.transferfunctions import Logistic, SoftMax
+from psyneulink.core.components.functions.nonstateful.transferfunctions import Linear, Logistic, ReLU, SoftMax
 from psyneulink.core.globals.context import handle_external_context
 from psyneulink.core.globals.keywords import \
     CONTRASTIVE_HEBBIAN_FUNCTION, EM_STORAGE_FUNCTION, TDLEARNING_FUNCTION, LEARNING_FUNCTION_TYPE, LEARNING_RATE, \
@@ -49,6 +47,8 @@ from psyneulink.core.globals.parameters import Parameter, check_user_specified
 from psyneulink.core.globals.preferences.basepreferenceset import ValidPrefSet
 from psyneulink.core.globals.utilities import convert_all_elements_to_np_array, is_numeric, scalar_distance, convert_to_np_array, all_within_range, safe_len, is_numeric_scalar
 
+torch = LazyModule('torch')
+
 __all__ = ['LearningFunction', 'Kohonen', 'Hebbian', 'ContrastiveHebbian',
            'Reinforcement', 'BayesGLM', 'BackPropagation', 'TDLearning', 'EMStorage',
            'LEARNING_ACTIVATION_FUNCTION','LEARNING_ACTIVATION_INPUT','LEARNING_ACTIVATION_OUTPUT',
@@ -181,6 +181,34 @@ class LearningFunction(Function_Base):
                 raise FunctionError("{} arg for {} ({}) must be a single value".
                                     format(LEARNING_RATE, self.name, learning_rate))
 
+    def _gen_llvm_load_learning_rate(self, ctx, builder, params, row, col):
+        # A 2d learning_rate applies to each element of the weight change matrix, a 1d learning_rate to each column,
+        # and a scalar (or a 1d array with a single element, if it is modulated) to all of them
+        learning_rate_ptr = ctx.get_param_or_state_ptr(builder, self, LEARNING_RATE, param_struct_ptr=params)
+        if pnlvm.helpers.is_2d_matrix(learning_rate_ptr):
+            return builder.load(builder.gep(learning_rate_ptr, [ctx.int32_ty(0), row, col]))
+        if pnlvm.helpers.is_vector(learning_rate_ptr) and len(learning_rate_ptr.type.pointee) > 1:
+            return builder.load(builder.gep(learning_rate_ptr, [ctx.int32_ty(0), col]))
+        return pnlvm.helpers.load_extract_scalar_array_one(builder, learning_rate_ptr)
+
+
+def _gen_llvm_hebbian_weight_change_matrix(function, ctx, builder, params, arg_in, arg_out):
+    # weight_change_matrix[i][j] = variable[i] * variable[j] * learning_rate, with zeros on the diagonal
+    activity = pnlvm.helpers.unwrap_2d_array(builder, arg_in)
+    with pnlvm.helpers.array_ptr_loop(builder, arg_out, "hebbian_rows") as (b1, row):
+        row_activity = b1.load(b1.gep(activity, [ctx.int32_ty(0), row]))
+        out_row = b1.gep(arg_out, [ctx.int32_ty(0), row])
+        with pnlvm.helpers.array_ptr_loop(b1, out_row, "hebbian_cols") as (b2, col):
+            col_activity = b2.load(b2.gep(activity, [ctx.int32_ty(0), col]))
+            learning_rate = function._gen_llvm_load_learning_rate(ctx, b2, params, row, col)
+
+            weight_change = b2.fmul(b2.fmul(col_activity, learning_rate), row_activity)
+            is_diagonal = b2.icmp_signed("==", row, col)
+            weight_change = b2.select(is_diagonal, weight_change.type(0), weight_change)
+            b2.store(weight_change, b2.gep(out_row, [ctx.int32_ty(0), col]))
+
+    return builder
+
 
 class EMStorage(LearningFunction):
     """
@@ -1258,6 +1286,58 @@ class Kohonen(LearningFunction):  # --------------------------------------------
 
         return self.convert_output_type(weight_change_matrix)
 
+    def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out, *, tags:frozenset):
+        assert getattr(self, 'measure', None) in {GAUSSIAN, LINEAR, EXPONENTIAL}, \
+            f"{self.name}: only {GAUSSIAN}, {LINEAR} and {EXPONENTIAL} distance functions are supported in " \
+            f"compiled {self.componentName}"
+        learning_rate_ptr = ctx.get_param_or_state_ptr(builder, self, LEARNING_RATE, param_struct_ptr=params)
+        assert not pnlvm.helpers.is_vector(learning_rate_ptr) or len(learning_rate_ptr.type.pointee) == 1, \
+            f"{self.name}: 1d learning_rate is not supported in compiled {self.componentName}"
+
+        input_pattern = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(0)])
+        activities = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(1)])
+        matrix = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(2)])
+
+        # Find the (first) most active element
+        index_of_max_ptr = builder.alloca(ctx.int32_ty, name="index_of_max")
+        builder.store(ctx.int32_ty(0), index_of_max_ptr)
+        with pnlvm.helpers.array_ptr_loop(builder, activities, "kohonen_max") as (b, idx):
+            index_of_max = b.load(index_of_max_ptr)
+            max_activity = b.load(b.gep(activities, [ctx.int32_ty(0), index_of_max]))
+            activity = b.load(b.gep(activities, [ctx.int32_ty(0), idx]))
+            is_new_max = b.fcmp_ordered(">", activity, max_activity)
+            b.store(b.select(is_new_max, idx, index_of_max), index_of_max_ptr)
+        index_of_max = builder.load(index_of_max_ptr)
+
+        with pnlvm.helpers.array_ptr_loop(builder, arg_out, "kohonen_rows") as (b1, row):
+            input_val = b1.load(b1.gep(input_pattern, [ctx.int32_ty(0), row]))
+            out_row = b1.gep(arg_out, [ctx.int32_ty(0), row])
+            with pnlvm.helpers.array_ptr_loop(b1, out_row, "kohonen_cols") as (b2, col):
+                # Distance of the element (column) from the most active one
+                offset = b2.sub(col, index_of_max)
+                offset = b2.select(b2.icmp_signed("<", offset, offset.type(0)), b2.neg(offset), offset)
+                offset = b2.sitofp(offset, ctx.float_ty)
+                if self.measure == GAUSSIAN:
+                    # standard normal pdf
+                    distance = b2.fmul(offset, offset)
+                    distance = b2.fdiv(distance, distance.type(-2))
+                    distance = b2.call(ctx.get_builtin("exp", [ctx.float_ty]), [distance])
+                    distance = b2.fdiv(distance, distance.type(np.sqrt(2 * np.pi)))
+                elif self.measure == LINEAR:
+                    distance = offset
+                else:
+                    distance = b2.call(ctx.get_builtin("exp", [ctx.float_ty]), [offset])
+                distance = b2.fsub(distance.type(1), distance)
+
+                weight = b2.load(b2.gep(matrix, [ctx.int32_ty(0), row, col]))
+                learning_rate = self._gen_llvm_load_learning_rate(ctx, b2, params, row, col)
+
+                weight_change = b2.fmul(distance, b2.fsub(weight, input_val))
+                weight_change = b2.fmul(weight_change, learning_rate)
+                b2.store(weight_change, b2.gep(out_row, [ctx.int32_ty(0), col]))
+
+        return builder
+
 
 class Hebbian(LearningFunction):  # -------------------------------------------------------------------------------
     """
@@ -1475,6 +1555,9 @@ class Hebbian(LearningFunction):  # --------------------------------------------
 
         return self.convert_output_type(weight_change_matrix)
 
+    def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out, *, tags:frozenset):
+        return _gen_llvm_hebbian_weight_change_matrix(self, ctx, builder, params, arg_in, arg_out)
+
 
 class ContrastiveHebbian(LearningFunction):  # -------------------------------------------------------------------------
     """
@@ -1692,6 +1775,9 @@ class ContrastiveHebbian(LearningFunction):  # ---------------------------------
 
         return self.convert_output_type(weight_change_matrix)
 
+    def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out, *, tags:frozenset):
+        return _gen_llvm_hebbian_weight_change_matrix(self, ctx, builder, params, arg_in, arg_out)
+
 
 def _activation_input_getter(owning_component=None, context=None):
     try:
@@ -1975,6 +2061,27 @@ class Reinforcement(LearningFunction):  # --------------------------------------
         weight_change_matrix = np.diag(error_array)
         return convert_all_elements_to_np_array([error_array, error_array])
 
+    def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out, *, tags:frozenset):
+        output = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(LEARNING_ACTIVATION_OUTPUT)])
+        error = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(LEARNING_ERROR_OUTPUT)])
+        error_array = builder.gep(arg_out, [ctx.int32_ty(0), ctx.int32_ty(0)])
+
+        # Assign error term to the non-zero items of output array
+        with pnlvm.helpers.array_ptr_loop(builder, output, "reinforcement_error") as (b, idx):
+            # TDLearning provides an error term for each item
+            error_idx = idx if len(error.type.pointee) > 1 else ctx.int32_ty(0)
+            error_val = b.load(b.gep(error, [ctx.int32_ty(0), error_idx]))
+            learning_rate = self._gen_llvm_load_learning_rate(ctx, b, params, idx, idx)
+
+            output_val = b.load(b.gep(output, [ctx.int32_ty(0), idx]))
+            is_chosen = b.fcmp_unordered("!=", output_val, output_val.type(0))
+            error_val = b.select(is_chosen, b.fmul(learning_rate, error_val), error_val.type(0))
+            b.store(error_val, b.gep(error_array, [ctx.int32_ty(0), idx]))
+
+        builder.store(builder.load(error_array), builder.gep(arg_out, [ctx.int32_ty(0), ctx.int32_ty(1)]))
+
+        return builder
+
 
 class TDLearning(Reinforcement):
     """Implement temporal difference learning using the `Reinforcement` Function
@@ -2557,3 +2664,100 @@ class BackPropagation(LearningFunction):
         weight_change_matrix = learning_rate * activation_input * dE_dW
 
         return convert_all_elements_to_np_array([weight_change_matrix, dE_dW])
+
+    def _get_compilation_params(self):
+        # loss_spec is resolved when the function is compiled, and covariates are not supported
+        return [p for p in super()._get_compilation_params() if p.name not in {"loss_spec", "covariates"}]
+
+    def _get_input_struct_type(self, ctx):
+        # error_matrix is passed to the Python function with the variable (in params);
+        # the compiled function receives it as the last item of its input
+        variable = self.defaults.variable
+        error_matrix = np.zeros((len(variable[LEARNING_ACTIVATION_OUTPUT]), len(variable[LEARNING_ERROR_OUTPUT])))
+        return pnlvm.ir.LiteralStructType([ctx.convert_python_struct_to_llvm_ir(x)
+                                           for x in (*variable, error_matrix)])
+
+    def _gen_llvm_activation_derivative(self, ctx, builder, activation_output, dA_dW):
+        # The derivative is computed by the compiled variant of the Function that activation_derivative_fct
+        # belongs to, using its current parameters as constants
+        activation_function = getattr(self.activation_derivative_fct, '__self__', None)
+        assert isinstance(activation_function, (Linear, Logistic, ReLU)), \
+            f"{self.name}: compiled {self.componentName} requires 'activation_derivative_fct' to be the derivative " \
+            f"of a {Linear.componentName}, {Logistic.componentName} or {ReLU.componentName} Function, " \
+            f"not {self.activation_derivative_fct}"
+
+        # The derivative of Linear does not depend on its input, the others are computed from their output
+        if isinstance(activation_function, Linear):
+            derivative_tags = frozenset({"derivative"})
+        else:
+            derivative_tags = frozenset({"derivative_out"})
+        derivative_f = ctx.import_llvm_function(activation_function, tags=derivative_tags)
+
+        derivative_params = builder.alloca(derivative_f.args[0].type.pointee, name="derivative_params")
+        builder.store(derivative_params.type.pointee(activation_function._get_param_initializer(None)),
+                      derivative_params)
+        derivative_state = builder.alloca(derivative_f.args[1].type.pointee, name="derivative_state")
+        builder.store(derivative_state.type.pointee(activation_function._get_state_initializer(None)),
+                      derivative_state)
+
+        # Functions of Mechanisms have 2d variable
+        derivative_in = activation_output
+        derivative_out = dA_dW
+        if derivative_f.args[2].type != activation_output.type:
+            derivative_in = builder.alloca(derivative_f.args[2].type.pointee, name="derivative_in")
+            builder.store(builder.load(activation_output),
+                          builder.gep(derivative_in, [ctx.int32_ty(0), ctx.int32_ty(0)]))
+        if derivative_f.args[3].type != dA_dW.type:
+            derivative_out = builder.alloca(derivative_f.args[3].type.pointee, name="derivative_out")
+
+        builder.call(derivative_f, [derivative_params, derivative_state, derivative_in, derivative_out])
+
+        if derivative_out is not dA_dW:
+            builder.store(builder.load(builder.gep(derivative_out, [ctx.int32_ty(0), ctx.int32_ty(0)])), dA_dW)
+
+    def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out, *, tags:frozenset):
+        activation_input = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(LEARNING_ACTIVATION_INPUT)])
+        activation_output = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(LEARNING_ACTIVATION_OUTPUT)])
+        error_signal = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(LEARNING_ERROR_OUTPUT)])
+        error_matrix = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(len(self.defaults.variable))])
+
+        weight_change_matrix = builder.gep(arg_out, [ctx.int32_ty(0), ctx.int32_ty(0)])
+        dE_dW = builder.gep(arg_out, [ctx.int32_ty(0), ctx.int32_ty(1)])
+
+        # Derivative of the output activity, stored in dE_dW and multiplied by dE_dA below
+        self._gen_llvm_activation_derivative(ctx, builder, activation_output, dE_dW)
+
+        # Derivative of error with respect to output activity (Jacobian vector product)
+        loss_spec = self.parameters.loss_spec.get()
+        num_output_units = len(error_signal.type.pointee)
+        dE_dA_ptr = builder.alloca(ctx.float_ty, name="dE_dA")
+        with pnlvm.helpers.array_ptr_loop(builder, dE_dW, "backprop_outputs") as (b1, out_idx):
+            b1.store(ctx.float_ty(0), dE_dA_ptr)
+            with pnlvm.helpers.array_ptr_loop(b1, error_signal, "backprop_errors") as (b2, err_idx):
+                weight = b2.load(b2.gep(error_matrix, [ctx.int32_ty(0), out_idx, err_idx]))
+                error = b2.load(b2.gep(error_signal, [ctx.int32_ty(0), err_idx]))
+                dE_dA = b2.fadd(b2.load(dE_dA_ptr), b2.fmul(weight, error))
+                b2.store(dE_dA, dE_dA_ptr)
+
+            dE_dA = b1.load(dE_dA_ptr)
+            if loss_spec == Loss.MSE:
+                dE_dA = b1.fdiv(dE_dA, dE_dA.type(num_output_units))
+                dE_dA = b1.fmul(dE_dA, dE_dA.type(2))
+            elif loss_spec == Loss.SSE:
+                dE_dA = b1.fmul(dE_dA, dE_dA.type(2))
+
+            # Chain rule to get the derivative of the error with respect to the weights
+            dE_dW_ptr = b1.gep(dE_dW, [ctx.int32_ty(0), out_idx])
+            b1.store(b1.fmul(dE_dA, b1.load(dE_dW_ptr)), dE_dW_ptr)
+
+        # Weight changes = delta rule (learning rate * activity * error)
+        with pnlvm.helpers.array_ptr_loop(builder, weight_change_matrix, "backprop_rows") as (b1, row):
+            activity = b1.load(b1.gep(activation_input, [ctx.int32_ty(0), row]))
+            out_row = b1.gep(weight_change_matrix, [ctx.int32_ty(0), row])
+            with pnlvm.helpers.array_ptr_loop(b1, out_row, "backprop_cols") as (b2, col):
+                learning_rate = self._gen_llvm_load_learning_rate(ctx, b2, params, row, col)
+                error = b2.load(b2.gep(dE_dW, [ctx.int32_ty(0), col]))
+                weight_change = b2.fmul(b2.fmul(learning_rate, activity), error)
+                b2.store(weight_change, b2.gep(out_row, [ctx.int32_ty(0), col]))
+
+        return builder
@@ -846,6 +846,64 @@ class Distance(ObjectiveFunction):
         denom = np.sqrt(np.sum(v1_norm ** 2) * np.sum(v2_norm ** 2)) or EPSILON
         return np.sum(v1_norm * v2_norm) / denom
 
+    def _broadcast_function(self, v1, v2):
+        """Calculate the distances between vectors along the last axis of **v1** and **v2**
+
+        **v1** and **v2** are broadcast against each other, so that the distances between one vector and a
+        stack of them (e.g., all entries in a memory) are computed in a single operation.  Returns the same
+        values as `function <Distance.function>` for each pair of vectors, without output type conversion.
+        """
+        v1 = np.asarray(v1, dtype=float)
+        v2 = np.asarray(v2, dtype=float)
+        length = np.broadcast_shapes(v1.shape, v2.shape)[-1]
+
+        if self.metric == MAX_ABS_DIFF:
+            result = np.max(np.fabs(v1 - v2), axis=-1)
+
+        elif self.metric == DIFFERENCE:
+            result = np.sum(np.fabs(v1 - v2), axis=-1)
+
+        elif self.metric == NORMED_L0_SIMILARITY:
+            result = 1.0 - np.sum(np.abs(v1 - v2), axis=-1) / 4.0
+
+        elif self.metric == DOT_PRODUCT:
+            result = np.sum(v1 * v2, axis=-1)
+
+        elif self.metric == EUCLIDEAN:
+            result = np.linalg.norm(v2 - v1, axis=-1)
+
+        elif self.metric in {COSINE, COSINE_SIMILARITY, CORRELATION}:
+            if self.metric == CORRELATION:
+                v1 = v1 - np.mean(v1, axis=-1, keepdims=True)
+                v2 = v2 - np.mean(v2, axis=-1, keepdims=True)
+                denom = np.sqrt(np.sum(v1 ** 2, axis=-1) * np.sum(v2 ** 2, axis=-1))
+            else:
+                denom = np.sqrt(np.sum(v1 ** 2, axis=-1)) * np.sqrt(np.sum(v2 ** 2, axis=-1))
+            denom = np.where(denom == 0, EPSILON, denom)
+            result = 1.0 - np.fabs(np.sum(v1 * v2, axis=-1) / denom)
+
+        elif self.metric == CROSS_ENTROPY:
+            if not self.is_initializing:
+                v1 = np.where(v1 == 0, EPSILON, v1)
+                v2 = np.where(v2 == 0, EPSILON, v2)
+            both_zero = np.logical_and(v1 == 0, v2 == 0)
+            log_v2 = np.log(v2, where=np.logical_not(both_zero), out=np.zeros(np.broadcast_shapes(v1.shape, v2.shape)))
+            result = -np.sum(v1 * np.where(both_zero, 0.0, log_v2), axis=-1)
+
+        elif self.metric == ENERGY:
+            result = -np.sum(v1 * v2, axis=-1) / 2.0
+
+        else:
+            assert False, '{} not a recognized metric in {}'.format(self.metric, self.__class__.__name__)
+
+        if self.normalize and self.metric not in {MAX_ABS_DIFF, CORRELATION, COSINE, COSINE_SIMILARITY}:
+            if self.metric == ENERGY:
+                result = result / length ** 2.0
+            else:
+                result = result / length
+
+        return result
+
     def __gen_llvm_sum_difference(self, builder, index, ctx, v1, v2, acc):
         ptr1 = builder.gep(v1, [index])
         ptr2 = builder.gep(v2, [index])
@@ -982,7 +1040,20 @@ class Distance(ObjectiveFunction):
 
         v1 = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(0), ctx.int32_ty(0)])
         v2 = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(1), ctx.int32_ty(0)])
+        ret = self._gen_llvm_distance(ctx, builder, params, v1, v2, arg_in.type.pointee.element.count)
+
+        if arg_out.type.pointee != ret.type:
+            # Some instances use 2d output values
+            arg_out = builder.gep(arg_out, [ctx.int32_ty(0), ctx.int32_ty(0),
+                                            ctx.int32_ty(0)])
+        builder.store(ret, arg_out)
+
+        return builder
 
+    def _gen_llvm_distance(self, ctx, builder, params, v1, v2, input_length):
+        """Return the distance between the **input_length** long vectors that start at **v1** and **v2**
+        (pointers to their first elements); used by Functions that compute distances between parts of their input.
+        """
         acc_ptr = builder.alloca(ctx.float_ty)
         builder.store(ctx.float_ty(-0.0), acc_ptr)
 
@@ -1030,7 +1101,6 @@ class Distance(ObjectiveFunction):
         else:
             raise RuntimeError('Unsupported metric')
 
-        input_length = arg_in.type.pointee.element.count
         vector_length = ctx.int32_ty(input_length)
         with pnlvm.helpers.for_loop_zero_inc(builder, vector_length, self.metric) as args:
             inner(*args)
@@ -1115,11 +1185,6 @@ class Distance(ObjectiveFunction):
             ret = builder.call(fabs, [corr])
             ret = builder.fsub(ctx.float_ty(1), ret)
 
-        if arg_out.type.pointee != ret.type:
-            # Some instances use 2d output values
-            arg_out = builder.gep(arg_out, [ctx.int32_ty(0), ctx.int32_ty(0),
-                                            ctx.int32_ty(0)])
-
         normalize_ptr = ctx.get_param_or_state_ptr(builder, self, NORMALIZE, param_struct_ptr=params)
         normalize = builder.load(normalize_ptr)
         normalize_b = builder.fcmp_ordered("!=", normalize, normalize.type(0))
@@ -1127,15 +1192,10 @@ class Distance(ObjectiveFunction):
         # MAX_ABS_DIFF, CORRELATION, and COSINE/COSINE_SIMILARITY ignore normalization
         allow_normalize_b = normalize_b.type(self.metric not in {MAX_ABS_DIFF, CORRELATION, COSINE, COSINE_SIMILARITY})
         normalize_b = builder.and_(normalize_b, allow_normalize_b)
-        with builder.if_else(normalize_b) as (then, otherwise):
-            with then:
-                norm_factor = input_length ** 2 if self.metric == ENERGY else input_length
-                normalized = builder.fdiv(ret, ctx.float_ty(norm_factor), name="normalized")
-                builder.store(normalized, arg_out)
-            with otherwise:
-                builder.store(ret, arg_out)
+        norm_factor = input_length ** 2 if self.metric == ENERGY else input_length
+        normalized = builder.fdiv(ret, ctx.float_ty(norm_factor), name="normalized")
 
-        return builder
+        return builder.select(normalize_b, normalized, ret)
 
     def _function(self,
                  variable=None,
@@ -1215,9 +1275,10 @@ class Distance(ObjectiveFunction):
             assert False, '{} not a recognized metric in {}'.format(self.metric, self.__class__.__name__)
 
         if self.normalize and self.metric not in {MAX_ABS_DIFF, CORRELATION, COSINE, COSINE_SIMILARITY}:
+            # Use size, rather than len, since v1 is a scalar if variable is a pair of scalars
             if self.metric == ENERGY:
-                result /= len(v1) ** 2.0
+                result /= np.size(v1) ** 2.0
             else:
-                result /= len(v1)
+                result /= np.size(v1)
 
         return self.convert_output_type(result)
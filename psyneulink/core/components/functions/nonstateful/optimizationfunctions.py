@@ -27,19 +27,14 @@ Functions that return the sample of a variable yielding the optimized value of a
 import contextlib
 # from fractions import Fraction
 import itertools
+import multiprocessing
 import warnings
 from numbers import Number
 
 import numpy as np
-
-# Conditionally import torch
-try:
-    import torch
-except ImportError:
-    torch = None
-
 from beartype import beartype
 
+from psyneulink._lazy import LazyModule
 from psyneulink._typing import Optional, Union, Callable, Literal
 
 from psyneulink.core import llvm as pnlvm
@@ -56,6 +51,8 @@ from psyneulink.core.globals.parameters import Parameter, check_user_specified
 from psyneulink.core.globals.sampleiterator import SampleIterator
 from psyneulink.core.globals.utilities import call_with_pruned_args, convert_to_np_array
 
+torch = LazyModule('torch')
+
 __all__ = ['OptimizationFunction', 'GradientOptimization', 'GridSearch', 'GaussianProcess',
            'ASCENT', 'DESCENT', 'DIRECTION', 'MAXIMIZE', 'MINIMIZE', 'OBJECTIVE_FUNCTION', 'SEARCH_FUNCTION',
            'SEARCH_SPACE', 'RANDOMIZATION_DIMENSION', 'SEARCH_TERMINATION_FUNCTION', 'SIMULATION_PROGRESS'
@@ -70,6 +67,17 @@ SEARCH_TERMINATION_FUNCTION = 'search_termination_function'
 DIRECTION = 'direction'
 SIMULATION_PROGRESS = 'simulation_progress'
 
+# OptimizationFunction and context being evaluated by _parallel_evaluate;
+# inherited by the forked worker processes, so that they don't need to be pickled
+_parallel_evaluate_state = None
+
+
+def _parallel_evaluate_samples(samples):
+    """Evaluate objective_function for each of **samples** in a worker process of _parallel_evaluate"""
+    optimization_function, context = _parallel_evaluate_state
+    return [call_with_pruned_args(optimization_function.objective_function, sample, context=context)
+            for sample in samples]
+
 class OptimizationFunctionError(FunctionError):
     pass
 
@@ -391,6 +399,18 @@ class OptimizationFunction(Function_Base):
 
                     :default value: lambda x, y, z: True
                     :type: ``types.FunctionType``
+
+                num_processes
+                    see `num_processes <GridSearch.num_processes>`
+
+                    :default value: None
+                    :type: ``int``
+
+                vectorized
+                    see `vectorized <GridSearch.vectorized>`
+
+                    :default value: False
+                    :type: ``bool``
         """
         variable = Parameter(np.array([0.0, 0.0, 0.0]), read_only=True, pnl_internal=True, constructor_argument='default_variable')
 
@@ -414,6 +434,8 @@ class OptimizationFunction(Function_Base):
         saved_values = Parameter([], read_only=True, pnl_internal=True)
 
         grid = Parameter(None)
+        num_processes = Parameter(None, stateful=False, loggable=False, pnl_internal=True)
+        vectorized = Parameter(False, stateful=False, loggable=False, pnl_internal=True)
 
     @check_user_specified
     @beartype
@@ -674,6 +696,12 @@ class OptimizationFunction(Function_Base):
                 all_values = np.transpose(all_values, (1, 2, 0))
 
             last_sample = last_value = None
+        # Evaluate grid of samples in a single call to objective_function if requested
+        elif self._use_vectorized_evaluate(context):
+            last_sample, last_value, all_samples, all_values = self._vectorized_evaluate(context)
+        # Evaluate grid of samples in parallel in worker processes if requested
+        elif self._use_parallel_evaluate(context):
+            last_sample, last_value, all_samples, all_values = self._parallel_evaluate(context)
         # Otherwise, default sequential sampling
         else:
             # Get initial sample in case it is needed by _search_space_evaluate (e.g., for gradient initialization)
@@ -771,15 +799,10 @@ class OptimizationFunction(Function_Base):
             # Get value of sample
             current_value = call_with_pruned_args(self.objective_function, current_sample, context=context)
 
-            # If the value returned by the objective function is a tuple, then we are using PEC and the
-            # evaluate_agent_rep function is returning the net_outcome, results tuple. We want the results
-            # in this case.
-            if type(current_value) is tuple:
-                current_value = np.squeeze(np.array(current_value[1]))
+            current_value = self._format_objective_value(current_value)
 
-            # Convert the sample and values to numpy arrays even if they are scalars
+            # Convert the sample to numpy array even if it is a scalar
             current_sample = np.atleast_1d(current_sample)
-            current_value = np.atleast_1d(current_value)
 
             evaluated_samples.append(current_sample)
             estimated_values.append(current_value)
@@ -808,6 +831,120 @@ class OptimizationFunction(Function_Base):
         # FIX: 11/3/21: ??MODIFY TO RETURN SAME AS _grid_evaluate
         return current_sample, current_value, evaluated_samples, estimated_values
 
+    @staticmethod
+    def _format_objective_value(value):
+        """Return value returned by objective_function as a numpy array."""
+        # If the value returned by the objective function is a tuple, then we are using PEC and the
+        # evaluate_agent_rep function is returning the net_outcome, results tuple. We want the results
+        # in this case.
+        if type(value) is tuple:
+            value = np.squeeze(np.array(value[1]))
+
+        # Convert the value to numpy array even if it is a scalar
+        return np.atleast_1d(value)
+
+    def _use_parallel_evaluate(self, context):
+        """Return True if the samples should be evaluated in worker processes by _parallel_evaluate."""
+        num_processes = self.parameters.num_processes._get(context)
+        if num_processes is None or num_processes <= 1:
+            return False
+
+        # Only evaluations of an agent_rep over a static grid of samples are farmed out
+        if (self.owner is None
+                or self.is_initializing
+                or ContextFlags.PROCESSING not in context.flags
+                or self.search_function != self._traverse_grid
+                or not getattr(getattr(self.owner, 'agent_rep', None), 'runs_simulations', False)):
+            return False
+
+        # Without a randomization control signal, the estimates of a stochastic agent_rep depend on the state of its
+        # random generators carried over from the previous sample, which worker processes cannot share
+        if (self.parameters.randomization_dimension._get(context) is None
+                and self.owner.agent_rep.random_variables):
+            warnings.warn(f"'num_processes' was specified for {self.name} of {self.owner.name}, but its agent_rep "
+                          f"({self.owner.agent_rep.name}) has random variables and no randomization control signal "
+                          f"('num_estimates' is None); samples will be evaluated sequentially.")
+            return False
+
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            warnings.warn(f"'num_processes' was specified for {self.name} of {self.owner.name}, but worker processes "
+                          f"cannot be forked on this platform; samples will be evaluated sequentially.")
+            return False
+
+        return True
+
+    def _parallel_evaluate(self, context):
+        """Evaluate every sample in the grid of search_space using a pool of `num_processes
+        <GridSearch.num_processes>` worker processes.
+        Each worker is forked from the current process, and so holds a frozen copy of the agent_rep (and
+        its state in **context**), that it uses to evaluate a contiguous chunk of samples.  Since each
+        sample includes its value of the randomization control signal (i.e., the seed for the estimate),
+        the values returned are the same as those of `_sequential_evaluate` for the same samples.
+        Return arrays with all samples evaluated, and array with all values of those samples.
+        """
+        global _parallel_evaluate_state
+
+        num_processes = self.parameters.num_processes._get(context)
+        max_iterations = self.parameters.max_iterations._get(context)
+
+        # Mirror the order in which samples are generated by _traverse_grid
+        evaluated_samples = [np.atleast_1d(s) for s in itertools.product(*self.search_space)]
+        if max_iterations and len(evaluated_samples) > max_iterations + 1:
+            warnings.warn(f"{self.name} of {self.owner.name} exceeded max iterations {max_iterations}.")
+            evaluated_samples = evaluated_samples[:max_iterations + 1]
+
+        num_processes = min(num_processes, len(evaluated_samples))
+        chunk_size = (len(evaluated_samples) + num_processes - 1) // num_processes
+        chunks = [evaluated_samples[i:i + chunk_size] for i in range(0, len(evaluated_samples), chunk_size)]
+
+        _parallel_evaluate_state = (self, context)
+        try:
+            with multiprocessing.get_context('fork').Pool(num_processes) as pool:
+                chunk_values = pool.map(_parallel_evaluate_samples, chunks)
+        finally:
+            _parallel_evaluate_state = None
+
+        estimated_values = [self._format_objective_value(v) for values in chunk_values for v in values]
+
+        # Convert evaluated_samples and estimated_values to numpy arrays, stack along the last dimension
+        estimated_values = np.stack(estimated_values, axis=-1)
+        evaluated_samples = np.stack(evaluated_samples, axis=-1)
+
+        return evaluated_samples[..., -1], estimated_values[..., -1], evaluated_samples, estimated_values
+
+    def _use_vectorized_evaluate(self, context):
+        """Return True if the samples should be evaluated in a single call by _vectorized_evaluate."""
+        return self.parameters.vectorized._get(context) and self.search_function == self._traverse_grid
+
+    def _vectorized_evaluate(self, context):
+        """Evaluate every sample in the grid of search_space with a single call to `objective_function
+        <OptimizationFunction.objective_function>`, that is passed a 2d array with one column for each sample
+        (see `vectorized <GridSearch.vectorized>`).
+        Return arrays with all samples evaluated, and array with all values of those samples.
+        """
+        max_iterations = self.parameters.max_iterations._get(context)
+
+        # Mirror the order in which samples are generated by _traverse_grid (i.e., last dimension varies fastest)
+        grid = np.meshgrid(*[np.asarray(s()) for s in self.search_space], indexing='ij')
+        evaluated_samples = np.stack([g.reshape(-1) for g in grid])
+        num_samples = evaluated_samples.shape[-1]
+        if max_iterations and num_samples > max_iterations + 1:
+            warnings.warn(f"{self.name} exceeded max iterations {max_iterations}.")
+            num_samples = max_iterations + 1
+            evaluated_samples = evaluated_samples[:, :num_samples]
+
+        estimated_values = call_with_pruned_args(self.objective_function, evaluated_samples, context=context)
+        if type(estimated_values) is tuple:
+            estimated_values = estimated_values[1]
+        estimated_values = np.atleast_2d(estimated_values)
+
+        if estimated_values.shape[-1] != num_samples:
+            raise OptimizationFunctionError(f"The {repr(OBJECTIVE_FUNCTION)} of {self.name} must return a value for "
+                                            f"each of the {num_samples} samples it is passed when 'vectorized' is "
+                                            f"True, but returned an array of shape {estimated_values.shape}.")
+
+        return evaluated_samples[..., -1], estimated_values[..., -1], evaluated_samples, estimated_values
+
     def _grid_evaluate(self, ocm, context, get_results:bool):
         """Helper method for evaluation of a grid of samples from search space via LLVM backends."""
         # If execution mode is not Python, the search space has to be static
@@ -831,17 +968,25 @@ class OptimizationFunction(Function_Base):
         num_evals = np.prod([d._num for d in self.search_space])
 
         # Map allocations to values
-        comp_exec = pnlvm.execution.CompExecution(ocm.agent_rep, context)
+        comp_exec = self._get_evaluate_execution(ocm, context)
         execution_mode = ocm.parameters.comp_execution_mode._get(context)
         if execution_mode == "PTX":
             outcomes = comp_exec.cuda_evaluate(inputs, num_inputs_sets, num_evals, get_results)
         elif execution_mode == "LLVM":
-            outcomes = comp_exec.thread_evaluate(inputs, num_inputs_sets, num_evals, get_results)
+            outcomes = comp_exec.thread_evaluate(inputs, num_inputs_sets, num_evals, get_results,
+                                                 num_threads=ocm.parameters.evaluate_num_threads._get(context),
+                                                 chunk_size=ocm.parameters.evaluate_chunk_size._get(context))
         else:
             assert False, f"Unknown execution mode for {ocm.name}: {execution_mode}."
 
         return outcomes, num_evals
 
+    def _get_evaluate_execution(self, ocm, context):
+        """Return the CompExecution used by _grid_evaluate to evaluate the agent_rep of **ocm** in **context**.
+        A new one is created for every evaluation, so that it reflects the current state of the agent_rep.
+        """
+        return pnlvm.execution.CompExecution(ocm.agent_rep, context)
+
     def reset_grid(self, context):
         """Reset iterators in `search_space <GridSearch.search_space>`"""
         for s in self.search_space:
@@ -1262,7 +1407,7 @@ class GradientOptimization(OptimizationFunction):
         # Differentiate objective_function using torch.func.grad()
         if objective_function is not None and not self.gradient_function:
 
-            if torch is None:
+            if not torch:
                 raise ValueError("PyTorch is not installed. Please install PyTorch to use GradientOptimization without "
                                  "specifying a gradient_function.")
 
@@ -1463,6 +1608,8 @@ class GridSearch(OptimizationFunction):
         max_iterations=1000,         \
         save_samples=False,          \
         save_values=False,           \
+        num_processes=None,          \
+        vectorized=False,            \
         params=None,                 \
         owner=None,                  \
         prefs=None                   \
@@ -1524,6 +1671,16 @@ class GridSearch(OptimizationFunction):
         specifies whether or not to save and return the values of `objective_function <GridSearch.objective_function>`
         for all samples evaluated in the `optimization process <GridSearch_Procedure>`.
 
+    num_processes : int : default None
+        specifies the number of worker processes used to evaluate the samples when the `objective_function
+        <GridSearch.objective_function>` is executed in Python (see `num_processes <GridSearch.num_processes>`
+        for additional details).
+
+    vectorized : bool : default False
+        specifies whether `objective_function <GridSearch.objective_function>` is called once with all of the
+        samples in `search_space <GridSearch.search_space>` (see `vectorized <GridSearch.vectorized>` for
+        additional details).
+
     Attributes
     ----------
 
@@ -1565,6 +1722,49 @@ class GridSearch(OptimizationFunction):
     save_values : bool
         determines whether or not to save and return the value of `objective_function
         <GridSearch.objective_function>` for all samples evaluated in the `optimization process <GridSearch_Procedure>`.
+
+    num_processes : int or None
+        determines the number of worker processes used to evaluate the samples in `search_space
+        <GridSearch.search_space>` when GridSearch is the `function <OptimizationControlMechanism.function>` of an
+        `OptimizationControlMechanism` executed in Python mode (i.e., its `agent_rep
+        <OptimizationControlMechanism.agent_rep>` is evaluated using Python, for example because it contains
+        `UserDefinedFunctions <UserDefinedFunction>` that cannot be compiled).  If it is greater than 1, the samples are
+        divided into contiguous chunks, each of which is evaluated by a worker process forked from the current one
+        (and that therefore holds a frozen copy of the `agent_rep <OptimizationControlMechanism.agent_rep>`).  Since
+        the seed for each estimate is part of the sample, the values returned are the same as for sequential
+        evaluation;  for this reason, if the `agent_rep <OptimizationControlMechanism.agent_rep>` has random variables
+        but no seed is included in the samples (i.e., `num_estimates <OptimizationControlMechanism.num_estimates>` is
+        None), a warning is issued and the samples are evaluated sequentially.  Worker processes do not update the state of the `agent_rep
+        <OptimizationControlMechanism.agent_rep>` in the current process (e.g., its `simulation_results
+        <Composition.simulation_results>`), and forking must be supported by the platform;  if it is not, a warning
+        is issued and the samples are evaluated sequentially.  If it is None or 1, the samples are evaluated
+        sequentially.
+
+    vectorized : bool
+        determines whether `objective_function <GridSearch.objective_function>` is called once for each sample in
+        `search_space <GridSearch.search_space>` (False), or once for all of them (True).  If it is True,
+        `objective_function <GridSearch.objective_function>` is passed a 2d array with one row for each
+        `SampleIterator` in `search_space <GridSearch.search_space>` and one column for each sample (in the order
+        in which they are generated by `grid <GridSearch.grid>`), and must return an array of values with one
+        element (or, if it returns more than one value for each sample, one column) for each sample.  This allows
+        functions that are written using array operations, such as `drift_diffusion_analytical_solution`, to
+        evaluate large grids of samples without calling `objective_function <GridSearch.objective_function>` for
+        each of them;  for example, the following finds the drift_rate and threshold that minimize the mean
+        response time of a drift diffusion process::
+
+            search = pnl.GridSearch(default_variable=[0, 0],
+                                    search_space=[pnl.SampleIterator(pnl.SampleSpec(0.1, 2.0, num=1000)),
+                                                  pnl.SampleIterator(pnl.SampleSpec(0.1, 2.0, num=1000))],
+                                    objective_function=lambda s: pnl.drift_diffusion_analytical_solution(
+                                        drift_rate=s[0], threshold=s[1])[0],
+                                    direction=pnl.MINIMIZE,
+                                    vectorized=True)
+            optimal_sample, optimal_value, _, _ = search([0, 0])
+
+        If `select_randomly_from_optimal_values <GridSearch.select_randomly_from_optimal_values>` is False, the
+        optimal sample is then also selected using array operations.  This is only used when GridSearch is not
+        the `function <OptimizationControlMechanism.function>` of an `OptimizationControlMechanism` executed in
+        compiled mode.
     """
 
     componentName = GRID_SEARCH_FUNCTION
@@ -1626,6 +1826,8 @@ class GridSearch(OptimizationFunction):
                  # tolerance=0.,
                  select_randomly_from_optimal_values=None,
                  seed=None,
+                 num_processes: Optional[int] = None,
+                 vectorized: Optional[bool] = None,
                  params=None,
                  owner=None,
                  prefs=None,
@@ -1654,6 +1856,8 @@ class GridSearch(OptimizationFunction):
             save_values=save_values,
             seed=seed,
             direction=direction,
+            num_processes=num_processes,
+            vectorized=vectorized,
             params=params,
             owner=owner,
             prefs=prefs,
@@ -2130,11 +2334,24 @@ class GridSearch(OptimizationFunction):
                     raise ValueError(f"GridSearch Error: {self}._evaluate returned values with more than one element. "
                                      "GridSearch currently does not support optimizing over multiple output values.")
 
+                select_randomly = self.parameters.select_randomly_from_optimal_values._get(context)
+
+                # Find the (first) optimal value without iterating over the samples
+                if self.parameters.vectorized._get(context) and not select_randomly:
+                    all_values_flat = all_values.flatten()
+                    if direction == MAXIMIZE:
+                        optimal_index = np.argmax(all_values_flat)
+                    else:
+                        optimal_index = np.argmin(all_values_flat)
+                    optimal_value, optimal_sample = all_values_flat[optimal_index], all_samples[:, optimal_index]
+                    value_sample_pairs = ()
+
                 # Find the optimal value(s)
+                else:
+                    value_sample_pairs = zip(all_values.flatten(),
+                                             [all_samples[:,i] for i in range(all_samples.shape[1])])
+                    optimal_value, optimal_sample = next(value_sample_pairs)
                 optimal_value_count = 1
-                value_sample_pairs = zip(all_values.flatten(),
-                                         [all_samples[:,i] for i in range(all_samples.shape[1])])
-                optimal_value, optimal_sample = next(value_sample_pairs)
 
                 # The algorithm below implements "Reservoir sampling"[0]. This
                 # matches the compiled implementation of "select_min". The
@@ -2142,7 +2359,6 @@ class GridSearch(OptimizationFunction):
                 # and a single pass over the evaluated values.
                 # The disadvantage is multiple calls to the PRNG.
                 # https://en.wikipedia.org/wiki/Reservoir_sampling
-                select_randomly = self.parameters.select_randomly_from_optimal_values._get(context)
                 for value, sample in value_sample_pairs:
                     if select_randomly and np.allclose(value, optimal_value):
                         optimal_value_count += 1
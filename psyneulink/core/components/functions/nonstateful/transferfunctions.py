@@ -70,12 +70,9 @@ from enum import Flag, auto
 from math import e, pi, sqrt
 
 import numpy as np
-try:
-    import torch
-except ImportError:
-    torch = None
 from beartype import beartype
 
+from psyneulink._lazy import LazyModule
 from psyneulink._typing import Callable, Mapping, Optional, Union
 
 from psyneulink.core import llvm as pnlvm
@@ -104,6 +101,8 @@ from psyneulink.core.globals.preferences.basepreferenceset import \
     REPORT_OUTPUT_PREF, PreferenceEntry, PreferenceLevel, ValidPrefSet
 from psyneulink.core.globals.utilities import ValidParamSpecType, convert_all_elements_to_np_array, safe_len, is_matrix_keyword
 
+torch = LazyModule('torch')
+
 __all__ = ['Angle', 'BinomialDistort', 'Dropout', 'Exponential', 'Gaussian', 'GaussianDistort', 'Identity',
            'Linear', 'LinearMatrix', 'Logistic', 'ReLU', 'SoftMax', 'Tanh', 'TransferFunction', 'TransferWithCosts'
            ]
@@ -1774,6 +1774,78 @@ class DualAdaptiveIntegrator(IntegratorFunction):  # ---------------------------
 
         return value + offset
 
+    def _get_compilation_params(self):
+        # rate and noise are not used to compute the result, and the logistic
+        # terms are only reported by the Python implementation
+        return [p for p in super()._get_compilation_params()
+                if p.name not in {RATE, NOISE, "short_term_logistic", "long_term_logistic"}]
+
+    def _get_compilation_state(self):
+        # The short and long term averages are the only state used in
+        # compiled code, previous_value is never updated
+        return [p for p in super()._get_compilation_state() if p.name != PREVIOUS_VALUE]
+
+    def _gen_llvm_function_reset(self, ctx, builder, params, state, arg_in, arg_out, *, tags:frozenset):
+        assert "reset" in tags
+        for a in ("previous_short_term_avg", "previous_long_term_avg"):
+            initializer = getattr(self.parameters, a).initializer
+            source_ptr = ctx.get_param_or_state_ptr(builder, self, initializer, param_struct_ptr=params)
+            dest_ptr = ctx.get_param_or_state_ptr(builder, self, a, state_struct_ptr=state)
+            builder.store(builder.load(source_ptr), dest_ptr)
+
+        return builder
+
+    def _gen_llvm_ewma_logistic(self, builder, index, ctx, vi_val, params, state, term):
+        rate = self._gen_llvm_load_param(ctx, builder, params, index, term + "_rate")
+        gain = self._gen_llvm_load_param(ctx, builder, params, index, term + "_gain")
+        bias = self._gen_llvm_load_param(ctx, builder, params, index, term + "_bias")
+
+        avg_ptr = ctx.get_param_or_state_ptr(builder, self, "previous_" + term + "_avg", state_struct_ptr=state)
+        avg_ptr = pnlvm.helpers.unwrap_2d_array(builder, avg_ptr)
+        avg_ptr = builder.gep(avg_ptr, [ctx.int32_ty(0), index])
+        prev_avg = builder.load(avg_ptr)
+
+        # _function passes the rate and the previous average to _EWMA_filter
+        # in the opposite order, so this computes:
+        # avg = (1 - previous_avg) * rate + previous_avg * variable
+        rev_prev_avg = builder.fsub(prev_avg.type(1), prev_avg)
+        avg = builder.fmul(rev_prev_avg, rate)
+        avg = builder.fadd(avg, builder.fmul(prev_avg, vi_val))
+        builder.store(avg, avg_ptr)
+
+        # logistic = 1 / (1 + exp(-(gain * avg) + bias))
+        exp_arg = builder.fmul(gain, avg)
+        exp_arg = builder.fsub(bias, exp_arg)
+        exp_val = pnlvm.helpers.exp(ctx, builder, exp_arg)
+        denominator = builder.fadd(exp_val.type(1), exp_val)
+        return builder.fdiv(denominator.type(1), denominator)
+
+    def _gen_llvm_integrate(self, builder, index, ctx, vi, vo, params, state):
+        offset = self._gen_llvm_load_param(ctx, builder, params, index, OFFSET)
+
+        vi_val = builder.load(builder.gep(vi, [ctx.int32_ty(0), index]))
+        short_term_logistic = self._gen_llvm_ewma_logistic(builder, index, ctx, vi_val, params, state, "short_term")
+        long_term_logistic = self._gen_llvm_ewma_logistic(builder, index, ctx, vi_val, params, state, "long_term")
+
+        rev_short_term_logistic = builder.fsub(short_term_logistic.type(1), short_term_logistic)
+
+        operation = self.parameters.operation.get()
+        if operation == PRODUCT:
+            res = builder.fmul(rev_short_term_logistic, long_term_logistic)
+        elif operation == SUM:
+            res = builder.fadd(rev_short_term_logistic, long_term_logistic)
+        elif operation == S_MINUS_L:
+            res = builder.fsub(rev_short_term_logistic, long_term_logistic)
+        elif operation == L_MINUS_S:
+            res = builder.fsub(long_term_logistic, rev_short_term_logistic)
+        else:
+            assert False, "Unsupported operation for {}: {}".format(self.name, operation)
+
+        res = builder.fadd(res, offset)
+
+        vo_ptr = builder.gep(vo, [ctx.int32_ty(0), index])
+        builder.store(res, vo_ptr)
+
     @handle_external_context(fallback_most_recent=True)
     def reset(self, short=None, long=None, context=NotImplemented):
         """
@@ -2077,9 +2149,8 @@ class InteractiveActivationIntegrator(IntegratorFunction):  # ------------------
                                     format(repr(RATE), self.__class__.__name__, rate))
 
         if DECAY in request_set and request_set[DECAY] is not None:
-            decay = request_set[DECAY]
-            if np.isscalar(decay):
-                decay = [decay]
+            # decay may have been converted to a 0d array
+            decay = np.atleast_1d(request_set[DECAY])
             if not all(0.0 <= d <= 1.0 for d in decay):
                 raise FunctionError("Value(s) specified for {} argument of {} ({}) must be in interval [0,1]".
                                     format(repr(DECAY), self.__class__.__name__, decay))
@@ -2153,6 +2224,49 @@ class InteractiveActivationIntegrator(IntegratorFunction):  # ------------------
 
         return self.convert_output_type(new_value)
 
+    def _gen_llvm_integrate(self, builder, index, ctx, vi, vo, params, state):
+        rate = self._gen_llvm_load_param(ctx, builder, params, index, RATE)
+        decay = self._gen_llvm_load_param(ctx, builder, params, index, DECAY)
+        rest = self._gen_llvm_load_param(ctx, builder, params, index, REST)
+        max_val = self._gen_llvm_load_param(ctx, builder, params, index, "max_val")
+        min_val = self._gen_llvm_load_param(ctx, builder, params, index, "min_val")
+        noise = self._gen_llvm_load_param(ctx, builder, params, index, NOISE, state=state)
+
+        # Get the only state member; previous value
+        prev_ptr = ctx.get_param_or_state_ptr(builder, self, PREVIOUS_VALUE, state_struct_ptr=state)
+
+        # Get rid of 2d array. When part of a Mechanism the input,
+        # (and output, and context) are 2d arrays.
+        prev_ptr = pnlvm.helpers.unwrap_2d_array(builder, prev_ptr)
+        assert len(prev_ptr.type.pointee) == len(vi.type.pointee)
+
+        prev_ptr = builder.gep(prev_ptr, [ctx.int32_ty(0), index])
+        prev_val = builder.load(prev_ptr)
+
+        in_val = builder.load(builder.gep(vi, [ctx.int32_ty(0), index]))
+
+        # Distance from the asymptote in the direction of the input
+        dist_max = builder.fsub(max_val, prev_val)
+        dist_min = builder.fsub(prev_val, min_val)
+        is_pos = builder.fcmp_ordered(">", in_val, in_val.type(0))
+        is_neg = builder.fcmp_ordered("<", in_val, in_val.type(0))
+        dist = builder.select(is_neg, dist_min, dist_min.type(0))
+        dist = builder.select(is_pos, dist_max, dist)
+
+        # new_value = previous_value + rate * (input + noise) * dist_from_asymptote
+        #                            - decay * (previous_value - rest)
+        ret = builder.fadd(in_val, noise)
+        ret = builder.fmul(ret, rate)
+        ret = builder.fmul(ret, dist)
+        ret = builder.fadd(prev_val, ret)
+
+        dist_rest = builder.fsub(prev_val, rest)
+        ret = builder.fsub(ret, builder.fmul(decay, dist_rest))
+
+        vo_ptr = builder.gep(vo, [ctx.int32_ty(0), index])
+        builder.store(ret, vo_ptr)
+        builder.store(ret, prev_ptr)
+
 
 class DriftDiffusionIntegrator(IntegratorFunction):  # -----------------------------------------------------------------
     """
@@ -2611,6 +2725,116 @@ class DriftDiffusionIntegrator(IntegratorFunction):  # -------------------------
             context=context
         )
 
+    @handle_external_context(fallback_most_recent=True)
+    def simulate_population(self, num_trials, variable=None, max_time_steps=None, seed=None, context=None):
+        """
+        simulate_population(num_trials, variable=None, max_time_steps=None, seed=None, context=None)
+
+        Simulate **num_trials** independent trials of the drift diffusion process, each of which is integrated until
+        it reaches `threshold <DriftDiffusionIntegrator.threshold>`, and return the decision value and response time
+        of every trial.
+
+        Each trial is equivalent to resetting the function, and then executing it until the absolute value of its
+        result reaches `threshold <DriftDiffusionIntegrator.threshold>` (as a `DDM` does when its execution is
+        scheduled using a `WhenFinished` `Condition`):  it starts at `starting_value
+        <DriftDiffusionIntegrator.starting_value>` and `non_decision_time <DriftDiffusionIntegrator.non_decision_time>`,
+        and is advanced by `time_step_size <DriftDiffusionIntegrator.time_step_size>` in each time step, using the
+        current values of `rate <DriftDiffusionIntegrator.rate>`, `noise <DriftDiffusionIntegrator.noise>` and
+        `offset <DriftDiffusionIntegrator.offset>`.  However, all of the trials are advanced together, as arrays, and
+        trials are dropped from them as they reach threshold.  If `variable <DriftDiffusionIntegrator.variable>` has
+        more than one element, each element of each trial is treated as an independent process.
+
+        If **seed** is specified, the random terms are drawn from a new random state initialized with it, so that
+        calls with the same **seed** return the same results (though they differ from the results of executing the
+        trials one after another).  Otherwise, they are drawn from the function's `random_state
+        <DriftDiffusionIntegrator.random_state>` in **context**, which is advanced by the draws (and by any
+        executions of the function).  The `previous_value <DriftDiffusionIntegrator.previous_value>` and
+        `previous_time <DriftDiffusionIntegrator.previous_time>` of the function are not changed.
+
+        Arguments
+        ---------
+
+        num_trials : int
+            the number of trials to simulate.
+
+        variable : number, list or array : default class_defaults.variable
+            the stimulus component of the drift rate used for all of the trials.
+
+        max_time_steps : int : default None
+            the maximum number of time steps for which the trials are integrated;  if it is None, they are
+            integrated until all of them reach threshold.
+
+        seed : int : default None
+            the seed of the random state from which the random terms are drawn;  if it is None, they are drawn from
+            the function's `random_state <DriftDiffusionIntegrator.random_state>`.
+
+        Returns
+        -------
+
+        decision values, response times : 2d array, 2d array
+            arrays with one row for each trial and one column for each element of `variable
+            <DriftDiffusionIntegrator.variable>`, that contain the value of the integral (i.e., +/- `threshold
+            <DriftDiffusionIntegrator.threshold>`) and the time at which it reached threshold;  the response time is
+            NaN for trials that did not reach threshold within **max_time_steps**.
+        """
+        if variable is None:
+            variable = self.defaults.variable
+        variable = np.atleast_1d(self.parameters._parse_initializer(np.asarray(variable, dtype=float)))
+        num_elements = len(variable)
+
+        rate = np.array(self._get_current_parameter_value(RATE, context)).astype(float)
+        noise = self._get_current_parameter_value(NOISE, context)
+        offset = self._get_current_parameter_value(OFFSET, context)
+        threshold = self._get_current_parameter_value(THRESHOLD, context)
+        time_step_size = self._get_current_parameter_value(TIME_STEP_SIZE, context)
+        non_decision_time = self._get_current_parameter_value('non_decision_time', context)
+        starting_value = self._get_current_parameter_value(INITIALIZER, context)
+        random_state = self._get_current_parameter_value("random_state", context)
+        if seed is not None:
+            # use a new random state of the same type as the function's
+            random_state = type(random_state)(seed=[seed])
+
+        def _per_element(param):
+            return np.broadcast_to(np.asarray(param, dtype=float).reshape(-1), (num_elements,))
+
+        # Trials are flattened into walkers, one for each element of each trial;
+        # the parameters of each walker are indexed by the element it integrates
+        drift = _per_element(rate * variable * time_step_size)
+        diffusion = _per_element(noise * np.sqrt(time_step_size))
+        offset = _per_element(offset)
+        threshold = _per_element(threshold)
+        time_step_size = _per_element(time_step_size)
+
+        num_walkers = num_trials * num_elements
+        active = np.arange(num_walkers)
+        element = active % num_elements
+        value = np.array(_per_element(self.parameters._parse_initializer(np.asarray(starting_value)))[element])
+        time = np.array(_per_element(non_decision_time)[element])
+
+        decision_values = np.zeros(num_walkers)
+        response_times = np.full(num_walkers, np.nan)
+
+        time_step = 0
+        while len(active) and (max_time_steps is None or time_step < max_time_steps):
+            value = np.clip(value + drift[element] + diffusion[element] * random_state.normal(size=len(active))
+                            + offset[element],
+                            -threshold[element], threshold[element])
+            time = time + time_step_size[element]
+            time_step += 1
+
+            finished = np.abs(value) >= threshold[element]
+            decision_values[active[finished]] = value[finished]
+            response_times[active[finished]] = time[finished]
+
+            running = ~finished
+            active, element, value, time = active[running], element[running], value[running], time[running]
+
+        # Trials that did not finish keep their last value
+        decision_values[active] = value
+
+        return (decision_values.reshape(num_trials, num_elements),
+                response_times.reshape(num_trials, num_elements))
+
     def _assign_to_mdf_model(self, model, input_id):
         import modeci_mdf.mdf as mdf
 
@@ -3189,6 +3413,71 @@ class DriftOnASphereIntegrator(IntegratorFunction):  # -------------------------
 
         return angle_function(value)
 
+    def _get_compilation_params(self):
+        # dimension is implied by the shapes of previous_value and the result
+        return [p for p in super()._get_compilation_params() if p.name != "dimension"]
+
+    def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out, *, tags:frozenset):
+        arg_in = pnlvm.helpers.unwrap_2d_array(builder, arg_in)
+        arg_out = pnlvm.helpers.unwrap_2d_array(builder, arg_out)
+
+        random_state = ctx.get_random_state_ptr(builder, self, state, params)
+        rand_f = ctx.get_normal_dist_function_by_state(random_state)
+        rand_val_ptr = builder.alloca(ctx.float_ty, name="random_out")
+
+        prev_ptr = ctx.get_param_or_state_ptr(builder, self, PREVIOUS_VALUE, state_struct_ptr=state)
+        prev_ptr = pnlvm.helpers.unwrap_2d_array(builder, prev_ptr)
+        assert len(prev_ptr.type.pointee) + 1 == len(arg_out.type.pointee)
+
+        # The drift is either a single value used for all coordinates,
+        # or one value per coordinate
+        assert len(arg_in.type.pointee) in {1, len(prev_ptr.type.pointee)}
+        sqrt_f = ctx.get_builtin("sqrt", [ctx.float_ty])
+
+        with pnlvm.helpers.array_ptr_loop(builder, prev_ptr, "integrate") as (b, index):
+            rate = self._gen_llvm_load_param(ctx, b, params, index, RATE)
+            noise = self._gen_llvm_load_param(ctx, b, params, index, NOISE)
+            offset = self._gen_llvm_load_param(ctx, b, params, index, OFFSET)
+            time_step_size = self._gen_llvm_load_param(ctx, b, params, index, TIME_STEP_SIZE)
+
+            drift_idx = index if len(arg_in.type.pointee) > 1 else ctx.int32_ty(0)
+            drift = b.load(b.gep(arg_in, [ctx.int32_ty(0), drift_idx]))
+
+            b.call(rand_f, [random_state, rand_val_ptr])
+            rand_val = b.load(rand_val_ptr)
+
+            # value = previous_value + rate * drift * time_step_size
+            #       + np.sqrt(time_step_size * noise) * random_draw + offset
+            val_ptr = b.gep(prev_ptr, [ctx.int32_ty(0), index])
+            val = b.fmul(rate, drift)
+            val = b.fmul(val, time_step_size)
+            val = b.fadd(b.load(val_ptr), val)
+
+            factor = b.call(sqrt_f, [b.fmul(time_step_size, noise)])
+            val = b.fadd(val, b.fmul(factor, rand_val))
+            val = b.fadd(val, offset)
+            b.store(val, val_ptr)
+
+        # previous_time has the shape of the variable
+        prev_time_ptr = ctx.get_param_or_state_ptr(builder, self, "previous_time", state_struct_ptr=state)
+        prev_time_ptr = pnlvm.helpers.unwrap_2d_array(builder, prev_time_ptr)
+        with pnlvm.helpers.array_ptr_loop(builder, prev_time_ptr, "update_time") as (b, index):
+            time_step_size = self._gen_llvm_load_param(ctx, b, params, ctx.int32_ty(0), TIME_STEP_SIZE)
+            time_ptr = b.gep(prev_time_ptr, [ctx.int32_ty(0), index])
+            b.store(b.fadd(b.load(time_ptr), time_step_size), time_ptr)
+
+        # Return the angle of the updated coordinates
+        angle_f = ctx.import_llvm_function(self.parameters.angle_function.default_value)
+        angle_params = ctx.get_param_or_state_ptr(builder, self, "angle_function", param_struct_ptr=params)
+        # The angle function is only included in the state structure if it is stateful
+        if "angle_function" in self.llvm_state_ids:
+            angle_state = ctx.get_param_or_state_ptr(builder, self, "angle_function", state_struct_ptr=state)
+        else:
+            angle_state = builder.alloca(angle_f.args[1].type.pointee, name="angle_state")
+        builder.call(angle_f, [angle_params, angle_state, prev_ptr, arg_out])
+
+        return builder
+
     def reset(self, previous_value=None, previous_time=None, context=None):
         return super().reset(
             previous_value=previous_value,
@@ -3559,6 +3848,62 @@ class OrnsteinUhlenbeckIntegrator(IntegratorFunction):  # ----------------------
         self.parameters.previous_value._set(previous_value, context)
         return previous_value, previous_time
 
+    def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out, *, tags:frozenset):
+        # A single random draw is shared by all elements of the variable
+        random_state = ctx.get_random_state_ptr(builder, self, state, params)
+        rand_val_ptr = builder.alloca(ctx.float_ty, name="random_out")
+        rand_f = ctx.get_normal_dist_function_by_state(random_state)
+        builder.call(rand_f, [random_state, rand_val_ptr])
+        rand_val = builder.load(rand_val_ptr)
+
+        arg_in = pnlvm.helpers.unwrap_2d_array(builder, arg_in)
+        with pnlvm.helpers.array_ptr_loop(builder, arg_in, "integrate") as (b, index):
+            self._gen_llvm_integrate(b, index, ctx, arg_in, arg_out, params, state, rand_val)
+
+        return builder
+
+    def _gen_llvm_integrate(self, builder, index, ctx, vi, vo, params, state, rand_val):
+        rate = self._gen_llvm_load_param(ctx, builder, params, index, RATE)
+        decay = self._gen_llvm_load_param(ctx, builder, params, index, DECAY)
+        noise = self._gen_llvm_load_param(ctx, builder, params, index, NOISE)
+        offset = self._gen_llvm_load_param(ctx, builder, params, index, OFFSET)
+        time_step_size = self._gen_llvm_load_param(ctx, builder, params, index, TIME_STEP_SIZE)
+
+        # Get state pointers
+        prev_ptr = ctx.get_param_or_state_ptr(builder, self, PREVIOUS_VALUE, state_struct_ptr=state)
+        prev_ptr = pnlvm.helpers.unwrap_2d_array(builder, prev_ptr)
+        prev_time_ptr = ctx.get_param_or_state_ptr(builder, self, "previous_time", state_struct_ptr=state)
+
+        # value = previous_value + (decay * previous_value - rate * variable) * time_step_size
+        #       + np.sqrt(time_step_size * noise) * random_state.normal()
+        prev_val_ptr = builder.gep(prev_ptr, [ctx.int32_ty(0), index])
+        prev_val = builder.load(prev_val_ptr)
+
+        val = builder.load(builder.gep(vi, [ctx.int32_ty(0), index]))
+        val = builder.fmul(val, rate)
+        val = builder.fsub(builder.fmul(prev_val, decay), val)
+        val = builder.fmul(val, time_step_size)
+        val = builder.fadd(prev_val, val)
+
+        sqrt_f = ctx.get_builtin("sqrt", [ctx.float_ty])
+        factor = builder.call(sqrt_f, [builder.fmul(time_step_size, noise)])
+        val = builder.fadd(val, builder.fmul(factor, rand_val))
+
+        val = builder.fadd(val, offset)
+
+        # Store value result
+        data_vo_ptr = pnlvm.helpers.unwrap_2d_array(builder, builder.gep(vo, [ctx.int32_ty(0), ctx.int32_ty(0)]))
+        builder.store(val, builder.gep(data_vo_ptr, [ctx.int32_ty(0), index]))
+        builder.store(val, prev_val_ptr)
+
+        # Update timestep
+        prev_time_ptr = builder.gep(prev_time_ptr, [ctx.int32_ty(0), index])
+        curr_time = builder.fadd(builder.load(prev_time_ptr), time_step_size)
+        builder.store(curr_time, prev_time_ptr)
+
+        time_vo_ptr = builder.gep(vo, [ctx.int32_ty(0), ctx.int32_ty(1), index])
+        builder.store(curr_time, time_vo_ptr)
+
     def reset(self, previous_value=None, previous_time=None, context=None):
         return super().reset(
             previous_value=previous_value,
@@ -23,6 +23,8 @@ Functions that store and can return a record of their input.
 
 """
 
+import abc
+import bisect
 import copy
 import itertools
 import numbers
@@ -44,20 +46,479 @@ from psyneulink.core.components.functions.nonstateful.transferfunctions import S
 from psyneulink.core.components.functions.stateful.integratorfunctions import StatefulFunction
 from psyneulink.core.globals.context import handle_external_context
 from psyneulink.core.globals.keywords import \
-    ADDITIVE_PARAM, BUFFER_FUNCTION, MEMORY_FUNCTION, COSINE, \
-    ContentAddressableMemory_FUNCTION, DictionaryMemory_FUNCTION, \
+    ADDITIVE_PARAM, ALL, BUFFER_FUNCTION, MEMORY_FUNCTION, CORRELATION, COSINE, COSINE_SIMILARITY, DIFFERENCE, \
+    EUCLIDEAN, GAIN, MAX_ABS_DIFF, ContentAddressableMemory_FUNCTION, DictionaryMemory_FUNCTION, \
     MIN_INDICATOR, MIN_VAL, MULTIPLICATIVE_PARAM, NEWEST, NOISE, OLDEST, OVERWRITE, RATE, RANDOM, SINGLE, WEIGHTED
 from psyneulink.core.globals.parameters import Parameter, check_user_specified, copy_parameter_value
 from psyneulink.core.globals.preferences.basepreferenceset import ValidPrefSet
 from psyneulink.core.globals.utilities import \
     all_within_range, convert_all_elements_to_np_array, convert_to_np_array, convert_to_list, is_numeric_scalar
 
-__all__ = ['MemoryFunction', 'Buffer', 'DictionaryMemory', 'ContentAddressableMemory', 'RETRIEVAL_PROB', 'STORAGE_PROB']
+__all__ = ['MemoryFunction', 'Buffer', 'DictionaryMemory', 'ContentAddressableMemory', 'RETRIEVAL_PROB', 'STORAGE_PROB',
+           'MemoryIndex', 'FlatIndex', 'LSHIndex']
+
+
+class MemoryIndex(abc.ABC):
+    """Abstract base class for indices of the entries in the memory of a `ContentAddressableMemory` or `DictionaryMemory`.
+
+    An index is specified in the **memory_index** argument of the memory Function's constructor, and is used to
+    select the candidate entries (identified by their position in memory) for which distances to the cue are
+    computed on retrieval, instead of computing them for every entry in memory.  The memory Function creates a
+    separate (empty) copy of the specified index for each `execution context <Context>` in which it is executed,
+    and keeps it up to date as entries are stored (including those evicted when `max_entries` is exceeded),
+    overwritten or deleted.  Each entry is indexed by a vector:  its key for `DictionaryMemory`, and all of its
+    fields concatenated for `ContentAddressableMemory`.
+
+    Subclasses must implement `append`, `replace`, `delete`, `clear` and `candidates`.
+
+    Attributes
+    ----------
+
+    size : int
+        the number of entries indexed.
+
+    version : int or None
+        the version of the memory with which the index is in sync (see `MemoryFunction._memory_changed`).
+    """
+
+    def __init__(self):
+        self.size = 0
+        self.version = None
+
+    def _new_index(self, metric=None):
+        """Return an empty index with the same configuration, for use in a new execution context"""
+        index = copy.deepcopy(self)
+        index.clear()
+        return index
+
+    def build(self, vectors):
+        """Clear the index, and add an entry for each of **vectors** in order"""
+        self.clear()
+        for vector in vectors:
+            self.append(vector)
+
+    @abc.abstractmethod
+    def append(self, vector):
+        """Add an entry for **vector** as the last (newest) position in memory"""
+        pass
+
+    @abc.abstractmethod
+    def replace(self, position, vector):
+        """Replace the entry at **position** in memory with one for **vector**"""
+        pass
+
+    @abc.abstractmethod
+    def delete(self, position):
+        """Remove the entry at **position** in memory (later entries move down by one position)"""
+        pass
+
+    @abc.abstractmethod
+    def clear(self):
+        """Remove all entries"""
+        pass
+
+    @abc.abstractmethod
+    def candidates(self, query):
+        """Return 1d array with the positions (in ascending order) of candidate entries for **query**"""
+        pass
+
+
+class FlatIndex(MemoryIndex):
+    """Exact index, for which every entry in memory is a candidate for retrieval.
+
+    This produces the same results as not specifying an index (i.e., an exhaustive search of memory), and can be
+    used as a baseline for assessing the recall of an approximate index (such as `LSHIndex`).
+    """
+
+    def append(self, vector):
+        self.size += 1
+
+    def replace(self, position, vector):
+        pass
+
+    def delete(self, position):
+        self.size -= 1
+
+    def clear(self):
+        self.size = 0
+
+    def candidates(self, query):
+        return np.arange(self.size)
+
+
+class LSHIndex(MemoryIndex):
+    """Approximate index using locality sensitive hashing (LSH) of entries by random projections.
+
+    Each entry is hashed into a bucket of each of **num_tables** hash tables, using a key computed from
+    **num_bits** random projections of its vector.  The candidates for a query are the entries that share a bucket
+    with it in at least one table.  For the *COSINE* (and *CORRELATION*) metric, each bit of a key is the side of a
+    random hyperplane on which the (normalized) vector lies;  the hyperplanes pass through the centroid of the
+    entries, which is recomputed (and all entries rehashed) each time the number of entries doubles.  For the
+    *EUCLIDEAN* metric (and other metrics based on differences), it is the projection onto a random line,
+    quantized into bins of width **bucket_width**.
+
+    The tradeoff between recall and latency is determined by **num_tables** (more tables increase the chance that
+    the best match is among the candidates, at the cost of more candidates and hashing) and **num_bits** (more bits
+    produce smaller buckets and so fewer candidates, at the cost of a lower chance that the best match is among
+    them).  If fewer than **min_candidates** are found for a query, all entries are used as candidates.
+
+    Arguments
+    ---------
+
+    num_tables : int : default 8
+        number of hash tables.
+
+    num_bits : int : default 8
+        number of projections used to compute the key for each table.
+
+    metric : COSINE | EUCLIDEAN | None : default None
+        metric for which the hash is designed;  if None, it is determined from the `metric <Distance.metric>` of
+        the memory Function's `distance_function <ContentAddressableMemory.distance_function>`.
+
+    bucket_width : float : default 1.0
+        width of the bins into which projections are quantized for the *EUCLIDEAN* metric; it should be
+        comparable to the distance between entries that are considered similar.
+
+    min_candidates : int : default 1
+        minimum number of candidates for a query, below which all entries are used as candidates.
+
+    seed : int : default 0
+        seed for the random projections.
+    """
+
+    _cosine_metrics = {COSINE, COSINE_SIMILARITY, CORRELATION}
+    _euclidean_metrics = {EUCLIDEAN, DIFFERENCE, MAX_ABS_DIFF}
+
+    def __init__(self, num_tables=8, num_bits=8, metric=None, bucket_width=1.0, min_candidates=1, seed=0):
+        if metric is not None and metric not in self._cosine_metrics | self._euclidean_metrics:
+            raise FunctionError(f"'metric' arg for {self.__class__.__name__} ({metric}) must be "
+                                f"{COSINE} or {EUCLIDEAN}.")
+        self.num_tables = num_tables
+        self.num_bits = num_bits
+        self.metric = metric
+        self.bucket_width = bucket_width
+        self.min_candidates = min_candidates
+        self.seed = seed
+        super().__init__()
+        self.clear()
+
+    def _new_index(self, metric=None):
+        if self.metric is None:
+            if metric not in self._cosine_metrics | self._euclidean_metrics:
+                raise FunctionError(f"{self.__class__.__name__} cannot be used with a distance_function that uses "
+                                    f"{metric if metric is not None else 'an unknown'} metric; "
+                                    f"use {FlatIndex.__name__} or specify 'metric' for the "
+                                    f"{self.__class__.__name__}.")
+            index = super()._new_index()
+            index.metric = metric
+            return index
+        return super()._new_index()
+
+    def clear(self):
+        self.size = 0
+        self._projections = None
+        self._offsets = None
+        self._center = None
+        self._size_at_centering = 0
+        self._tables = [{} for _ in range(self.num_tables)]
+        # ids of entries in order of their positions in memory (ascending, since entries are appended)
+        self._ids = []
+        self._vectors_of_ids = {}
+        self._keys_of_ids = {}
+        self._next_id = 0
+
+    def _prepare(self, vector):
+        """Return **vector** as it is hashed: normalized to unit length (after removing its mean, for CORRELATION)
+        for the cosine metrics, so that its hash depends only on its direction
+        """
+        vector = np.asarray(vector, dtype=float).ravel()
+        if self.metric in self._cosine_metrics:
+            if self.metric == CORRELATION:
+                vector = vector - np.mean(vector)
+            norm = np.linalg.norm(vector)
+            if norm:
+                vector = vector / norm
+        return vector
+
+    def _hash(self, vector):
+        if self._projections is None:
+            rng = np.random.default_rng(self.seed)
+            self._projections = rng.standard_normal((self.num_tables, self.num_bits, len(vector)))
+            self._offsets = rng.uniform(0, self.bucket_width, (self.num_tables, self.num_bits))
+        if self.metric in self._cosine_metrics:
+            # The hyperplanes pass through the centroid of the entries, rather than the origin, so that entries
+            # with similar directions (e.g., all with positive elements) are still spread across the buckets
+            if self._center is not None:
+                vector = vector - self._center
+            codes = (self._projections @ vector) > 0
+        else:
+            codes = np.floor((self._projections @ vector + self._offsets) / self.bucket_width).astype(np.int64)
+        return [c.tobytes() for c in codes]
+
+    def _add_keys(self, entry_id, vector):
+        keys = self._hash(vector)
+        for table, key in zip(self._tables, keys):
+            table.setdefault(key, set()).add(entry_id)
+        self._keys_of_ids[entry_id] = keys
+
+    def _remove_keys(self, entry_id):
+        for table, key in zip(self._tables, self._keys_of_ids.pop(entry_id)):
+            bucket = table[key]
+            bucket.discard(entry_id)
+            if not bucket:
+                del table[key]
+
+    def _recenter(self):
+        """Move the hyperplanes to the centroid of the entries, and rehash all of them"""
+        self._center = np.mean(list(self._vectors_of_ids.values()), axis=0)
+        self._size_at_centering = self.size
+        self._tables = [{} for _ in range(self.num_tables)]
+        self._keys_of_ids = {}
+        for entry_id, vector in self._vectors_of_ids.items():
+            self._add_keys(entry_id, vector)
+
+    def build(self, vectors):
+        self.clear()
+        for vector in vectors:
+            entry_id = self._next_id
+            self._next_id += 1
+            self._vectors_of_ids[entry_id] = self._prepare(vector)
+            self._ids.append(entry_id)
+            self.size += 1
+        if self.metric in self._cosine_metrics and self.size:
+            self._recenter()
+        else:
+            for entry_id, vector in self._vectors_of_ids.items():
+                self._add_keys(entry_id, vector)
+
+    def append(self, vector):
+        entry_id = self._next_id
+        self._next_id += 1
+        vector = self._prepare(vector)
+        self._vectors_of_ids[entry_id] = vector
+        self._ids.append(entry_id)
+        self.size += 1
+        # For the cosine metrics, the centroid is recomputed each time the number of entries doubles,
+        # so that rehashing the entries has a constant amortized cost per entry
+        if self.metric in self._cosine_metrics and self.size >= 2 * self._size_at_centering:
+            self._recenter()
+        else:
+            self._add_keys(entry_id, vector)
+
+    def replace(self, position, vector):
+        entry_id = self._ids[position]
+        self._remove_keys(entry_id)
+        vector = self._prepare(vector)
+        self._vectors_of_ids[entry_id] = vector
+        self._add_keys(entry_id, vector)
+
+    def delete(self, position):
+        entry_id = self._ids.pop(position)
+        self._remove_keys(entry_id)
+        del self._vectors_of_ids[entry_id]
+        self.size -= 1
+
+    def candidates(self, query):
+        if not self.size:
+            return np.arange(0)
+        candidate_ids = set()
+        for table, key in zip(self._tables, self._hash(self._prepare(query))):
+            candidate_ids.update(table.get(key, ()))
+        if len(candidate_ids) < self.min_candidates:
+            return np.arange(self.size)
+        return np.array(sorted(bisect.bisect_left(self._ids, i) for i in candidate_ids), dtype=int)
+
+
+class RingBuffer:
+    """Sequence of items of the same shape, stored in order (oldest first) in a preallocated array.
+
+    Used for the `previous_value <Buffer.previous_value>` of a `Buffer`.  As for a `collections.deque` with a
+    **maxlen**, appending an item to a full RingBuffer discards its oldest item.  The items occupy a single
+    contiguous block of a storage array that is twice as long as **maxlen**, so that appending an item and `array`
+    (a view of all of the items) never copy the stored items, except when the block reaches the end of the storage
+    array and is moved back to its start (once every **maxlen** appends).  If **maxlen** is None, the storage array
+    doubles in length whenever it is full.  The dtype of the storage array is that of the items (an object dtype
+    for ragged items);  it is promoted if an item, or a `decay`, requires it.
+
+    Arguments
+    ---------
+
+    items : iterable : default ()
+        items with which the RingBuffer is initialized (only the last **maxlen** are kept).
+
+    maxlen : int : default None
+        the maximum number of items stored;  if None, the number of items is unlimited.
+
+    Attributes
+    ----------
+
+    maxlen : int or None
+        the maximum number of items stored.
+
+    array : ndarray
+        view of the items stored, oldest first, with shape (len(RingBuffer), *item_shape);  modifying it modifies
+        the items stored.
+
+    item_shape : tuple
+        shape of the items stored.
+    """
+
+    _min_capacity = 16
+
+    def __init__(self, items=(), maxlen=None):
+        self.maxlen = maxlen
+        self._data = None
+        self._head = 0
+        self._length = 0
+
+        items = list(items)
+        if maxlen is not None:
+            items = items[max(len(items) - maxlen, 0):] if maxlen else []
+        for item in items:
+            self.append(item)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return iter(self.array)
+
+    def __getitem__(self, index):
+        return self.array[index]
+
+    def __array__(self, dtype=None, copy=None):
+        return np.array(self.array, dtype=dtype)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.array.tolist()}, maxlen={self.maxlen})'
+
+    def __deepcopy__(self, memo):
+        result = self.__class__(maxlen=self.maxlen)
+        if self._data is not None:
+            result._data = np.empty_like(self._data)
+            result._data[:self._length] = self.array
+            result._length = self._length
+        memo[id(self)] = result
+        return result
+
+    @property
+    def array(self):
+        if self._data is None:
+            return np.empty((0,))
+        return self._data[self._head:self._head + self._length]
+
+    @property
+    def item_shape(self):
+        if self._data is None:
+            return None
+        return self._data.shape[1:]
+
+    def _promote(self, *values):
+        dtype = np.result_type(self._data, *values)
+        if dtype != self._data.dtype:
+            self._data = self._data.astype(dtype)
+
+    def append(self, item):
+        """Add **item** as the newest item, discarding the oldest one if the RingBuffer is full"""
+        item = convert_all_elements_to_np_array(item)
+        if self.maxlen == 0:
+            return
+
+        # the shape of the items is set by the first one appended to an empty RingBuffer
+        if self._data is None or (self._length == 0 and item.shape != self.item_shape):
+            capacity = 2 * self.maxlen if self.maxlen is not None else self._min_capacity
+            self._data = np.empty((capacity, *item.shape), dtype=item.dtype)
+            self._head = 0
+        else:
+            self._promote(item)
+
+        if self._length == self.maxlen:
+            self._head += 1
+            self._length -= 1
+
+        end = self._head + self._length
+        if end == len(self._data):
+            if self.maxlen is None and self._length > len(self._data) // 2:
+                data = np.empty((2 * len(self._data), *self.item_shape), dtype=self._data.dtype)
+            else:
+                data = self._data
+            data[:self._length] = self.array
+            self._data = data
+            self._head = 0
+            end = self._length
+
+        self._data[end] = item
+        self._length += 1
+
+    def clear(self):
+        """Remove all items"""
+        self._head = 0
+        self._length = 0
+
+    def decay(self, rate, noise):
+        """Assign item * **rate** + **noise** to each item, in place"""
+        if self._data is None:
+            return
+        self._promote(rate, noise)
+        items = self.array
+        if np.any(rate != 1):
+            items *= rate
+        if np.any(noise != 0):
+            items += noise
 
 
 class MemoryFunction(StatefulFunction):  # -----------------------------------------------------------------------------
     componentType = MEMORY_FUNCTION
 
+    @staticmethod
+    def _index_vector(entry) -> np.ndarray:
+        """Return vector used to index **entry** (or key) in memory_index"""
+        return np.hstack(entry).astype(float)
+
+    def _get_memory_index(self, context, entries):
+        """Return the `MemoryIndex` for the memory in **context**, or None if memory_index is not specified.
+        The index is created (or rebuilt from **entries**, one for each entry or key in memory) if it is not in sync
+        with the current version of the memory (see `_memory_changed`)
+        """
+        memory_index = self.parameters.memory_index._get(context)
+        if memory_index is None:
+            return None
+
+        execution_id = getattr(context, 'execution_id', None)
+        try:
+            index = self._memory_indices[execution_id]
+        except KeyError:
+            distance_function = self.parameters.distance_function._get(context)
+            metric = distance_function.metric if isinstance(distance_function, Distance) else None
+            index = memory_index._new_index(metric)
+            self._memory_indices[execution_id] = index
+
+        version = self._memory_versions.get(execution_id, 0)
+        if index.version != version or index.size != len(entries):
+            index.build([self._index_vector(entry) for entry in entries])
+            index.version = version
+
+        return index
+
+    def _memory_changed(self, context, memory_index=None):
+        """Record a change to the memory in **context**.  Its memory_index is rebuilt when it is next used, unless
+        it is passed in **memory_index** (i.e., the index has already been updated to reflect the change).
+        """
+        execution_id = getattr(context, 'execution_id', None)
+        version = self._memory_versions.get(execution_id, 0) + 1
+        self._memory_versions[execution_id] = version
+        if memory_index is not None:
+            memory_index.version = version
+
+    def _delete_contexts(self, *contexts, check_simulation_storage=False, visited=None):
+        super()._delete_contexts(*contexts, check_simulation_storage=check_simulation_storage, visited=visited)
+        # Buffer has no memory index
+        if not hasattr(self, '_memory_indices'):
+            return
+        for context in contexts:
+            self._memory_indices.pop(context.execution_id, None)
+            self._memory_versions.pop(context.execution_id, None)
+
     # TODO: refactor to avoid skip of direct super
     def _update_default_variable(self, new_default_variable, context=None):
         if not self.parameters.initializer._user_specified:
@@ -69,6 +530,32 @@ class MemoryFunction(StatefulFunction):  # -------------------------------------
         # other stateful functions
         super(StatefulFunction, self)._update_default_variable(new_default_variable, context=context)
 
+    def _gen_llvm_flat_ptr(self, ctx, builder, ptr):
+        # View a float, or any array (or structure) of floats, as a 1d array
+        flat_type = pnlvm.ir.ArrayType(ctx.float_ty, self._gen_llvm_num_floats(ptr.type.pointee))
+        return builder.bitcast(ptr, flat_type.as_pointer())
+
+    @staticmethod
+    def _gen_llvm_num_floats(ty):
+        if isinstance(ty, pnlvm.ir.ArrayType):
+            return len(ty) * MemoryFunction._gen_llvm_num_floats(ty.element)
+        if isinstance(ty, pnlvm.ir.LiteralStructType):
+            return sum(MemoryFunction._gen_llvm_num_floats(t) for t in ty.elements)
+        return 1
+
+    def _gen_llvm_load_elem(self, ctx, builder, ptr, index):
+        # Load scalar, or element **index** of a flattened array, parameter
+        if not isinstance(ptr.type.pointee, pnlvm.ir.ArrayType):
+            return builder.load(ptr)
+        flat_ptr = self._gen_llvm_flat_ptr(ctx, builder, ptr)
+        if len(flat_ptr.type.pointee) == 1:
+            index = ctx.int32_ty(0)
+        return builder.load(builder.gep(flat_ptr, [ctx.int32_ty(0), index]))
+
+    def _gen_llvm_ring_buffer_ptrs(self, ctx, builder, state):
+        ring_buffer_ptr = ctx.get_param_or_state_ptr(builder, self, "ring_buffer", state_struct_ptr=state)
+        return (builder.gep(ring_buffer_ptr, [ctx.int32_ty(0), ctx.int32_ty(i)]) for i in range(3))
+
 
 class Buffer(MemoryFunction):  # ------------------------------------------------------------------------------
     """
@@ -86,7 +573,7 @@ class Buffer(MemoryFunction):  # -----------------------------------------------
     .. _Buffer:
 
     Append `variable <Buffer.variable>` to the end of `previous_value <Buffer.previous_value>` (i.e., right-append
-    to deque of previous inputs).
+    to the `RingBuffer` of previous inputs).
 
     .. note::
        Every appended item must have same shape as the first.
@@ -104,6 +591,11 @@ class Buffer(MemoryFunction):  # -----------------------------------------------
     If the length of the result exceeds `history <Buffer.history>`, delete the first item.
     Return `previous_value <Buffer.previous_value>` appended with `variable <Buffer.variable>`.
 
+    .. note::
+       Buffer can be compiled only if `history <Buffer.history>` is specified, `initializer <Buffer.initializer>`
+       has at least `history <Buffer.history>` items, and `noise <Buffer.noise>` is not a Function, so that
+       `function <Buffer.function>` always returns `history <Buffer.history>` items.
+
     Arguments
     ---------
 
@@ -112,18 +604,20 @@ class Buffer(MemoryFunction):  # -----------------------------------------------
         integrated.
 
     rate : float, list or 1d array : default 1.0
-        specifies a value applied multiplicatively to each item already stored in the deque on each call to `function
-        <Buffer.function>`;  must be in interval [0,1]
+        specifies a value applied multiplicatively to each item already stored in `previous_value
+        <Buffer.previous_value>` on each call to `function <Buffer.function>`;  must be in interval [0,1]
 
     noise : float or Function : default 0.0
-        specifies a random value added to each item already in the deque on each call to `function <Buffer.function>`
-        (see `noise <Buffer.noise>` for details).
+        specifies a random value added to each item already in `previous_value <Buffer.previous_value>` on each call
+        to `function <Buffer.function>` (see `noise <Buffer.noise>` for details).
 
     history : int : default None
-        specifies the maxlen of the deque, and hence `value <Buffer.value>`.
+        specifies the maximum number of items in `previous_value <Buffer.previous_value>`, and hence `value
+        <Buffer.value>`.
 
     initializer float, list or ndarray : default []
-        specifies a starting value for the deque;  if none is specified, the deque is initialized with an empty list.
+        specifies the items with which `previous_value <Buffer.previous_value>` starts;  if none is specified, it
+        starts out empty.
 
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterPort_Specification>` that specifies the parameters for the
@@ -143,30 +637,32 @@ class Buffer(MemoryFunction):  # -----------------------------------------------
     ----------
 
     variable : number or array
-        current input value appended to the end of the deque.
+        current input value appended to the end of `previous_value <Buffer.previous_value>`.
 
     rate : float or 1d array with all elements in interval [0,1]
-        multiplicatively applied to each item already in the deque on call to `function <Buffer.function>`;
-        implements exponential decay of stored items.
+        multiplicatively applied to each item already in `previous_value <Buffer.previous_value>` on call to
+        `function <Buffer.function>`;  implements exponential decay of stored items.
 
     noise : float or Function
-        random value added to each item of the deque in each call to `function <Buffer.function>`
-        (see `noise <Stateful_Noise>` for additional details).
+        random value added to each item of `previous_value <Buffer.previous_value>` in each call to `function
+        <Buffer.function>` (see `noise <Stateful_Noise>` for additional details).
 
     history : int
-        determines maxlen of the deque and the value returned by the `function <Buffer.function>`. If appending
-        `variable <Buffer.variable>` to `previous_value <Buffer.previous_value>` exceeds history, the first item of
+        determines the maximum number of items in `previous_value <Buffer.previous_value>` and the value returned by
+        the `function <Buffer.function>`. If appending `variable <Buffer.variable>` to `previous_value
+        <Buffer.previous_value>` exceeds history, the first item of
         `previous_value <Buffer.previous_value>` is deleted, and `variable <Buffer.variable>` is appended to it,
         so that `value <Buffer.previous_value>` maintains a constant length.  If history is not specified,
         the value returned continues to be extended indefinitely.
 
     initializer : float, list or ndarray
-        value assigned as the first item of the deque when the Function is initialized, or reset
+        items with which `previous_value <Buffer.previous_value>` starts when the Function is initialized, or reset
         if the **new_previous_value** argument is not specified in the call to `reset
         <StatefulFunction.reset>`.
 
-    previous_value : 1d array : default class_defaults.variable
-        state of the deque prior to appending `variable <Buffer.variable>` in the current call.
+    previous_value : RingBuffer
+        items stored prior to appending `variable <Buffer.variable>` in the current call;  it is updated in
+        place, and its `array <RingBuffer.array>` is a view of the items stored (oldest first).
 
     owner : Component
         `component <Component>` to which the Function has been assigned.
@@ -267,32 +763,38 @@ class Buffer(MemoryFunction):  # -----------------------------------------------
             prefs=prefs,
         )
 
+    def _validate_initializers(self, default_variable, context=None):
+        # initializer can also be a sequence of items, each with the shape of variable
+        initializer = self._get_current_parameter_value('initializer', context=context)
+        if (isinstance(initializer, (list, np.ndarray)) and len(initializer)
+                and all(np.shape(item) == np.shape(default_variable) for item in initializer)):
+            return
+        super()._validate_initializers(default_variable, context=context)
+
+    def _get_maxlen(self, context):
+        maxlen = self.parameters.history._get(context)
+        return maxlen.item() if maxlen is not None else None
+
     def _initialize_previous_value(self, initializer, context=None):
-        previous_value = deque(initializer, maxlen=self.parameters.history.get(context))
-        self.parameters.previous_value.set(previous_value, context, override=True)
+        previous_value = RingBuffer(initializer, maxlen=self._get_maxlen(context))
+        self.parameters.previous_value._set(previous_value, context)
 
         return previous_value
 
     def _instantiate_attributes_before_function(self, function=None, context=None):
-        self.parameters.previous_value._set(
-            self._initialize_previous_value(
-                self.parameters.initializer._get(context),
-                context
-            ),
-            context
-        )
+        self._initialize_previous_value(self.parameters.initializer._get(context), context)
 
     @handle_external_context(fallback_most_recent=True)
     def reset(self, previous_value=None, context=None):
         """
 
-        Clears the `previous_value <Buffer.previous_value>` deque.
+        Clears the `previous_value <Buffer.previous_value>` RingBuffer.
 
         If an argument is passed into reset or if the `initializer <Buffer.initializer>` attribute contains a
-        value besides [], then that value is used to start the new `previous_value <Buffer.previous_value>` deque.
-        Otherwise, the new `previous_value <Buffer.previous_value>` deque starts out empty.
+        value besides [], then that value is used to start the new `previous_value <Buffer.previous_value>` RingBuffer.
+        Otherwise, the new `previous_value <Buffer.previous_value>` RingBuffer starts out empty.
 
-        `value <Buffer.value>` takes on the same value as  `previous_value <Buffer.previous_value>`.
+        `value <Buffer.value>` takes on the same items as `previous_value <Buffer.previous_value>`, in a deque.
 
         """
         # no arguments were passed in -- use current values of initializer attributes
@@ -300,12 +802,11 @@ class Buffer(MemoryFunction):  # -----------------------------------------------
             previous_value = self._get_current_parameter_value("initializer", context)
 
         if previous_value is None or np.asarray(previous_value).size == 0:
-            self.parameters.previous_value._get(context).clear()
-            value = deque([], maxlen=self.parameters.history.get(context))
-
-        else:
-            value = self._initialize_previous_value(previous_value, context=context)
+            previous_value = []
 
+        # previous_value is updated in place, so value is a copy of its items
+        previous_value = self._initialize_previous_value(previous_value, context=context)
+        value = deque(np.array(previous_value), maxlen=previous_value.maxlen)
         self.parameters.value.set(value, context, override=True)
         return value
 
@@ -330,7 +831,7 @@ class Buffer(MemoryFunction):  # -----------------------------------------------
         Returns
         -------
 
-        updated value of deque : deque
+        updated items of previous_value : ndarray
 
         """
         rate = np.array(self._get_current_parameter_value(RATE, context)).astype(float)
@@ -338,30 +839,140 @@ class Buffer(MemoryFunction):  # -----------------------------------------------
         # execute noise if it is a function
         noise = self._try_execute_param(self._get_current_parameter_value(NOISE, context), variable, context=context)
 
-        # If this is an initialization run, leave deque empty (don't want to count it as an execution step);
+        # If this is an initialization run, leave previous_value empty (don't want to count it as an execution step);
         # Just return current input (for validation).
         if self.is_initializing:
             return variable
 
         previous_value = self.parameters.previous_value._get(context)
+        maxlen = self._get_maxlen(context)
+        if not isinstance(previous_value, RingBuffer) or previous_value.maxlen != maxlen:
+            # previous_value or history was assigned since the last call
+            previous_value = RingBuffer(previous_value, maxlen=maxlen)
 
         # Apply rate and/or noise, if they are specified, to all stored items
         if len(previous_value):
             # TODO: remove this shape hack when buffer shapes made consistent
-            noise = np.reshape(noise, np.asarray(previous_value[0]).shape)
-            variable = np.reshape(variable, np.asarray(previous_value[0]).shape)
-            previous_value = convert_to_np_array(previous_value) * rate + noise
+            noise = np.reshape(noise, previous_value.item_shape)
+            variable = np.reshape(variable, previous_value.item_shape)
+            previous_value.decay(rate, noise)
 
-        maxlen = self.parameters.history._get(context)
-        previous_value = deque(
-            previous_value,
-            maxlen=maxlen.item() if maxlen is not None else None
-        )
+        previous_value.append(variable)
 
-        previous_value.append(copy_parameter_value(variable))
+        # previous_value is updated in place, so its history would only hold the same RingBuffer
+        self.parameters.previous_value._set(previous_value, context, skip_history=True)
+        return self.convert_output_type(np.array(previous_value))
 
-        self.parameters.previous_value._set(previous_value, context)
-        return self.convert_output_type(previous_value)
+    def _get_compilation_params(self):
+        # history is the fixed size of the compiled ring buffer
+        return [p for p in super()._get_compilation_params() if p.name != "history"]
+
+    def _get_item_shape(self):
+        initializer = self.defaults.initializer
+        if np.size(initializer):
+            return np.shape(initializer[0])
+        return np.shape(self.defaults.variable)
+
+    def _get_state_ids(self):
+        return super()._get_state_ids() + ["ring_buffer"]
+
+    def _get_state_struct_type(self, ctx):
+        # Construct a circular buffer of 'history' items,
+        # with the position of the oldest item and the number of items
+        history = self.parameters.history.get()
+        assert history is not None, f"{self.name}: compiled Buffer requires 'history'"
+        # The compiled output has a fixed number of items, the buffer must be full from the start
+        assert len(np.atleast_1d(self.defaults.initializer)) >= history, \
+            f"{self.name}: compiled Buffer requires at least 'history' ({history}) items in 'initializer'"
+        item_type = pnlvm.helpers.array_from_shape(self._get_item_shape(), ctx.float_ty)
+        ring_buffer_struct = pnlvm.ir.LiteralStructType((
+            pnlvm.ir.ArrayType(item_type, history), ctx.int32_ty, ctx.int32_ty))
+        generic_struct = ctx.get_state_struct_type(super())
+        return pnlvm.ir.LiteralStructType((*generic_struct, ring_buffer_struct))
+
+    def _get_state_initializer(self, context):
+        history = self.parameters.history.get(context)
+        stored = np.array(self.parameters.previous_value._get(context))[-history:]
+        assert len(stored) == history, f"{self.name}: compiled Buffer requires 'history' ({history}) stored items"
+        ring_buffer_init = pnlvm._tupleize([stored, 0, history])
+        return (*super()._get_state_initializer(context), ring_buffer_init)
+
+    def _get_output_struct_type(self, ctx):
+        # The buffer is always full, the output has 'history' items
+        state_struct = ctx.get_state_struct_type(self)
+        return state_struct.elements[-1].elements[0]
+
+    def _copy_compiled_ring_buffer(self, ring_buffer, context):
+        items, head, length = (ring_buffer[name] for name in ring_buffer.dtype.names)
+        order = (int(head) + np.arange(int(length))) % len(items)
+        previous_value = RingBuffer(items[order], maxlen=len(items))
+        self.parameters.previous_value._set(previous_value, context, skip_history=True, skip_log=True)
+
+    def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out, *, tags:frozenset):
+        items_ptr, head_ptr, length_ptr = self._gen_llvm_ring_buffer_ptrs(ctx, builder, state)
+        history = ctx.int32_ty(len(items_ptr.type.pointee))
+        head = builder.load(head_ptr)
+        length = builder.load(length_ptr)
+
+        rate_ptr = ctx.get_param_or_state_ptr(builder, self, RATE, param_struct_ptr=params)
+        noise_ptr = ctx.get_param_or_state_ptr(builder, self, NOISE, param_struct_ptr=params)
+        assert not isinstance(noise_ptr, tuple), f"{self.name}: noise functions are not supported in compiled Buffer"
+
+        # Apply rate and noise to all stored items
+        with pnlvm.helpers.for_loop_zero_inc(builder, length, "buffer_decay") as (b, i):
+            slot = b.urem(b.add(head, i), history)
+            item_ptr = self._gen_llvm_flat_ptr(ctx, b, b.gep(items_ptr, [ctx.int32_ty(0), slot]))
+            with pnlvm.helpers.array_ptr_loop(b, item_ptr, "buffer_decay_item") as (b2, j):
+                elem_ptr = b2.gep(item_ptr, [ctx.int32_ty(0), j])
+                elem = b2.fmul(b2.load(elem_ptr), self._gen_llvm_load_elem(ctx, b2, rate_ptr, j))
+                elem = b2.fadd(elem, self._gen_llvm_load_elem(ctx, b2, noise_ptr, j))
+                b2.store(elem, elem_ptr)
+
+        # Append variable, overwriting the oldest item if the buffer is full
+        full = builder.icmp_unsigned('==', length, history)
+        slot = builder.urem(builder.add(head, length), history)
+        item_ptr = self._gen_llvm_flat_ptr(ctx, builder, builder.gep(items_ptr, [ctx.int32_ty(0), slot]))
+        var_ptr = self._gen_llvm_flat_ptr(ctx, builder, arg_in)
+        assert len(var_ptr.type.pointee) == len(item_ptr.type.pointee)
+        builder.store(builder.load(var_ptr), item_ptr)
+
+        head = builder.select(full, builder.urem(builder.add(head, head.type(1)), history), head)
+        length = builder.select(full, length, builder.add(length, length.type(1)))
+        builder.store(head, head_ptr)
+        builder.store(length, length_ptr)
+
+        # Output the stored items, oldest first
+        builder.store(arg_out.type.pointee(None), arg_out)
+        with pnlvm.helpers.for_loop_zero_inc(builder, length, "buffer_output") as (b, i):
+            slot = b.urem(b.add(head, i), history)
+            item = b.load(b.gep(items_ptr, [ctx.int32_ty(0), slot]))
+            b.store(item, b.gep(arg_out, [ctx.int32_ty(0), i]))
+
+        return builder
+
+    def _gen_llvm_function_reset(self, ctx, builder, params, state, arg_in, arg_out, *, tags:frozenset):
+        assert "reset" in tags
+        items_ptr, head_ptr, length_ptr = self._gen_llvm_ring_buffer_ptrs(ctx, builder, state)
+        history = len(items_ptr.type.pointee)
+
+        # Refill the buffer with the last 'history' items of initializer
+        initializer_ptr = ctx.get_param_or_state_ptr(builder, self, "initializer", param_struct_ptr=params)
+        num_items = 0
+        if np.size(self.defaults.initializer):
+            num_items = len(initializer_ptr.type.pointee)
+            initializer_ptr = builder.bitcast(
+                initializer_ptr, pnlvm.ir.ArrayType(items_ptr.type.pointee.element, num_items).as_pointer()
+            )
+        first_item = max(num_items - history, 0)
+        for i in range(num_items - first_item):
+            src = builder.gep(initializer_ptr, [ctx.int32_ty(0), ctx.int32_ty(first_item + i)])
+            dst = builder.gep(items_ptr, [ctx.int32_ty(0), ctx.int32_ty(i)])
+            builder.store(builder.load(src), dst)
+
+        builder.store(ctx.int32_ty(0), head_ptr)
+        builder.store(ctx.int32_ty(num_items - first_item), length_ptr)
+
+        return builder
 
 
 RETRIEVAL_PROB = 'retrieval_prob'
@@ -432,6 +1043,7 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
         duplicate_threshold=0,                       \
         equidistant_entries_select=RANDOM,           \
         max_entries=None,                            \
+        memory_index=None,                           \
         params=None,                                 \
         owner=None,                                  \
         prefs=None,                                  \
@@ -874,6 +1486,10 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
         specifies the maximum number of entries allowed in `memory <ContentAddressableMemory.memory>`
         (see `max_entries <ContentAddressableMemory.max_entries>` for additional details).
 
+    memory_index : MemoryIndex : default None
+        specifies an index used to select the entries in `memory <ContentAddressableMemory.memory>` that are
+        considered for retrieval (see `memory_index <ContentAddressableMemory.memory_index>` for additional details).
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterPort_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -1009,6 +1625,17 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
         maximum number of entries allowed in `memory <ContentAddressableMemory.memory>`;  if storing a memory
         exceeds the number, the oldest memory is deleted.
 
+    memory_index : MemoryIndex or None
+        index used to select the candidate entries in `memory <ContentAddressableMemory.memory>` for retrieval;
+        `distance_function <ContentAddressableMemory.distance_function>` and `selection_function
+        <ContentAddressableMemory.selection_function>` are applied only to those entries (preserving their order in
+        memory), and the values of `distances_to_entries <ContentAddressableMemory.distances_to_entries>` are for
+        those entries.  A `FlatIndex` considers every entry (as does None);  an approximate index, such as
+        `LSHIndex`, considers only entries similar to the cue, which reduces the time required for retrieval from
+        large memories, at the cost of sometimes missing the best match.  The index is used only for retrieval in
+        Python mode; entries are indexed by all of their fields concatenated, irrespective of
+        `distance_field_weights <ContentAddressableMemory.distance_field_weights>`.
+
     previous_value : ndarray
         state of the `memory <ContentAddressableMemory.memory>` prior to storing `variable
         <ContentAddressableMemory.variable>` in the current call.
@@ -1121,6 +1748,12 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
                     :default value: 1000
                     :type: ``int``
 
+                memory_index
+                    see `memory_index <ContentAddressableMemory.memory_index>`
+
+                    :default value: None
+                    :type: `MemoryIndex`
+
                 noise
                     see `noise <ContentAddressableMemory.noise>`
 
@@ -1187,6 +1820,7 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
             0.0, modulable=True, aliases=[ADDITIVE_PARAM], setter=_noise_setter
         )
         max_entries = Parameter(1000)
+        memory_index = Parameter(None, stateful=False, loggable=False)
         random_state = Parameter(None, loggable=False, getter=_random_state_getter, dependencies='seed')
         seed = Parameter(DEFAULT_SEED(), modulable=True, fallback_default=True, setter=_seed_setter)
         distance_function = Parameter(Distance(metric=COSINE), stateful=False, loggable=False)
@@ -1251,12 +1885,16 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
                  duplicate_threshold:Optional[Union[int,float]]=None,
                  equidistant_entries_select:Optional[Union[str, Literal[RANDOM, OLDEST, NEWEST]]]=None,
                  max_entries:Optional[int]=None,
+                 memory_index:Optional[MemoryIndex]=None,
                  seed:Optional[int]=None,
                  params:Optional[Union[List, np.ndarray]]=None,
                  owner=None,
                  prefs:  Optional[ValidPrefSet] = None):
 
         self._memory = []
+        self._memory_indices = {}
+        self._memory_versions = {}
+        self._memory_storage = {}
 
         super().__init__(
             default_variable=default_variable,
@@ -1272,6 +1910,7 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
             rate=rate,
             noise=noise,
             max_entries=max_entries,
+            memory_index=memory_index,
             seed=seed,
             params=params,
             owner=owner,
@@ -1294,6 +1933,389 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
             for i in range(self.defaults.max_entries)
         ])
 
+    def _get_compilation_params(self):
+        # The shapes of the entries, handling of duplicates and selection of equidistant entries are fixed when
+        # compiling; rate is not used, and the distances are only reported by the Python implementation
+        blacklist = {RATE, "memory_num_fields", "memory_field_shapes", "duplicate_entries_allowed",
+                     "distance", "distances_by_field", "distances_to_entries"}
+        if self.parameters.duplicate_entries_allowed.get() is True:
+            blacklist.add("duplicate_threshold")
+        if self.selection_type == SINGLE:
+            # Single entries are selected directly from the distances
+            blacklist.add(SELECTION_FUNCTION)
+        return [p for p in super()._get_compilation_params() if p.name not in blacklist]
+
+    def _get_state_ids(self):
+        return super()._get_state_ids() + ["ring_buffer"]
+
+    def _get_state_struct_type(self, ctx):
+        # Construct a circular buffer of 'max_entries' entries,
+        # with the position of the oldest entry and the number of entries
+        entry_type = ctx.get_input_struct_type(self)
+        ring_buffer_struct = pnlvm.ir.LiteralStructType((
+            pnlvm.ir.ArrayType(entry_type, self.parameters.max_entries.get()), ctx.int32_ty, ctx.int32_ty))
+        generic_struct = ctx.get_state_struct_type(super())
+        return pnlvm.ir.LiteralStructType((*generic_struct, ring_buffer_struct))
+
+    def _get_state_initializer(self, context):
+        max_entries = self.parameters.max_entries.get(context)
+        memory = self.parameters.previous_value._get(context)
+        stored = [] if memory is None else list(memory[-max_entries:])
+        # use * 0 instead of zeros_like to deal with ragged entries
+        empty_entry = convert_all_elements_to_np_array(self.defaults.variable) * 0
+        entries = stored + [empty_entry] * (max_entries - len(stored))
+        ring_buffer_init = pnlvm._tupleize([entries, 0, len(stored)])
+        return (*super()._get_state_initializer(context), ring_buffer_init)
+
+    def _delete_contexts(self, *contexts, check_simulation_storage=False, visited=None):
+        super()._delete_contexts(*contexts, check_simulation_storage=check_simulation_storage, visited=visited)
+        for context in contexts:
+            self._memory_storage.pop(context.execution_id, None)
+
+    def _copy_compiled_ring_buffer(self, ring_buffer, context):
+        items, head, length = (ring_buffer[name] for name in ring_buffer.dtype.names)
+        order = (int(head) + np.arange(int(length))) % len(items)
+        entries = items[order]
+        if entries.dtype.names is not None:
+            # Entries with fields of different lengths are compiled as structures
+            entries = [[np.array(entry[name]) for name in entries.dtype.names] for entry in entries]
+        memory = convert_all_elements_to_np_array(entries) if len(entries) else None
+        self.parameters.previous_value._set(memory, context, skip_history=True, skip_log=True)
+        self._memory = memory if memory is not None else []
+        self._memory_changed(context)
+
+    @staticmethod
+    def _gen_llvm_field_types(entry_type):
+        if isinstance(entry_type, pnlvm.ir.LiteralStructType):
+            return list(entry_type.elements)
+        return [entry_type.element] * len(entry_type)
+
+    def _gen_llvm_entry_ptr(self, ctx, builder, items_ptr, head, index):
+        # Pointer to entry **index** of memory, oldest first
+        slot = builder.urem(builder.add(head, index), head.type(len(items_ptr.type.pointee)))
+        return builder.gep(items_ptr, [ctx.int32_ty(0), slot])
+
+    def _gen_llvm_entry_distance(self, ctx, builder, params, state, cue_ptr, entry_ptr):
+        """Return the distance between the entries at **cue_ptr** and **entry_ptr**,
+        as computed by _get_distance with granularity 'full_entry'
+        """
+        distance_f = self.parameters.distance_function.get()
+        assert isinstance(distance_f, Distance), \
+            f"{self.name}: compiled ContentAddressableMemory requires a Distance distance_function"
+        distance_params, _ = ctx.get_param_or_state_ptr(builder, self, DISTANCE_FUNCTION,
+                                                        param_struct_ptr=params, state_struct_ptr=state)
+
+        field_lengths = [self._gen_llvm_num_floats(t) for t in self._gen_llvm_field_types(cue_ptr.type.pointee)]
+        weights_ptr = ctx.get_param_or_state_ptr(builder, self, DISTANCE_FIELD_WEIGHTS, param_struct_ptr=params)
+        weights = [self._gen_llvm_load_elem(ctx, builder, weights_ptr, ctx.int32_ty(i))
+                   for i in range(len(field_lengths))]
+        homogeneous = ctx.bool_ty(1)
+        for weight in weights[1:]:
+            homogeneous = builder.and_(homogeneous, builder.fcmp_ordered('==', weight, weights[0]))
+
+        distance_ptr = builder.alloca(ctx.float_ty)
+        with builder.if_else(homogeneous) as (then, otherwise):
+            with then:
+                # Distance between the full entries, scaled by the (single) field weight
+                cue = builder.bitcast(cue_ptr, ctx.float_ty.as_pointer())
+                entry = builder.bitcast(entry_ptr, ctx.float_ty.as_pointer())
+                distance = distance_f._gen_llvm_distance(ctx, builder, distance_params, cue, entry,
+                                                         sum(field_lengths))
+                builder.store(builder.fmul(distance, weights[0]), distance_ptr)
+
+            with otherwise:
+                # Mean of the field-wise distances, weighted by the non-zero field weights
+                total = ctx.float_ty(0)
+                num_non_zero = ctx.float_ty(0)
+                for i, (weight, length) in enumerate(zip(weights, field_lengths)):
+                    cue_field = builder.gep(cue_ptr, [ctx.int32_ty(0), ctx.int32_ty(i), ctx.int32_ty(0)])
+                    entry_field = builder.gep(entry_ptr, [ctx.int32_ty(0), ctx.int32_ty(i), ctx.int32_ty(0)])
+                    distance = distance_f._gen_llvm_distance(ctx, builder, distance_params,
+                                                             cue_field, entry_field, length)
+                    non_zero = builder.fcmp_ordered('!=', weight, weight.type(0))
+                    total = builder.fadd(total, builder.select(non_zero, builder.fmul(distance, weight),
+                                                               total.type(0)))
+                    num_non_zero = builder.fadd(num_non_zero, builder.select(non_zero, num_non_zero.type(1),
+                                                                             num_non_zero.type(0)))
+                builder.store(builder.fdiv(total, num_non_zero), distance_ptr)
+
+        return builder.load(distance_ptr)
+
+    def _gen_llvm_random_event(self, ctx, builder, uniform_f, rand_struct, prob):
+        # prob == 1.0 or (prob > 0.0 and prob > random_state.uniform()),
+        # the random number is only drawn if it is needed to match Python
+        event_ptr = builder.alloca(ctx.bool_ty)
+        builder.store(builder.fcmp_ordered('==', prob, prob.type(1)), event_ptr)
+        draw = builder.and_(builder.fcmp_ordered('>', prob, prob.type(0)),
+                            builder.fcmp_ordered('!=', prob, prob.type(1)))
+        with builder.if_then(draw):
+            rand_ptr = builder.alloca(ctx.float_ty)
+            builder.call(uniform_f, [rand_struct, rand_ptr])
+            builder.store(builder.fcmp_ordered('>', prob, builder.load(rand_ptr)), event_ptr)
+
+        return builder.load(event_ptr)
+
+    def _gen_llvm_store_entry(self, ctx, builder, params, state, entry_ptr):
+        """Store the entry at **entry_ptr** as in _store_memory:  add noise, handle duplicates of existing
+        entries as specified by duplicate_entries_allowed and, if memory is full, replace the oldest entry
+        """
+        items_ptr, head_ptr, length_ptr = self._gen_llvm_ring_buffer_ptrs(ctx, builder, state)
+        max_entries = ctx.int32_ty(len(items_ptr.type.pointee))
+        head = builder.load(head_ptr)
+        length = builder.load(length_ptr)
+
+        # Add noise, which is a scalar, one value for each field of ragged entries,
+        # or one value for each element of a field (or of the entry) of regular ones
+        noise_ptr = ctx.get_param_or_state_ptr(builder, self, NOISE, param_struct_ptr=params)
+        assert not isinstance(noise_ptr, tuple), \
+            f"{self.name}: noise functions are not supported in compiled ContentAddressableMemory"
+        num_noise = self._gen_llvm_num_floats(noise_ptr.type.pointee)
+        ragged = isinstance(entry_ptr.type.pointee, pnlvm.ir.LiteralStructType)
+        new_entry_ptr = builder.alloca(entry_ptr.type.pointee)
+        offset = 0
+        for i, field_type in enumerate(self._gen_llvm_field_types(entry_ptr.type.pointee)):
+            field_idx = [ctx.int32_ty(0), ctx.int32_ty(i)]
+            src = self._gen_llvm_flat_ptr(ctx, builder, builder.gep(entry_ptr, field_idx))
+            dst = self._gen_llvm_flat_ptr(ctx, builder, builder.gep(new_entry_ptr, field_idx))
+            with pnlvm.helpers.array_ptr_loop(builder, src, "entry_noise_{}".format(i)) as (b, j):
+                if ragged:
+                    noise_idx = ctx.int32_ty(i)
+                elif num_noise == self._gen_llvm_num_floats(entry_ptr.type.pointee):
+                    noise_idx = b.add(j, j.type(offset))
+                else:
+                    noise_idx = j
+                noise = self._gen_llvm_load_elem(ctx, b, noise_ptr, noise_idx)
+                elem = b.load(b.gep(src, [ctx.int32_ty(0), j]))
+                b.store(b.fadd(elem, noise), b.gep(dst, [ctx.int32_ty(0), j]))
+            offset += self._gen_llvm_num_floats(field_type)
+
+        new_entry = builder.load(new_entry_ptr)
+        append = ctx.bool_ty(1)
+
+        # Find the first existing entry within duplicate_threshold of the new one
+        duplicate_entries_allowed = self.parameters.duplicate_entries_allowed.get()
+        if duplicate_entries_allowed is not True:
+            threshold_ptr = ctx.get_param_or_state_ptr(builder, self, "duplicate_threshold", param_struct_ptr=params)
+            threshold = pnlvm.helpers.load_extract_scalar_array_one(builder, threshold_ptr)
+            match_ptr = builder.alloca(ctx.int32_ty)
+            builder.store(length, match_ptr)
+            with pnlvm.helpers.for_loop_zero_inc(builder, length, "duplicates_loop") as (b, i):
+                existing_ptr = self._gen_llvm_entry_ptr(ctx, b, items_ptr, head, i)
+                distance = self._gen_llvm_entry_distance(ctx, b, params, state, new_entry_ptr, existing_ptr)
+                is_first_match = b.and_(b.fcmp_ordered('<=', distance, threshold),
+                                        b.icmp_unsigned('==', b.load(match_ptr), length))
+                with b.if_then(is_first_match):
+                    b.store(i, match_ptr)
+
+            match = builder.load(match_ptr)
+            matched = builder.icmp_unsigned('!=', match, length)
+            if duplicate_entries_allowed == OVERWRITE:
+                with builder.if_then(matched):
+                    builder.store(new_entry, self._gen_llvm_entry_ptr(ctx, builder, items_ptr, head, match))
+            append = builder.not_(matched)
+
+        # Append the entry, replacing the oldest one if memory is full
+        with builder.if_then(append):
+            full = builder.icmp_unsigned('==', length, max_entries)
+            builder.store(new_entry, self._gen_llvm_entry_ptr(ctx, builder, items_ptr, head, length))
+            new_head = builder.select(full, builder.urem(builder.add(head, head.type(1)), max_entries), head)
+            new_length = builder.select(full, length, builder.add(length, length.type(1)))
+            builder.store(new_head, head_ptr)
+            builder.store(new_length, length_ptr)
+
+    def _gen_llvm_select_entry(self, ctx, builder, params, state, cue_ptr, arg_out, uniform_f, rand_struct):
+        """Write the entry in memory that is selected for **cue_ptr** to **arg_out**, as in _select_entry"""
+        items_ptr, head_ptr, length_ptr = self._gen_llvm_ring_buffer_ptrs(ctx, builder, state)
+        head = builder.load(head_ptr)
+        length = builder.load(length_ptr)
+
+        # Distances of the cue to all entries
+        distances_ptr = builder.alloca(pnlvm.ir.ArrayType(ctx.float_ty, len(items_ptr.type.pointee)))
+        with pnlvm.helpers.for_loop_zero_inc(builder, length, "distances_loop") as (b, i):
+            entry_ptr = self._gen_llvm_entry_ptr(ctx, b, items_ptr, head, i)
+            distance = self._gen_llvm_entry_distance(ctx, b, params, state, cue_ptr, entry_ptr)
+            b.store(distance, b.gep(distances_ptr, [ctx.int32_ty(0), i]))
+
+        out_ptr = self._gen_llvm_flat_ptr(ctx, builder, arg_out)
+        selection_f = self.parameters.selection_function.get()
+
+        if self.selection_type == WEIGHTED:
+            # Sum of the entries, weighted by the softmax of their distances
+            assert isinstance(selection_f, SoftMax) and selection_f.output == ALL \
+                   and selection_f.mask_threshold is None, \
+                f"{self.name}: unsupported selection_function for compiled weighted retrieval: {selection_f}"
+            selection_params, _ = ctx.get_param_or_state_ptr(builder, self, SELECTION_FUNCTION,
+                                                             param_struct_ptr=params, state_struct_ptr=state)
+            gain_ptr = ctx.get_param_or_state_ptr(builder, selection_f, GAIN, param_struct_ptr=selection_params)
+            gain = pnlvm.helpers.load_extract_scalar_array_one(builder, gain_ptr)
+
+            max_ptr = builder.alloca(ctx.float_ty)
+            builder.store(ctx.float_ty(float("-inf")), max_ptr)
+            with pnlvm.helpers.for_loop_zero_inc(builder, length, "softmax_max") as (b, i):
+                value_ptr = b.gep(distances_ptr, [ctx.int32_ty(0), i])
+                value = b.fmul(b.load(value_ptr), gain)
+                b.store(value, value_ptr)
+                max_value = b.load(max_ptr)
+                b.store(b.select(b.fcmp_ordered('>', value, max_value), value, max_value), max_ptr)
+
+            sum_ptr = builder.alloca(ctx.float_ty)
+            builder.store(ctx.float_ty(0), sum_ptr)
+            max_value = builder.load(max_ptr)
+            with pnlvm.helpers.for_loop_zero_inc(builder, length, "softmax_exp") as (b, i):
+                value_ptr = b.gep(distances_ptr, [ctx.int32_ty(0), i])
+                value = pnlvm.helpers.exp(ctx, b, b.fsub(b.load(value_ptr), max_value))
+                b.store(value, value_ptr)
+                b.store(b.fadd(b.load(sum_ptr), value), sum_ptr)
+
+            exp_sum = builder.load(sum_ptr)
+            with pnlvm.helpers.for_loop_zero_inc(builder, length, "weighted_sum") as (b, i):
+                weight = b.fdiv(b.load(b.gep(distances_ptr, [ctx.int32_ty(0), i])), exp_sum)
+                entry_ptr = self._gen_llvm_flat_ptr(ctx, b, self._gen_llvm_entry_ptr(ctx, b, items_ptr, head, i))
+                with pnlvm.helpers.array_ptr_loop(b, entry_ptr, "weighted_sum_entry") as (b2, j):
+                    elem = b2.fmul(b2.load(b2.gep(entry_ptr, [ctx.int32_ty(0), j])), weight)
+                    out_elem_ptr = b2.gep(out_ptr, [ctx.int32_ty(0), j])
+                    b2.store(b2.fadd(b2.load(out_elem_ptr), elem), out_elem_ptr)
+            return
+
+        # Entry with the smallest distance
+        assert isinstance(selection_f, OneHot) and selection_f.mode in {MIN_INDICATOR, MIN_VAL,
+                                                                       ARG_MIN, ARG_MIN_INDICATOR}, \
+            f"{self.name}: unsupported selection_function for compiled retrieval: {selection_f}"
+        min_ptr = builder.alloca(ctx.float_ty)
+        builder.store(ctx.float_ty(float("inf")), min_ptr)
+        selected_ptr = builder.alloca(ctx.int32_ty)
+        builder.store(ctx.int32_ty(0), selected_ptr)
+        with pnlvm.helpers.for_loop_zero_inc(builder, length, "min_distance") as (b, i):
+            distance = b.load(b.gep(distances_ptr, [ctx.int32_ty(0), i]))
+            with b.if_then(b.fcmp_ordered('<', distance, b.load(min_ptr))):
+                b.store(distance, min_ptr)
+                b.store(i, selected_ptr)
+        min_distance = builder.load(min_ptr)
+
+        def _is_tied(b, i):
+            return b.fcmp_ordered('==', b.load(b.gep(distances_ptr, [ctx.int32_ty(0), i])), min_distance)
+
+        duplicate = ctx.bool_ty(0)
+        if selection_f.mode in {MIN_INDICATOR, MIN_VAL}:
+            # All equidistant entries are selected by the selection_function
+            num_tied_ptr = builder.alloca(ctx.int32_ty)
+            builder.store(ctx.int32_ty(0), num_tied_ptr)
+            last_ptr = builder.alloca(ctx.int32_ty)
+            builder.store(ctx.int32_ty(0), last_ptr)
+            with pnlvm.helpers.for_loop_zero_inc(builder, length, "tied_entries") as (b, i):
+                with b.if_then(_is_tied(b, i)):
+                    b.store(b.add(b.load(num_tied_ptr), ctx.int32_ty(1)), num_tied_ptr)
+                    b.store(i, last_ptr)
+            num_tied = builder.load(num_tied_ptr)
+            multiple = builder.icmp_unsigned('>', num_tied, num_tied.type(1))
+
+            if not self.parameters.duplicate_entries_allowed.get():
+                # Zeros are returned if any of the equidistant entries are duplicates
+                threshold_ptr = ctx.get_param_or_state_ptr(builder, self, "duplicate_threshold",
+                                                           param_struct_ptr=params)
+                threshold = pnlvm.helpers.load_extract_scalar_array_one(builder, threshold_ptr)
+                duplicate_ptr = builder.alloca(ctx.bool_ty)
+                builder.store(ctx.bool_ty(0), duplicate_ptr)
+                with builder.if_then(multiple):
+                    with pnlvm.helpers.for_loop_zero_inc(builder, length, "duplicates_outer") as (b, i):
+                        with b.if_then(_is_tied(b, i)):
+                            entry_i = self._gen_llvm_entry_ptr(ctx, b, items_ptr, head, i)
+                            with pnlvm.helpers.for_loop(b, b.add(i, i.type(1)), length, i.type(1),
+                                                        "duplicates_inner") as (b2, j):
+                                with b2.if_then(_is_tied(b2, j)):
+                                    entry_j = self._gen_llvm_entry_ptr(ctx, b2, items_ptr, head, j)
+                                    distance = self._gen_llvm_entry_distance(ctx, b2, params, state,
+                                                                             entry_i, entry_j)
+                                    with b2.if_then(b2.fcmp_ordered('<=', distance, threshold)):
+                                        b2.store(ctx.bool_ty(1), duplicate_ptr)
+                duplicate = builder.load(duplicate_ptr)
+
+            equidistant_entries_select = self.parameters.equidistant_entries_select.get()
+            if equidistant_entries_select == NEWEST:
+                builder.store(builder.load(last_ptr), selected_ptr)
+            elif equidistant_entries_select == RANDOM:
+                # The random number is only drawn if there is a choice to make, as in Python;
+                # it is not used in the same way as by numpy's choice(), so the selected entries may differ
+                with builder.if_then(builder.and_(multiple, builder.not_(duplicate))):
+                    rand_ptr = builder.alloca(ctx.float_ty)
+                    builder.call(uniform_f, [rand_struct, rand_ptr])
+                    choice = builder.fmul(builder.load(rand_ptr), builder.uitofp(num_tied, ctx.float_ty))
+                    choice = pnlvm.helpers.uint_min(builder, builder.fptoui(choice, ctx.int32_ty),
+                                                    builder.sub(num_tied, num_tied.type(1)))
+                    choice_ptr = builder.alloca(ctx.int32_ty)
+                    builder.store(choice, choice_ptr)
+                    with pnlvm.helpers.for_loop_zero_inc(builder, length, "random_tied_entry") as (b, i):
+                        with b.if_then(_is_tied(b, i)):
+                            remaining = b.load(choice_ptr)
+                            with b.if_then(b.icmp_unsigned('==', remaining, remaining.type(0))):
+                                b.store(i, selected_ptr)
+                            b.store(b.sub(remaining, remaining.type(1)), choice_ptr)
+            else:
+                assert equidistant_entries_select == OLDEST, \
+                    f"PROGRAM ERROR:  bad specification ({repr(equidistant_entries_select)}) for " \
+                    f"'equidistant_entries_select' parameter of {self.name}"
+
+        with builder.if_then(builder.not_(duplicate)):
+            entry_ptr = self._gen_llvm_entry_ptr(ctx, builder, items_ptr, head, builder.load(selected_ptr))
+            entry_ptr = self._gen_llvm_flat_ptr(ctx, builder, entry_ptr)
+            assert len(entry_ptr.type.pointee) == len(out_ptr.type.pointee)
+            builder.store(builder.load(entry_ptr), out_ptr)
+
+    def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out, *, tags:frozenset):
+        # PRNG
+        rand_struct = ctx.get_random_state_ptr(builder, self, state, params)
+        uniform_f = ctx.get_uniform_dist_function_by_state(rand_struct)
+
+        # Zero output
+        builder.store(arg_out.type.pointee(None), arg_out)
+
+        # Retrieval is disabled if all distance_field_weights are 0
+        weights_ptr = ctx.get_param_or_state_ptr(builder, self, DISTANCE_FIELD_WEIGHTS, param_struct_ptr=params)
+        any_weights = ctx.bool_ty(0)
+        for i in range(self._gen_llvm_num_floats(weights_ptr.type.pointee)):
+            weight = self._gen_llvm_load_elem(ctx, builder, weights_ptr, ctx.int32_ty(i))
+            any_weights = builder.or_(any_weights, builder.fcmp_ordered('!=', weight, weight.type(0)))
+
+        # Probs can be [x] if we are part of a mechanism
+        retrieval_prob_ptr = ctx.get_param_or_state_ptr(builder, self, RETRIEVAL_PROB, param_struct_ptr=params)
+        retrieval_prob = pnlvm.helpers.load_extract_scalar_array_one(builder, retrieval_prob_ptr)
+        retrieval_prob = builder.select(any_weights, retrieval_prob, retrieval_prob.type(0))
+        storage_prob_ptr = ctx.get_param_or_state_ptr(builder, self, STORAGE_PROB, param_struct_ptr=params)
+        storage_prob = pnlvm.helpers.load_extract_scalar_array_one(builder, storage_prob_ptr)
+
+        # Retrieve the entry that best matches variable (zeros if memory is empty)
+        retrieve = self._gen_llvm_random_event(ctx, builder, uniform_f, rand_struct, retrieval_prob)
+        _, _, length_ptr = self._gen_llvm_ring_buffer_ptrs(ctx, builder, state)
+        length = builder.load(length_ptr)
+        with builder.if_then(builder.and_(retrieve, builder.icmp_unsigned('!=', length, length.type(0)))):
+            self._gen_llvm_select_entry(ctx, builder, params, state, arg_in, arg_out, uniform_f, rand_struct)
+
+        # Store variable
+        store = self._gen_llvm_random_event(ctx, builder, uniform_f, rand_struct, storage_prob)
+        with builder.if_then(store):
+            self._gen_llvm_store_entry(ctx, builder, params, state, arg_in)
+
+        return builder
+
+    def _gen_llvm_function_reset(self, ctx, builder, params, state, arg_in, arg_out, *, tags:frozenset):
+        assert "reset" in tags
+        _, head_ptr, length_ptr = self._gen_llvm_ring_buffer_ptrs(ctx, builder, state)
+        builder.store(ctx.int32_ty(0), head_ptr)
+        builder.store(ctx.int32_ty(0), length_ptr)
+
+        # Store the entries of initializer, as in _initialize_previous_value
+        initializer_ptr = ctx.get_param_or_state_ptr(builder, self, "initializer", param_struct_ptr=params)
+        if np.size(self.defaults.initializer):
+            num_entries = len(initializer_ptr.type.pointee)
+            entry_type = ctx.get_input_struct_type(self)
+            initializer_ptr = builder.bitcast(initializer_ptr,
+                                              pnlvm.ir.ArrayType(entry_type, num_entries).as_pointer())
+            for i in range(num_entries):
+                entry_ptr = builder.gep(initializer_ptr, [ctx.int32_ty(0), ctx.int32_ty(i)])
+                self._gen_llvm_store_entry(ctx, builder, params, state, entry_ptr)
+
+        return builder
+
     def _validate(self, context=None):
         """Validate distance_function, selection_function and memory store"""
         distance_function = self.distance_function
@@ -1373,6 +2395,7 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
         self.parameters.memory_field_shapes.set([item.shape for item in initializer[0]],
                                                context=context, override=True)
         self.parameters.previous_value.set(None, context, override=True)
+        self._memory_changed(context)
 
         for entry in initializer:
             # Store each item, which also validates it by call to _validate_entry()
@@ -1416,6 +2439,9 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
         `previous_value <ContentAddressableMemory.previous_value>`.
         """
 
+        # Release the storage of the previous memory
+        self._memory_storage.pop(context.execution_id, None)
+
         if new_value is not None:
             value = self._initialize_previous_value(ContentAddressableMemory._enforce_memory_shape(new_value),
                                                     context=context)
@@ -1429,6 +2455,7 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
             else:
                 # no initializer, so clear previous_value and set value to None
                 self.parameters.previous_value._get(context).clear()
+                self._memory_changed(context)
                 value = None
 
         self.parameters.value.set(value, context, override=True)
@@ -1569,13 +2596,67 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
         cue = convert_all_elements_to_np_array(cue)
         self._validate_entry(cue, context)
 
+        # Restrict retrieval to candidate entries if an index is used
+        memory_index = self._get_memory_index(context, _memory)
+        candidates = None
+        if memory_index is not None:
+            candidates = memory_index.candidates(self._index_vector(cue))
+            if len(candidates) == len(_memory):
+                candidates = None
+            elif not len(candidates):
+                return self.uniform_entry(0, context)
+
         # Get mean of field-wise distances between cue each entry in memory
-        # FIX: REMOVE 8/20/23
-        # distances_to_entries = []
-        # for entry in _memory:
-        #     distances_to_entries.append(self._get_distance(cue, entry, field_weights, 'full_entry', context))
-        distances_to_entries = [self._get_distance(cue, entry, field_weights,'full_entry', context)
-                                for entry in self.memory]
+        distances_to_entries = self._get_distances_to_entries(
+            [cue], field_weights, context, _memory if candidates is None else _memory[candidates]
+        )[0]
+
+        return self._select_entry(cue, distances_to_entries, field_weights, context, candidates)
+
+    @handle_external_context()
+    def get_memories(self, cues:Union[list, np.ndarray], field_weights=None, context=None) -> np.ndarray:
+        """get_memories(cues, context=None)
+
+        Retrieve an entry from `memory <ContentAddressableMemory.memory>` for each of a batch of cues, in the same
+        way as `get_memory <ContentAddressableMemory.get_memory>`.  The distances of all of the cues to all entries
+        in memory are computed together (see `_get_distances_to_entries
+        <ContentAddressableMemory._get_distances_to_entries>`), and then used to select an entry for each cue.
+
+        Arguments
+        ---------
+        cues : list or 3d array
+          list of cues, each of which must have same number and shapes of fields as existing entries in `memory
+          <ContentAddressableMemory.memory>`.
+
+        Returns
+        -------
+        entries retrieved : 3d array
+          one entry for each cue, in the same order as **cues**.
+        """
+        cues = [convert_all_elements_to_np_array(cue) for cue in cues]
+        for cue in cues:
+            self._validate_entry(cue, context)
+
+        _memory = self.parameters.previous_value._get(context)
+        if _memory is None:
+            return convert_all_elements_to_np_array([self.uniform_entry(0, context) for cue in cues])
+
+        # Candidates selected by an index differ for each cue
+        if self.parameters.memory_index._get(context) is not None:
+            return convert_all_elements_to_np_array([self.get_memory(cue, field_weights, context=context)
+                                                     for cue in cues])
+
+        distances_to_entries = self._get_distances_to_entries(cues, field_weights, context)
+        return convert_all_elements_to_np_array([self._select_entry(cue, distances, field_weights, context)
+                                                 for cue, distances in zip(cues, distances_to_entries)])
+
+    def _select_entry(self, cue:np.ndarray, distances_to_entries, field_weights, context, candidates=None):
+        """Select entry in `memory <ContentAddressableMemory.memory>` for **cue** given its distances to entries
+        If **candidates** is specified, distances_to_entries are for the entries in memory at those positions
+        """
+        _memory = self.parameters.previous_value._get(context)
+        if candidates is not None:
+            _memory = _memory[candidates]
 
         # Get the best-match(es) in memory based on selection_function and return as non-zero value(s) in an array
         selection_array = self.selection_function(distances_to_entries, context=context)
@@ -1657,6 +2738,7 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
                 raise FunctionError(f"'noise' for '{self.name}' of '{self.owner.name}' "
                                     f"not appropriate shape (single number or array of length {num_fields}.")
         existing_entries = self.parameters.previous_value._get(context)
+        memory_index = self._get_memory_index(context, [] if existing_entries is None else existing_entries)
 
         def format_for_storage(entry:np.ndarray) -> np.ndarray:
             """Format an entry to be added to memory
@@ -1680,7 +2762,14 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
 
         if existing_entries is not None:
             # Check for matches of entry with existing entries
-            matches = [m for m in existing_entries if len(m) and self._is_duplicate(entry, m, field_weights, context)]
+            #   (i.e., ones with a distance within duplicate_threshold; see _is_duplicate)
+            distances = self._get_broadcast_distances([entry], field_weights, context, existing_entries)
+            if distances is None:
+                matches = [m for m in existing_entries
+                           if len(m) and self._is_duplicate(entry, m, field_weights, context)]
+            else:
+                duplicate_threshold = self.parameters.duplicate_threshold.get(context)
+                matches = [m for m, d in zip(existing_entries, distances[0]) if d <= duplicate_threshold]
 
             # If duplicate entries are not allowed and entry matches any existing entries, don't store
             if matches and self.duplicate_entries_allowed is False:
@@ -1701,26 +2790,148 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
                     index = [i for i,e in enumerate(existing_entries) if np.all(e == matches[0])][0]
                 except ValueError:
                     index = existing_entries.tolist().index(entry)
+                # existing_entries may be a view of storage shared with previous values of memory
+                existing_entries = existing_entries.copy()
                 existing_entries[index] = entry
+                if memory_index is not None:
+                    memory_index.replace(index, self._index_vector(entry))
                 storage_succeeded = True
             else:
                 # Add to existing entries
-                existing_entries = np.append(existing_entries, format_for_storage(entry), axis=0)
+                existing_entries, evicted = self._append_to_memory(existing_entries, format_for_storage(entry),
+                                                                   context)
+                if memory_index is not None:
+                    memory_index.append(self._index_vector(entry))
+                    if evicted:
+                        memory_index.delete(0)
                 storage_succeeded = True
 
         else:
             # No entries yet, so add new one
             existing_entries = format_for_storage(entry)
+            if memory_index is not None:
+                memory_index.append(self._index_vector(entry))
             storage_succeeded = True
 
-        if len(existing_entries) > self.max_entries:
+        if len(existing_entries) > self._get_current_parameter_value('max_entries', context):
             existing_entries = np.delete(existing_entries,0,axis=0)
+            if memory_index is not None:
+                memory_index.delete(0)
 
         self.parameters.previous_value._set(existing_entries,context)
+        self._memory_changed(context, memory_index)
         self._memory = existing_entries
 
         return storage_succeeded
 
+    def _append_to_memory(self, existing_entries:np.ndarray, entry:np.ndarray, context):
+        """Return **existing_entries** with **entry** (formatted for storage) appended, without its oldest entry if
+        that would exceed max_entries, and whether the oldest entry was removed.
+
+        Entries are kept in an array preallocated for each execution context, that grows geometrically as needed, and
+        the memory returned is a view of it, so that the existing entries are not copied each time one is added.
+        Only the part of the array after the memory is written, so views returned previously remain unchanged.
+        """
+        execution_id = getattr(context, 'execution_id', None)
+        storage, start, memory = self._memory_storage.get(execution_id, (None, 0, None))
+        num_entries = len(existing_entries)
+        dtype = np.result_type(existing_entries, entry)
+
+        # Reallocate if memory was assigned some other way, or if there is no room for the entry
+        if memory is not existing_entries or storage.dtype != dtype or start + num_entries == len(storage):
+            storage = np.empty((2 * (num_entries + 1), *existing_entries.shape[1:]), dtype=dtype)
+            storage[:num_entries] = existing_entries
+            start = 0
+
+        storage[start + num_entries] = entry[0]
+        evicted = num_entries + 1 > self._get_current_parameter_value('max_entries', context)
+        if evicted:
+            start += 1
+        else:
+            num_entries += 1
+
+        memory = storage[start:start + num_entries]
+        self._memory_storage[execution_id] = (storage, start, memory)
+        return memory, evicted
+
+    def _get_distances_to_entries(self, cues:Union[list, np.ndarray], field_weights, context, memory=None):
+        """Get distances of each of **cues** to every entry in **memory** (default: `memory
+        <ContentAddressableMemory.memory>`), as computed by `_get_distance <ContentAddressableMemory._get_distance>`
+        with granularity 'full_entry'.
+
+        If `distance_function <ContentAddressableMemory.distance_function>` is a `Distance` Function, all fields of
+        the cues and entries have the same length (i.e., memory is a regular 3d array), and each of
+        **field_weights** is a scalar, the distances for all cues and entries are computed in a single (broadcast)
+        operation;  otherwise, `_get_distance <ContentAddressableMemory._get_distance>` is called for each pair.
+
+        :returns
+            2d array with a row of distances to the entries for each cue;
+            list of lists if the distances could not be computed in a single operation
+        """
+        if memory is None:
+            memory = self.parameters.previous_value._get(context)
+
+        distances = self._get_broadcast_distances(cues, field_weights, context, memory)
+        if distances is None:
+            distances = [[self._get_distance(cue, entry, field_weights, 'full_entry', context) for entry in memory]
+                         for cue in cues]
+        return distances
+
+    def _get_broadcast_distances(self, cues, field_weights, context, memory):
+        """Compute distances for _get_distances_to_entries in a single operation; return None if that is not possible
+        """
+        distance_fct = self.parameters.distance_function._get(context)
+        if not isinstance(distance_fct, Distance):
+            return None
+
+        if not isinstance(memory, np.ndarray) or memory.dtype == object or memory.ndim != 3 or not len(memory):
+            return None
+
+        try:
+            cues = np.asarray(cues, dtype=float)
+        except (TypeError, ValueError):
+            # Ragged cues
+            return None
+        if cues.shape[1:] != memory.shape[1:]:
+            return None
+
+        if field_weights is None:
+            # Could be from get_memory called from COMMAND LINE without field_weights
+            field_weights = self._get_current_parameter_value('distance_field_weights', context)
+        # Set any items in field_weights to None if they are None or an empty list (as in _get_distance)
+        field_weights = np.atleast_1d([None if
+                                       fw is None or np.asarray(fw).size == 0
+                                       else fw
+                                       for fw in field_weights])
+
+        # Homogenous field_weights: distance between entire cue and entry, scaled by single field weight
+        if np.all(field_weights[0] == field_weights):
+            field_weight = field_weights[0]
+            if field_weight is None or not np.isscalar(field_weight):
+                return None
+            num_entries = len(memory)
+            return distance_fct._broadcast_function(cues.reshape(len(cues), 1, -1),
+                                                    memory.reshape(1, num_entries, -1)) * field_weight
+
+        # Heterogenous field_weights: mean of field-wise distances, weighted by field_weights (ignoring 0 or None)
+        if len(field_weights) != memory.shape[1]:
+            return None
+        weights = np.zeros(len(field_weights))
+        for i, fw in enumerate(field_weights):
+            if fw is None:
+                continue
+            fw = np.asarray(fw)
+            if fw.size != 1:
+                return None
+            weights[i] = fw.item()
+        non_zero_fields = weights != 0
+        if not np.any(non_zero_fields):
+            return None
+
+        distances_by_field = distance_fct._broadcast_function(cues[:, np.newaxis, non_zero_fields],
+                                                              memory[np.newaxis, :, non_zero_fields])
+        return np.sum(distances_by_field * weights[non_zero_fields], axis=-1) / np.count_nonzero(non_zero_fields)
+
     def _get_distance(self, cue:Union[list, np.ndarray],
                       candidate:Union[list, np.ndarray],
                       field_weights:Union[list, np.ndarray],
@@ -1856,13 +3067,18 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
         fields = convert_to_list(fields)
 
         existing_memory = self.parameters.previous_value._get(context)
+        memory_index = self._get_memory_index(context, existing_memory)
         pruned_memory = copy_parameter_value(existing_memory)
         for entry, memory in itertools.product(entries, existing_memory):
             if (np.all(entry == memory)
                     or fields and all(entry[f] == memory[f] for f in fields)):
-                pruned_memory = np.delete(pruned_memory, pruned_memory.tolist().index(memory.tolist()), axis=0)
+                position = pruned_memory.tolist().index(memory.tolist())
+                pruned_memory = np.delete(pruned_memory, position, axis=0)
+                if memory_index is not None:
+                    memory_index.delete(position)
         self._memory = convert_all_elements_to_np_array(pruned_memory)
         self.parameters.previous_value._set(self._memory, context)
+        self._memory_changed(context, memory_index)
 
     def _parse_memories(self, entries, method, context=None):
         """Parse passing of single vs. multiple memories, validate memories, and return ndarray
@@ -1930,6 +3146,7 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
         equidistant_keys_select=RANDOM,              \
         duplicate_keys=False,                        \
         max_entries=None,                            \
+        memory_index=None,                           \
         params=None,                                 \
         owner=None,                                  \
         prefs=None,                                  \
@@ -2048,6 +3265,10 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
         specifies the maximum number of entries allowed in `memory <DictionaryMemory.memory>`
         (see `max_entries <DictionaryMemory.max_entries for additional details>`).
 
+    memory_index : MemoryIndex : default None
+        specifies an index used to select the keys in `memory <DictionaryMemory.memory>` that are considered for
+        retrieval (see `memory_index <DictionaryMemory.memory_index>` for additional details).
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterPort_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -2128,6 +3349,15 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
         maximum number of entries allowed in `memory <DictionaryMemory.memory>`;  if storing a memory
         exceeds the number, the oldest memory is deleted.
 
+    memory_index : MemoryIndex or None
+        index of the keys in `memory <DictionaryMemory.memory>`, used to select the candidate entries for
+        retrieval; `distance_function <DictionaryMemory.distance_function>` and `selection_function
+        <DictionaryMemory.selection_function>` are applied only to the keys of those entries.  A `FlatIndex`
+        considers every entry (as does None);  an approximate index, such as `LSHIndex`, considers only entries
+        with keys similar to the query key, which reduces the time required for retrieval from large memories, at
+        the cost of sometimes missing the best match.  The index is used only in Python mode (compiled execution
+        always searches all of memory).
+
     random_state : numpy.RandomState
         private pseudorandom number generator
 
@@ -2194,6 +3424,12 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
                     :default value: 1000
                     :type: ``int``
 
+                memory_index
+                    see `memory_index <DictionaryMemory.memory_index>`
+
+                    :default value: None
+                    :type: `MemoryIndex`
+
                 noise
                     see `noise <DictionaryMemory.noise>`
 
@@ -2248,6 +3484,7 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
             0.0, modulable=True, aliases=[ADDITIVE_PARAM], setter=_noise_setter
         )
         max_entries = Parameter(1000)
+        memory_index = Parameter(None, stateful=False, loggable=False)
         random_state = Parameter(None, loggable=False, getter=_random_state_getter, dependencies='seed')
         seed = Parameter(DEFAULT_SEED(), modulable=True, fallback_default=True, setter=_seed_setter)
 
@@ -2269,6 +3506,7 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
                  duplicate_keys: Optional[Union[bool, Literal['overwrite']]] = None,
                  equidistant_keys_select: Optional[Literal['random', 'oldest', 'newest']] = None,
                  max_entries=None,
+                 memory_index: Optional[MemoryIndex] = None,
                  seed=None,
                  params: Optional[Union[list, np.ndarray]] = None,
                  owner=None,
@@ -2278,6 +3516,8 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
             initializer = []
 
         self._memory = []
+        self._memory_indices = {}
+        self._memory_versions = {}
 
         super().__init__(
             default_variable=default_variable,
@@ -2291,6 +3531,7 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
             rate=rate,
             noise=noise,
             max_entries=max_entries,
+            memory_index=memory_index,
             seed=seed,
             params=params,
             owner=owner,
@@ -2650,6 +3891,7 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
         if np.asarray(previous_value).size == 0:
             value = np.ndarray(shape=(2, 0, len(self.defaults.variable[0])))
             self.parameters.previous_value._set(copy.deepcopy(value), context)
+            self._memory_changed(context)
 
         else:
             value = self._initialize_previous_value(previous_value, context=context)
@@ -2781,16 +4023,24 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
         if len(_memory[KEYS]) == 0:
             return self._get_default_entry(context)
 
-        # Get distances between query_key and all keys in memory
-        distances = [self.distance_function([query_key, list(m)]) for m in _memory[KEYS]]
+        # Restrict retrieval to candidate keys if an index is used
+        candidates = np.arange(len(_memory[KEYS]))
+        memory_index = self._get_memory_index(context, _memory[KEYS])
+        if memory_index is not None:
+            candidates = memory_index.candidates(self._index_vector(query_key))
+            if not len(candidates):
+                return self._get_default_entry(context)
+
+        # Get distances between query_key and all (candidate) keys in memory
+        distances = [self.distance_function([query_key, list(_memory[KEYS][i])]) for i in candidates]
 
         # Get the best-match(es) in memory based on selection_function and return as non-zero value(s) in an array
         selection_array = self.selection_function(distances, context=context)
-        indices_of_selected_items = np.flatnonzero(selection_array)
+        indices_of_selected_items = candidates[np.flatnonzero(selection_array)]
 
         # Single key identified
         if len(indices_of_selected_items) == 1:
-            index_of_selected_item = int(np.flatnonzero(selection_array).item())
+            index_of_selected_item = int(indices_of_selected_items.item())
         # More than one key identified
         else:
             selected_keys = _memory[KEYS]
@@ -2833,6 +4083,7 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
         val = list(memory[VALS])
 
         d = self.parameters.previous_value._get(context)
+        memory_index = self._get_memory_index(context, d[KEYS])
 
         matches = [k for k in d[KEYS] if key==list(k)]
 
@@ -2865,14 +4116,19 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
 
             # Return 3d array with keys and vals as lists
             d = [keys, values]
+            if memory_index is not None:
+                memory_index.append(self._index_vector(key))
             storage_succeeded = True
 
         if len(d[KEYS]) > self.max_entries:
             d = np.delete(d, [KEYS], axis=1)
+            if memory_index is not None:
+                memory_index.delete(0)
 
         d = convert_all_elements_to_np_array(d)
 
         self.parameters.previous_value._set(d,context)
+        self._memory_changed(context, memory_index)
         self._memory = d
 
         return storage_succeeded
@@ -2917,6 +4173,7 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
 
         keys = [list(k) for k in memories[0]]
         vals = [list(k) for k in memories[0]]
+        memory_index = self._get_memory_index(context, self._memory[KEYS])
 
         for i, key in enumerate(keys):
             for j, stored_key in enumerate(self._memory[KEYS]):
@@ -2925,7 +4182,10 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
                         memory_keys = np.delete(self._memory[KEYS],j,axis=0)
                         memory_vals = np.delete(self._memory[VALS],j,axis=0)
                         self._memory = np.array([list(memory_keys), list(memory_vals)])
+                        if memory_index is not None:
+                            memory_index.delete(j)
                         self.parameters.previous_value._set(self._memory, context)
+                        self._memory_changed(context, memory_index)
 
     def _parse_memories(self, memories, method, context=None):
         """Parse passing of single vs. multiple memories, validate memories, and return ndarray"""
@@ -1113,6 +1113,7 @@ from psyneulink.core.globals.keywords import \
     TARGET_LABELS_DICT, VALUE, VARIABLE, WEIGHT, MODEL_SPEC_ID_MDF_VARIABLE, MODEL_SPEC_ID_INPUT_PORT_COMBINATION_FUNCTION
 from psyneulink.core.globals.parameters import Parameter, check_user_specified, copy_parameter_value
 from psyneulink.core.globals.preferences.preferenceset import PreferenceLevel
+from psyneulink.core.globals.profiling import profiled
 from psyneulink.core.globals.registry import register_category, remove_instance_from_registry
 from psyneulink.core.globals.utilities import \
     ContentAddressableList, append_type_to_name, convert_all_elements_to_np_array, convert_to_np_array, \
@@ -2362,6 +2363,7 @@ class Mechanism_Base(Mechanism):
 
     # when called externally, ContextFlags.PROCESSING is not set. Maintain this behavior here
     # even though it will not update input ports for example
+    @profiled()
     @handle_external_context(execution_phase=ContextFlags.IDLE)
     def execute(self,
                 input=None,
@@ -3133,6 +3135,9 @@ class Mechanism_Base(Mechanism):
     def _gen_llvm_is_finished_cond(self, ctx, builder, m_base_params, m_state, m_inputs):
         return ctx.bool_ty(1)
 
+    def _gen_llvm_is_single_execution(self, ctx, builder, m_params):
+        return ctx.bool_ty(0)
+
     def _gen_llvm_mechanism_functions(self, ctx, builder, m_base_params, m_params, m_state, m_in,
                                       m_val, ip_output, *, tags:frozenset):
 
@@ -3296,12 +3301,8 @@ class Mechanism_Base(Mechanism):
         is_finished = builder.or_(is_finished_cond, max_reached)
         iter_end = builder.or_(is_finished, exec_until_off)
 
-        # Check if in integrator mode
-        if hasattr(self, "integrator_mode"):
-            int_mode_ptr = ctx.get_param_or_state_ptr(builder, self, "integrator_mode", param_struct_ptr=params)
-            int_mode = builder.load(int_mode_ptr)
-            int_mode_off = builder.fcmp_ordered("==", int_mode, int_mode.type(0))
-            iter_end = builder.or_(iter_end, int_mode_off)
+        # Check if the mechanism executes only once, regardless of 'is_finished'
+        iter_end = builder.or_(iter_end, self._gen_llvm_is_single_execution(ctx, builder, params))
 
         with builder.if_then(iter_end):
             new_flag = builder.uitofp(is_finished, current_flag.type)
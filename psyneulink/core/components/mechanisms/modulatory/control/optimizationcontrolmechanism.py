@@ -1249,6 +1249,8 @@ class OptimizationControlMechanism(ControlMechanism):
         search_function=None,                           \
         search_termination_function=None,               \
         search_space=None,                              \
+        evaluate_num_threads=None,                      \
+        evaluate_chunk_size=None,                       \
         control_signals=None,                           \
         modulation=MULTIPLICATIVE,                      \
         combine_costs=np.sum,                           \
@@ -1356,6 +1358,16 @@ class OptimizationControlMechanism(ControlMechanism):
         <ControlMechanism.control_allocation>`, and return a similar array (see `Function
         <OptimizationControlMechanism_Function>` for additional details).
 
+    evaluate_num_threads : int : default None
+        specifies the number of threads used to evaluate the `control_allocations
+        <ControlMechanism.control_allocation>` of a `GridSearch` in compiled (LLVM) mode (see `evaluate_num_threads
+        <OptimizationControlMechanism.evaluate_num_threads>` for additional information).
+
+    evaluate_chunk_size : int : default None
+        specifies the number of `control_allocations <ControlMechanism.control_allocation>` evaluated by a thread
+        at a time in compiled (LLVM) mode (see `evaluate_chunk_size <OptimizationControlMechanism.evaluate_chunk_size>`
+        for additional information).
+
     Attributes
     ----------
 
@@ -1577,6 +1589,18 @@ class OptimizationControlMechanism(ControlMechanism):
         <OptimizationControlMechanism.function>` if its `save_values <OptimizationFunction.save_samples>` parameter
         is `True`;  otherwise list is empty.
 
+    evaluate_num_threads : int or None
+        determines the number of threads used to evaluate the `control_allocations
+        <ControlMechanism.control_allocation>` sampled by a `GridSearch` when the `agent_rep
+        <OptimizationControlMechanism.agent_rep>` is executed in a compiled (LLVM) `mode <Composition_Compilation>`;
+        if None, the number of CPUs is used.
+
+    evaluate_chunk_size : int or None
+        determines the number of `control_allocations <ControlMechanism.control_allocation>` evaluated in each
+        task by the threads used in compiled (LLVM) mode.  Each thread takes the next task as soon as it finishes the
+        previous one, so that smaller chunks balance the load when evaluations take different amounts of time, at
+        the cost of more tasks;  if None, the evaluations are divided into four chunks per thread.
+
     search_statefulness : bool : True
         if True (the default), calls to `evaluate_agent_rep <OptimizationControlMechanism.evaluate_agent_rep>`
         by the OptimizationControlMechanism's `function <OptimizationControlMechanism.function>` for each
@@ -1642,6 +1666,18 @@ class OptimizationControlMechanism(ControlMechanism):
                     :default value: None
                     :type:
 
+                evaluate_chunk_size
+                    see `evaluate_chunk_size <OptimizationControlMechanism.evaluate_chunk_size>`
+
+                    :default value: None
+                    :type: ``int``
+
+                evaluate_num_threads
+                    see `evaluate_num_threads <OptimizationControlMechanism.evaluate_num_threads>`
+
+                    :default value: None
+                    :type: ``int``
+
                 function
                     see `function <OptimizationControlMechanism_Function>`
 
@@ -1753,6 +1789,8 @@ class OptimizationControlMechanism(ControlMechanism):
         search_space = Parameter(None, read_only=True)
         search_termination_function = Parameter(None, stateful=False, loggable=False)
         comp_execution_mode = Parameter('Python', stateful=False, loggable=False, pnl_internal=True)
+        evaluate_num_threads = Parameter(None, stateful=False, loggable=False)
+        evaluate_chunk_size = Parameter(None, stateful=False, loggable=False)
         search_statefulness = Parameter(True, stateful=False, loggable=False)
 
         # FIX: Should any of these be stateful?
@@ -1773,6 +1811,20 @@ class OptimizationControlMechanism(ControlMechanism):
         saved_samples = None
         saved_values = None
 
+        def _validate_evaluate_num_threads(self, evaluate_num_threads):
+            # values may have been converted to 0d arrays
+            evaluate_num_threads = try_extract_0d_array_item(evaluate_num_threads)
+            if evaluate_num_threads is not None:
+                if not isinstance(evaluate_num_threads, (int, np.integer)) or evaluate_num_threads < 1:
+                    return 'must be a positive integer or None.'
+
+        def _validate_evaluate_chunk_size(self, evaluate_chunk_size):
+            # values may have been converted to 0d arrays
+            evaluate_chunk_size = try_extract_0d_array_item(evaluate_chunk_size)
+            if evaluate_chunk_size is not None:
+                if not isinstance(evaluate_chunk_size, (int, np.integer)) or evaluate_chunk_size < 1:
+                    return 'must be a positive integer or None.'
+
         def _validate_state_feature_default_spec(self, state_feature_default):
             if not (isinstance(state_feature_default, (InputPort, OutputPort, Mechanism))
                     or state_feature_default in {SHADOW_INPUTS}
@@ -1799,6 +1851,8 @@ class OptimizationControlMechanism(ControlMechanism):
                  search_function: Optional[Callable]=None,
                  search_termination_function: Optional[Callable]=None,
                  search_statefulness=None,
+                 evaluate_num_threads: Optional[int] = None,
+                 evaluate_chunk_size: Optional[int] = None,
                  return_results: bool = False,
                  data=None,
                  context=None,
@@ -1882,6 +1936,8 @@ class OptimizationControlMechanism(ControlMechanism):
             initial_seed=initial_seed,
             same_seed_for_all_allocations=same_seed_for_all_allocations,
             search_statefulness=search_statefulness,
+            evaluate_num_threads=evaluate_num_threads,
+            evaluate_chunk_size=evaluate_chunk_size,
             search_function=search_function,
             search_termination_function=search_termination_function,
             **kwargs
@@ -3151,10 +3207,13 @@ class OptimizationControlMechanism(ControlMechanism):
         except AttributeError:
             self.parameters.simulation_ids._set([sim_context.execution_id], base_context)
 
+        # the frozen context is not modified during simulations, so each
+        # simulation shares its values and copies only those it assigns
         self.agent_rep._initialize_as_agent_rep(
             sim_context,
             base_context=self._get_frozen_context(base_context),
-            alt_controller=alt_controller
+            alt_controller=alt_controller,
+            copy_on_write=True,
         )
 
         return sim_context
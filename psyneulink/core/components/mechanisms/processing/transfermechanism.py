@@ -1628,20 +1628,31 @@ class TransferMechanism(ProcessingMechanism_Base):
         cmp_str = self.parameters.termination_comparison_op.get(None)
         return builder.fcmp_ordered(cmp_str, cmp_val, threshold)
 
+    def _gen_llvm_is_single_execution(self, ctx, builder, m_params):
+        # Only integrator mode executes until finished
+        int_mode_ptr = ctx.get_param_or_state_ptr(builder, self, "integrator_mode", param_struct_ptr=m_params)
+        int_mode = builder.load(int_mode_ptr)
+        return builder.fcmp_ordered("==", int_mode, int_mode.type(0))
+
+    def _gen_llvm_function_variable(self, ctx, builder, m_base_params, m_params,
+                                    m_state, m_in, ip_out, *, tags:frozenset):
+        # Compiled counterpart of _parse_function_variable
+        if not self.integrator_mode:
+            return ip_out, builder
+
+        if_base_params, if_state = ctx.get_param_or_state_ptr(builder, self, "integrator_function", param_struct_ptr=m_base_params, state_struct_ptr=m_state)
+        if_params, builder = self._gen_llvm_param_ports_for_obj(
+                self.integrator_function, if_base_params, ctx, builder,
+                m_base_params, m_state, m_in)
+
+        return self._gen_llvm_invoke_function(ctx, builder, self.integrator_function, if_params,
+                                              if_state, ip_out, None, tags=tags)
+
     def _gen_llvm_mechanism_functions(self, ctx, builder, m_base_params, m_params,
                                       m_state, m_in, m_val, ip_out, *, tags:frozenset):
 
-        if self.integrator_mode:
-            if_base_params, if_state = ctx.get_param_or_state_ptr(builder, self, "integrator_function", param_struct_ptr=m_base_params, state_struct_ptr=m_state)
-            if_params, builder = self._gen_llvm_param_ports_for_obj(
-                    self.integrator_function, if_base_params, ctx, builder,
-                    m_base_params, m_state, m_in)
-
-            mf_in, builder = self._gen_llvm_invoke_function(
-                    ctx, builder, self.integrator_function, if_params,
-                    if_state, ip_out, None, tags=tags)
-        else:
-            mf_in = ip_out
+        mf_in, builder = self._gen_llvm_function_variable(ctx, builder, m_base_params, m_params,
+                                                          m_state, m_in, ip_out, tags=tags)
 
         mf_base_params, mf_state = ctx.get_param_or_state_ptr(builder, self, "function", param_struct_ptr=m_base_params, state_struct_ptr=m_state)
         mf_params, builder = self._gen_llvm_param_ports_for_obj(
@@ -1,19 +1,29 @@
+from psyneulink._lazy import lazy_getattr
+
 from . import composition
 from . import compositionfunctionapproximator
-from . import parameterestimationcomposition
 from . import showgraph
 
 
 from .composition import *
 from .pathway import *
 from .compositionfunctionapproximator import *
-from .parameterestimationcomposition import *
 from .showgraph import *
 from .report import *
 
 __all__ = list(composition.__all__)
 __all__.extend(pathway.__all__)
 __all__.extend(compositionfunctionapproximator.__all__)
-__all__.extend(parameterestimationcomposition.__all__)
 __all__.extend(showgraph.__all__)
 __all__.extend(report.__all__)
+
+# ParameterEstimationComposition (and with it, pandas and the optimization back-ends it uses) is only imported when it
+# is first used
+_lazy_attributes = {
+    'parameterestimationcomposition': 'psyneulink.core.compositions.parameterestimationcomposition',
+    'ParameterEstimationComposition': 'psyneulink.core.compositions.parameterestimationcomposition',
+    'ParameterEstimationCompositionError': 'psyneulink.core.compositions.parameterestimationcomposition',
+}
+__all__.extend(['ParameterEstimationComposition', 'ParameterEstimationCompositionError'])
+
+__getattr__ = lazy_getattr(__name__, _lazy_attributes)
@@ -2882,6 +2882,7 @@ import types
 import numbers
 import itertools
 import logging
+import multiprocessing
 import sys
 import typing
 import warnings
@@ -2940,8 +2941,8 @@ from psyneulink.core.compositions.report import Report, \
 from psyneulink.core.compositions.showgraph import ShowGraph, INITIAL_FRAME, SHOW_CIM, EXECUTION_SET, SHOW_CONTROLLER
 from psyneulink.core.globals.context import Context, ContextFlags, handle_external_context
 from psyneulink.core.globals.keywords import \
-    AFTER, ALL, ALLOW_PROBES, ANY, BEFORE, COMPONENT, COMPOSITION, CONTROL, CONTROL_SIGNAL, CONTROLLER, CROSS_ENTROPY, \
-    DEFAULT, DEFAULT_VARIABLE, DICT, FEEDBACK, FULL, FUNCTION, HARD_CLAMP, IDENTITY_MATRIX, \
+    AFTER, ALL, ALLOW_PROBES, ANY, AUTODIFF_COMPOSITION, BEFORE, COMPONENT, COMPOSITION, CONTROL, CONTROL_SIGNAL, \
+    CONTROLLER, CROSS_ENTROPY, DEFAULT, DEFAULT_VARIABLE, DICT, FEEDBACK, FULL, FUNCTION, HARD_CLAMP, IDENTITY_MATRIX, \
     INPUT, INPUT_PORTS, INPUTS, INPUT_CIM_NAME, \
     LEARNABLE, LEARNED_PROJECTIONS, LEARNING_FUNCTION, LEARNING_MECHANISM, LEARNING_MECHANISMS, LEARNING_PATHWAY, \
     LEARNING_SIGNAL, Loss, \
@@ -2955,6 +2956,7 @@ from psyneulink.core.globals.log import CompositionLog, LogCondition
 from psyneulink.core.globals.parameters import Parameter, ParametersBase, check_user_specified, copy_parameter_value
 from psyneulink.core.globals.preferences.basepreferenceset import BasePreferenceSet
 from psyneulink.core.globals.preferences.preferenceset import PreferenceLevel, _assign_prefs
+from psyneulink.core.globals.profiling import get_active_profiler, profiled, profiled_run
 from psyneulink.core.globals.registry import register_category
 from psyneulink.core.globals.utilities import ContentAddressableList, call_with_pruned_args, convert_all_elements_to_np_array, convert_to_list, \
     nesting_depth, convert_to_np_array, is_numeric, is_matrix, is_matrix_keyword, parse_valid_identifier, extended_array_equal
@@ -2992,6 +2994,241 @@ class RunError(Exception):
         return repr(self.error_value)
 
 
+# Composition and arguments of the replications being executed by run_replications;
+# inherited by the forked worker processes, so that they don't need to be pickled
+_run_replications_state = None
+
+
+def _run_replication(index):
+    """Execute replication **index** of run_replications in a worker process, and return its results"""
+    composition, seeds, contexts, base_context, run_kwargs = _run_replications_state
+    return composition._run_replication(seeds[index], contexts[index], base_context, run_kwargs)
+
+
+def _is_autodiff_composition(composition):
+    """Return True if **composition** is an AutodiffComposition, without importing it (and torch) if it is not
+    already loaded; a Composition can only be an AutodiffComposition if its module has been imported
+    """
+    autodiffcomposition = sys.modules.get('psyneulink.library.compositions.autodiffcomposition')
+    return autodiffcomposition is not None and isinstance(composition, autodiffcomposition.AutodiffComposition)
+
+
+class ResultsBuffer(object):
+    """
+        Preallocated, growable store for the trial outputs that make up a Composition's `results
+        <Composition.results>` in a given context.
+
+        Trial outputs are written into rows of a single ndarray whose capacity is doubled when it is full, so that
+        appending a trial is amortized O(1) rather than requiring the entire set of results to be converted to an
+        ndarray on every trial.  If trial outputs are ragged (i.e., the `OUTPUT` Nodes have values of different
+        shapes), the rows are stored using object dtype, in the same form produced by `convert_to_np_array`.
+
+        Arguments
+        ---------
+
+        results : ndarray, list or None
+            results already accumulated in the context, used to initialize the buffer.
+
+        capacity : int : default 16
+            number of trials for which space is initially allocated.
+
+        Attributes
+        ----------
+
+        view : ndarray
+            ndarray of the trial outputs appended so far;  this is a view on the underlying storage (not a copy),
+            and is the value assigned to the Composition's `results <Composition.results>` Parameter.
+    """
+
+    def __init__(self, results=None, capacity=16):
+        self._data = None
+        self._len = 0
+        self._view = None
+        self._initial_capacity = max(int(capacity), 1)
+        if results is not None and len(results):
+            results = convert_to_np_array(results)
+            self._allocate(results.shape[1:], results.dtype, len(results))
+            self._data[:len(results)] = results
+            self._len = len(results)
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, item):
+        return self.view[item]
+
+    @property
+    def view(self):
+        if self._view is None:
+            if self._data is None:
+                self._view = convert_to_np_array([])
+            else:
+                self._view = self._data[:self._len]
+        return self._view
+
+    def _allocate(self, item_shape, dtype, min_capacity):
+        capacity = self._initial_capacity if self._data is None else len(self._data)
+        while capacity < min_capacity:
+            capacity *= 2
+        data = np.empty((capacity, *item_shape), dtype=dtype)
+        if self._len:
+            data[:self._len] = self._data[:self._len]
+        self._data = data
+
+    def append(self, trial_output):
+        """Add **trial_output** as the last trial of the buffer, growing the storage if needed."""
+        item = convert_to_np_array(trial_output)
+        if not isinstance(item, np.ndarray):
+            # e.g., torch tensor
+            item = np.asarray(item)
+
+        if self._data is None:
+            self._allocate(item.shape, item.dtype, 1)
+
+        elif item.shape != self._data.shape[1:] or (item.dtype == object) != (self._data.dtype == object):
+            if self._data.ndim == 1 and self._data.dtype == object:
+                # results are already ragged across trials, so each trial is stored as a single object
+                self._store_object(item)
+                return
+            # form of trial outputs changed, so rebuild storage in the form that convert_to_np_array produces
+            results = convert_to_np_array([*self._data[:self._len], item])
+            self._data = None
+            self._len = 0
+            self._allocate(results.shape[1:], results.dtype, len(results))
+            self._data[:len(results)] = results
+            self._len = len(results)
+            self._view = None
+            return
+
+        elif item.dtype != self._data.dtype and item.dtype != object:
+            dtype = np.result_type(self._data.dtype, item.dtype)
+            if dtype != self._data.dtype:
+                self._data = self._data.astype(dtype)
+
+        if self._len == len(self._data):
+            self._allocate(self._data.shape[1:], self._data.dtype, self._len + 1)
+
+        self._data[self._len] = item
+        self._len += 1
+        self._view = None
+
+    def _store_object(self, item):
+        if self._len == len(self._data):
+            self._allocate((), object, self._len + 1)
+        self._data[self._len] = item
+        self._len += 1
+        self._view = None
+
+    def extend(self, trial_outputs):
+        """Append each item of **trial_outputs** to the buffer."""
+        for trial_output in trial_outputs:
+            self.append(trial_output)
+
+    def _reserve(self, num_items, item_shape, dtype):
+        """Return a writable view on the storage for the next **num_items** trials, each with **item_shape** and
+        **dtype**, so that their outputs can be written in place (e.g., by compiled code) and then added to the
+        buffer by `_commit`.  Returns None if trials already in the buffer have a different form.
+        """
+        if self._data is None:
+            if dtype.names is not None:
+                # structured (ragged) outputs are stored using object dtype
+                return None
+            self._allocate(item_shape, dtype, num_items)
+        elif self._data.shape[1:] != tuple(item_shape) or self._data.dtype != dtype:
+            return None
+        elif self._len + num_items > len(self._data):
+            self._allocate(item_shape, dtype, self._len + num_items)
+        return self._data[self._len:self._len + num_items]
+
+    def _commit(self, items):
+        """Add **items** to the buffer if they were written in place to the view returned by `_reserve`; returns
+        True if they were, and False otherwise (in which case they need to be added using `extend`).
+        """
+        if len(items) == 0:
+            return True
+        if (self._data is None
+                or items.__array_interface__['data'][0] != self._data[self._len:].__array_interface__['data'][0]):
+            return False
+        self._len += len(items)
+        self._view = None
+        return True
+
+
+class _ExecutionPlan(object):
+    """
+        Per-time-step bookkeeping for `Composition.execute <Composition.execute>` in Python mode that depends only on
+        the structure of the Composition and on whether reporting and animation are enabled, so that it can be
+        computed once and reused for every `TRIAL <TimeScale.TRIAL>` (see `Composition._get_execution_plan`).
+
+        Arguments
+        ---------
+
+        composition : Composition
+            the Composition being executed.
+
+        report_enabled : bool
+            whether output is being reported;  if it is not, `TIME_STEP <TimeScale.TIME_STEP>` and node reports are
+            skipped (Report calls are no-ops when output reporting is off).
+
+        animate_execution_sets : bool
+            whether each execution_set is animated.
+
+        animate_nodes : bool
+            whether each Node is animated.
+
+        Attributes
+        ----------
+
+        learning_nodes : frozenset
+            Nodes with `NodeRole.LEARNING`, purged from execution sets when the Composition is not learning.
+
+        readers : dict
+            for each Node, the set of other Nodes in the Composition that receive its output values through a
+            Projection (including ones that modulate a Projection to the Node), or None if they could not all be
+            determined (in which case the Node is always treated as having readers).
+    """
+
+    def __init__(self, composition, report_enabled, animate_execution_sets, animate_nodes):
+        self.report_enabled = report_enabled
+        self.animate_execution_sets = animate_execution_sets
+        self.animate_nodes = animate_nodes
+        self.learning_nodes = frozenset(composition.get_nodes_by_role(NodeRole.LEARNING))
+        nodes = set(composition.nodes)
+        projections = set(composition.projections)
+        self.readers = {node: self._get_readers(composition, node, nodes, projections) for node in nodes}
+
+    @staticmethod
+    def _get_readers(composition, node, nodes, projections):
+        readers = set()
+        for output_port in node.output_ports:
+            for projection in output_port.efferents:
+                owner = projection.receiver.owner
+                # A Projection modulating a Projection (e.g., its matrix) is read when the latter's receiver executes
+                while isinstance(owner, Projection):
+                    owner = owner.receiver.owner
+                if owner in nodes:
+                    readers.add(owner)
+                elif isinstance(owner, CompositionInterfaceMechanism) and owner.composition in nodes:
+                    readers.add(owner.composition)
+                elif owner is composition.output_CIM or projection not in projections:
+                    # Read only after the TRIAL, or not by this Composition
+                    continue
+                else:
+                    return None
+        readers.discard(node)
+        return readers
+
+    def nodes_to_freeze(self, execution_set):
+        """Return the Nodes in **execution_set** whose output values are read by another Node in **execution_set**;
+        these are the only ones for which values must be frozen until the end of the `TIME_STEP <TimeScale.TIME_STEP>`.
+        """
+        if len(execution_set) < 2:
+            return set()
+        execution_set = set(execution_set)
+        return {node for node in execution_set
+                if self.readers.get(node) is None or not self.readers[node].isdisjoint(execution_set)}
+
+
 class EdgeType(enum.Enum):
     """
         Attributes:
@@ -3921,6 +4158,10 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         contains output and/or progress reports from execution(s) of Composition if *DIVERT* is specified in the
         **report_to_devices** argument of a `Composition execution method <Composition_Execution_Methods>`.
 
+    profiler : Profiler or None
+        the `Profiler` used in the last call to `run <Composition.run>` for which **profile** was specified, or None
+        if it has not been profiled.
+
     input_specification : None or dict or list or generator or function
         stores the `inputs` for executions of the Composition when it is executed using its `run <Composition.run>`
         method.
@@ -4088,6 +4329,12 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
         self.parsed_inputs = False
 
+        # ResultsBuffer for each execution_id in which the Composition has been run
+        self._results_buffers = {}
+
+        # _ExecutionPlans for Python mode execution, by reporting and animation settings;  reset when graph changes
+        self._execution_plans = {}
+
         self.disable_learning = disable_learning
         self.learning_rate = learning_rate
         self._runtime_learning_rate = None
@@ -4117,6 +4364,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
         # Compiled resources
         self._compilation_data = self._CompilationData(owner=self)
+        self.profiler = None
 
         # If a PreferenceSet was provided, assign to instance
         _assign_prefs(self, prefs, BasePreferenceSet)
@@ -4283,6 +4531,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         self._update_shadow_projections(context=context)
         self._check_for_projection_assignments(context=context)
         self.needs_update_graph = False
+        self._execution_plans = {}
 
     def _update_processing_graph(self):
         """
@@ -4370,6 +4619,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             self.needs_update_graph_processing = True
             self.needs_update_scheduler = True
             self.needs_update_controller = True
+            self._execution_plans = {}
         # Otherwise, put in list of existing_components
         else:
             self._pre_existing_pathway_components[NODES].append(node)
@@ -4484,6 +4734,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
         self.needs_update_graph_processing = True
         self.needs_update_scheduler = True
+        self._execution_plans = {}
 
         if analyze_graph:
             self._analyze_graph()
@@ -6672,6 +6923,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         self.needs_update_graph = True
         self.needs_update_graph_processing = True
         self.needs_update_scheduler = True
+        self._execution_plans = {}
 
         projection._activate_for_compositions(self)
         for comp in nested_compositions:
@@ -6699,6 +6951,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         # step 2 - remove Projection from Composition's list
         if projection in self.projections:
             self.projections.remove(projection)
+        self._execution_plans = {}
 
         projection._remove_from_composition(self)
 
@@ -8744,10 +8997,9 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             input_source = input_source[0] if isinstance(input_source, tuple) else input_source
             output_source = output_source[0] if isinstance(output_source, tuple) else output_source
 
-            from psyneulink.library.compositions.autodiffcomposition import AutodiffComposition
             if (any([isinstance(source, Composition) or source not in self.nodes
                  for source in {input_source, output_source}])
-                    and not isinstance(self, AutodiffComposition)):
+                    and not _is_autodiff_composition(self)):
                 raise CompositionError(f"Learning in Python mode does not currently support nested Compositions;  "
                                        f"try using an AutodiffComposition with ExecutionMode.PyTorch.")
             # FIX: NOTE: THIS ONLY SUPPORTS A SINGLE PROJECTION TO/FROM A NESTED COMPOSITION USING PRIMARY CIM PORTS
@@ -9813,6 +10065,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
     # region ------------------------------------ EXECUTION ------------------------------------------------------------
     # ******************************************************************************************************************
 
+    @profiled('Simulation')
     @handle_external_context()
     def evaluate(
             self,
@@ -10881,6 +11134,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
     #                                           EXECUTION
     # ******************************************************************************************************************
 
+    @profiled_run
     @handle_external_context()
     def run(
             self,
@@ -10911,6 +11165,9 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             scheduling_mode: typing.Optional[SchedulingMode] = None,
             execution_mode:pnlvm.ExecutionMode = pnlvm.ExecutionMode.Python,
             default_absolute_time_unit: typing.Optional[pint.Quantity] = None,
+            chunk_size: typing.Optional[int] = None,
+            call_after_chunk=None,
+            profile=False,
             context=None,
             base_context=Context(execution_id=None),
             **kwargs
@@ -11095,6 +11352,28 @@ _
             if not otherwise determined by any absolute **conditions**, specifies the absolute duration
             of a `TIME_STEP`. See `Scheduler.default_absolute_time_unit`
 
+        chunk_size : int : default None
+            if specified, and **execution_mode** is a compiled `Run <ExecutionMode.LLVMRun>` mode, the trials of the
+            run are passed to the compiled code in chunks of (at most) this many trials.  Inputs are constructed one
+            chunk at a time (so that a generator specified for **inputs** is consumed lazily, and the inputs for all
+            trials need not be held in memory), and the outputs of each chunk are written in place into the storage
+            for `results <Composition.results>`.  Because the compiled code shares the memory in which values of
+            Parameters are stored, values of Parameters are current at each chunk boundary without any copying.  This
+            is ignored for other values of **execution_mode**.  `TimeScale.RUN` clocks, and the state of
+            `Conditions <Condition>` (e.g., `AtTrial`), continue across chunks, so the run is executed as it is
+            without chunks.
+
+        call_after_chunk : callable : default None
+            specifies function to call after each chunk of trials is executed when **chunk_size** is specified;
+            it is called with the outputs of the trials in the chunk, after `results <Composition.results>` has
+            been updated.
+
+        profile : bool or Profiler : default False
+            specifies whether to record the time spent in each Node, Port, Projection and Function of the Composition
+            during the run (see `Profiler`).  If True, a new `Profiler` is created; if a Profiler is specified,
+            it is used so that several runs can be aggregated.  The Profiler is assigned to the Composition's
+            `profiler <Composition.profiler>` attribute.
+
         context : `execution_id <Context.execution_id>` : default `default_execution_id`
             context in which the `Composition` will be executed;  set to self.default_execution_id ifunspecified.
 
@@ -11288,11 +11567,7 @@ _
                 self._reset_stateful_functions_when_cache[node] = node.reset_stateful_function_when
                 node.reset_stateful_function_when = reset_stateful_functions_when[node]
 
-        results = self.parameters.results._get(context)
-        if results is None:
-            results = []
-        else:
-            results = list(results)
+        results = self._get_results_buffer(context)
 
         is_simulation = (context is not None and
                          ContextFlags.SIMULATION_MODE in context.runmode)
@@ -11322,15 +11597,24 @@ _
                 try:
                     comp_ex_tags = frozenset({"learning"}) if self._is_learning(context) else frozenset()
                     _comp_ex = pnlvm.CompExecution.get(self, context, additional_tags=comp_ex_tags)
-                    if execution_mode & pnlvm.ExecutionMode.LLVM:
-                        results += _comp_ex.run(inputs, num_trials, num_inputs_sets)
+                    if execution_mode & pnlvm.ExecutionMode.LLVM and chunk_size is not None:
+                        for chunk_outputs in _comp_ex.run_chunked(inputs, num_trials, num_inputs_sets, chunk_size,
+                                                                  get_output_buffer=results._reserve):
+                            if not results._commit(chunk_outputs):
+                                results.extend(_comp_ex._get_indexable(chunk_outputs))
+                            self.parameters.results._set(results.view, context, skip_history=True)
+                            self._propagate_most_recent_context(context)
+                            if call_after_chunk:
+                                call_after_chunk(chunk_outputs)
+                    elif execution_mode & pnlvm.ExecutionMode.LLVM:
+                        results.extend(_comp_ex.run(inputs, num_trials, num_inputs_sets))
                     elif execution_mode & pnlvm.ExecutionMode.PTX:
-                        results += _comp_ex.cuda_run(inputs, num_trials, num_inputs_sets)
+                        results.extend(_comp_ex.cuda_run(inputs, num_trials, num_inputs_sets))
                     else:
                         assert False, "Unknown execution mode: {}".format(execution_mode)
 
                     # Update the parameter for results
-                    self.parameters.results._set(convert_to_np_array(results), context)
+                    self.parameters.results._set(results.view, context, skip_history=True)
                     self._propagate_most_recent_context(context)
 
                     report(self,
@@ -11510,6 +11794,157 @@ _
 
             return trial_output
 
+    @handle_external_context()
+    def run_replications(self,
+                         inputs=None,
+                         seeds=None,
+                         num_trials: Optional[int] = None,
+                         n_jobs: Optional[int] = None,
+                         execution_mode: pnlvm.ExecutionMode = pnlvm.ExecutionMode.Python,
+                         base_context=Context(execution_id=None),
+                         context=None,
+                         **kwargs):
+        """Execute independent replications of a `run <Composition.run>` of the Composition using the same **inputs**,
+        each with a different seed for its `random_variables <Composition.random_variables>`.
+
+        Each replication is executed in its own `execution context <Composition_Execution_Context>`, that has the
+        execution_id ``'<execution_id>-replication-<i>'`` (where ``<execution_id>`` is that of **context** and ``<i>``
+        is the index of the replication), and that is initialized from **base_context**.  The seed of every Component
+        in `random_variables <Composition.random_variables>` is derived from the seed for the replication, so that
+        replications with the same seed produce identical results, and ones with different seeds are independent.
+
+        Arguments
+        ---------
+
+        inputs : Dict{`INPUT` `Node <Composition_Nodes>` : list}, list or generator function : default None
+            specifies the inputs used for every replication, in any of the formats accepted by `run
+            <Composition.run>` other than a generator (which can be consumed only once).
+
+        seeds : list[int]
+            specifies the seed (a non-negative int) for each replication;  the seeds of the Components in
+            `random_variables <Composition.random_variables>` are generated from it using ``numpy.random.SeedSequence``.
+
+        num_trials : int : default None
+            specifies the number of trials executed in each replication (see `run <Composition.run>`).
+
+        n_jobs : int : default None
+            specifies the number of replications executed concurrently.  If **execution_mode** is
+            `ExecutionMode.LLVMRun`, replications are executed by threads that share a single compiled binary for the
+            Composition (as well as the input structure);  if it is `ExecutionMode.Python`, they are executed by
+            worker processes forked from the current one (if forking is not supported by the platform, a warning is
+            issued and they are executed sequentially).  If it is None or 1, replications are executed sequentially,
+            using the same procedure, so that results are identical to those executed concurrently.
+
+        execution_mode : ExecutionMode : default ExecutionMode.Python
+            specifies the mode in which each replication is executed;  replications are executed sequentially in modes
+            other than `ExecutionMode.Python` and `ExecutionMode.LLVMRun`.
+
+        base_context : `execution_id <Context.execution_id>` : Context(execution_id=None)
+            the context from which the execution context of each replication is initialized.
+
+        context : `execution_id <Context.execution_id>` : default `default_execution_id`
+            the context from which the execution_ids of the replications are derived.
+
+        kwargs :
+            additional arguments passed to `run <Composition.run>` for each replication;  if any are specified,
+            replications in `ExecutionMode.LLVMRun` are executed sequentially, using `run <Composition.run>`.
+
+        Returns
+        -------
+
+        results of all replications : ndarray
+            `results <Composition.results>` of each replication, stacked into an array with shape (replication, trial,
+            ...) (or an object array if they differ in shape).  The results of each replication are also assigned to
+            `results <Composition.results>` in the replication's execution context.
+
+            .. note::
+               Worker processes used to execute replications in `ExecutionMode.Python` do not update the current
+               process other than by returning results; values of other Parameters of the Composition and its
+               `Nodes <Composition_Nodes>` are not available in the execution contexts of those replications.
+        """
+        global _run_replications_state
+
+        if seeds is None or not len(seeds):
+            raise CompositionError(f"At least one seed must be specified in call to run_replications() "
+                                   f"for {self.name}.")
+
+        if isgenerator(inputs):
+            raise CompositionError(f"A generator cannot be used as inputs for run_replications() of {self.name}, "
+                                   f"since it can be consumed only once; use a generator function instead.")
+
+        execution_id = context.execution_id if context.execution_id is not None else self.default_execution_id
+        contexts = [Context(execution_id=f'{execution_id}-replication-{i}') for i in range(len(seeds))]
+        n_jobs = 1 if n_jobs is None else n_jobs
+
+        if execution_mode is pnlvm.ExecutionMode.LLVMRun and not kwargs:
+            self._analyze_graph(context=context)
+            parsed_inputs, num_inputs_sets = self._parse_run_inputs(inputs, context)
+            if num_trials is None:
+                num_trials = num_inputs_sets
+
+            executions = []
+            for seed, rep_context in zip(seeds, contexts):
+                self._initialize_replication_context(seed, rep_context, base_context)
+                executions.append(pnlvm.CompExecution.get(self, rep_context))
+
+            all_results = pnlvm.CompExecution.thread_run(executions, parsed_inputs, num_trials, num_inputs_sets, n_jobs)
+
+            for rep_context, rep_results in zip(contexts, all_results):
+                results = self._get_results_buffer(rep_context)
+                results.extend(rep_results)
+                self.parameters.results._set(results.view, rep_context, skip_history=True)
+                self._propagate_most_recent_context(rep_context)
+
+        else:
+            run_kwargs = dict(inputs=inputs, num_trials=num_trials, execution_mode=execution_mode, **kwargs)
+
+            if (n_jobs > 1 and len(seeds) > 1 and execution_mode is pnlvm.ExecutionMode.Python
+                    and 'fork' not in multiprocessing.get_all_start_methods()):
+                warnings.warn(f"'n_jobs' was specified for run_replications() of {self.name}, but worker processes "
+                              f"cannot be forked on this platform; replications will be executed sequentially.")
+                n_jobs = 1
+
+            if n_jobs > 1 and len(seeds) > 1 and execution_mode is pnlvm.ExecutionMode.Python:
+                # Analyze graph before forking, so that workers don't each repeat it
+                self._analyze_graph(context=context)
+                _run_replications_state = (self, seeds, contexts, base_context, run_kwargs)
+                try:
+                    with multiprocessing.get_context('fork').Pool(min(n_jobs, len(seeds))) as pool:
+                        all_results = pool.map(_run_replication, range(len(seeds)))
+                finally:
+                    _run_replications_state = None
+
+                for rep_context, rep_results in zip(contexts, all_results):
+                    self.parameters.results._set(rep_results, rep_context, skip_history=True)
+            else:
+                all_results = [self._run_replication(seed, rep_context, base_context, run_kwargs)
+                               for seed, rep_context in zip(seeds, contexts)]
+
+        return convert_to_np_array(all_results)
+
+    def _run_replication(self, seed, context, base_context, run_kwargs):
+        """Execute a replication of run_replications in **context** using run, and return its results"""
+        self._initialize_replication_context(seed, context, base_context)
+        self.run(context=context, base_context=base_context, **run_kwargs)
+        return self.parameters.results._get(context)
+
+    def _initialize_replication_context(self, seed, context, base_context):
+        """Initialize **context** from **base_context** for a replication executed by run_replications, and assign
+        seeds generated from **seed** to the Components in random_variables
+        """
+        # Same initialization as used by run for new execution contexts
+        for node in self.nodes:
+            if node.parameters.num_executions._get(context) is None:
+                node.parameters.num_executions._set(Time(), context)
+        self._initialize_from_context(context, base_context, override=False)
+        self.scheduler._init_counts(execution_id=context.execution_id)
+        context.composition = self
+
+        seed_params = list(self.all_dependent_parameters('seed'))
+        param_seeds = np.random.SeedSequence(seed).generate_state(len(seed_params)) % 2**31
+        for param, param_seed in zip(seed_params, param_seeds):
+            param._set(int(param_seed), context)
+
     @handle_external_context()
     def learn(
             self,
@@ -11648,13 +12083,12 @@ _
 
         """
         from psyneulink.library.compositions import CompositionRunner
-        from psyneulink.library.compositions import AutodiffComposition
         runner = CompositionRunner(self)
 
         # Non-Python (i.e. PyTorch and LLVM) learning modes only supported for AutodiffComposition
-        if execution_mode is not pnlvm.ExecutionMode.Python and not isinstance(self, AutodiffComposition):
+        if execution_mode is not pnlvm.ExecutionMode.Python and not _is_autodiff_composition(self):
             raise CompositionError(f"ExecutionMode.{execution_mode.name} cannot be used in the learn() method of "
-                                   f"'{self.name}' because it is not an {AutodiffComposition.componentCategory}")
+                                   f"'{self.name}' because it is not an {AUTODIFF_COMPOSITION}")
         elif execution_mode is pnlvm.ExecutionMode.Python and not self.learning_components:
             warnings.warn(f"learn() method called on '{self.name}', but it has no learning components; "
                           f"it will be run but no learning will occur.")
@@ -11754,6 +12188,21 @@ _
                            context=context,
                            node=self.controller)
 
+    def _get_execution_plan(self, report):
+        """Return the `_ExecutionPlan` used by execute() in Python mode for the current reporting and animation
+        settings, constructing it if it has not been used since the Composition's graph was last modified.
+        """
+        report_enabled = report._report_output is not ReportOutput.OFF
+        animate_execution_sets = self._animate is not False and self._animate_unit == EXECUTION_SET
+        animate_nodes = self._animate is not False and self._animate_unit == COMPONENT
+        key = (report_enabled, animate_execution_sets, animate_nodes)
+        try:
+            return self._execution_plans[key]
+        except KeyError:
+            plan = self._execution_plans[key] = _ExecutionPlan(self, *key)
+            return plan
+
+    @profiled()
     @handle_external_context(execution_phase=ContextFlags.PROCESSING)
     def execute(
             self,
@@ -12197,6 +12646,13 @@ _
                 for i in range(scheduler.get_clock(context).time.time_step):
                     execution_sets.__next__()
 
+            profiler = get_active_profiler()
+            if profiler is not None:
+                execution_sets = profiler.profile_iterator(execution_sets, 'Scheduler', self.name)
+
+            # Reporting, animation and freezing of values that are needed for each execution_set
+            execution_plan = self._get_execution_plan(report)
+
 
             for next_execution_set in execution_sets:
 
@@ -12262,6 +12718,7 @@ _
                 # If nodes within a timestep are connected by projections, those projections must pass their senders'
                 # values from the beginning of the timestep (i.e. their "frozen values")
                 # This ensures that the order in which nodes execute does not affect the results of this timestep
+                # Only the values of nodes that are read by another node in the execution_set need to be frozen
                 frozen_values = {}
                 new_values = {}
                 if execution_mode & pnlvm.ExecutionMode.COMPILED:
@@ -12270,20 +12727,23 @@ _
                 # PURGE LEARNING IF NOT ENABLED ----------------------------------------------------------------
                 # If learning is turned off, check for learning related nodes and remove them from the execution set
                 if not self._is_learning(context):
-                    next_execution_set = next_execution_set - set(self.get_nodes_by_role(NodeRole.LEARNING))
+                    next_execution_set = next_execution_set - execution_plan.learning_nodes
+
+                nodes_to_freeze = execution_plan.nodes_to_freeze(next_execution_set)
 
                 # Add TIME_STEP header to output report
-                nodes_to_report = any(node.reportOutputPref for node in next_execution_set)
-                report(self,
-                       EXECUTE_REPORT,
-                       report_num=report_num,
-                       scheduler=execution_scheduler,
-                       content='time_step_start',
-                       context=context,
-                       nodes_to_report=True)
+                if execution_plan.report_enabled:
+                    nodes_to_report = any(node.reportOutputPref for node in next_execution_set)
+                    report(self,
+                           EXECUTE_REPORT,
+                           report_num=report_num,
+                           scheduler=execution_scheduler,
+                           content='time_step_start',
+                           context=context,
+                           nodes_to_report=True)
 
                 # ANIMATE execution_set ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                if self._animate is not False and self._animate_unit == EXECUTION_SET:
+                if execution_plan.animate_execution_sets:
                     context.execution_phase = ContextFlags.PROCESSING
                     self._animate_execution(next_execution_set, context)
 
@@ -12303,9 +12763,10 @@ _
                         node.parameters.num_executions.get(context)._set_by_time_scale(TimeScale.PASS, 0)
 
 
-                    # Store values of all nodes in this execution_set for use by other nodes in the execution set
+                    # Store values of nodes in this execution_set for use by other nodes in the execution set
                     #    throughout this timestep (e.g., for recurrent Projections)
-                    frozen_values[node] = copy_parameter_value(node.get_output_values(context))
+                    if node in nodes_to_freeze:
+                        frozen_values[node] = copy_parameter_value(node.get_output_values(context))
 
                     # FIX: 6/12/19 Deprecate?
                     # Handle input clamping
@@ -12356,8 +12817,9 @@ _
                                 if self.is_nested and node in self.get_nodes_by_role(NodeRole.INPUT):
                                     for port in node.input_ports:
                                         port._update(context=context)
+                                # Passing report_num=None skips the Mechanism's reporting
                                 node.execute(context=mech_context,
-                                             report_num=report_num,
+                                             report_num=report_num if execution_plan.report_enabled else None,
                                              runtime_params=execution_runtime_params,
                                              )
                                 assert 'DEBUGGING BREAK POINT'
@@ -12425,16 +12887,17 @@ _
                         context.composition = self
 
                         # Add Node info for TIME_STEP to output report
-                        report(self,
-                               EXECUTE_REPORT,
-                               report_num=report_num,
-                               scheduler=execution_scheduler,
-                               content='nested_comp',
-                               context=context,
-                               node=node)
+                        if execution_plan.report_enabled:
+                            report(self,
+                                   EXECUTE_REPORT,
+                                   report_num=report_num,
+                                   scheduler=execution_scheduler,
+                                   content='nested_comp',
+                                   context=context,
+                                   node=node)
 
                     # ANIMATE node ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                    if self._animate is not False and self._animate_unit == COMPONENT:
+                    if execution_plan.animate_nodes:
                         self._animate_execution(node, context)
 
 
@@ -12451,25 +12914,27 @@ _
 
                     # Store new value generated by node,
                     #    then set back to frozen value for use by other nodes in execution_set
-                    new_values[node] = copy_parameter_value(node.get_output_values(context))
-                    for i in range(len(node.output_ports)):
-                        node.output_ports[i].parameters.value._set(frozen_values[node][i], context,
-                                                                   skip_history=True, skip_log=True)
-
-                # Set all nodes to new values
-                for node in next_execution_set:
+                    if node in frozen_values:
+                        new_values[node] = copy_parameter_value(node.get_output_values(context))
+                        for i in range(len(node.output_ports)):
+                            node.output_ports[i].parameters.value._set(frozen_values[node][i], context,
+                                                                       skip_history=True, skip_log=True)
+
+                # Set all frozen nodes to new values
+                for node in new_values:
                     for i in range(len(node.output_ports)):
                         node.output_ports[i].parameters.value._set(new_values[node][i], context,
                                                                    skip_history=True, skip_log=True)
 
                 # Complete TIME_STEP entry for output report
-                report(self,
-                       EXECUTE_REPORT,
-                       report_num=report_num,
-                       scheduler=execution_scheduler,
-                       content='time_step_end',
-                       context=context,
-                       nodes_to_report=nodes_to_report)
+                if execution_plan.report_enabled:
+                    report(self,
+                           EXECUTE_REPORT,
+                           report_num=report_num,
+                           scheduler=execution_scheduler,
+                           content='time_step_end',
+                           context=context,
+                           nodes_to_report=nodes_to_report)
 
                 if self.controller_time_scale == TimeScale.TIME_STEP:
                     self._execute_controller(
@@ -12487,9 +12952,8 @@ _
             context.remove_flag(ContextFlags.PROCESSING)
 
             # Update matrix parameter of PathwayProjections being learned with learning_enabled==AFTER
-            from psyneulink.library.compositions.autodiffcomposition import AutodiffComposition
             if self._is_learning(context) \
-                    and (not isinstance(self, AutodiffComposition) or execution_mode is pnlvm.ExecutionMode.Python):
+                    and (not _is_autodiff_composition(self) or execution_mode is pnlvm.ExecutionMode.Python):
                 context.execution_phase = ContextFlags.LEARNING
                 for projection in [p for p in self.projections if
                                    hasattr(p, 'has_learning_projection') and p.has_learning_projection]:
@@ -12864,13 +13328,31 @@ _
         else:
             return {k:np.array(v).tolist() for k,v in result_set}
 
+    def _get_results_buffer(self, context):
+        """Return the `ResultsBuffer` holding results for **context**
+        A new buffer is created (from the current value of results) if there is none for the context,
+        or if results has been assigned other than through the buffer (e.g., by the user or by learning)
+        """
+        results = self.parameters.results._get(context)
+        try:
+            results_buffer = self._results_buffers[context.execution_id]
+        except KeyError:
+            results_buffer = None
+
+        if results_buffer is None or results_buffer.view is not results:
+            results_buffer = ResultsBuffer(results)
+            self._results_buffers[context.execution_id] = results_buffer
+
+        return results_buffer
+
     def _update_results(self, results, trial_output, execution_mode, synch_with_pnl_options, context):
         """Update results by appending most recent trial_output
         This is included as a helper so it can be overriden by subclasses (such as AutodiffComposition)
         that may need to do this less frequently for scallable exeuction
+        results is a ResultsBuffer, so the append is amortized O(1), and results Parameter holds a view on it
         """
         results.append(trial_output)
-        self.parameters.results._set(convert_to_np_array(results), context)
+        self.parameters.results._set(results.view, context, skip_history=True)
 
     def do_gradient_optimization(self, retain_in_pnl_options, context, optimization_num=None):
         pass
@@ -13137,18 +13619,27 @@ _
                 self.scheduler._delete_counts(c.execution_id)
             except AttributeError:
                 self.scheduler._delete_counts(c)
+            self._results_buffers.pop(getattr(c, 'execution_id', c), None)
 
-    def _initialize_as_agent_rep(self, context, base_context, alt_controller=None):
+    def _initialize_as_agent_rep(self, context, base_context, alt_controller=None, copy_on_write=False):
         assert self.controller is None or alt_controller is None
 
         _initialized = set()  # avoid reinitializing shared dependencies below
         self._initialize_from_context(
-            context, base_context=base_context, override=True, visited=_initialized
+            context,
+            base_context=base_context,
+            override=True,
+            visited=_initialized,
+            copy_on_write=copy_on_write,
         )
         if alt_controller is not None:
             # evaluation will be done with a controller from another composition
             alt_controller._initialize_from_context(
-                context, base_context=base_context, override=True, visited=_initialized
+                context,
+                base_context=base_context,
+                override=True,
+                visited=_initialized,
+                copy_on_write=copy_on_write,
             )
 
     def _clean_up_as_agent_rep(self, context, alt_controller=None):
@@ -13255,9 +13746,24 @@ _
         else:
             return pnlvm.codegen.gen_composition_exec(ctx, self, tags=tags)
 
-    def _delete_compilation_data(self, context: Context, from_parameter: Parameter = None):
+    def _delete_compilation_data(
+        self,
+        context: Context,
+        from_parameter: Parameter = None,
+        structure_changed: bool = False,
+    ):
         if from_parameter is None:
             self._compilation_data.execution.delete(context)
+        elif structure_changed:
+            # the compiled structs no longer match the parameter, so only
+            # the code that depends on its owner is regenerated
+            pnlvm.invalidate(from_parameter._owner._owner)
+            execution_dict = self._compilation_data.execution.get(context)
+            if execution_dict is None:
+                return
+
+            for execution in execution_dict.values():
+                execution._discard_compiled()
         else:
             execution_dict = self._compilation_data.execution.get(context)
             if execution_dict is None:
@@ -6,6 +6,7 @@ from . import kvo
 from . import log
 from . import parameters
 from . import preferences
+from . import profiling
 from . import registry
 from . import utilities
 from . import sampleiterator
@@ -19,6 +20,7 @@ from .log import *
 from .mdf import *
 from .parameters import *
 from .preferences import *
+from .profiling import *
 from .registry import *
 from .utilities import *
 from .sampleiterator import *
@@ -32,6 +34,7 @@ __all__.extend(log.__all__)
 __all__.extend(mdf.__all__)
 __all__.extend(parameters.__all__)
 __all__.extend(preferences.__all__)
+__all__.extend(profiling.__all__)
 __all__.extend(registry.__all__)
 __all__.extend(utilities.__all__)
 __all__.extend(sampleiterator.__all__)
@@ -51,6 +51,11 @@ of `LogEntry` tuples recording its values.  Each `LogEntry` tuple has three item
     * *value* -- the value of the item.
 The time is recorded only if the Component is executed within a `System`;  otherwise, the time field is `None`.
 
+The `LogEntry` tuples for each `execution context <Context>` are stored in a `LogBuffer`, that keeps the times,
+contexts and values in separate arrays rather than a tuple for each value.  Its `set_log_storage
+<Log.set_log_storage>` method can be used to limit the number of values retained for an item (the most recent ones
+are kept), and/or to write them to files while they are being logged (see `LogStream`).
+
 A Log has several attributes and methods that make it easy to manage how and when it values are recorded, and
 to access its `entries <Log.entries>`:
 
@@ -381,6 +386,8 @@ Class Reference
 
 """
 import enum
+import os
+import re
 import warnings
 
 from collections import OrderedDict, namedtuple
@@ -397,7 +404,7 @@ from psyneulink.core.globals.keywords import ALL, CONTEXT, EID_SIMULATION, FUNCT
 from psyneulink.core.globals.utilities import AutoNumber, ContentAddressableList
 
 __all__ = [
-    'EntriesDict', 'Log', 'LogEntry', 'LogError', 'LogCondition'
+    'EntriesDict', 'Log', 'LogBuffer', 'LogEntry', 'LogError', 'LogCondition', 'LogStream'
 ]
 
 
@@ -507,6 +514,286 @@ def _time_string(time):
     return time_str
 
 
+class LogBuffer:
+    """Columnar storage of the `LogEntry` items logged for a Parameter in a single `execution context <Context>`.
+
+    Rather than a `LogEntry` tuple for each item logged, a LogBuffer keeps three columns:  the times of the items,
+    as the rows of a 2d array of integers (with columns for the `RUN`, `TRIAL <TimeScale.TRIAL>`, `PASS` and
+    `TIME_STEP` in which each was logged, and -1 for any not recorded);  their contexts, as indices into a list of the
+    distinct context strings;  and their values, as the items of a preallocated array if all of the values are numeric
+    and have the same shape and dtype (otherwise, as the items of a list, which unlike an object array is traversed
+    by the garbage collector, so that values referring to their owner do not keep it alive).  The arrays are doubled
+    in size when they are full, unless **maxlen** is specified, in which case the LogBuffer is a ring buffer that
+    retains only the **maxlen** most recently logged items.
+
+    A LogBuffer can be used as a sequence of `LogEntry` items (indexing it or iterating over it returns `LogEntry`
+    tuples), and its `times <LogBuffer.times>`, `contexts <LogBuffer.contexts>` and `values <LogBuffer.values>`
+    attributes return each column in the order the items were logged;  `times <LogBuffer.times>` and `values
+    <LogBuffer.values>` are views of the underlying arrays (i.e., are not copied), unless the ring buffer has wrapped
+    around or the values are not stored in an array.
+
+    If **stream** is specified, items are also written to it in chunks as they are logged (see `LogStream`).
+
+    Arguments
+    ---------
+
+    maxlen : int : default None
+        specifies the maximum number of items retained;  if it is None, all items logged are retained.
+
+    stream : LogStream : default None
+        specifies a `LogStream` to which items are written as they are logged.
+
+    name : str : default None
+        specifies the name used for the files written to **stream**.
+    """
+
+    _initial_capacity = 16
+
+    def __init__(self, maxlen=None, stream=None, name=None):
+        if maxlen is not None and maxlen < 1:
+            raise LogError(f"'maxlen' for {self.__class__.__name__} ({maxlen}) must be a positive integer.")
+        self.maxlen = maxlen
+        self.stream = stream
+        self.name = name
+        self.clear()
+
+    def clear(self):
+        """Remove all items"""
+        self._times = None
+        self._context_indices = None
+        self._values = None
+        self._typed = False
+        self._scalar_type = None
+        self._context_strings = []
+        self._context_index = {}
+        self._start = 0
+        self._len = 0
+        self._num_logged = 0
+        self._num_streamed = 0
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for i in range(self._len):
+            yield self[i]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError(f"{self.__class__.__name__} index out of range")
+        position = (self._start + index) % len(self._times)
+        return LogEntry(self._time_at(position),
+                        self._context_strings[self._context_indices[position]],
+                        self._value_at(position))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self)})"
+
+    def __eq__(self, other):
+        try:
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        except (TypeError, ValueError):
+            return False
+
+    @property
+    def times(self):
+        """2d array with the run, trial, pass and time_step of each item (-1 where not recorded)"""
+        if self._times is None:
+            return np.empty((0, NUM_TIME_SCALES), dtype=np.int64)
+        return self._ordered(self._times)
+
+    @property
+    def contexts(self):
+        """list with the context string of each item"""
+        if self._times is None:
+            return []
+        return [self._context_strings[i] for i in self._ordered(self._context_indices)]
+
+    @property
+    def values(self):
+        """array with the value of each item (along axis 0);  an object array if values could not be stored together"""
+        if self._values is None:
+            return np.empty(0)
+        values = self._ordered(self._values)
+        if not self._typed:
+            object_values = np.empty(len(values), dtype=object)
+            for i, value in enumerate(values):
+                object_values[i] = value
+            values = object_values
+        return values
+
+    def append(self, entry):
+        """Add **entry** (a `LogEntry`) as the most recent item"""
+        self._append(*entry)
+
+    def _append(self, time, context, value):
+        if self._times is None:
+            self._allocate(value, self.maxlen or self._initial_capacity)
+        elif self._typed and not self._is_compatible(value):
+            self._convert_to_objects()
+
+        capacity = len(self._times)
+        if self._len < capacity:
+            position = (self._start + self._len) % capacity
+            self._len += 1
+        elif self.maxlen is None:
+            self._grow()
+            position = self._len
+            self._len += 1
+        else:
+            # Ring buffer is full, so overwrite oldest item (after streaming it, if it hasn't been)
+            if self.stream is not None and self._num_logged - self._num_streamed >= self._len:
+                self.flush()
+            position = self._start
+            self._start = (self._start + 1) % capacity
+
+        self._times[position] = [-1 if t is None else t for t in (time or (None,) * NUM_TIME_SCALES)]
+        try:
+            context_index = self._context_index[context]
+        except KeyError:
+            context_index = self._context_index[context] = len(self._context_strings)
+            self._context_strings.append(context)
+        self._context_indices[position] = context_index
+        self._values[position] = value
+        self._num_logged += 1
+
+        if self.stream is not None and self._num_logged - self._num_streamed >= self.stream.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write any items that have not yet been written to `stream <LogBuffer.stream>`"""
+        num_unstreamed = self._num_logged - self._num_streamed
+        if self.stream is None or num_unstreamed == 0:
+            return
+        self.stream._write(self.name, self.times[-num_unstreamed:], self.contexts[-num_unstreamed:],
+                           self.values[-num_unstreamed:])
+        self._num_streamed = self._num_logged
+
+    def _allocate(self, value, capacity):
+        self._times = np.empty((capacity, NUM_TIME_SCALES), dtype=np.int64)
+        self._context_indices = np.empty(capacity, dtype=np.int32)
+        if isinstance(value, (int, float, np.number)):
+            self._scalar_type = type(value)
+            value = np.asarray(value)
+        if isinstance(value, np.ndarray) and value.dtype.kind in 'biufc':
+            self._values = np.empty((capacity,) + value.shape, dtype=value.dtype)
+            self._typed = True
+        else:
+            self._values = [None] * capacity
+
+    def _is_compatible(self, value):
+        if self._scalar_type is not None:
+            return type(value) is self._scalar_type
+        return (isinstance(value, np.ndarray)
+                and value.dtype == self._values.dtype
+                and value.shape == self._values.shape[1:])
+
+    def _convert_to_objects(self):
+        values = [None] * len(self._values)
+        for position in (self._start + np.arange(self._len)) % len(self._values):
+            values[position] = self._value_at(position)
+        self._values = values
+        self._typed = False
+        self._scalar_type = None
+
+    def _grow(self):
+        # only called when not a ring buffer, so items are always stored from position 0
+        capacity = 2 * len(self._times)
+        arrays = ['_times', '_context_indices']
+        if self._typed:
+            arrays.append('_values')
+        else:
+            self._values.extend([None] * (capacity - len(self._values)))
+        for attr in arrays:
+            array = getattr(self, attr)
+            new_array = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+            new_array[:self._len] = array[:self._len]
+            setattr(self, attr, new_array)
+
+    def _ordered(self, array):
+        end = self._start + self._len
+        if end <= len(array):
+            return array[self._start:end]
+        if isinstance(array, list):
+            return array[self._start:] + array[:end - len(array)]
+        return np.concatenate((array[self._start:], array[:end - len(array)]))
+
+    def _time_at(self, position):
+        return time_object(*(None if t < 0 else t for t in self._times[position].tolist()))
+
+    def _value_at(self, position):
+        value = self._values[position]
+        if not self._typed:
+            return value
+        if self._scalar_type is not None:
+            return self._scalar_type(value)
+        # items of a ring buffer are overwritten, so a view of one can't be returned
+        return value if self.maxlen is None else value.copy()
+
+
+class LogStream:
+    """Writes the items logged for one or more Parameters to files in chunks, while they are being logged.
+
+    Each chunk is written to a separate .npz file in **directory**, named with the Component, Parameter and
+    `execution context <Context>` for which the items were logged, and the number of the chunk; each file has
+    *time*, *context* and *value* arrays, in the format of the `times <LogBuffer.times>`, `contexts
+    <LogBuffer.contexts>` and `values <LogBuffer.values>` attributes of a `LogBuffer`.  A LogStream is assigned
+    using a Log's `set_log_storage <Log.set_log_storage>` method;  items remaining after the last full chunk are
+    written by calling its `flush_log_streams <Log.flush_log_streams>` method.
+
+    Arguments
+    ---------
+
+    directory : str
+        directory in which the files are written (created if it does not exist).
+
+    chunk_size : int : default 1000
+        number of items written to each file.
+
+    Attributes
+    ----------
+
+    files : list
+        paths of the files written, in the order they were written.
+    """
+
+    def __init__(self, directory, chunk_size=1000):
+        if chunk_size < 1:
+            raise LogError(f"'chunk_size' for {self.__class__.__name__} ({chunk_size}) must be a positive integer.")
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.files = []
+        self._num_chunks = {}
+
+    def __deepcopy__(self, memo):
+        # shared by copies of the Parameters to which it is assigned, so that their chunks are numbered consistently
+        return self
+
+    def _write(self, name, times, contexts, values):
+        os.makedirs(self.directory, exist_ok=True)
+        name = re.sub(r'[^\w.-]+', '_', str(name))
+        chunk = self._num_chunks.get(name, 0)
+        self._num_chunks[name] = chunk + 1
+        path = os.path.join(self.directory, f'{name}-{chunk:06d}.npz')
+        np.savez(path, time=times, context=np.array(contexts, dtype=str), value=values)
+        self.files.append(path)
+
+    @staticmethod
+    def load(files):
+        """Return a dict with the *time*, *context* and *value* arrays in **files**, concatenated in order"""
+        chunks = []
+        for file in files:
+            with np.load(file, allow_pickle=True) as chunk:
+                chunks.append({k: chunk[k] for k in ['time', 'context', 'value']})
+        if not chunks:
+            return {}
+        return {k: np.concatenate([chunk[k] for chunk in chunks]) for k in ['time', 'context', 'value']}
+
+
 #region Custom Entries Dict
 # Modified from: http://stackoverflow.com/questions/7760916/correct-useage-of-getter-setter-for-dictionary-values
 class EntriesDict(MutableMapping,dict):
@@ -840,6 +1127,65 @@ class Log:
             else:
                 assign_log_condition(item[0], item[1])
 
+    def set_log_storage(self, items, max_length=None, stream_to=None, chunk_size=1000):
+        """Specifies how the values logged for items are stored.
+
+        Values are stored in a `LogBuffer` for each `execution context <Context>` in which an item is logged;
+        this specifies the maximum number of values retained in each, and whether they are also written to files
+        while they are being logged.  It applies to LogBuffers created after it is called (i.e., it should be called
+        before the items are logged, or after their entries have been cleared using `clear_entries
+        <Log.clear_entries>`).
+
+        Arguments
+        ---------
+
+        items : str, Component, list containing either, or ALL
+            specifies items for which storage is specified;  these must be `loggable_items <Log.loggable_items>` of
+            the Log.
+
+        max_length : int : default None
+            specifies the maximum number of values retained for each item in each execution context;  once it is
+            reached, each value logged replaces the oldest one.  If it is None, all values logged are retained.
+
+        stream_to : str or LogStream : default None
+            specifies a directory (or a `LogStream`) to which values are written in chunks of **chunk_size**
+            values while they are being logged;  values remaining after the last full chunk are written by calling
+            `flush_log_streams <Log.flush_log_streams>`.
+
+        chunk_size : int : default 1000
+            specifies the number of values in each chunk written to **stream_to** (ignored if **stream_to** is a
+            `LogStream`).
+        """
+        from psyneulink.core.components.component import Component
+
+        if isinstance(stream_to, str):
+            stream_to = LogStream(stream_to, chunk_size)
+
+        if items == ALL:
+            items = self.all_items
+        elif not isinstance(items, list):
+            items = [items]
+
+        for item in items:
+            if isinstance(item, Component):
+                item = item.name
+            if item not in self.loggable_items:
+                raise LogError(f"'{item}' is not a loggable item for {self.owner.name}.")
+            param = self._get_parameter_from_item_string(item)
+            param.log_max_length = max_length
+            param.log_stream = stream_to
+
+    def flush_log_streams(self, entries=ALL):
+        """Write values logged for **entries** that have not yet been written to their `LogStream`
+        (see `set_log_storage <Log.set_log_storage>`).
+        """
+        if entries == ALL:
+            entries = self.all_items
+        for item in self._validate_entries_arg(entries):
+            for buffer in (self._get_parameter_from_item_string(item).log or {}).values():
+                if isinstance(buffer, LogBuffer):
+                    buffer.flush()
+
     def _set_delivery_conditions(self, items, delivery_condition=LogCondition.EXECUTION):
         """Specifies items to be delivered via gRPC under the specified `LogCondition`\\(s).
 
@@ -1533,9 +1879,20 @@ class Log:
             contexts = [eid for eid in contexts if EID_SIMULATION not in str(eid)]
 
         for eid in contexts:
-            time_values = self._parse_entries_for_time_values(entries, execution_id=eid)
             log_dict[eid] = OrderedDict()
 
+            # Use values stored in LogBuffers without copying them, if possible
+            columns = None if report_all_executions else self._get_columnar_entry_data(entries, eid)
+            if columns is not None:
+                times, values = columns
+                for i in range(NUM_TIME_SCALES):
+                    log_dict[eid][TIME_SCALE_NAMES[i].capitalize()] = times[:, i:i + 1].tolist()
+                for entry, entry_values in zip(entries, values):
+                    log_dict[eid][entry] = entry_values
+                continue
+
+            time_values = self._parse_entries_for_time_values(entries, execution_id=eid)
+
             # If all time values are recorded - - - log_dict = {"Run": array, "Trial": array, "Time_step": array}
             if time_values:
                 for i in range(NUM_TIME_SCALES):
@@ -1766,7 +2123,10 @@ class Log:
             logged_entries_for_param = logged_entries_for_param.get(entry) if logged_entries_for_param else None
             # make sure execution id exists in logged entries of param
             logged_entries_for_param = logged_entries_for_param.get(execution_id) if logged_entries_for_param else None
-            if logged_entries_for_param:
+            if isinstance(logged_entries_for_param, LogBuffer):
+                times = logged_entries_for_param.times
+                time_values.extend(time_object._make(t) for t in times[(times >= 0).all(axis=1)].tolist())
+            elif logged_entries_for_param:
                 time_values.extend([item.time
                                     for item in logged_entries_for_param
                                     if all(i is not None for i in item.time)])
@@ -1777,6 +2137,32 @@ class Log:
 
         return time_values
 
+    def _get_columnar_entry_data(self, entries, execution_id):
+        """Return times and values of **entries** for **execution_id**, as stored in their `LogBuffers <LogBuffer>`,
+        if those all have numeric values logged at the same (and strictly increasing) times;  otherwise return None
+        """
+        buffers = []
+        for entry in entries:
+            log = self._get_parameter_from_item_string(entry).log
+            buffer = log.get(execution_id) if log else None
+            if not isinstance(buffer, LogBuffer) or not buffer._typed or not len(buffer):
+                return None
+            buffers.append(buffer)
+
+        times = buffers[0].times
+        if (times < 0).any():
+            return None
+        # each time must be later than the previous one (i.e., only one value logged in each time_step)
+        steps = np.diff(times, axis=0)
+        nonzero = steps != 0
+        first_nonzero = steps[np.arange(len(steps)), nonzero.argmax(axis=1)]
+        if not (nonzero.any(axis=1) & (first_nonzero > 0)).all():
+            return None
+        if not all(np.array_equal(buffer.times, times) for buffer in buffers[1:]):
+            return None
+
+        return times, [buffer.values for buffer in buffers]
+
     def _assemble_entry_data(self, entry, time_values, report_all_executions=False, execution_id=None):
         # Assembles list of entry's (component's) value at each of the time points specified in time_values
         # If there are multiple entries for a given time point:
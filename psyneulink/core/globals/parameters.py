@@ -288,6 +288,12 @@ You should avoid using `dot notation <Parameter_Dot_Notation>` in internal code,
 |  log_condition   |     `OFF`     |the `LogCondition` for which the parameter  |                                         |
 |                  |               |should be logged                            |                                         |
 +------------------+---------------+--------------------------------------------+-----------------------------------------+
+|  log_max_length  |     None      |the maximum number of values retained in the|                                         |
+|                  |               |log for each execution context              |                                         |
++------------------+---------------+--------------------------------------------+-----------------------------------------+
+|    log_stream    |     None      |a `LogStream` to which logged values are    |                                         |
+|                  |               |written while they are being logged         |                                         |
++------------------+---------------+--------------------------------------------+-----------------------------------------+
 |     history      |     None      |stores the history of the parameter         |                                         |
 |                  |               |(previous values)                           |                                         |
 +------------------+---------------+--------------------------------------------+-----------------------------------------+
@@ -316,12 +322,13 @@ import types
 import typing
 import weakref
 
+import numpy as np
 import toposort
 
 from psyneulink.core.globals.context import Context, ContextError, ContextFlags, _get_time, handle_external_context
 from psyneulink.core.globals.context import time as time_object
 from psyneulink.core.globals.keywords import SHARED_COMPONENT_TYPES
-from psyneulink.core.globals.log import LogCondition, LogEntry, LogError
+from psyneulink.core.globals.log import LogBuffer, LogCondition, LogError
 from psyneulink.core.globals.utilities import (
     call_with_pruned_args,
     convert_all_elements_to_np_array,
@@ -431,6 +438,20 @@ def copy_parameter_value(value, shared_types=None, memo=None):
             raise
 
 
+_copy_on_write_scalar_types = (type(None), bool, int, float, complex, str, np.generic)
+
+
+def _is_copy_on_write_value(value):
+    """
+        Returns True if **value** may be shared between contexts until
+        it is assigned, because it is immutable or is a numeric array,
+        which Parameter._set_value only modifies in place
+    """
+    if isinstance(value, np.ndarray):
+        return value.dtype != object
+    return isinstance(value, _copy_on_write_scalar_types)
+
+
 def get_init_signature_default_value(obj, parameter):
     """
         Returns:
@@ -517,6 +538,33 @@ def is_array_like(obj: typing.Any) -> bool:
     return hasattr(obj, 'dtype')
 
 
+def _is_structure_changed(old_value, new_value) -> bool:
+    """
+        Returns True if **new_value** cannot be stored in the compiled
+        struct generated for **old_value**, because the shape or the
+        shape of a ragged element is different
+    """
+    if not is_array_like(old_value) or not is_array_like(new_value):
+        return is_array_like(old_value) != is_array_like(new_value)
+
+    if old_value.shape != new_value.shape:
+        return True
+
+    if old_value.dtype == object or new_value.dtype == object:
+        if old_value.dtype != new_value.dtype:
+            return True
+        # elements of ragged arrays may be lists rather than arrays
+        def _as_array(x):
+            return convert_all_elements_to_np_array(x) if isinstance(x, (list, tuple)) else x
+
+        return any(
+            _is_structure_changed(_as_array(old), _as_array(new))
+            for old, new in zip(old_value.flat, new_value.flat)
+        )
+
+    return False
+
+
 # used in Parameter._set_value. Parameter names where a change in
 # shape/type should cause deletion of corresponding compiled structs
 # even if the values are not synced
@@ -535,7 +583,9 @@ class ParametersTemplate:
             self._parent._children.add(self)
 
         # create list of params currently existing
-        self._params = set()
+        # (a dict is used as an ordered set, so that iteration over Parameters
+        # does not depend on the hash seed, e.g. for layout of compiled structures)
+        self._params = {}
         try:
             parent_keys = list(self._parent._params)
         except AttributeError:
@@ -543,7 +593,7 @@ class ParametersTemplate:
         source_keys = dir(self) + parent_keys
         for k in source_keys:
             if self._is_parameter(k):
-                self._params.add(k)
+                self._params[k] = None
 
         self._children = weakref.WeakSet()
 
@@ -594,7 +644,7 @@ class ParametersTemplate:
                 return True
 
     def _register_parameter(self, param_name):
-        self._params.add(param_name)
+        self._params[param_name] = None
         self._nonexistent_attr_cache.discard(param_name)
 
         for child in self._children:
@@ -864,7 +914,19 @@ class Parameter(ParameterBase):
         log
             stores the log of the parameter if applicable.
 
-            :type: dict{execution_id: deque([LogEntry])}
+            :type: dict{execution_id: `LogBuffer`}
+            :default: None
+
+        log_max_length
+            the maximum number of values retained in the log for each execution context; if None, all values
+            logged are retained (see `Log.set_log_storage`).
+
+            :default: None
+
+        log_stream
+            a `LogStream` to which logged values are written while they are being logged (see `Log.set_log_storage`).
+
+            :type: `LogStream`
             :default: None
 
         log_condition
@@ -967,7 +1029,7 @@ class Parameter(ParameterBase):
     # display if the function is True based on the value of the attribute
     _hidden_if_unset_attrs = {
         'aliases', 'getter', 'setter', 'constructor_argument', 'spec',
-        'modulation_combination_function', 'valid_types', 'initializer'
+        'modulation_combination_function', 'valid_types', 'initializer', 'log_max_length', 'log_stream'
     }
     _hidden_if_false_attrs = {'read_only', 'modulable', 'fallback_default', 'retain_old_simulation_data'}
     _hidden_when = {
@@ -1007,6 +1069,8 @@ class Parameter(ParameterBase):
         loggable=True,
         log=None,
         log_condition=LogCondition.OFF,
+        log_max_length=None,
+        log_stream=None,
         delivery_condition=LogCondition.OFF,
         history=None,
         history_max_length=1,
@@ -1073,6 +1137,8 @@ class Parameter(ParameterBase):
             loggable=loggable,
             log=log,
             log_condition=log_condition,
+            log_max_length=log_max_length,
+            log_stream=log_stream,
             delivery_condition=delivery_condition,
             history=history,
             history_max_length=history_max_length,
@@ -1103,6 +1169,9 @@ class Parameter(ParameterBase):
             + [k for k in self.__class__.__dict__ if k in self._additional_param_attr_properties]
 
         self._is_invalid_source = False
+        # execution_ids whose value and history are shared with the
+        # context they were initialized from (see _initialize_from_context)
+        self._copy_on_write_ids = set()
         self._inherited_attrs_cache = {}
         self.__inherited = False
         self._inherited = _inherited
@@ -1145,6 +1214,7 @@ class Parameter(ParameterBase):
                 copy_parameter_value(self.default_value, memo), directly=True
             )
 
+        result._copy_on_write_ids = set(self._copy_on_write_ids)
         memo[id(self)] = result
 
         return result
@@ -1583,6 +1653,17 @@ class Parameter(ParameterBase):
         compilation_sync=False,
     ):
         value_is_array_like = is_array_like(value)
+
+        # the current value and history are shared with another context,
+        # so they are replaced rather than modified in place below
+        copy_on_write = execution_id in self._copy_on_write_ids
+        if copy_on_write:
+            self._copy_on_write_ids.remove(execution_id)
+            try:
+                self.history[execution_id] = copy.copy(self.history[execution_id])
+            except KeyError:
+                pass
+
         # store history
         if not skip_history:
             if execution_id in self.values:
@@ -1610,7 +1691,7 @@ class Parameter(ParameterBase):
                 self._deliver_value(value_for_log, context)
 
         value_updated = False
-        if not compilation_sync:
+        if not compilation_sync and not copy_on_write:
             try:
                 update_array_in_place(self.values[execution_id], value)
             except (KeyError, TypeError, ValueError):
@@ -1624,6 +1705,13 @@ class Parameter(ParameterBase):
                 value_updated = True
 
         if not value_updated:
+            try:
+                old_value = self.values[execution_id]
+            except KeyError:
+                structure_changed = False
+            else:
+                structure_changed = _is_structure_changed(old_value, value)
+
             self.values[execution_id] = value
 
             if compilation_sync:
@@ -1643,11 +1731,15 @@ class Parameter(ParameterBase):
                     pass
                 else:
                     for comp in owner_comps:
-                        comp._delete_compilation_data(context, self)
+                        comp._delete_compilation_data(
+                            context, self, structure_changed=structure_changed
+                        )
                 self._tracking_compiled_struct = False
 
     @handle_external_context()
     def delete(self, context=None):
+        self._copy_on_write_ids.discard(context.execution_id)
+
         try:
             del self.values[context.execution_id]
         except KeyError:
@@ -1698,11 +1790,13 @@ class Parameter(ParameterBase):
                 execution_id = context.execution_id
 
             if execution_id not in self.log:
-                self.log[execution_id] = collections.deque([])
+                self.log[execution_id] = LogBuffer(
+                    maxlen=self.log_max_length,
+                    stream=self.log_stream,
+                    name=f'{self._owner._owner.name}-{self.name}-{execution_id}'
+                )
 
-            self.log[execution_id].append(
-                LogEntry(time, context_str, value)
-            )
+            self.log[execution_id]._append(time, context_str, value)
 
     def _deliver_value(self, value, context=None):
         # if a context is attached and a pipeline is attached to the context
@@ -1809,11 +1903,28 @@ class Parameter(ParameterBase):
 
         for eid in execution_ids:
             try:
-                self.history[eid].clear()
+                if eid in self._copy_on_write_ids:
+                    self.history[eid] = collections.deque(maxlen=self.history[eid].maxlen)
+                else:
+                    self.history[eid].clear()
             except KeyError:
                 pass
 
-    def _initialize_from_context(self, context=None, base_context=Context(execution_id=None), override=True):
+    def _initialize_from_context(
+        self,
+        context=None,
+        base_context=Context(execution_id=None),
+        override=True,
+        copy_on_write=False,
+    ):
+        """
+            Copies the value and history of this Parameter in
+            **base_context** into **context**. If **copy_on_write** is
+            True, values that are only ever changed through `_set` are
+            shared with **base_context** instead, and copied on the
+            first assignment in **context**. **base_context** must not
+            be modified while **context** exists.
+        """
         try:
             try:
                 cur_val = self.values[context.execution_id]
@@ -1831,14 +1942,21 @@ class Parameter(ParameterBase):
                 except KeyError:
                     new_history = NotImplemented
 
-                new_val = copy_parameter_value(new_val)
-                self.values[context.execution_id] = new_val
-
                 if new_history is None:
                     raise ParameterError('history should always be a collections.deque if it exists')
-                elif new_history is not NotImplemented:
-                    # shallow copy is OK because history should not change
-                    self.history[context.execution_id] = copy.copy(new_history)
+
+                if copy_on_write and _is_copy_on_write_value(new_val):
+                    self._copy_on_write_ids.add(context.execution_id)
+                else:
+                    self._copy_on_write_ids.discard(context.execution_id)
+                    new_val = copy_parameter_value(new_val)
+                    if new_history is not NotImplemented:
+                        # shallow copy is OK because history should not change
+                        new_history = copy.copy(new_history)
+
+                self.values[context.execution_id] = new_val
+                if new_history is not NotImplemented:
+                    self.history[context.execution_id] = new_history
 
         except ParameterError as e:
             raise ParameterError('Error when attempting to initialize from {0}: {1}'.format(base_context.execution_id, e))
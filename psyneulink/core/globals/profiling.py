@@ -0,0 +1,391 @@
+# Princeton University licenses this file to You under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.  You may obtain a copy of the License at:
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and limitations under the License.
+#
+#
+# ***********************************************  Profiling ***********************************************************
+
+"""
+
+Overview
+--------
+
+A Profiler records how much wall-clock time is spent in each part of a model while a `Composition` executes.  It is
+enabled for a single run by setting the **profile** argument of the Composition's `run <Composition.run>` method, in
+which case it is assigned to the Composition's `profiler <Composition.profiler>` attribute, or for an arbitrary block
+of code by using it as a context manager::
+
+    with pnl.Profiler() as profiler:
+        comp.run(inputs)
+    print(profiler.report())
+
+The methods that record sections are only instrumented while a Profiler is active, so that profiling adds no
+overhead when it is disabled.
+
+.. _Profiler_Sections:
+
+Sections
+--------
+
+Time is aggregated by *section*.  Each section is identified by a (category, name) tuple, and records the number of
+calls, the inclusive time (including the time spent in sections called from it) and the exclusive time (excluding
+it).  The following sections are recorded:
+
+    * *Mechanism* -- `execute <Mechanism_Base.execute>` of each `Mechanism`;
+    * *Port* -- execution of each `Port`, identified as ``<owner name>[<port name>]``;
+    * *Projection* -- execution of each `Projection`;
+    * *Function* -- `function <Function_Base.function>` of each `Function`;
+    * *Scheduler* -- computation of the next set of nodes to execute by a Composition's `scheduler
+      <Composition.scheduler>`;
+    * *Simulation* -- `evaluate <Composition.evaluate>` of a Composition by its `controller <Composition.controller>`;
+    * *Compiled* -- calls to compiled code; these are recorded for each node in `ExecutionMode.LLVM`, and for each
+      `TRIAL <TimeScale.TRIAL>` or `RUN` in the other compiled modes, since compiled code is not instrumented
+      internally.
+
+.. _Profiler_Output:
+
+Output
+------
+
+`stats <Profiler.stats>` contains a `ProfileEntry` for each section, and `report <Profiler.report>` formats them as a
+table.  `dump_stats <Profiler.dump_stats>` writes the sections in the format read by the standard library's
+`pstats.Stats`, and `write_collapsed_stacks <Profiler.write_collapsed_stacks>` writes the collapsed stack format
+read by flamegraph tools.
+
+.. _Profiler_Class_Reference:
+
+Class Reference
+---------------
+
+"""
+
+import functools
+import marshal
+import threading
+import time
+
+from psyneulink.core.globals.keywords import \
+    FUNCTION_COMPONENT_CATEGORY, MECHANISM_COMPONENT_CATEGORY, PORT_COMPONENT_CATEGORY, PROJECTION_COMPONENT_CATEGORY
+
+__all__ = ['Profiler', 'ProfileEntry']
+
+
+# the Profiler that records sections, or None if profiling is disabled
+_active_profiler = None
+
+# (class, attribute name, method, category, exclude_categories) for each method decorated with profiled
+_profiled_methods = []
+
+_section_categories = {
+    FUNCTION_COMPONENT_CATEGORY: 'Function',
+    MECHANISM_COMPONENT_CATEGORY: 'Mechanism',
+    PORT_COMPONENT_CATEGORY: 'Port',
+    PROJECTION_COMPONENT_CATEGORY: 'Projection',
+}
+
+
+class ProfileEntry:
+    """Timing record of a single `section <Profiler_Sections>`.
+
+    Attributes
+    ----------
+
+    calls : int
+        number of times the section was entered.
+
+    inclusive_time : float
+        total time, in seconds, spent in the section, including sections called from it.
+
+    exclusive_time : float
+        total time, in seconds, spent in the section, excluding sections called from it.
+    """
+    __slots__ = ('calls', 'inclusive_time', 'exclusive_time')
+
+    def __init__(self):
+        self.calls = 0
+        self.inclusive_time = 0.0
+        self.exclusive_time = 0.0
+
+    def __repr__(self):
+        return '{}(calls={}, inclusive_time={}, exclusive_time={})'.format(
+            self.__class__.__name__, self.calls, self.inclusive_time, self.exclusive_time
+        )
+
+
+class Profiler:
+    """
+    Profiler(timer=time.perf_counter)
+
+    Record call counts and wall-clock time of the `sections <Profiler_Sections>` executed while it is active.
+
+    Arguments
+    ---------
+
+    timer : Callable : default time.perf_counter
+        function that returns the current time in seconds.
+
+    Attributes
+    ----------
+
+    stats : dict
+        `ProfileEntry` for each section, keyed by the section's (category, name) tuple.
+
+    call_stacks : dict
+        exclusive time, in seconds, of each distinct stack of sections, keyed by a tuple of the sections' keys from
+        the outermost to the innermost.
+    """
+
+    def __init__(self, timer=time.perf_counter):
+        self.timer = timer
+        self.stats = {}
+        self.call_stacks = {}
+        self._callers = {}
+        self._stack = []
+        self._depths = {}
+        self._thread = None
+        self._activations = []
+
+    def __enter__(self):
+        global _active_profiler
+        if _active_profiler is None:
+            _install_profiling_wrappers(True)
+        self._activations.append((_active_profiler, len(self._stack)))
+        self._thread = threading.get_ident()
+        _active_profiler = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global _active_profiler
+        _active_profiler, stack_depth = self._activations.pop()
+        if _active_profiler is None:
+            _install_profiling_wrappers(False)
+
+        # close sections left open by an exception
+        while len(self._stack) > stack_depth:
+            self._exit()
+
+    def _enter(self, key):
+        # only the thread that enabled profiling is recorded; sections
+        # executed by worker threads are included in the caller's time
+        if threading.get_ident() != self._thread:
+            return False
+
+        self._stack.append([key, self.timer(), 0.0])
+        self._depths[key] = self._depths.get(key, 0) + 1
+        return True
+
+    def _exit(self):
+        key, start, children_time = self._stack.pop()
+        elapsed = self.timer() - start
+        exclusive = elapsed - children_time
+
+        try:
+            entry = self.stats[key]
+        except KeyError:
+            entry = self.stats[key] = ProfileEntry()
+        entry.calls += 1
+        entry.exclusive_time += exclusive
+
+        # count recursive calls only once in inclusive time
+        depth = self._depths[key] - 1
+        self._depths[key] = depth
+        if depth == 0:
+            entry.inclusive_time += elapsed
+
+        stack_key = tuple(s[0] for s in self._stack) + (key,)
+        self.call_stacks[stack_key] = self.call_stacks.get(stack_key, 0.0) + exclusive
+
+        if self._stack:
+            caller = self._stack[-1]
+            caller[2] += elapsed
+            edge = self._callers.setdefault((caller[0], key), [0, 0.0, 0.0])
+            edge[0] += 1
+            edge[1] += exclusive
+            edge[2] += elapsed
+
+    def section(self, category, name):
+        """Return a context manager that records the enclosed code as the section (**category**, **name**)."""
+        return _Section(self, (category, name))
+
+    def profile_iterator(self, iterable, category, name):
+        """Iterate over **iterable**, recording the computation of each item as the section (**category**,
+        **name**).
+        """
+        iterator = iter(iterable)
+        key = (category, name)
+        while True:
+            recorded = self._enter(key)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                if recorded:
+                    self._exit()
+            yield item
+
+    def clear(self):
+        """Remove all recorded sections."""
+        self.stats.clear()
+        self.call_stacks.clear()
+        self._callers.clear()
+
+    def report(self, sort_by='exclusive_time', limit=None):
+        """Return a table of the recorded sections, sorted in descending order by **sort_by**, which can be
+        'calls', 'inclusive_time' or 'exclusive_time'. Only the first **limit** sections are included if it is
+        specified.
+        """
+        if sort_by not in ProfileEntry.__slots__:
+            raise ValueError("'sort_by' must be one of {}, not '{}'.".format(ProfileEntry.__slots__, sort_by))
+
+        entries = sorted(self.stats.items(), key=lambda item: getattr(item[1], sort_by), reverse=True)
+        if limit is not None:
+            entries = entries[:limit]
+
+        lines = ['{:>10} {:>14} {:>14}  {}'.format('calls', 'inclusive (s)', 'exclusive (s)', 'section')]
+        for (category, name), entry in entries:
+            lines.append('{:>10} {:>14.6f} {:>14.6f}  {}: {}'.format(
+                entry.calls, entry.inclusive_time, entry.exclusive_time, category, name
+            ))
+        return '\n'.join(lines)
+
+    def _pstats_dict(self):
+        def _func(key):
+            # pstats identifies functions by (file name, line number, function name)
+            return (key[0], 0, key[1])
+
+        callers = {}
+        for (caller, callee), (calls, exclusive, inclusive) in self._callers.items():
+            callers.setdefault(callee, {})[_func(caller)] = (calls, calls, exclusive, inclusive)
+
+        return {
+            _func(key): (
+                entry.calls, entry.calls, entry.exclusive_time, entry.inclusive_time, callers.get(key, {})
+            )
+            for key, entry in self.stats.items()
+        }
+
+    def dump_stats(self, filename):
+        """Write the recorded sections to **filename** in the format read by `pstats.Stats`."""
+        with open(filename, 'wb') as f:
+            marshal.dump(self._pstats_dict(), f)
+
+    def write_collapsed_stacks(self, filename, unit=1e-6):
+        """Write the exclusive time of each stack of sections to **filename** in the collapsed stack format used
+        by flamegraph tools. Times are written as integer multiples of **unit** seconds.
+        """
+        with open(filename, 'w') as f:
+            for stack, exclusive in sorted(self.call_stacks.items()):
+                frames = ';'.join('{}: {}'.format(*key).replace(';', ',') for key in stack)
+                f.write('{} {}\n'.format(frames, int(round(exclusive / unit))))
+
+
+class _Section:
+    __slots__ = ('_profiler', '_key', '_recorded')
+
+    def __init__(self, profiler, key):
+        self._profiler = profiler
+        self._key = key
+
+    def __enter__(self):
+        self._recorded = self._profiler._enter(self._key)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._recorded:
+            self._profiler._exit()
+
+
+def _section_key(component, category):
+    component_category = component.componentCategory
+    if category is None:
+        category = _section_categories.get(component_category, component_category)
+
+    name = component.name
+    if component_category == PORT_COMPONENT_CATEGORY:
+        try:
+            name = '{}[{}]'.format(component.owner.name, name)
+        except AttributeError:
+            pass
+
+    return (category, name)
+
+
+class _ProfiledMethod:
+    """Placeholder for a method decorated with `profiled`, that registers the method and replaces itself with it
+    when its class is created.
+    """
+    def __init__(self, method, category, exclude_categories):
+        self.method = method
+        self.category = category
+        self.exclude_categories = exclude_categories
+
+    def __set_name__(self, owner, name):
+        _profiled_methods.append((owner, name, self.method, self.category, self.exclude_categories))
+        setattr(owner, name, self.method)
+
+
+def _profiling_wrapper(method, category, exclude_categories):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        profiler = _active_profiler
+        if (
+            profiler is None
+            or self.componentCategory in exclude_categories
+            or not profiler._enter(_section_key(self, category))
+        ):
+            return method(self, *args, **kwargs)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            profiler._exit()
+
+    return wrapper
+
+
+def _install_profiling_wrappers(install):
+    # methods are only wrapped while a Profiler is active, so that they have no overhead otherwise
+    for owner, name, method, category, exclude_categories in _profiled_methods:
+        setattr(owner, name, _profiling_wrapper(method, category, exclude_categories) if install else method)
+
+
+def profiled(category=None, exclude_categories=frozenset()):
+    """
+    Returns a decorator that records each call of a Component method as the `section <Profiler_Sections>`
+    (**category**, name of the Component), while a Profiler is active. If **category** is not specified, it is
+    determined by the Component's componentCategory. Calls on Components whose componentCategory is in
+    **exclude_categories** are not recorded.
+
+    The method itself is left unchanged; it is replaced by a wrapper that records it only while a Profiler is
+    active, so that profiling adds no overhead when it is disabled.
+    """
+    def decorator(method):
+        return _ProfiledMethod(method, category, exclude_categories)
+
+    return decorator
+
+
+def profiled_run(method):
+    """
+    Decorator for Composition.run that activates a Profiler for the run when its **profile** argument is
+    specified; the argument itself is ignored by the decorated method.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        profile = kwargs.get('profile', False)
+        if profile is False or profile is None:
+            return method(self, *args, **kwargs)
+
+        profiler = profile if isinstance(profile, Profiler) else Profiler()
+        self.profiler = profiler
+        with profiler:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def get_active_profiler():
+    """Return the active Profiler, or None if profiling is disabled."""
+    return _active_profiler
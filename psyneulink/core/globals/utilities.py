@@ -106,6 +106,7 @@ import itertools
 import logging
 import psyneulink
 import re
+import sys
 import time
 import warnings
 import weakref
@@ -115,6 +116,7 @@ import typing
 from beartype import beartype
 
 from numbers import Number
+from psyneulink._lazy import LazyModule
 from psyneulink._typing import Any, Callable, Optional, Union, Literal, Type, List, Tuple
 
 from enum import Enum, EnumMeta, IntEnum
@@ -125,15 +127,12 @@ from itertools import chain, combinations
 import numpy as np
 from numpy.typing import DTypeLike
 
-# Conditionally import torch
-try:
-    import torch
-except ImportError:
-    torch = None
-
 from psyneulink.core.globals.keywords import (comparison_operators, DISTANCE_METRICS, EXPONENTIAL, GAUSSIAN, LINEAR,
                                               MATRIX_KEYWORD_VALUES, MPS, NAME, SINUSOID, VALUE)
 
+# torch is only imported when it is first used
+torch = LazyModule('torch')
+
 __all__ = [
     'append_type_to_name', 'AutoNumber', 'ContentAddressableList', 'convert_to_list', 'convert_to_np_array',
     'convert_all_elements_to_np_array', 'copy_iterable_with_shared', 'get_class_attributes', 'extended_array_equal', 'flatten_list',
@@ -1054,7 +1053,7 @@ def convert_to_np_array(value, dimension=None):
     value = safe_create_np_array(value)
 
     if dimension == 1:
-        if torch and torch.is_tensor(value):
+        if _is_torch_tensor(value):
             value = torch.atleast_1d(value)
         else:
             value = np.atleast_1d(value)
@@ -1068,7 +1067,7 @@ def convert_to_np_array(value, dimension=None):
         ):
             pass
         else:
-            if torch and torch.is_tensor(value):
+            if _is_torch_tensor(value):
                 value = torch.atleast_2d(value)
             else:
                 value = np.atleast_2d(value)
@@ -2365,6 +2364,12 @@ def array_from_matrix_string(
 
 #region PYTORCH TENSOR METHODS *****************************************************************************************
 
+def _is_torch_tensor(value):
+    # a tensor can only exist if torch has already been imported, so don't import it to check
+    torch_module = sys.modules.get('torch')
+    return torch_module is not None and torch_module.is_tensor(value)
+
+
 def get_torch_tensor(value, dtype, device):
     if device == MPS or device == torch.device(MPS):
         if isinstance(value, torch.Tensor):
@@ -2382,7 +2387,7 @@ def safe_create_np_array(value):
     with warnings.catch_warnings():
 
         # If we have a torch tensor, allow it to pass through unchanged
-        if torch and torch.is_tensor(value):
+        if _is_torch_tensor(value):
             return value
 
         warnings.filterwarnings('error', category=np.VisibleDeprecationWarning)
@@ -252,7 +252,10 @@ _ptx_engine = None
 def _get_engines():
     global _cpu_engine
     if _cpu_engine is None:
-        _cpu_engine = cpu_jit_engine()
+        object_cache = None
+        if "cache" in debug_env:
+            object_cache = LLVMObjectCache(debug_env["cache"] or None)
+        _cpu_engine = cpu_jit_engine(object_cache)
 
     global _ptx_engine
     if ptx_enabled:
@@ -306,3 +309,16 @@ def cleanup(check_leaks:bool=False):
             assert any(inspect.isframe(r) for r in gc.get_referrers(e))
 
         CompExecution.active_executions.clear()
+
+
+def invalidate(component):
+    """Drop compiled code that depends on the structure of *component*.
+
+    Unlike `cleanup`, code of unrelated components stays cached and is
+    reused when the affected functions are regenerated.
+    """
+    if LLVMBuilderContext.is_active():
+        LLVMBuilderContext.get_current().invalidate(component)
+
+    # Binary functions are cached by name, regenerated functions get new names.
+    LLVMBinaryFunction.from_obj.cache_clear()
@@ -278,6 +278,52 @@ class LLVMBuilderContext:
 
         return obj_cache[tags]
 
+    def invalidate(self, component):
+        """
+        Drop cached code and struct types that depend on the structure of
+        *component*.
+
+        This includes the component itself, its owners, and every
+        composition that contains any of them together with the composition's
+        node wrappers and controller. Code generated for other nodes is kept
+        and is linked into the regenerated wrappers using declarations.
+        """
+        stale = []
+        compositions = []
+
+        obj = component
+        while obj is not None and obj not in stale:
+            stale.append(obj)
+            # recurrent projections are part of their mechanism's structures
+            try:
+                if obj.sender.owner is obj.receiver.owner:
+                    stale.append(obj.receiver.owner)
+            except AttributeError:
+                pass
+            obj = getattr(obj, 'owner', None)
+
+        for obj in stale:
+            compositions.extend(getattr(obj, 'compositions', ()))
+
+        while len(compositions) > 0:
+            comp = compositions.pop()
+            if comp in stale:
+                continue
+            stale.append(comp)
+            stale.extend(getattr(comp, '_node_assemblies', {}).values())
+            controller = getattr(comp, 'controller', None)
+            if controller is not None:
+                stale.extend((controller, controller.function))
+            # nested compositions are part of their parents' structures
+            compositions.extend(getattr(comp, 'compositions', ()))
+
+        for obj in stale:
+            for cache in (self._cache, self._component_param_use, self._component_state_use):
+                try:
+                    del cache[obj]
+                except (KeyError, TypeError):
+                    pass
+
     def import_llvm_function(self, fun, *, tags:frozenset=frozenset()) -> ir.Function:
         """
         Get function handle if function exists in current modele.
@@ -475,7 +521,10 @@ class LLVMBuilderContext:
                 val = [val]   # modulation adds array wrap
             return self.convert_python_struct_to_llvm_ir(val)
 
-        elements = map(_param_struct, component._get_compilation_params())
+        # Structures of parent classes are built using super(); the parameters
+        # included are the ones of the instance, as for the initializer and ids
+        instance = component.__self__ if isinstance(component, super) else component
+        elements = map(_param_struct, instance._get_compilation_params())
         return ir.LiteralStructType(elements)
 
     @_comp_cached
@@ -495,7 +544,9 @@ class LLVMBuilderContext:
             struct = self.convert_python_struct_to_llvm_ir(val)
             return ir.ArrayType(struct, p.history_min_length + 1)
 
-        elements = map(_state_struct, component._get_compilation_state())
+        # See get_param_struct_type
+        instance = component.__self__ if isinstance(component, super) else component
+        elements = map(_state_struct, instance._get_compilation_state())
         return ir.LiteralStructType(elements)
 
     @_comp_cached
@@ -529,7 +580,7 @@ class LLVMBuilderContext:
             assert all(round(x.value) == x.value for x in type(t))
             return self.int32_ty
 
-        elif isinstance(t, (int, float, np.floating)):
+        elif isinstance(t, (int, float, np.floating, np.bool_)):
             return self.float_ty
 
         elif isinstance(t, np.integer):
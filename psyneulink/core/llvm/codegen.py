@@ -1000,7 +1000,10 @@ def gen_composition_exec(ctx, composition, *, tags:frozenset):
 def gen_composition_run(ctx, composition, *, tags:frozenset):
     assert "run" in tags
     simulation = "simulation" in tags
+    chunked = "chunked" in tags
     name = "_".join(("wrap",  *tags, composition.name))
+    cond_gen = helpers.ConditionGenerator(ctx, composition)
+    cond_type = cond_gen.get_condition_struct_type()
     args = [ctx.get_state_struct_type(composition).as_pointer(),
             ctx.get_param_struct_type(composition).as_pointer(),
             ctx.get_data_struct_type(composition).as_pointer(),
@@ -1008,12 +1011,15 @@ def gen_composition_run(ctx, composition, *, tags:frozenset):
             ctx.get_output_struct_type(composition).as_pointer(),
             ctx.int32_ty.as_pointer(),
             ctx.int32_ty.as_pointer()]
+    if chunked:
+        # Condition structure, that is kept by the caller between the chunks of a run
+        args.append(cond_type.as_pointer())
     builder = ctx.create_llvm_function(args, composition, name)
     llvm_func = builder.function
     for a in llvm_func.args:
         a.attributes.add('noalias')
 
-    state, params, data, data_in, data_out, trials_ptr, inputs_ptr = llvm_func.args
+    state, params, data, data_in, data_out, trials_ptr, inputs_ptr, *chunk_args = llvm_func.args
 
     nodes_states = helpers.get_state_ptr(builder, composition, state, "nodes")
 
@@ -1044,19 +1050,28 @@ def gen_composition_run(ctx, composition, *, tags:frozenset):
         builder.store(data_in.type.pointee(input_init), data_in)
         builder.store(inputs_ptr.type.pointee(1), inputs_ptr)
 
-    # Reset internal 'RUN' clocks of each node
-    for idx, node in enumerate(composition._all_nodes):
-        node_state = builder.gep(state, [ctx.int32_ty(0), ctx.int32_ty(0), ctx.int32_ty(idx)])
-        num_executions_ptr = helpers.get_state_ptr(builder, node, node_state, "num_executions")
-        num_exec_time_ptr = builder.gep(num_executions_ptr, [ctx.int32_ty(0), ctx.int32_ty(TimeScale.RUN.value)])
-        builder.store(num_exec_time_ptr.type.pointee(None), num_exec_time_ptr)
+    if chunked:
+        # Continue the run from the state of the conditions after the previous chunk,
+        # 'RUN' clocks are reset only before its first trial
+        cond, = chunk_args
+        first_trial = ctx.bool_ty(1)
+        if len(cond_type.elements) != 0:
+            trial_ptr = builder.gep(cond, [ctx.int32_ty(0)] * 4)
+            first_trial = builder.icmp_unsigned("==", builder.load(trial_ptr), trial_ptr.type.pointee(0))
+    else:
+        # Allocate and initialize condition structure
+        cond = builder.alloca(cond_type, name="scheduler_metadata")
+        cond_init = cond_type(cond_gen.get_condition_initializer())
+        builder.store(cond_init, cond)
+        first_trial = ctx.bool_ty(1)
 
-    # Allocate and initialize condition structure
-    cond_gen = helpers.ConditionGenerator(ctx, composition)
-    cond_type = cond_gen.get_condition_struct_type()
-    cond = builder.alloca(cond_type, name="scheduler_metadata")
-    cond_init = cond_type(cond_gen.get_condition_initializer())
-    builder.store(cond_init, cond)
+    # Reset internal 'RUN' clocks of each node
+    with builder.if_then(first_trial):
+        for idx, node in enumerate(composition._all_nodes):
+            node_state = builder.gep(state, [ctx.int32_ty(0), ctx.int32_ty(0), ctx.int32_ty(idx)])
+            num_executions_ptr = helpers.get_state_ptr(builder, node, node_state, "num_executions")
+            num_exec_time_ptr = builder.gep(num_executions_ptr, [ctx.int32_ty(0), ctx.int32_ty(TimeScale.RUN.value)])
+            builder.store(num_exec_time_ptr.type.pointee(None), num_exec_time_ptr)
 
     trials = builder.load(trials_ptr, "trials")
     iters_ptr = builder.alloca(trials.type, name="iterations")
@@ -1096,7 +1111,7 @@ def gen_composition_run(ctx, composition, *, tags:frozenset):
     data_in_ptr = builder.gep(data_in, [input_idx])
 
     # Call execution
-    exec_tags = tags.difference({"run", "simulation_results"})
+    exec_tags = tags.difference({"run", "simulation_results", "chunked"})
     exec_f = ctx.import_llvm_function(composition, tags=exec_tags)
     builder.call(exec_f, [state, params, data_in_ptr, data, cond])
 
@@ -31,6 +31,10 @@ Compilation modifiers:
  * "const_state" -- hardcode base context values into generate code,
                  instead of laoding them from the context argument
  * "opt" -- Set compiler optimization level (0,1,2,3)
+ * "cache" -- Store compiled CPU objects in a persistent on-disk cache,
+              and reuse them in later processes instead of optimizing and
+              compiling the same code again. Use "cache=<dir>" to select
+              the cache directory (default: ~/.cache/psyneulink/llvm)
  * "unaligned_copy" -- Do not assume structures are 4B aligned
 
 CUDA options:
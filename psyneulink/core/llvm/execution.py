@@ -9,8 +9,10 @@
 # ********************************************* Binary Execution Wrappers **************************************************************
 
 import concurrent.futures
+import contextlib
 import copy
 import ctypes
+import itertools
 import numpy as np
 from inspect import isgenerator
 import os
@@ -22,6 +24,7 @@ import weakref
 
 from psyneulink.core import llvm as pnlvm
 from psyneulink.core.globals.context import Context
+from psyneulink.core.globals.profiling import get_active_profiler
 
 from . import helpers, jit_engine, builder_context
 from .debug import debug_env
@@ -47,6 +50,19 @@ def _pretty_size(size):
     return "{:.2f} {}".format(size, u)
 
 
+# Default number of chunks of evaluations per thread used by CompExecution.thread_evaluate.
+# More chunks than threads allow threads that finish early to take over the remaining work.
+_EVALUATE_CHUNKS_PER_THREAD = 4
+
+
+def _compiled_section(name):
+    # Compiled code is not instrumented, calls into it are recorded as a whole
+    profiler = get_active_profiler()
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.section('Compiled', name)
+
+
 class Execution:
     def __init__(self):
         self._debug_env = debug_env
@@ -137,6 +153,11 @@ class Execution:
                 if attribute == "ring_memory":
                     continue
 
+                # Reconstruct Python RingBuffer of Buffer function
+                if attribute == "ring_buffer":
+                    component._copy_compiled_ring_buffer(numpy_field, context)
+                    continue
+
                 # TODO: Reconstruct Time class
                 if attribute == "num_executions":
                     continue
@@ -262,8 +283,13 @@ class FuncExecution(CUDAExecution):
         return self._get_compilation_param('_state', '_get_state_initializer', 1)
 
     def execute(self, variable):
-        new_variable = np.asfarray(variable, dtype=self._bin_func.np_arg_dtypes[2].base)
-        data_in = new_variable.reshape(self._bin_func.np_arg_dtypes[2].shape)
+        input_dtype = self._bin_func.np_arg_dtypes[2]
+        if input_dtype.names is not None:
+            # Variables with items of different shapes are passed in a struct
+            data_in = np.asarray(_tupleize(variable), dtype=input_dtype)
+        else:
+            new_variable = np.asfarray(variable, dtype=input_dtype.base)
+            data_in = new_variable.reshape(input_dtype.shape)
 
         data_out = self._bin_func.np_buffer_for_arg(3)
 
@@ -296,16 +322,26 @@ class CompExecution(CUDAExecution):
         super().__init__(buffers=['state_struct', 'param_struct', 'data_struct', 'conditions'])
         self._composition = composition
         self._execution_context = context
+        self.__tags = frozenset(additional_tags)
+        self._discard_compiled()
+
+        self.active_executions.add(self)
+
+    def _discard_compiled(self):
+        """Discard binary functions and compiled structures, they are recreated when next used
+        (e.g., after the structure of a parameter of the Composition changed)"""
         self.__bin_exec_func = None
         self.__bin_func = None
         self.__bin_run_func = None
+        self.__bin_chunked_run_func = None
         self.__frozen_values = None
-        self.__tags = frozenset(additional_tags)
 
         # Scheduling conditions, only used by "execute"
         self.__conditions = None
 
-        self.active_executions.add(self)
+        for struct_name in ('_param', '_state', '_data', '_eval_data'):
+            setattr(self, struct_name, None)
+        self._gpu_buffers = dict.fromkeys(self._gpu_buffers)
 
     def __del__(self):
         self.active_executions.discard(self)
@@ -336,6 +372,8 @@ class CompExecution(CUDAExecution):
             return self.__bin_exec_func
         if self.__bin_run_func is not None:
             return self.__bin_run_func
+        if self.__bin_chunked_run_func is not None:
+            return self.__bin_chunked_run_func
 
         assert False, "Binary function not set for execution!"
 
@@ -377,7 +415,7 @@ class CompExecution(CUDAExecution):
     @property
     def _data_struct(self):
         # Run wrapper changed argument order
-        arg = 2 if self._bin_func is self.__bin_run_func else 3
+        arg = 2 if self._bin_func in (self.__bin_run_func, self.__bin_chunked_run_func) else 3
         return self._get_compilation_param('_data', '_get_data_initializer', arg)
 
     @_data_struct.setter
@@ -476,7 +514,8 @@ class CompExecution(CUDAExecution):
             # the same structure as outputs.
             data_in = self._data_struct
 
-        self._bin_func(self._state_struct, self._param_struct, inputs, data_in, self._data_struct)
+        with _compiled_section(node.name):
+            self._bin_func(self._state_struct, self._param_struct, inputs, data_in, self._data_struct)
 
         if "comp_node_debug" in self._debug_env:
             print("RAN: {}. State: {}".format(node, self.extract_node_state(node)))
@@ -495,31 +534,39 @@ class CompExecution(CUDAExecution):
     def execute(self, inputs):
         # NOTE: Make sure that input struct generation is inlined.
         # We need the binary function to be setup for it to work correctly.
-        self._bin_exec_func(self._state_struct,
-                            self._param_struct,
-                            self._get_input_struct(inputs),
-                            self._data_struct,
-                            self._conditions)
+        with _compiled_section(self._composition.name):
+            self._bin_exec_func(self._state_struct,
+                                self._param_struct,
+                                self._get_input_struct(inputs),
+                                self._data_struct,
+                                self._conditions)
 
     def cuda_execute(self, inputs):
         # NOTE: Make sure that input struct generation is inlined.
         # We need the binary function to be setup for it to work correctly.
-        self._bin_exec_func.cuda_call(self._cuda_state_struct,
-                                      self._cuda_param_struct,
-                                      jit_engine.pycuda.driver.In(self._get_input_struct(inputs)),
-                                      self._cuda_data_struct,
-                                      self._cuda_conditions)
+        with _compiled_section(self._composition.name):
+            self._bin_exec_func.cuda_call(self._cuda_state_struct,
+                                          self._cuda_param_struct,
+                                          jit_engine.pycuda.driver.In(self._get_input_struct(inputs)),
+                                          self._cuda_data_struct,
+                                          self._cuda_conditions)
 
     # Methods used to accelerate "Run"
-    def _get_run_input_struct(self, inputs, num_input_sets, arg=3):
+    def _get_run_input_struct(self, inputs, num_input_sets, arg=3, input_indices=None, run_func=None):
         # Callers that override input arg, should ensure that _bin_func is not None
-        bin_f = self._bin_run_func if arg == 3 else self._bin_func
+        bin_f = (run_func or self._bin_run_func) if arg == 3 else self._bin_func
+
+        # Used by chunked runs to select the input sets of a chunk
+        if input_indices is None:
+            input_indices = range(num_input_sets)
+        else:
+            assert len(input_indices) == num_input_sets
 
         input_type = bin_f.byref_arg_types[arg]
         c_input_type = (input_type * num_input_sets)
 
         # Extract input for each trial and execution id
-        run_inputs = (([x] for x in self._composition._build_variable_for_input_CIM({k:v[i] for k,v in inputs.items()})) for i in range(num_input_sets))
+        run_inputs = (([x] for x in self._composition._build_variable_for_input_CIM({k:v[i] for k,v in inputs.items()})) for i in input_indices)
         c_inputs = c_input_type(*_tupleize(run_inputs))
         if "stat" in self._debug_env:
             print("Instantiated struct: input ( size:" ,
@@ -530,13 +577,13 @@ class CompExecution(CUDAExecution):
 
         return c_inputs
 
-    def _get_generator_run_input_struct(self, inputs, runs):
+    def _get_generator_run_input_struct(self, inputs, runs, run_func=None):
         # Extract input for each trial
         run_inputs = ((np.atleast_2d(x) for x in self._composition._build_variable_for_input_CIM({k:np.atleast_1d(v) for k,v in inp.items()})) for inp in inputs)
         run_inputs = _tupleize(run_inputs)
         num_input_sets = len(run_inputs)
         runs = num_input_sets if runs == 0 or runs == sys.maxsize else runs
-        c_input_type = self._bin_run_func.byref_arg_types[3] * num_input_sets
+        c_input_type = (run_func or self._bin_run_func).byref_arg_types[3] * num_input_sets
         return c_input_type(*run_inputs), runs
 
     @property
@@ -549,10 +596,23 @@ class CompExecution(CUDAExecution):
 
         return self.__bin_run_func
 
+    @property
+    def _bin_chunked_run_func(self):
+        if self.__bin_chunked_run_func is None:
+            self.__bin_chunked_run_func = pnlvm.LLVMBinaryFunction.from_obj(self._composition,
+                                                                            tags=self.__tags.union({"run", "chunked"}),
+                                                                            ctype_ptr_args=(3,),
+                                                                            dynamic_size_args=(4,))
+
+        return self.__bin_chunked_run_func
+
     def _prepare_run(self, inputs, runs, num_input_sets):
 
         # Create input buffer
-        if isgenerator(inputs):
+        if isinstance(inputs, ctypes.Array):
+            # Input structure was constructed in advance (e.g., shared by replications of a run)
+            assert num_input_sets == len(inputs)
+        elif isgenerator(inputs):
             inputs, runs = self._get_generator_run_input_struct(inputs, runs)
             assert num_input_sets == 0 or num_input_sets == sys.maxsize
             num_input_sets = len(inputs)
@@ -560,7 +620,9 @@ class CompExecution(CUDAExecution):
             inputs = self._get_run_input_struct(inputs, num_input_sets)
 
         # Create output buffer
-        outputs = self._bin_func.np_buffer_for_arg(4, extra_dimensions=(runs,))
+        # Use _bin_run_func; _bin_func is only set to it by constructing the input structure above,
+        # which is skipped if the structure was constructed in advance
+        outputs = self._bin_run_func.np_buffer_for_arg(4, extra_dimensions=(runs,))
         assert ctypes.sizeof(self._bin_run_func.byref_arg_types[4]) * runs == outputs.nbytes
 
         if "stat" in self._debug_env:
@@ -574,28 +636,131 @@ class CompExecution(CUDAExecution):
     def run(self, inputs, runs, num_input_sets):
         ct_inputs, outputs, runs_count, input_count = self._prepare_run(inputs, runs, num_input_sets)
 
-        self._bin_run_func(self._state_struct,
-                           self._param_struct,
-                           self._data_struct,
-                           ct_inputs,
-                           outputs,
-                           runs_count,
-                           input_count)
+        with _compiled_section(self._composition.name):
+            self._bin_run_func(self._state_struct,
+                               self._param_struct,
+                               self._data_struct,
+                               ct_inputs,
+                               outputs,
+                               runs_count,
+                               input_count)
 
         # Extract only #trials elements in case the run exited early
         assert runs_count <= runs, "Composition ran more times than allowed!"
         return self._get_indexable(outputs[0:runs_count])
 
+    @staticmethod
+    def thread_run(executions, inputs, runs, num_input_sets, jobs):
+        """Execute the compiled run function for each of **executions** (that are executions of the same Composition
+        in different contexts) using up to **jobs** threads.
+
+        All executions share the compiled binary and the input structure, which (together with their state,
+        parameter, and data structures) are constructed before any thread starts.
+        Returns the outputs of each execution.
+        """
+        # Construct input structure once, it is the same for every execution
+        ct_inputs, outputs, runs_count, input_count = executions[0]._prepare_run(inputs, runs, num_input_sets)
+        runs = int(runs_count)
+        prepared = [(ct_inputs, outputs, runs_count, input_count)]
+        prepared += [ex._prepare_run(ct_inputs, runs, len(ct_inputs)) for ex in executions[1:]]
+
+        # Arguments of the compiled run function of each execution
+        run_args = [(ex._state_struct, ex._param_struct, ex._data_struct, *args)
+                    for ex, args in zip(executions, prepared)]
+
+        # Compiled functions are JIT compiled on first access, which must not happen concurrently
+        run_funcs = [ex._bin_run_func.c_func for ex in executions]
+
+        jobs = max(1, min(jobs, len(executions)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as ex:
+            results = [ex.submit(run_func, *args) for run_func, args in zip(run_funcs, run_args)]
+
+        exceptions = [r.exception() for r in results]
+        assert all(e is None for e in exceptions), "Not all jobs finished sucessfully: {}".format(exceptions)
+
+        # Extract only #trials elements in case a run exited early
+        return [execution._get_indexable(args[1][0:args[2]]) for execution, args in zip(executions, prepared)]
+
+    def run_chunked(self, inputs, runs, num_input_sets, chunk_size, get_output_buffer=None):
+        """Execute the compiled run function for **runs** trials, in chunks of at most **chunk_size** trials.
+
+        Input structures are built one chunk at a time, so a generator passed as **inputs** is consumed lazily and
+        only the inputs of a single chunk are held in memory.  **get_output_buffer** is called with the number of
+        trials in a chunk, the shape and the dtype of the output of a single trial, and may return a preallocated
+        writable C-contiguous array into which the compiled function writes the outputs of the chunk in place
+        (a new buffer is allocated if it is None or returns None).
+
+        Yields the outputs of the trials executed in each chunk.  Execution stops after a chunk in which the
+        compiled run terminated early (fewer trials executed than requested).
+
+        The state of the scheduling conditions is kept between chunks, so TimeScale.RUN clocks and conditions
+        (e.g., AtTrial or AfterNTrials) continue across chunk boundaries, as in a single run.
+        """
+        assert chunk_size > 0, "Invalid chunk size: {}".format(chunk_size)
+
+        run_func = self._bin_chunked_run_func
+        output_dtype = run_func.np_arg_dtypes[4]
+
+        # Scheduling conditions of the run, updated in place by every chunk
+        ct_conditions = run_func.byref_arg_types[7](
+            *helpers.ConditionGenerator(None, self._composition).get_condition_initializer())
+        conditions = np.frombuffer(ct_conditions, dtype=run_func.np_arg_dtypes[7], count=1)
+        conditions.shape = ()
+        chunk_start = 0
+        while chunk_start < runs:
+            num_runs = min(chunk_size, runs - chunk_start)
+
+            # Create input buffer for the chunk
+            if isgenerator(inputs):
+                chunk_inputs = list(itertools.islice(inputs, num_runs))
+                if len(chunk_inputs) == 0:
+                    return
+                ct_inputs, num_runs = self._get_generator_run_input_struct(chunk_inputs, len(chunk_inputs),
+                                                                           run_func=run_func)
+            else:
+                # The run function cycles through input sets, continue from where the previous chunk stopped
+                input_indices = [i % num_input_sets for i in range(chunk_start, chunk_start + num_runs)]
+                ct_inputs = self._get_run_input_struct(inputs, num_runs, input_indices=input_indices,
+                                                       run_func=run_func)
+
+            # Create output buffer for the chunk
+            outputs = None
+            if get_output_buffer is not None:
+                outputs = get_output_buffer(num_runs, output_dtype.shape, output_dtype.base)
+            if outputs is None:
+                outputs = run_func.np_buffer_for_arg(4, extra_dimensions=(num_runs,))
+
+            runs_count = np.asarray(num_runs, dtype=np.uint32).copy()
+            input_count = np.asarray(num_runs, dtype=np.uint32)
+
+            with _compiled_section(self._composition.name):
+                run_func(self._state_struct,
+                         self._param_struct,
+                         self._data_struct,
+                         ct_inputs,
+                         outputs,
+                         runs_count,
+                         input_count,
+                         conditions)
+
+            assert runs_count <= num_runs, "Composition ran more times than allowed!"
+            yield outputs[0:runs_count]
+
+            if runs_count < num_runs:
+                return
+            chunk_start += num_runs
+
     def cuda_run(self, inputs, runs, num_input_sets):
         ct_inputs, outputs, runs_count, input_count = self._prepare_run(inputs, runs, num_input_sets)
 
-        self._bin_run_func.cuda_call(self._cuda_state_struct,
-                                     self._cuda_param_struct,
-                                     self._cuda_data_struct,
-                                     jit_engine.pycuda.driver.In(np.ctypeslib.as_array(ct_inputs)),
-                                     jit_engine.pycuda.driver.Out(outputs),
-                                     jit_engine.pycuda.driver.InOut(runs_count),
-                                     jit_engine.pycuda.driver.In(input_count))
+        with _compiled_section(self._composition.name):
+            self._bin_run_func.cuda_call(self._cuda_state_struct,
+                                         self._cuda_param_struct,
+                                         self._cuda_data_struct,
+                                         jit_engine.pycuda.driver.In(np.ctypeslib.as_array(ct_inputs)),
+                                         jit_engine.pycuda.driver.Out(outputs),
+                                         jit_engine.pycuda.driver.InOut(runs_count),
+                                         jit_engine.pycuda.driver.In(input_count))
 
         # Extract only #trials elements in case the run exited early
         assert runs_count <= runs, "Composition ran more times than allowed: {}".format(runs)
@@ -641,6 +806,42 @@ class CompExecution(CUDAExecution):
 
         return comp_params, comp_state, comp_data, ct_inputs, outputs, num_inputs
 
+    def _update_evaluate_search_space(self):
+        """Write the current search_space of the controller's function into the parameter structure used by evaluate.
+
+        This allows the structures created by `_prepare_evaluate` to be reused by subsequent evaluations that differ
+        only in the values of the search_space (e.g., those of PECOptimizationFunction).
+        Returns False if the structure has not been created yet, or if the shape of the search_space has changed
+        (in which case a new execution is needed).
+        """
+        comp_params = getattr(self, '_eval_param', None)
+        if comp_params is None:
+            return False
+
+        def _get_element(struct, idx):
+            # Structures with elements of the same type are converted to arrays
+            names = struct.dtype.names
+            return struct[names[idx]] if names is not None else struct[idx, ...]
+
+        ocm = self._composition.controller
+        nodes_params = _get_element(comp_params, self._composition.llvm_param_ids.index('nodes'))
+        ocm_params = _get_element(nodes_params, self._composition._get_node_index(ocm))
+        func_params = _get_element(ocm_params, ocm.llvm_param_ids.index('function'))
+        search_space = _get_element(func_params, ocm.function.llvm_param_ids.index('search_space'))
+
+        # Same conversion as used for the initializer of the parameter structure
+        sample_iterators = ocm.function.parameters.search_space._get(self._execution_context)
+        for i, sample_iterator in enumerate(sample_iterators):
+            dim = _get_element(search_space, i)
+            if isinstance(sample_iterator.generator, list):
+                if dim.shape != (len(sample_iterator.generator),):
+                    return False
+                dim[...] = sample_iterator.generator
+            else:
+                dim[...] = (sample_iterator.start, sample_iterator.step, sample_iterator.num)
+
+        return True
+
     def cuda_evaluate(self, inputs, num_input_sets, num_evaluations, all_results:bool=False):
         comp_params, comp_state, comp_data, ct_inputs, results, num_inputs = \
             self._prepare_evaluate(inputs, num_input_sets, num_evaluations, all_results)
@@ -657,12 +858,23 @@ class CompExecution(CUDAExecution):
 
         return results
 
-    def thread_evaluate(self, inputs, num_input_sets, num_evaluations, all_results:bool=False):
+    def thread_evaluate(self, inputs, num_input_sets, num_evaluations, all_results:bool=False, *,
+                        num_threads:Optional[int]=None, chunk_size:Optional[int]=None):
+        """Evaluate **num_evaluations** allocations using a pool of **num_threads** threads (the number of CPUs
+        by default).
+
+        The allocations are split into chunks of **chunk_size** consecutive evaluations that are submitted as
+        separate tasks, so that threads that finish early take over the remaining chunks.  By default, there are
+        _EVALUATE_CHUNKS_PER_THREAD chunks for each thread.
+        """
         comp_params, comp_state, comp_data, ct_inputs, outputs, num_inputs = \
             self._prepare_evaluate(inputs, num_input_sets, num_evaluations, all_results)
 
-        jobs = min(os.cpu_count(), num_evaluations)
-        evals_per_job = (num_evaluations + jobs - 1) // jobs
+        jobs = min(num_threads or os.cpu_count(), num_evaluations)
+        if chunk_size is None:
+            chunks = jobs * _EVALUATE_CHUNKS_PER_THREAD
+            chunk_size = (num_evaluations + chunks - 1) // chunks
+        assert chunk_size > 0, "Invalid chunk size: {}".format(chunk_size)
 
         parallel_start = time.time()
         with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as ex:
@@ -679,18 +891,18 @@ class CompExecution(CUDAExecution):
             results = [ex.submit(self.__bin_func,
                                  comp_params,
                                  comp_state,
-                                 int(i * evals_per_job),
-                                 min((i + 1) * evals_per_job, num_evaluations),
+                                 int(start),
+                                 int(min(start + chunk_size, num_evaluations)),
                                  output_arg,
                                  input_arg,
                                  comp_data,
                                  num_inputs)
-                       for i in range(jobs)]
+                       for start in range(0, num_evaluations, chunk_size)]
 
         parallel_stop = time.time()
         if "time_stat" in self._debug_env:
-            print("Time to run {} executions of '{}' in {} threads: {}".format(
-                      num_evaluations, self.__bin_func.name, jobs,
+            print("Time to run {} executions of '{}' in {} threads ({} chunks): {}".format(
+                      num_evaluations, self.__bin_func.name, jobs, len(results),
                       parallel_stop - parallel_start))
 
 
@@ -55,6 +55,30 @@ def for_loop(builder, start, stop, inc, id):
     builder.position_at_end(out_block)
 
 
+@contextmanager
+def while_loop(builder, cond_gen, id):
+    # 'cond_gen' is called with the builder to generate the loop condition,
+    # it is re-evaluated before every iteration
+    cond_block = builder.append_basic_block(id + "-cond-bb")
+    out_block = None
+
+    # Loop condition
+    builder.branch(cond_block)
+    with builder.goto_block(cond_block):
+        cond = cond_gen(builder)
+
+        # Loop body
+        with builder.if_then(cond, likely=True):
+
+            yield builder
+
+            builder.branch(cond_block)
+
+        out_block = builder.block
+
+    builder.position_at_end(out_block)
+
+
 def for_loop_zero_inc(builder, stop, id):
     start = stop.type(0)
     inc = stop.type(1)
@@ -9,6 +9,9 @@
 # ********************************************* LLVM bindings **************************************************************
 
 from llvmlite import binding
+import hashlib
+import os
+import tempfile
 import time
 import warnings
 
@@ -39,7 +42,7 @@ except Exception as e:
     ptx_enabled = False
 
 
-__all__ = ['cpu_jit_engine', 'ptx_enabled']
+__all__ = ['cpu_jit_engine', 'LLVMObjectCache', 'ptx_enabled']
 
 if ptx_enabled:
     __all__.append('ptx_jit_engine')
@@ -148,6 +151,117 @@ def _try_parse_module(module):
     return mod
 
 
+class LLVMObjectCache:
+    """Persistent on-disk cache of compiled objects produced by the CPU JIT engine.
+
+    Entries are keyed by a hash of the (unoptimized) LLVM IR of the compiled
+    module bundle, combined with the floating point type, the optimization
+    level, the LLVM version, and the host CPU name and features.
+    A cache hit allows the engine to skip both the optimization passes and
+    machine code generation.
+
+    Entries are written to a temporary file and atomically renamed into place,
+    so several processes can safely share the same cache directory.
+
+    The default cache directory can be set using the "cache" option of the
+    PNL_LLVM_DEBUG environment variable (see `debug`).
+    """
+    _default_cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "psyneulink", "llvm")
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir if cache_dir else self._default_cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        self._target_key = None
+        self._current_name = None
+        self._current_key = None
+        self._current_buffer = None
+
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "store_errors": 0}
+
+    def _target_description(self, opt_level):
+        if self._target_key is None:
+            _binding_initialize()
+            self._target_key = "{}|{}|{}".format(binding.llvm_version_info,
+                                                 binding.get_host_cpu_name(),
+                                                 binding.get_host_cpu_features().flatten())
+        return "{}|{}|opt={}".format(self._target_key, LLVMBuilderContext.get_current().float_ty, opt_level)
+
+    def module_key(self, module_text_ir, opt_level, parent_key=None):
+        """Return the cache key of a module bundle.
+
+        *parent_key* is the key of the module bundle that the new module is
+        linked into, which makes the key independent of whether the parent was
+        optimized in this process or loaded from the cache.
+        """
+        h = hashlib.sha256()
+        h.update(self._target_description(opt_level).encode())
+        if parent_key is not None:
+            h.update(parent_key.encode())
+        h.update(module_text_ir.encode())
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + ".o")
+
+    def lookup(self, key):
+        """Load the object stored for *key*, returns None if there is no such entry."""
+        try:
+            with open(self._path(key), 'rb') as f:
+                buffer = f.read()
+        except OSError:
+            buffer = None
+
+        if buffer:
+            self.stats["hits"] += 1
+        else:
+            buffer = None
+            self.stats["misses"] += 1
+
+        return buffer
+
+    def store(self, key, buffer):
+        """Atomically write *buffer* as the object for *key*."""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=key, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(buffer)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            self.stats["store_errors"] += 1
+            warnings.warn("Failed to store compiled object in '{}': {}".format(self.cache_dir, e))
+        else:
+            self.stats["stores"] += 1
+
+    def clear(self):
+        """Remove all entries from the cache directory."""
+        for f in os.listdir(self.cache_dir):
+            if f.endswith(".o"):
+                os.unlink(os.path.join(self.cache_dir, f))
+
+    # Set the module that is about to be added to the execution engine.
+    # The MCJIT callbacks below are invoked synchronously from finalize_object,
+    # which also compiles other pending modules (e.g. the builtins backing module).
+    # Those are not cached, and are recognized by their name.
+    def _prepare(self, name, key, buffer):
+        self._current_name = name
+        self._current_key = key
+        self._current_buffer = buffer
+
+    def _notify(self, module, buffer):
+        if module.name == self._current_name and self._current_key is not None and self._current_buffer is None:
+            self.store(self._current_key, buffer)
+
+    def _getbuffer(self, module):
+        if module.name == self._current_name:
+            return self._current_buffer
+        return None
+
+
 class jit_engine:
     def __init__(self):
         self._jit_engine = None
@@ -161,6 +275,9 @@ class jit_engine:
         self.staged_modules = set()
         self.compiled_modules = set()
 
+        self._object_cache = None
+        self.__mod_key = None
+
         # Track few statistics:
         self.__optimized_modules = 0
         self.__linked_modules = 0
@@ -172,10 +289,26 @@ class jit_engine:
             print("Total optimized modules in '{}': {}".format(s, self.__optimized_modules))
             print("Total linked modules in '{}': {}".format(s, self.__linked_modules))
             print("Total parsed modules in '{}': {}".format(s, self.__parsed_modules))
+            if isinstance(self._object_cache, LLVMObjectCache):
+                print("Object cache statistics in '{}': {}".format(s, self._object_cache.stats))
+
+    def _lookup_cached_object(self, module, cache_key):
+        if not isinstance(self._object_cache, LLVMObjectCache):
+            return None, None
+
+        if cache_key is None:
+            cache_key = self._object_cache.module_key(str(module), self._opt_level)
+
+        return cache_key, self._object_cache.lookup(cache_key)
+
+    def opt_and_add_bin_module(self, module, cache_key=None):
+        cache_key, cached_object = self._lookup_cached_object(module, cache_key)
 
-    def opt_and_add_bin_module(self, module):
         start = time.perf_counter()
-        self._pass_manager.run(module)
+        # Optimization passes are only needed to produce a new object.
+        # The resulting IR is not used if the object is loaded from cache.
+        if cached_object is None:
+            self._pass_manager.run(module)
         finish = time.perf_counter()
 
         if "time_stat" in debug_env:
@@ -190,9 +323,16 @@ class jit_engine:
             with open(self.__class__.__name__ + '-' + str(self.__optimized_modules) + '.S', 'w') as dump_file:
                 dump_file.write(self._target_machine.emit_assembly(module))
 
+        if cache_key is not None:
+            self._object_cache._prepare(module.name, cache_key, cached_object)
+
         start = time.perf_counter()
-        self._engine.add_module(module)
-        self._engine.finalize_object()
+        try:
+            self._engine.add_module(module)
+            self._engine.finalize_object()
+        finally:
+            if cache_key is not None:
+                self._object_cache._prepare(None, None, None)
         finish = time.perf_counter()
         if "time_stat" in debug_env:
             print("Time to finalize LLVM module bundle '{}': {}".format(module.name, finish - start))
@@ -204,6 +344,11 @@ class jit_engine:
 
     def opt_and_append_bin_module(self, module):
         mod_name = module.name
+        cache_key = None
+        if isinstance(self._object_cache, LLVMObjectCache):
+            # The key needs to be computed before linking, which modifies the module
+            cache_key = self._object_cache.module_key(str(module), self._opt_level, self.__mod_key)
+
         if self.__mod is None:
             self.__mod = module
         else:
@@ -216,11 +361,17 @@ class jit_engine:
             with open(mod_name + '.linked.ll', 'w') as dump_file:
                 dump_file.write(str(self.__mod))
 
-        self.opt_and_add_bin_module(self.__mod)
+        self.opt_and_add_bin_module(self.__mod, cache_key=cache_key)
+        self.__mod_key = cache_key
 
     def clean_module(self):
         self._remove_bin_module(self.__mod)
         self.__mod = None
+        self.__mod_key = None
+
+    @property
+    def _opt_level(self):
+        return int(debug_env.get('opt', 2))
 
     @property
     def _engine(self):
@@ -245,8 +396,10 @@ class jit_engine:
     def compile_staged(self):
         # Parse generated modules and link them
         mod_bundle = binding.parse_assembly("")
-        while self.staged_modules:
-            m = self.staged_modules.pop()
+        # Link in a deterministic order, so that the bundle
+        # (and its object cache key) is the same in every process
+        for m in sorted(self.staged_modules, key=lambda m: m.name):
+            self.staged_modules.remove(m)
 
             start = time.perf_counter()
             new_mod = _try_parse_module(m)
@@ -276,7 +429,9 @@ class cpu_jit_engine(jit_engine):
         assert self._target_machine is None
 
         self._jit_engine, self._jit_pass_manager, self._target_machine = _cpu_jit_constructor()
-        if self._object_cache is not None:
+        if isinstance(self._object_cache, LLVMObjectCache):
+            self._jit_engine.set_object_cache(self._object_cache._notify, self._object_cache._getbuffer)
+        elif self._object_cache is not None:
             self._jit_engine.set_object_cache(self._object_cache)
 
 
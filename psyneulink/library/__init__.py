@@ -4,11 +4,15 @@ This module provides implementations of theory using the core components of psyn
 https://princetonuniversity.github.io/PsyNeuLink/Library.html
 """
 
+from psyneulink._lazy import import_eager_attributes, lazy_getattr
+
 from . import components
 from . import compositions
 
 from .components import *
-from .compositions import *
+_lazy_attributes = import_eager_attributes(globals(), compositions)
 
 __all__ = list(components.__all__)
 __all__.extend(compositions.__all__)
+
+__getattr__ = lazy_getattr(__name__, _lazy_attributes)
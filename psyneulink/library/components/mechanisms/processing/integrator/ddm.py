@@ -1216,6 +1216,62 @@ class DDM(ProcessingMechanism):
             self.parameters.value._set(convert_all_elements_to_np_array(new_values), context)
             self._update_output_ports(context=context)
 
+    @handle_external_context(fallback_most_recent=True)
+    def simulate_population(self, num_trials, variable=None, max_time_steps=None, seed=None, context=None):
+        """
+        simulate_population(num_trials, variable=None, max_time_steps=None, seed=None, context=None)
+
+        Simulate **num_trials** independent trials of the DDM, each of which is integrated until the decision
+        variable reaches `threshold <DriftDiffusionIntegrator.threshold>`, and return the `DECISION_VARIABLE
+        <DDM_DECISION_VARIABLE>` and `RESPONSE_TIME <DDM_RESPONSE_TIME>` of every trial.
+
+        The trials are simulated together using the `simulate_population
+        <DriftDiffusionIntegrator.simulate_population>` method of the DDM's `function <DDM.function>`, which must
+        be a `DriftDiffusionIntegrator`;  this yields the same distribution of outcomes as executing the DDM, with
+        a `WhenFinished` `Condition`, once for each trial (using the current values of its parameters in **context**,
+        including any `modulation <ModulatorySignal_Modulation>` of them), but does not change the state of the DDM.
+
+        Arguments
+        ---------
+
+        num_trials : int
+            the number of trials to simulate.
+
+        variable : number, list or array : default class_defaults.variable
+            the `variable <Mechanism_Base.variable>` of the DDM (i.e., the stimulus component of its drift rate)
+            used for all of the trials.
+
+        max_time_steps : int : default None
+            the maximum number of time steps for which the trials are integrated;  if it is None, they are
+            integrated until all of them reach threshold.
+
+        seed : int : default None
+            the seed used for the random terms of the trials, so that calls with the same **seed** return the same
+            results;  if it is None, they are drawn from the `random_state <DriftDiffusionIntegrator.random_state>`
+            of the DDM's `function <DDM.function>`.
+
+        Returns
+        -------
+
+        decision variables, response times : 1d array, 1d array
+            arrays with the `DECISION_VARIABLE <DDM_DECISION_VARIABLE>` and `RESPONSE_TIME <DDM_RESPONSE_TIME>` of
+            each trial;  the response time is NaN for trials that did not reach threshold within **max_time_steps**.
+        """
+        if not isinstance(self.function, DriftDiffusionIntegrator):
+            raise DDMError(f"simulate_population can only be used with a DDM that uses {DriftDiffusionIntegrator.__name__} "
+                           f"as its function; the function of {self.name} is {self.function.name}.")
+
+        if variable is None:
+            variable = self.defaults.variable
+        variable = self._validate_variable(np.atleast_2d(variable))
+
+        decision_variables, response_times = self.function.simulate_population(num_trials,
+                                                                               variable,
+                                                                               max_time_steps=max_time_steps,
+                                                                               seed=seed,
+                                                                               context=context)
+        return decision_variables[:, 0], response_times[:, 0]
+
     @handle_external_context()
     def is_finished(self, context=None):
         # find the single numeric entry in previous_value
@@ -332,12 +332,14 @@ Class Reference
 from collections.abc import Iterable
 
 import copy
+import itertools
 import numpy as np
 from beartype import beartype
 
 from psyneulink._typing import Optional, Union, Callable, Literal
 
 
+from psyneulink.core import llvm as pnlvm
 from psyneulink.core.components.functions.function import get_matrix
 from psyneulink.core.components.functions.nonstateful.learningfunctions import ContrastiveHebbian, Hebbian
 from psyneulink.core.components.functions.nonstateful.objectivefunctions import Distance
@@ -349,6 +351,7 @@ from psyneulink.core.globals.keywords import \
 from psyneulink.core.globals.parameters import Parameter, SharedParameter, check_user_specified
 from psyneulink.core.globals.preferences.basepreferenceset import ValidPrefSet
 from psyneulink.core.globals.utilities import ValidParamSpecType, NumericCollections
+from psyneulink.core.scheduling.time import TimeScale
 from psyneulink.library.components.mechanisms.processing.transfer.recurrenttransfermechanism import \
     CONVERGENCE, RECURRENT, RECURRENT_INDEX, RecurrentTransferMechanism
 from psyneulink.library.components.projections.pathway.autoassociativeprojection import AutoAssociativeProjection
@@ -386,6 +389,12 @@ TARGET_INDEX = 2
 MINUS_PHASE = False
 PLUS_PHASE  = True
 
+# Parameters that track the phases of execution, kept in the compiled state
+_COMPILED_PHASE_STATE = ('execution_phase', 'phase_execution_count', 'phase_terminated',
+                         CURRENT_ACTIVITY_ATTR, MINUS_PHASE_ACTIVITY_ATTR, PLUS_PHASE_ACTIVITY_ATTR)
+# Phase state that can be None or bool in Python, compiled as float flags
+_COMPILED_PHASE_FLAGS = ('execution_phase', 'phase_terminated')
+
 
 class ContrastiveHebbianError(MechanismError):
     pass
@@ -1264,6 +1273,11 @@ class ContrastiveHebbianMechanism(RecurrentTransferMechanism):
     def _parse_integrator_function_variable(self, variable, context=None):
         return self.combination_function(variable=variable, context=context)
 
+    def _parse_function_variable(self, variable, context=None):
+        # The function is executed on the single (RECURRENT) item returned by combination_function,
+        # and its value is the mechanism's value
+        return np.atleast_2d(super()._parse_function_variable(variable, context=context))
+
     def _parse_phase_convergence_function_variable(self, variable):
         # determines shape only
         return np.asarray([variable[0], variable[0]])
@@ -1366,3 +1380,290 @@ class ContrastiveHebbianMechanism(RecurrentTransferMechanism):
     @recurrent_size.setter
     def recurrent_size(self, value):
         self._recurrent_size = value
+
+    def _get_compilation_params(self):
+        # Phase activities and bookkeeping are kept in the compiled state (see _get_compilation_state),
+        # and sizes, mode, clamp and termination conditions are resolved when the function is generated
+        blacklist = {"input_size", "hidden_size", "target_size", "separated", "mode", "continuous", "clamp",
+                     "phase_convergence_threshold", "current_termination_condition",
+                     "current_termination_threshold", *_COMPILED_PHASE_STATE}
+        if not self._enforces_max_passes:
+            blacklist.add("max_passes")
+        if self.continuous:
+            blacklist.add("integrator_mode")
+        if not self._uses_phase_convergence:
+            blacklist.add("phase_convergence_function")
+        return [p for p in super()._get_compilation_params() if p.name not in blacklist]
+
+    def _get_compilation_state(self):
+        state = super()._get_compilation_state()
+        if not self._uses_phase_convergence:
+            state = [p for p in state if p.name != "phase_convergence_function"]
+        return list(itertools.chain(state, (getattr(self.parameters, name) for name in _COMPILED_PHASE_STATE)))
+
+    def _get_state_struct_type(self, ctx):
+        # execution_phase is None until the first execution (see _execute), and phase_terminated
+        # is None or a numpy bool depending on the termination condition; both are compiled as flags
+        elements = list(super()._get_state_struct_type(ctx).elements)
+        for name in _COMPILED_PHASE_FLAGS:
+            history = getattr(self.parameters, name).history_min_length + 1
+            elements[self.llvm_state_ids.index(name)] = pnlvm.ir.ArrayType(ctx.float_ty, history)
+        return pnlvm.ir.LiteralStructType(elements)
+
+    def _get_state_initializer(self, context):
+        state_init = list(super()._get_state_initializer(context))
+        for name in _COMPILED_PHASE_FLAGS:
+            param = getattr(self.parameters, name)
+            # None is MINUS_PHASE and not terminated, respectively
+            flag = float(bool(param._get(context)))
+            state_init[self.llvm_state_ids.index(name)] = (flag,) * (param.history_min_length + 1)
+        return tuple(state_init)
+
+    @property
+    def _uses_phase_convergence(self):
+        return CONVERGENCE in {self.minus_phase_termination_condition, self.plus_phase_termination_condition}
+
+    @property
+    def _enforces_max_passes(self):
+        # max_passes only applies to phases that terminate on CONVERGENCE (see is_converged)
+        return self._uses_phase_convergence and self.max_passes is not None
+
+    def _gen_llvm_is_single_execution(self, ctx, builder, m_params):
+        # Both phases are executed until the plus phase terminates, regardless of integrator_mode
+        return ctx.bool_ty(0)
+
+    def _gen_llvm_function_variable(self, ctx, builder, m_base_params, m_params,
+                                    m_state, m_in, ip_out, *, tags:frozenset):
+        # Compiled counterpart of _parse_function_variable
+        variable, builder = super()._gen_llvm_function_variable(ctx, builder, m_base_params, m_params,
+                                                                m_state, m_in, ip_out, tags=tags)
+        mf_in_ty = ctx.import_llvm_function(self.function).args[2].type
+        return builder.bitcast(variable, mf_in_ty), builder
+
+    def _gen_llvm_integrator_function_variable(self, ctx, builder, m_params, m_state, ip_out):
+        # Compiled counterpart of combination_function
+        zero = ctx.int32_ty(0)
+        target_f = ctx.import_llvm_function(self.integrator_function if self.integrator_mode else self.function)
+        combined = builder.alloca(target_f.args[2].type.pointee, name="combined_input")
+        combined_data = combined
+        while isinstance(combined_data.type.pointee.element, pnlvm.ir.ArrayType):
+            combined_data = builder.gep(combined_data, [zero, zero])
+
+        phase_ptr = ctx.get_param_or_state_ptr(builder, self, "execution_phase", state_struct_ptr=m_state)
+        phase = builder.load(phase_ptr)
+        is_plus_phase = builder.fcmp_ordered("!=", phase, phase.type(0))
+
+        # Zero the input from the recurrent projection at the start of a new trial,
+        # so that it does not contain residual activity of the previous trial
+        flag_ptr = ctx.get_param_or_state_ptr(builder, self, "is_finished_flag", state_struct_ptr=m_state)
+        flag = builder.load(flag_ptr)
+        new_trial = builder.fcmp_ordered("!=", flag, flag.type(0))
+
+        recurrent_ptr = builder.gep(ip_out, [zero, ctx.int32_ty(RECURRENT_INDEX)])
+        with pnlvm.helpers.array_ptr_loop(builder, recurrent_ptr, "chm_recurrent") as (b, idx):
+            val = b.load(b.gep(recurrent_ptr, [zero, idx]))
+            val = b.select(new_trial, val.type(0), val)
+            b.store(val, b.gep(combined_data, [zero, idx]))
+
+        def _gen_clamp(builder, src_index, start):
+            src_ptr = builder.gep(ip_out, [zero, ctx.int32_ty(src_index)])
+            with pnlvm.helpers.array_ptr_loop(builder, src_ptr, "chm_clamp") as (b, idx):
+                dst_ptr = b.gep(combined_data, [zero, b.add(idx, idx.type(start))])
+                val = b.load(b.gep(src_ptr, [zero, idx]))
+                if self.clamp != HARD_CLAMP:
+                    val = b.fadd(b.load(dst_ptr), val)
+                b.store(val, dst_ptr)
+
+        if self.mode == SIMPLE_HEBBIAN:
+            with builder.if_then(is_plus_phase):
+                _gen_clamp(builder, INPUT_INDEX, 0)
+        else:
+            _gen_clamp(builder, INPUT_INDEX, 0)
+            if self._target_included:
+                with builder.if_then(is_plus_phase):
+                    _gen_clamp(builder, TARGET_INDEX, self.target_start)
+
+        return combined, builder
+
+    def _gen_llvm_phase_delta(self, ctx, builder, m_base_params, m_state, m_in, current_ptr):
+        # Compiled counterpart of delta; returns the distance between the current and the previous activity
+        zero = ctx.int32_ty(0)
+        conv_f = self.phase_convergence_function
+        conv_base_params, conv_state = ctx.get_param_or_state_ptr(builder, self, "phase_convergence_function",
+                                                                  param_struct_ptr=m_base_params,
+                                                                  state_struct_ptr=m_state)
+        conv_params, builder = self._gen_llvm_param_ports_for_obj(conv_f, conv_base_params, ctx, builder,
+                                                                  m_base_params, m_state, m_in)
+
+        prev_val_ptr = ctx.get_param_or_state_ptr(builder, self, "value", state_struct_ptr=m_state, history=1)
+        prev_ptr = builder.gep(prev_val_ptr, [zero, zero])
+        activity_len = len(current_ptr.type.pointee)
+        assert len(prev_ptr.type.pointee) == activity_len
+
+        # phase_convergence_function is shaped by the INPUT InputPort (see _parse_phase_convergence_function_variable),
+        # but compares the activities, which have the length of the RECURRENT InputPort
+        if isinstance(conv_f, Distance):
+            return conv_f._gen_llvm_distance(ctx, builder, conv_params, builder.gep(current_ptr, [zero, zero]),
+                                             builder.gep(prev_ptr, [zero, zero]), activity_len), builder
+
+        conv_in = builder.alloca(ctx.import_llvm_function(conv_f).args[2].type.pointee, name="chm_delta_in")
+        assert conv_in.type.pointee.element == current_ptr.type.pointee, \
+            f"Compiled {self.name} requires a phase_convergence_function that accepts its activity " \
+            f"({activity_len} items)"
+        builder.store(builder.load(current_ptr), builder.gep(conv_in, [zero, zero]))
+        builder.store(builder.load(prev_ptr), builder.gep(conv_in, [zero, ctx.int32_ty(1)]))
+
+        conv_out, builder = self._gen_llvm_invoke_function(ctx, builder, conv_f, conv_params, conv_state,
+                                                           conv_in, None, tags=frozenset())
+        return pnlvm.helpers.load_extract_scalar_array_one(builder, conv_out), builder
+
+    def _gen_llvm_mechanism_functions(self, ctx, builder, m_base_params, m_params,
+                                      m_state, m_in, m_val, ip_out, *, tags:frozenset):
+        # Compiled counterpart of _execute
+        zero = ctx.int32_ty(0)
+
+        def _state_ptr(name):
+            return ctx.get_param_or_state_ptr(builder, self, name, state_struct_ptr=m_state)
+
+        phase_ptr = _state_ptr("execution_phase")
+        count_ptr = _state_ptr("phase_execution_count")
+        current_ptr = _state_ptr(CURRENT_ACTIVITY_ATTR)
+        flag_ptr = _state_ptr("is_finished_flag")
+
+        phase = builder.load(phase_ptr)
+        is_plus_phase = builder.fcmp_ordered("!=", phase, phase.type(0))
+
+        # Phase execution count restarts with every execution of the minus phase
+        count = builder.load(count_ptr)
+        count = builder.select(is_plus_phase, count, count.type(0))
+
+        # The combined input reads 'is_finished_flag' before it is cleared
+        value, builder = super()._gen_llvm_mechanism_functions(ctx, builder, m_base_params, m_params,
+                                                               m_state, m_in, m_val, ip_out, tags=tags)
+        builder.store(flag_ptr.type.pointee(0), flag_ptr)
+
+        count = builder.fadd(count, count.type(1))
+        builder.store(count, count_ptr)
+        builder.store(builder.load(builder.gep(value, [zero, zero])), current_ptr)
+
+        if self._uses_phase_convergence:
+            delta, builder = self._gen_llvm_phase_delta(ctx, builder, m_base_params, m_state, m_in, current_ptr)
+            # There is no previous activity to compare with in the first execution
+            num_executions_ptr = _state_ptr("num_executions")
+            num_executions = builder.load(builder.gep(num_executions_ptr, [zero, ctx.int32_ty(TimeScale.LIFE.value)]))
+            has_previous = builder.icmp_unsigned("!=", num_executions, num_executions.type(0))
+
+        def _gen_phase_terminated(condition, threshold_name):
+            threshold_ptr = ctx.get_param_or_state_ptr(builder, self, threshold_name, param_struct_ptr=m_params)
+            threshold = pnlvm.helpers.load_extract_scalar_array_one(builder, threshold_ptr)
+            if condition == CONVERGENCE:
+                return builder.and_(has_previous, builder.fcmp_ordered("<=", delta, threshold))
+            elif condition == COUNT:
+                return builder.fcmp_ordered("==", count, threshold)
+            assert False, f"Unrecognized termination condition for {self.name}: {condition}."
+
+        minus_terminated = _gen_phase_terminated(self.minus_phase_termination_condition,
+                                                 "minus_phase_termination_threshold")
+        plus_terminated = _gen_phase_terminated(self.plus_phase_termination_condition,
+                                                "plus_phase_termination_threshold")
+        terminated = builder.select(is_plus_phase, plus_terminated, minus_terminated)
+
+        terminated_ptr = _state_ptr("phase_terminated")
+        builder.store(builder.uitofp(terminated, terminated_ptr.type.pointee), terminated_ptr)
+
+        if self._enforces_max_passes:
+            # Errors can't be raised by compiled code, so instead of the error raised by is_converged,
+            # the trial finishes if a phase that terminates on CONVERGENCE reaches max_passes executions
+            max_passes_ptr = ctx.get_param_or_state_ptr(builder, self, "max_passes", param_struct_ptr=m_params)
+            max_passes = pnlvm.helpers.load_extract_scalar_array_one(builder, max_passes_ptr)
+            convergence_phase = builder.select(is_plus_phase,
+                                               ctx.bool_ty(self.plus_phase_termination_condition == CONVERGENCE),
+                                               ctx.bool_ty(self.minus_phase_termination_condition == CONVERGENCE))
+            max_passes_reached = builder.and_(convergence_phase, builder.fcmp_ordered(">=", count, max_passes))
+            with builder.if_then(builder.and_(max_passes_reached, builder.not_(terminated))):
+                builder.store(flag_ptr.type.pointee(1), flag_ptr)
+                builder.store(phase.type(0), phase_ptr)
+                builder.store(count.type(0), count_ptr)
+
+        with builder.if_then(terminated):
+            with builder.if_else(is_plus_phase) as (plus_phase, minus_phase):
+                with plus_phase:
+                    # Store activity from last execution in plus phase, and finish the trial
+                    builder.store(builder.load(current_ptr), _state_ptr(PLUS_PHASE_ACTIVITY_ATTR))
+                    builder.store(flag_ptr.type.pointee(1), flag_ptr)
+
+                with minus_phase:
+                    builder.store(builder.load(current_ptr), _state_ptr(MINUS_PHASE_ACTIVITY_ATTR))
+                    if not self.continuous:
+                        builder = self._gen_llvm_reset_activity(ctx, builder, m_params, m_state, current_ptr)
+
+            # Switch execution_phase
+            builder.store(builder.select(is_plus_phase, phase.type(0), phase.type(1)), phase_ptr)
+            builder.store(count.type(0), count_ptr)
+
+        return value, builder
+
+    def _gen_llvm_reset_activity(self, ctx, builder, m_params, m_state, current_ptr):
+        # Use the initializer of the integrator_function to reset both its previous_value
+        # and the current activity for the plus phase (see _execute)
+        int_mode_ptr = ctx.get_param_or_state_ptr(builder, self, "integrator_mode", param_struct_ptr=m_params)
+        int_mode = builder.load(int_mode_ptr)
+        if "integrator_function" not in self.llvm_param_ids:
+            return builder
+
+        zero = ctx.int32_ty(0)
+        if_params, if_state = ctx.get_param_or_state_ptr(builder, self, "integrator_function",
+                                                         param_struct_ptr=m_params, state_struct_ptr=m_state)
+        init_ptr = ctx.get_param_or_state_ptr(builder, self.integrator_function, "initializer",
+                                              param_struct_ptr=if_params)
+        prev_ptr = ctx.get_param_or_state_ptr(builder, self.integrator_function, "previous_value",
+                                              state_struct_ptr=if_state)
+
+        def _flat(ptr):
+            while isinstance(ptr.type.pointee.element, pnlvm.ir.ArrayType):
+                ptr = builder.gep(ptr, [zero, zero])
+            return ptr
+
+        init_ptr = _flat(init_ptr)
+        prev_ptr = _flat(prev_ptr)
+        with builder.if_then(builder.fcmp_ordered("!=", int_mode, int_mode.type(0))):
+            with pnlvm.helpers.array_ptr_loop(builder, current_ptr, "chm_reset") as (b, idx):
+                val = b.load(b.gep(init_ptr, [zero, idx]))
+                b.store(val, b.gep(prev_ptr, [zero, idx]))
+                b.store(val, b.gep(current_ptr, [zero, idx]))
+
+        return builder
+
+    def _gen_llvm_output_port_parse_variable(self, ctx, builder,
+                                             mech_params, mech_state, value, port):
+        # Phase activities are read from the compiled state (see _execute)
+        activity_sources = {
+            OUTPUT_ACTIVITY_ATTR: (CURRENT_ACTIVITY_ATTR, self.target_start if self.target_size else 0),
+            CURRENT_ACTIVITY_ATTR: (CURRENT_ACTIVITY_ATTR, 0),
+            MINUS_PHASE_ACTIVITY_ATTR: (MINUS_PHASE_ACTIVITY_ATTR, 0),
+            PLUS_PHASE_ACTIVITY_ATTR: (PLUS_PHASE_ACTIVITY_ATTR, 0),
+        }
+        port_spec = port._variable_spec
+        specs = port_spec if isinstance(port_spec, list) else [port_spec]
+        if not all(isinstance(s, str) and s in activity_sources for s in specs):
+            return super()._gen_llvm_output_port_parse_variable(ctx, builder, mech_params,
+                                                                mech_state, value, port)
+
+        zero = ctx.int32_ty(0)
+        port_in_ty = ctx.import_llvm_function(port).args[2].type.pointee
+        if len(port.mod_afferents) > 0:
+            port_in_ty = port_in_ty.elements[0]
+        parsed = builder.alloca(port_in_ty, name=port.name + "_variable")
+
+        for i, spec in enumerate(specs):
+            dst_ptr = builder.gep(parsed, [zero, ctx.int32_ty(i)]) if isinstance(port_spec, list) else parsed
+            while isinstance(dst_ptr.type.pointee.element, pnlvm.ir.ArrayType):
+                dst_ptr = builder.gep(dst_ptr, [zero, zero])
+
+            name, start = activity_sources[spec]
+            src_ptr = ctx.get_param_or_state_ptr(builder, self, name, state_struct_ptr=mech_state)
+            with pnlvm.helpers.array_ptr_loop(builder, dst_ptr, "chm_" + spec) as (b, idx):
+                val = b.load(b.gep(src_ptr, [zero, b.add(idx, idx.type(start))]))
+                b.store(val, b.gep(dst_ptr, [zero, idx]))
+
+        return parsed
@@ -187,6 +187,7 @@ from beartype import beartype
 
 from psyneulink._typing import Optional, Union
 
+from psyneulink.core import llvm as pnlvm
 from psyneulink.core.components.functions.nonstateful.transferfunctions import Logistic
 from psyneulink.core.globals.keywords import KWTA_MECHANISM, K_VALUE, RATIO, RESULT, THRESHOLD
 from psyneulink.core.globals.parameters import Parameter, check_user_specified
@@ -450,34 +451,214 @@ class KWTAMechanism(RecurrentTransferMechanism):
 
         diffs = threshold - current_input[0]
 
-        sorted_diffs = sorted(diffs)
-
+        # Only the k (and k-1) smallest diffs are needed, so use a partial sort (introselect) rather than a full one
         if average_based:
-            top_k_mean = np.mean(sorted_diffs[0:k])
-            other_mean = np.mean(sorted_diffs[k:n])
+            # The mean of the k smallest diffs does not depend on their order
+            partitioned_diffs = np.partition(diffs, k - 1) if 0 < k < n else diffs
+            top_k_mean = np.mean(partitioned_diffs[0:k])
+            other_mean = np.mean(partitioned_diffs[k:n])
             final_diff = other_mean * ratio + top_k_mean * (1 - ratio)
         else:
             if k == 0:
-                final_diff = sorted_diffs[k]
-            elif k == len(sorted_diffs):
-                final_diff = sorted_diffs[k - 1]
-            elif k > len(sorted_diffs):
+                final_diff = np.min(diffs)
+            elif k == len(diffs):
+                final_diff = np.max(diffs)
+            elif k > len(diffs):
                 raise KWTAError("k value ({}) is greater than the length of the first input ({}) for KWTAMechanism mechanism {}".
                                 format(k, current_input[0], self.name))
             else:
-                final_diff = sorted_diffs[k] * ratio + sorted_diffs[k - 1] * (1 - ratio)
+                partitioned_diffs = np.partition(diffs, [k - 1, k])
+                final_diff = partitioned_diffs[k] * ratio + partitioned_diffs[k - 1] * (1 - ratio)
 
         if inhibition_only and final_diff > 0:
             final_diff = 0
 
-        new_input = np.array(current_input[0] + final_diff)
-        if (sum(new_input > threshold) > k) and not average_based:
+        new_input = current_input[0] + final_diff
+        if (np.count_nonzero(new_input > threshold) > k) and not average_based:
             warnings.warn("KWTAMechanism scaling was not successful: the result was too high. The original input was {}, "
                           "and the KWTAMechanism-scaled result was {}".format(current_input, new_input))
-        new_input = list(new_input)
-        for i in range(1, len(current_input)):
-            new_input.append(current_input[i])
-        return np.atleast_2d(new_input)
+        if len(current_input) == 1:
+            return np.atleast_2d(new_input)
+        return np.atleast_2d([*new_input, *current_input[1:]])
+
+    def _get_compilation_params(self):
+        # The input is scaled, rather than integrated, by the compiled function (see _parse_function_variable)
+        return [p for p in super()._get_compilation_params() if p.name != "integrator_function"]
+
+    def _get_compilation_state(self):
+        return [p for p in super()._get_compilation_state() if p.name != "integrator_function"]
+
+    def _gen_llvm_function_variable(self, ctx, builder, m_base_params, m_params,
+                                    m_state, m_in, ip_out, *, tags:frozenset):
+        # Compiled counterpart of _kwta_scale
+        def _load_param(name):
+            ptr = ctx.get_param_or_state_ptr(builder, self, name, param_struct_ptr=m_params)
+            if isinstance(ptr.type.pointee, pnlvm.ir.ArrayType):
+                ptr = builder.gep(ptr, [ctx.int32_ty(0), ctx.int32_ty(0)])
+            return builder.load(ptr)
+
+        k_value = _load_param(K_VALUE)
+        threshold = _load_param(THRESHOLD)
+        ratio = _load_param(RATIO)
+        average_based = builder.fcmp_ordered("!=", _load_param("average_based"), k_value.type(0))
+        inhibition_only = builder.fcmp_ordered("!=", _load_param("inhibition_only"), k_value.type(0))
+
+        input_ptr = builder.gep(ip_out, [ctx.int32_ty(0), ctx.int32_ty(0)])
+        n = len(input_ptr.type.pointee)
+        k = self._gen_llvm_kwta_k(ctx, builder, k_value, n)
+        zero = ctx.int32_ty(0)
+        n_int = ctx.int32_ty(n)
+
+        diffs = builder.alloca(input_ptr.type.pointee, name="kwta_diffs")
+        with pnlvm.helpers.array_ptr_loop(builder, input_ptr, "kwta_diffs") as (b, idx):
+            val = b.load(b.gep(input_ptr, [zero, idx]))
+            b.store(b.fsub(threshold, val), b.gep(diffs, [zero, idx]))
+
+        k_in_range = builder.and_(builder.icmp_signed(">", k, zero), builder.icmp_signed("<", k, n_int))
+        final_diff_ptr = builder.alloca(ctx.float_ty, name="kwta_final_diff")
+        with builder.if_else(average_based) as (then, otherwise):
+            with then:
+                # Only the set of the k smallest diffs is needed, not their order
+                with builder.if_then(k_in_range):
+                    self._gen_llvm_select(ctx, builder, diffs, builder.sub(k, k.type(1)))
+
+                top_k = pnlvm.helpers.uint_min(builder, k, n_int)
+                top_k_sum = builder.alloca(ctx.float_ty, name="kwta_top_k_sum")
+                builder.store(top_k_sum.type.pointee(0), top_k_sum)
+                other_sum = builder.alloca(ctx.float_ty, name="kwta_other_sum")
+                builder.store(other_sum.type.pointee(0), other_sum)
+                with pnlvm.helpers.array_ptr_loop(builder, diffs, "kwta_sums") as (b, idx):
+                    diff = b.load(b.gep(diffs, [zero, idx]))
+                    sum_ptr = b.select(b.icmp_signed("<", idx, top_k), top_k_sum, other_sum)
+                    b.store(b.fadd(b.load(sum_ptr), diff), sum_ptr)
+
+                # Empty sets produce NaN means, as they do in Python
+                top_k_mean = builder.fdiv(builder.load(top_k_sum), builder.uitofp(top_k, ctx.float_ty))
+                other_mean = builder.fdiv(builder.load(other_sum),
+                                          builder.uitofp(builder.sub(n_int, top_k), ctx.float_ty))
+                final_diff = builder.fadd(builder.fmul(other_mean, ratio),
+                                          builder.fmul(top_k_mean, builder.fsub(ratio.type(1), ratio)))
+                builder.store(final_diff, final_diff_ptr)
+
+            with otherwise:
+                # k larger than the number of elements is an error in Python,
+                # use the largest diff, as for k equal to the number of elements.
+                kth_idx = builder.select(builder.icmp_signed(">=", k, n_int), n_int.type(n - 1), k)
+                self._gen_llvm_select(ctx, builder, diffs, kth_idx)
+                kth_diff = builder.load(builder.gep(diffs, [zero, kth_idx]))
+
+                # The (k-1)-th smallest diff is the largest of those before the k-th
+                prev_diff_ptr = builder.alloca(ctx.float_ty, name="kwta_prev_diff")
+                builder.store(kth_diff, prev_diff_ptr)
+                with builder.if_then(k_in_range):
+                    builder.store(builder.load(builder.gep(diffs, [zero, zero])), prev_diff_ptr)
+                    with pnlvm.helpers.for_loop(builder, k.type(1), k, k.type(1), "kwta_prev_max") as (b, idx):
+                        diff = b.load(b.gep(diffs, [zero, idx]))
+                        prev_diff = b.load(prev_diff_ptr)
+                        b.store(b.select(b.fcmp_ordered(">", diff, prev_diff), diff, prev_diff), prev_diff_ptr)
+
+                interpolated = builder.fadd(builder.fmul(kth_diff, ratio),
+                                            builder.fmul(builder.load(prev_diff_ptr), builder.fsub(ratio.type(1), ratio)))
+                builder.store(builder.select(k_in_range, interpolated, kth_diff), final_diff_ptr)
+
+        final_diff = builder.load(final_diff_ptr)
+        inhibit = builder.and_(inhibition_only, builder.fcmp_ordered(">", final_diff, final_diff.type(0)))
+        final_diff = builder.select(inhibit, final_diff.type(0), final_diff)
+
+        # Only the first input is scaled, the others are passed through unchanged
+        scaled_in = builder.alloca(ip_out.type.pointee, name="kwta_scaled_input")
+        builder.store(builder.load(ip_out), scaled_in)
+        scaled_ptr = builder.gep(scaled_in, [zero, zero])
+        with pnlvm.helpers.array_ptr_loop(builder, scaled_ptr, "kwta_scale") as (b, idx):
+            val_ptr = b.gep(scaled_ptr, [zero, idx])
+            b.store(b.fadd(b.load(val_ptr), final_diff), val_ptr)
+
+        return scaled_in, builder
+
+    def _gen_llvm_kwta_k(self, ctx, builder, k_value, n):
+        # Number of elements that should be above threshold, computed as in _kwta_scale
+        int_k = builder.fptosi(k_value, ctx.int32_ty)
+
+        # int(round(k_value * n)) rounds halves to even
+        k_scaled = builder.fmul(k_value, k_value.type(n))
+        k_trunc = builder.fptosi(k_scaled, ctx.int32_ty)
+        k_frac = builder.fsub(k_scaled, builder.sitofp(k_trunc, k_value.type))
+        k_odd = builder.trunc(k_trunc, ctx.bool_ty)
+        round_up = builder.or_(builder.fcmp_ordered(">", k_frac, k_frac.type(0.5)),
+                               builder.and_(builder.fcmp_ordered("==", k_frac, k_frac.type(0.5)), k_odd))
+        k_rounded = builder.add(k_trunc, builder.zext(round_up, ctx.int32_ty))
+
+        is_fraction = builder.and_(builder.fcmp_ordered(">", k_value, k_value.type(0)),
+                                   builder.fcmp_ordered("<", k_value, k_value.type(1)))
+        is_negative = builder.icmp_signed("<", int_k, int_k.type(0))
+        k = builder.select(is_negative, builder.sub(int_k.type(n), int_k), int_k)
+        return builder.select(is_fraction, k_rounded, k)
+
+    @staticmethod
+    def _gen_llvm_select(ctx, builder, array, k):
+        """Reorder the elements of **array** in place so that the element at index **k** is the one that would be
+        there if the array were sorted, with no larger elements before it and no smaller ones after it.
+        Uses Hoare's selection algorithm, which is linear in the number of elements on average.
+        """
+        zero = ctx.int32_ty(0)
+        one = ctx.int32_ty(1)
+
+        def _swap(b, idx1, idx2):
+            ptr1 = b.gep(array, [zero, idx1])
+            ptr2 = b.gep(array, [zero, idx2])
+            val1 = b.load(ptr1)
+            b.store(b.load(ptr2), ptr1)
+            b.store(val1, ptr2)
+
+        lo_ptr = builder.alloca(ctx.int32_ty, name="select_lo")
+        builder.store(zero, lo_ptr)
+        hi_ptr = builder.alloca(ctx.int32_ty, name="select_hi")
+        builder.store(ctx.int32_ty(len(array.type.pointee) - 1), hi_ptr)
+        i_ptr = builder.alloca(ctx.int32_ty, name="select_i")
+        j_ptr = builder.alloca(ctx.int32_ty, name="select_j")
+
+        def _range_cond(b):
+            return b.icmp_signed("<", b.load(lo_ptr), b.load(hi_ptr))
+
+        with pnlvm.helpers.while_loop(builder, _range_cond, "select_range") as b:
+            lo = b.load(lo_ptr)
+            hi = b.load(hi_ptr)
+            pivot = b.load(b.gep(array, [zero, b.lshr(b.add(lo, hi), one)]))
+            b.store(lo, i_ptr)
+            b.store(hi, j_ptr)
+
+            # Partition [lo, hi] around the pivot
+            def _partition_cond(b):
+                return b.icmp_signed("<=", b.load(i_ptr), b.load(j_ptr))
+
+            with pnlvm.helpers.while_loop(b, _partition_cond, "select_partition") as b:
+                def _left_cond(b):
+                    return b.fcmp_ordered("<", b.load(b.gep(array, [zero, b.load(i_ptr)])), pivot)
+
+                with pnlvm.helpers.while_loop(b, _left_cond, "select_left") as b:
+                    b.store(b.add(b.load(i_ptr), one), i_ptr)
+
+                def _right_cond(b):
+                    return b.fcmp_ordered(">", b.load(b.gep(array, [zero, b.load(j_ptr)])), pivot)
+
+                with pnlvm.helpers.while_loop(b, _right_cond, "select_right") as b:
+                    b.store(b.sub(b.load(j_ptr), one), j_ptr)
+
+                i = b.load(i_ptr)
+                j = b.load(j_ptr)
+                with b.if_then(b.icmp_signed("<=", i, j)):
+                    _swap(b, i, j)
+                    b.store(b.add(i, one), i_ptr)
+                    b.store(b.sub(j, one), j_ptr)
+
+            # Continue in the part that contains k, or stop if k is between the parts
+            i = b.load(i_ptr)
+            j = b.load(j_ptr)
+            new_hi = b.select(b.icmp_signed("<=", k, j), j, hi)
+            new_lo = b.select(b.icmp_signed(">=", k, i), i, lo)
+            done = b.and_(b.icmp_signed(">", k, j), b.icmp_signed("<", k, i))
+            b.store(new_hi, hi_ptr)
+            b.store(b.select(done, new_hi, new_lo), lo_ptr)
 
     def _validate_params(self, request_set, target_set=None, context=None):
         """Validate shape and size of matrix.
@@ -1284,8 +1284,8 @@ class RecurrentTransferMechanism(TransferMechanism):
         reinit_out = builder.alloca(reinit_func.args[3].type.pointee, name="reinit_out")
         builder.call(reinit_func, [reinit_params, reinit_state, reinit_in, reinit_out])
 
-        # Reinit integrator function
-        if self.integrator_mode:
+        # Reinit integrator function, if it is used
+        if self.integrator_mode and "integrator_function" in self.llvm_param_ids:
             reinit_f = ctx.import_llvm_function(self.integrator_function, tags=tags)
             reinit_in = builder.alloca(reinit_f.args[2].type.pointee, name="integ_reinit_in")
             reinit_out = builder.alloca(reinit_f.args[3].type.pointee, name="integ_reinit_out")
@@ -1329,10 +1329,20 @@ class RecurrentTransferMechanism(TransferMechanism):
             # input
             builder.call(recurrent_f, [recurrent_params, recurrent_state, recurrent_in, recurrent_out])
 
-        assert not self.has_recurrent_input_port, "Configuration using combination function is not supported!"
-
         return super()._gen_llvm_input_ports(ctx, builder, params, state, arg_in)
 
+    def _gen_llvm_function_variable(self, ctx, builder, m_base_params, m_params,
+                                    m_state, m_in, ip_out, *, tags:frozenset):
+        # Compiled counterpart of _parse_function_variable
+        variable, builder = self._gen_llvm_integrator_function_variable(ctx, builder, m_params, m_state, ip_out)
+        return super()._gen_llvm_function_variable(ctx, builder, m_base_params, m_params,
+                                                   m_state, m_in, variable, tags=tags)
+
+    def _gen_llvm_integrator_function_variable(self, ctx, builder, m_params, m_state, ip_out):
+        # Compiled counterpart of _parse_integrator_function_variable
+        assert not self.has_recurrent_input_port, "Configuration using combination function is not supported!"
+        return ip_out, builder
+
     def _gen_llvm_output_ports(self, ctx, builder, value,
                                mech_params, mech_state, mech_in, mech_out):
         ret = super()._gen_llvm_output_ports(ctx, builder, value, mech_params,
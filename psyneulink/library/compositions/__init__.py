@@ -1,22 +1,45 @@
+from psyneulink._lazy import lazy_getattr
+
 from .regressioncfa import *
 from .compositionrunner import *
-from .autodiffcomposition import *
-from .emcomposition import *
+
+# AutodiffComposition and EMComposition (and with them, torch) are only imported when they are first used
+_lazy_attributes = {
+    'autodiffcomposition': 'psyneulink.library.compositions.autodiffcomposition',
+    'emcomposition': 'psyneulink.library.compositions.emcomposition',
+    'AutodiffComposition': 'psyneulink.library.compositions.autodiffcomposition',
+    'EMComposition': 'psyneulink.library.compositions.emcomposition',
+    'EMCompositionError': 'psyneulink.library.compositions.emcomposition',
+    'WEIGHTED_AVG': 'psyneulink.library.compositions.emcomposition',
+    'PROBABILISTIC': 'psyneulink.library.compositions.emcomposition',
+    'torch_available': __name__,
+}
+
 __all__ = list(regressioncfa.__all__)
 __all__.extend(compositionrunner.__all__)
-__all__.extend(autodiffcomposition.__all__)
-__all__.extend(emcomposition.__all__)
+__all__.extend(['AutodiffComposition', 'EMComposition', 'EMCompositionError', 'WEIGHTED_AVG', 'PROBABILISTIC',
+                'torch_available'])
+
+_getattr = lazy_getattr(__name__, _lazy_attributes)
+
+
+def _is_torch_available():
+    try:
+        import torch
+        from torch import nn
 
-try:
-    import torch
-    from torch import nn
+        # Some torch releases have silent dependency on a more recent numpy than the one curently required by PNL.
+        # This breaks torch numpy bindings, see e.g:  https://github.com/pytorch/pytorch/issues/100690
+        torch.tensor([1,2,3]).numpy()
 
-    # Some torch releases have silent dependency on a more recent numpy than the one curently required by PNL.
-    # This breaks torch numpy bindings, see e.g:  https://github.com/pytorch/pytorch/issues/100690
-    torch.tensor([1,2,3]).numpy()
+        return True
+    except (ImportError, RuntimeError):
+        return False
 
-    torch_available = True
-except (ImportError, RuntimeError):
-    torch_available = False
 
-__all__.append('torch_available')
+def __getattr__(name):
+    if name == 'torch_available':
+        global torch_available
+        torch_available = _is_torch_available()
+        return torch_available
+    return _getattr(name)
@@ -195,6 +195,20 @@ AutoDiffCompositions in learning. Although it is best suited for use with `super
       * Specifying `ExecutionMode.LLVM` or `ExecutionMode.PyTorch` in the learn() method of a standard
         `Composition` causes an error.
 
+    .. _AutodiffComposition_PyTorch_Batching:
+
+    .. note::
+       By default, the trials of a minibatch are executed one at a time in PyTorch mode.  Specifying
+       **batched_minibatches** = True in the `learn <AutodiffComposition.learn>` method stacks the inputs and targets
+       for all of the trials in a minibatch along a leading (batch) dimension, and executes the PyTorch model's
+       forward and backward passes once for the entire minibatch, computing the loss averaged over its trials;
+       the weights are then updated once per minibatch (or **optimizations_per_minibatch** times), and the
+       `results <Composition.results>` for each trial are retained as usual.  This is supported for feedforward
+       AutodiffCompositions (without nesting) of Mechanisms that each have a single InputPort and OutputPort and
+       an elementwise `function <Mechanism_Base.function>` (e.g., `Linear`, `Logistic` or `ReLU`), and that are
+       not in `integrator_mode <TransferMechanism.integrator_mode>`;  if these conditions are not met, the trials
+       of the minibatch are executed one at a time, but the weights are still updated once per minibatch.
+
 COMMENT:
 FIX: ADD MENTION OF TARGET NODES AND PYTORCH WRAPPERS
 COMMENT
@@ -1163,6 +1177,98 @@ class AutodiffComposition(Composition):
 
         return trained_output_values, all_output_values
 
+    def autodiff_forward_batch(self, inputs, targets,
+                               synch_with_pnl_options, retain_in_pnl_options,
+                               execution_mode, scheduler, context):
+        """Perform forward pass of model and compute loss for a minibatch of trials in Pytorch mode.
+        inputs and targets are lists with a dict for each trial in the minibatch (as used by autodiff_forward());
+        if the pytorch_representation supports it, these are stacked along a leading (batch) dimension and executed
+        in a single call to its forward_batch() method, and the loss is computed over the batch;  otherwise,
+        autodiff_forward() is called for each trial.  In either case, losses are accumulated in the same way as by
+        autodiff_forward(), so that do_gradient_optimization() averages them over the trials in the minibatch.
+        Returns a list with the values of all OUTPUT nodes for each trial.
+        """
+        assert execution_mode == pnlvm.ExecutionMode.PyTorch
+        pytorch_rep = self.parameters.pytorch_representation._get(context)
+        batch_size = len(inputs)
+
+        if not pytorch_rep.supports_batching(inputs[0], context):
+            return [self.autodiff_forward(inputs=trial_inputs,
+                                          targets=trial_targets,
+                                          synch_with_pnl_options=synch_with_pnl_options,
+                                          retain_in_pnl_options=retain_in_pnl_options,
+                                          execution_mode=execution_mode,
+                                          scheduler=scheduler,
+                                          context=context)[1]
+                    for trial_inputs, trial_targets in zip(inputs, targets)]
+
+        def stack_trials(trials, component):
+            # Stack value of the (single) InputPort of component for each trial along a leading (batch) dimension
+            return np.array([np.atleast_2d(trial[component])[0] for trial in trials], dtype=float)
+
+        # --------- Do forward computation on inputs for all trials in the minibatch ------------------------------
+
+        curr_tensors_for_inputs = {}
+        for component in inputs[0].keys():
+            curr_tensors_for_inputs[component] = torch.tensor(stack_trials(inputs, component),
+                                                              device=self.device).double()
+        curr_tensors_for_outputs = pytorch_rep.forward_batch(curr_tensors_for_inputs, context)
+
+        # --------- Compute the loss (TARGET-OUTPUT) over the batch for each trained OUTPUT node ---------------------
+
+        target_values_for_batch = {component: stack_trials(targets, component) for component in targets[0].keys()}
+
+        # Accumulate the sum of the trial losses, as autodiff_forward() does trial by trial; if the loss function
+        # reduces by averaging, scale its value over the batch accordingly, and if it is not known how it reduces
+        # apply it to each trial.
+        reduction = getattr(self.loss_function, 'reduction', None)
+        batch_loss = 0
+        for trained_output, target in self.outputs_to_targets_map.items():
+            output_tensor = curr_tensors_for_outputs[trained_output]
+            target_tensor = torch.tensor(target_values_for_batch[target], device=self.device).double()
+            if reduction == 'sum':
+                batch_loss += self.loss_function(output_tensor, target_tensor)
+            elif reduction == 'mean':
+                batch_loss += self.loss_function(output_tensor, target_tensor) * batch_size
+            else:
+                batch_loss += sum(self.loss_function(output_tensor[i], target_tensor[i]) for i in range(batch_size))
+        pytorch_rep.minibatch_loss += batch_loss
+        pytorch_rep.minibatch_loss_count += batch_size
+
+        # --------- Return the values of all OUTPUT nodes for each trial ------------------------------------------
+
+        # Nodes executed in a batch have a single OutputPort, so trial i of a node's output is its value for the trial
+        output_values_for_batch = {component: value.detach().cpu().numpy()
+                                   for component, value in curr_tensors_for_outputs.items()}
+        trained_output_sources = []
+        for input_port in self.output_CIM.input_ports:
+            if input_port.path_afferents[0].sender.owner in self.targets_from_outputs_map.values():
+                trained_output_sources.append(self.output_CIM._get_source_info_from_output_CIM(input_port)[1])
+        all_output_sources = [self.output_CIM._get_source_info_from_output_CIM(input_port)[1]
+                              for input_port in self.output_CIM.input_ports]
+
+        all_output_values_for_batch = []
+        for i in range(batch_size):
+            trained_output_values = [output_values_for_batch[source][i].tolist() for source in trained_output_sources]
+            all_output_values = [output_values_for_batch[source][i].tolist() for source in all_output_sources]
+            target_values = [value[i].tolist() for value in target_values_for_batch.values()]
+            pytorch_rep.retain_for_psyneulink({TRAINED_OUTPUTS: trained_output_values,
+                                               TARGETS: target_values},
+                                              retain_in_pnl_options,
+                                              context)
+            all_output_values_for_batch.append(all_output_values)
+        pytorch_rep.all_output_values = all_output_values
+        pytorch_rep.target_values = target_values
+
+        # Synchronize outcomes for the last trial in the batch if specified
+        # IMPLEMENTATION NOTE: RESULTS is not included here as it is handled in call to autodiff._update_results()
+        pytorch_rep.synch_with_psyneulink(synch_with_pnl_options,
+                                          [OPTIMIZATION_STEP, TRIAL],
+                                          context,
+                                          [NODE_VARIABLES, NODE_VALUES])
+
+        return all_output_values_for_batch
+
     def clear_losses(self, context=None):
         self.losses = []
         if self.pytorch_representation:
@@ -1293,8 +1399,11 @@ class AutodiffComposition(Composition):
               retain_torch_trained_outputs:Optional[LEARNING_SCALE_LITERALS]=NotImplemented,
               retain_torch_targets:Optional[LEARNING_SCALE_LITERALS]=NotImplemented,
               retain_torch_losses:Optional[LEARNING_SCALE_LITERALS]=NotImplemented,
+              batched_minibatches:bool=False,
               **kwargs)->list:
         """Override to handle synch and retain args
+        If batched_minibatches is True, then in PyTorch mode the trials of each minibatch are executed together
+        (see `AutodiffComposition_PyTorch_Batching`).
         Note: defaults for synch and retain args are set to NotImplemented, so that the user can specify None if
               they want to locally override the default values for the AutodiffComposition (see docstrings for run()
               and _parse_synch_and_retain_args() for additonal details).
@@ -1342,6 +1451,7 @@ class AutodiffComposition(Composition):
                              synch_with_pnl_options=synch_with_pnl_options,
                              retain_in_pnl_options=retain_in_pnl_options,
                              execution_mode=execution_mode,
+                             batched_minibatches=batched_minibatches,
                              **kwargs)
 
     def _parse_synch_and_retain_args(self,
@@ -1465,8 +1575,13 @@ class AutodiffComposition(Composition):
                 report_to_devices:ReportDevices=None,
                 report=None,
                 report_num=None,
+                batched_minibatches:bool=False,
                 )->np.ndarray:
-        """Override to execute autodiff_forward() in learning mode if execute_mode is not Python"""
+        """Override to execute autodiff_forward() in learning mode if execute_mode is not Python
+        If batched_minibatches is True, inputs is a list with an inputs dict for each trial in a minibatch,
+        that is executed by autodiff_forward_batch(); the output values of the last trial are returned,
+        and those for all of the trials are added to results by _update_results().
+        """
 
         if (self._is_learning(context) and execution_mode is not pnlvm.ExecutionMode.PyTorch and
                 any([isinstance(node, Composition) for node in self.nodes])):
@@ -1492,8 +1607,12 @@ class AutodiffComposition(Composition):
                 # model may be modified between runs?
 
 
-                autodiff_inputs = self._get_autodiff_inputs_values(inputs)
-                autodiff_targets = self._get_autodiff_targets_values(inputs)
+                if batched_minibatches:
+                    autodiff_inputs = [self._get_autodiff_inputs_values(trial_inputs) for trial_inputs in inputs]
+                    autodiff_targets = [self._get_autodiff_targets_values(trial_inputs) for trial_inputs in inputs]
+                else:
+                    autodiff_inputs = self._get_autodiff_inputs_values(inputs)
+                    autodiff_targets = self._get_autodiff_targets_values(inputs)
 
                 # Begin reporting of learning TRIAL:
                 report(self,
@@ -1504,15 +1623,29 @@ class AutodiffComposition(Composition):
                        content='trial_start',
                        context=context)
 
-                self._build_pytorch_representation(context)
-                trained_output_values, all_output_values = \
-                                                self.autodiff_forward(inputs=autodiff_inputs,
-                                                                      targets=autodiff_targets,
-                                                                      synch_with_pnl_options=synch_with_pnl_options,
-                                                                      retain_in_pnl_options=retain_in_pnl_options,
-                                                                      execution_mode=execution_mode,
-                                                                      scheduler=scheduler,
-                                                                      context=context)
+                pytorch_rep = self._build_pytorch_representation(context)
+                if batched_minibatches:
+                    batched_output_values = \
+                                        self.autodiff_forward_batch(inputs=autodiff_inputs,
+                                                                    targets=autodiff_targets,
+                                                                    synch_with_pnl_options=synch_with_pnl_options,
+                                                                    retain_in_pnl_options=retain_in_pnl_options,
+                                                                    execution_mode=execution_mode,
+                                                                    scheduler=scheduler,
+                                                                    context=context)
+                    pytorch_rep.batched_output_values = batched_output_values
+                    all_output_values = batched_output_values[-1]
+                    num_trials_executed = len(batched_output_values)
+                else:
+                    trained_output_values, all_output_values = \
+                                                    self.autodiff_forward(inputs=autodiff_inputs,
+                                                                          targets=autodiff_targets,
+                                                                          synch_with_pnl_options=synch_with_pnl_options,
+                                                                          retain_in_pnl_options=retain_in_pnl_options,
+                                                                          execution_mode=execution_mode,
+                                                                          scheduler=scheduler,
+                                                                          context=context)
+                    num_trials_executed = 1
                 execution_phase = context.execution_phase
                 context.execution_phase = ContextFlags.PROCESSING
                 context.execution_phase = execution_phase
@@ -1526,7 +1659,8 @@ class AutodiffComposition(Composition):
                        content='trial_end',
                        context=context)
 
-                scheduler.get_clock(context)._increment_time(TimeScale.TRIAL)
+                for _ in range(num_trials_executed):
+                    scheduler.get_clock(context)._increment_time(TimeScale.TRIAL)
 
                 return all_output_values
 
@@ -1601,16 +1735,24 @@ class AutodiffComposition(Composition):
 
     def _update_results(self, results, trial_output, execution_mode, synch_with_pnl_options, context):
         if execution_mode is pnlvm.ExecutionMode.PyTorch:
-            # FIX: FOR NOW, USE THIS FOR BOTH TRIAL AND MINIBATCH, SINCE CURRENTLY NO DIFFERENCE;
-            #      NEED TO FIGURE OUT WHAT TO DO ABOUT UPDATING RESULTS ONCE TRUE BATCHING IS IMPLEMENTED
-            if (RESULTS in synch_with_pnl_options
-                    and synch_with_pnl_options[RESULTS] in {TRIAL, MINIBATCH}):
-                # Use Composition's own _update_results method since no savings when done trial-by-trial
-                super()._update_results(results, trial_output, execution_mode, synch_with_pnl_options, context)
-            elif (RESULTS in synch_with_pnl_options
-                    and synch_with_pnl_options[RESULTS] == RUN):
-                # Use pytorch_reps method to keep a local list of results that are copied to autodiff.results after run
-                self.parameters.pytorch_representation._get(context).retain_results(trial_output)
+            # A batched minibatch (see autodiff_forward_batch) returns the output of only its last trial,
+            #   so get the outputs of all of its trials from the pytorch_representation
+            pytorch_rep = self.parameters.pytorch_representation._get(context)
+            if pytorch_rep is not None and pytorch_rep.batched_output_values is not None:
+                trial_outputs = pytorch_rep.batched_output_values
+                pytorch_rep.batched_output_values = None
+            else:
+                trial_outputs = [trial_output]
+            for trial_output in trial_outputs:
+                # FIX: FOR NOW, USE THIS FOR BOTH TRIAL AND MINIBATCH, SINCE RESULTS ARE RETAINED FOR EACH TRIAL
+                if (RESULTS in synch_with_pnl_options
+                        and synch_with_pnl_options[RESULTS] in {TRIAL, MINIBATCH}):
+                    # Use Composition's own _update_results method since no savings when done trial-by-trial
+                    super()._update_results(results, trial_output, execution_mode, synch_with_pnl_options, context)
+                elif (RESULTS in synch_with_pnl_options
+                        and synch_with_pnl_options[RESULTS] == RUN):
+                    # Use pytorch_rep's method to keep a local list of results copied to autodiff.results after run
+                    pytorch_rep.retain_results(trial_output)
         else:
             super()._update_results(results, trial_output, execution_mode, synch_with_pnl_options, context)
 
@@ -13,7 +13,7 @@ from types import GeneratorType
 
 from psyneulink._typing import Mapping, Optional
 from psyneulink.core.llvm import ExecutionMode
-from psyneulink.core.compositions.composition import Composition
+from psyneulink.core.compositions.composition import Composition, _is_autodiff_composition
 from psyneulink.core.compositions.report import Report, ReportProgress, ReportDevices, LEARN_REPORT, PROGRESS_REPORT
 from psyneulink.core.components.mechanisms.modulatory.learning.learningmechanism import LearningMechanism
 from psyneulink.core.globals.keywords import (EPOCH, MATRIX_WEIGHTS, MINIBATCH, OBJECTIVE_MECHANISM, OPTIMIZATION_STEP,
@@ -37,9 +37,7 @@ class CompositionRunner():
         """
         Returns a value that is the sum of all the losses from the last iteration
         """
-        from psyneulink.library.compositions import AutodiffComposition
-
-        if isinstance(self._composition, AutodiffComposition):
+        if _is_autodiff_composition(self._composition):
             return self._composition._get_total_loss(num_trials, context)
 
         total_loss = 0
@@ -61,12 +59,15 @@ class CompositionRunner():
                       call_after_minibatch=None,
                       early_stopper=None,
                       execution_mode:ExecutionMode=ExecutionMode.Python,
+                      batched_minibatches:bool=False,
                       context=None)->GeneratorType:
         """Execute inputs and update pytorch parameters for one minibatch at a time.
         Partition inputs dict into ones of length minibatch_size (or, for the last set, the remainder)
         Execute all inputs in that dict and then update weights (parameters), and repeat for all batches
         within an epoch Synchronize weights, values and results with PsyNeuLink as specified in
         synch_with_pnl_options and retain_in_pnl_options dicts.
+        If batched_minibatches is True (only used in PyTorch mode), yield a list with the inputs for all of the
+        trials in a minibatch, that are executed together before each update of the weights.
         """
         assert early_stopper is None or not self._is_llvm_mode, "Early stopper doesn't work in compiled mode"
         assert call_before_minibatch is None or not self._is_llvm_mode, "minibatch calls don't work in compiled mode"
@@ -87,41 +88,56 @@ class CompositionRunner():
                 # Cycle over trials (stimui) within a minibatch
                 indices_of_trials_in_batch = indices_of_all_trials[i:i + minibatch_size]
 
-                # FIX: IMPLEMENT PARALLELIZATION FOR minibatch_size > 1
-                # # assert IF MINIBATCH > 1 THEN OPTIMIZATIONS_PER_STIMULUS == 1
-                # if minibatch_size > 1 and optimizations_per_minibatch == 1:
-                #     yield DICT WITH STIMULI FOR BATCH RUN THROUGH copy_parameter_value(stim)
-                #  FIX: _gen_pytorch_fct's need to be refactored to handle batch dimension
-
-                for trial_idx in indices_of_trials_in_batch:
-                    inputs_for_minibatch = {}
-                    # Get inputs for the current minibatch
-                    for k, v in inputs.items():
-                        inputs_for_minibatch[k] = v[trial_idx % len(v)]
-
-                    # Cycle over optimizations per trial (stimulus
+                if batched_minibatches:
+                    # Execute all of the trials in the minibatch together (see AutodiffComposition.execute)
+                    inputs_for_minibatch = [{k: v[trial_idx % len(v)] for k, v in inputs.items()}
+                                            for trial_idx in indices_of_trials_in_batch]
                     for optimization_num in range(optimizations_per_minibatch):
-                        # Return current set of stimuli for minibatch
                         yield copy_parameter_value(inputs_for_minibatch)
+                        self._composition.do_gradient_optimization(retain_in_pnl_options, context, optimization_num)
+                        from torch import no_grad
+                        pytorch_rep = self._composition.parameters.pytorch_representation.get(context)
+                        with no_grad():
+                            for node, variable in pytorch_rep._nodes_to_execute_after_gradient_calc.items():
+                                node._composition_wrapper_owner.execute_node(node, variable,
+                                                                            optimization_num, context)
+                        pytorch_rep.synch_with_psyneulink(synch_with_pnl_options, OPTIMIZATION_STEP, context,
+                                                          [MATRIX_WEIGHTS, NODE_VARIABLES, NODE_VALUES])
+                    # Nodes hold the values for the last trial of the minibatch
+                    pytorch_rep.synch_with_psyneulink(synch_with_pnl_options, TRIAL, context)
 
-                        # Update weights if in PyTorch execution_mode;
-                        #  handled by Composition.execute in Python mode and in compiled version in LLVM mode
-                        if execution_mode is ExecutionMode.PyTorch:
-                            self._composition.do_gradient_optimization(retain_in_pnl_options, context, optimization_num)
-                            from torch import no_grad
-                            pytorch_rep = self._composition.parameters.pytorch_representation.get(context)
-                            with no_grad():
-                                for node, variable in pytorch_rep._nodes_to_execute_after_gradient_calc.items():
-                                    node._composition_wrapper_owner.execute_node(node, variable,
-                                                                                optimization_num, context)
-
-                            # Synchronize after every optimization step for a given stimulus (i.e., trial) if specified
-                            pytorch_rep.synch_with_psyneulink(synch_with_pnl_options, OPTIMIZATION_STEP, context,
-                                                              [MATRIX_WEIGHTS, NODE_VARIABLES, NODE_VALUES])
+                else:
+                    for trial_idx in indices_of_trials_in_batch:
+                        inputs_for_minibatch = {}
+                        # Get inputs for the current minibatch
+                        for k, v in inputs.items():
+                            inputs_for_minibatch[k] = v[trial_idx % len(v)]
+
+                        # Cycle over optimizations per trial (stimulus
+                        for optimization_num in range(optimizations_per_minibatch):
+                            # Return current set of stimuli for minibatch
+                            yield copy_parameter_value(inputs_for_minibatch)
+
+                            # Update weights if in PyTorch execution_mode;
+                            #  handled by Composition.execute in Python mode and in compiled version in LLVM mode
+                            if execution_mode is ExecutionMode.PyTorch:
+                                self._composition.do_gradient_optimization(retain_in_pnl_options, context,
+                                                                           optimization_num)
+                                from torch import no_grad
+                                pytorch_rep = self._composition.parameters.pytorch_representation.get(context)
+                                with no_grad():
+                                    for node, variable in pytorch_rep._nodes_to_execute_after_gradient_calc.items():
+                                        node._composition_wrapper_owner.execute_node(node, variable,
+                                                                                    optimization_num, context)
+
+                                # Synchronize after every optimization step for a given stimulus (i.e., trial)
+                                #  if specified
+                                pytorch_rep.synch_with_psyneulink(synch_with_pnl_options, OPTIMIZATION_STEP, context,
+                                                                  [MATRIX_WEIGHTS, NODE_VARIABLES, NODE_VALUES])
 
-                    if execution_mode is ExecutionMode.PyTorch:
-                        # Synchronize specified outcomes after every stimulus (i.e., trial)
-                        pytorch_rep.synch_with_psyneulink(synch_with_pnl_options, TRIAL, context)
+                        if execution_mode is ExecutionMode.PyTorch:
+                            # Synchronize specified outcomes after every stimulus (i.e., trial)
+                            pytorch_rep.synch_with_psyneulink(synch_with_pnl_options, TRIAL, context)
 
                 if execution_mode is ExecutionMode.PyTorch:
                     # Synchronize specified outcomes after every minibatch
@@ -229,6 +245,7 @@ class CompositionRunner():
                      call_after_minibatch = None,
                      context=None,
                      execution_mode:ExecutionMode = ExecutionMode.Python,
+                     batched_minibatches:bool = False,
                      **kwargs)->np.ndarray:
         """
         Runs the composition repeatedly with the specified parameters.
@@ -259,6 +276,9 @@ class CompositionRunner():
             # This is used by local learning-related methods to override the default learning_rate set at construction.
             self._composition._runtime_learning_rate = learning_rate
 
+        # Minibatches are only executed as a batch by the PyTorch model of an AutodiffComposition
+        batched_minibatches = batched_minibatches and execution_mode is ExecutionMode.PyTorch
+
         # Handle function and generator inputs
         if isgeneratorfunction(inputs):
             inputs = inputs()
@@ -333,8 +353,13 @@ class CompositionRunner():
                                                        call_after_minibatch=call_after_minibatch,
                                                        early_stopper=early_stopper,
                                                        execution_mode=execution_mode,
+                                                       batched_minibatches=batched_minibatches,
                                                        context=context)
 
+            if batched_minibatches:
+                # Only inputs specified as a dict are batched (by _batch_inputs)
+                kwargs['batched_minibatches'] = not callable(stim_input) or isgeneratorfunction(stim_input)
+
             # The above generators generate:
             # num_trials / batch_size * batch_size * stim_epoch entries
             # unless 'early_stopper' stops the iteration sooner.
@@ -18,6 +18,8 @@ import numpy as np
 from enum import Enum, auto
 
 from psyneulink.core.components.functions.nonstateful.combinationfunctions import LinearCombination, PRODUCT, SUM
+from psyneulink.core.components.functions.nonstateful.transferfunctions import \
+    Dropout, Exponential, Identity, Linear, Logistic, ReLU, Tanh
 from psyneulink.core.components.functions.stateful.integratorfunctions import IntegratorFunction
 from psyneulink.core.components.functions.stateful import StatefulFunction
 from psyneulink.core.components.mechanisms.processing.transfermechanism import TransferMechanism
@@ -36,6 +38,9 @@ from psyneulink.core import llvm as pnlvm
 
 __all__ = ['PytorchCompositionWrapper', 'PytorchMechanismWrapper', 'PytorchProjectionWrapper']
 
+# Functions for which _gen_pytorch_fct is elementwise, and so can be applied to a batch of trials along dim 0
+_BATCHABLE_FUNCTIONS = (Identity, Linear, Exponential, Logistic, Tanh, ReLU, Dropout)
+
 class DataTypeEnum(Enum):
 
     TRAINED_OUTPUTS = 0
@@ -140,6 +145,11 @@ class PytorchCompositionWrapper(torch.nn.Module):
     minibatch_loss_count : int
         count of losses (trials) within batch, used to calculate average loss per batch.
 
+    batched_output_values : List[list] or None
+        `output_values <Composition.output_values>` for each trial of the most recent call to `forward_batch
+        <PytorchCompositionWrapper.forward_batch>`, held until they are added to the AutodiffComposition's `results
+        <Composition.results>` by its _update_results() method.
+
     retained_results : List[ndarray]
         list of the `output_values <Composition.output_values>` of the AutodiffComposition for ever trial executed
         in a call to `run <AutoDiffComposition.run>` or `learn <AutoDiffComposition.learn>`.
@@ -184,6 +194,7 @@ class PytorchCompositionWrapper(torch.nn.Module):
 
         self.minibatch_loss = torch.zeros(1, device=self.device).double() # Accumulated losses within a batch
         self.minibatch_loss_count = 0  # Count of losses within batch
+        self.batched_output_values = None  # Per-trial output values of most recent call to forward_batch()
 
         # Data retained by the wrapper during execution and copied to pnl as specified by retain_for_psyneulink
         self.retained_results = []          # Values of all output NODES
@@ -687,6 +698,64 @@ class PytorchCompositionWrapper(torch.nn.Module):
 
         return outputs
 
+    def supports_batching(self, inputs, context=None)->bool:
+        """Return True if forward_batch() can be used in place of trial-by-trial calls to forward() for inputs
+        This requires a flat (i.e., not nested) feedforward model, all Nodes of which are Mechanisms that have a single
+        InputPort and OutputPort, and an elementwise function (one of _BATCHABLE_FUNCTIONS) not in integrator_mode,
+        and that inputs is specified directly for each INPUT Node (i.e., not for its InputPorts).
+        """
+        # Subclasses (e.g., for EMComposition) override execute_node() to implement node-specific computations
+        if type(self).execute_node is not PytorchCompositionWrapper.execute_node:
+            return False
+        if not all(isinstance(node, PytorchMechanismWrapper) for node in self.wrapped_nodes):
+            return False
+        executed = set()
+        for current_exec_set in self.execution_sets:
+            for node in current_exec_set:
+                if not node._supports_batching(context):
+                    return False
+                if node._is_input:
+                    if node._mechanism not in inputs:
+                        return False
+                # Afferents must all be from Nodes already executed in the current pass (i.e., no recurrence)
+                elif any(proj_wrapper.sender not in executed for proj_wrapper in node.afferents):
+                    return False
+            executed.update(current_exec_set)
+        return True
+
+    @handle_external_context()
+    def forward_batch(self, inputs, context=None)->dict:
+        """Forward method of the model for a minibatch of trials, stacked along a leading (batch) dimension
+        inputs is a dict {input_node: tensor(batch_size, input_len)}; returns a dict {output_node:value} in which
+        each value is a tensor(batch_size, output_len).  Should only be called if supports_batching() returns True.
+        The input and output of each node are left as those for the last trial in the batch, in the same format
+        as forward(), so that they are synched and logged as they are after trial-by-trial execution.
+        """
+        outputs = {}  # dict for storing values of terminal (output) nodes
+        batch_outputs = {}  # dict for storing batched output of every node for its efferents
+        for current_exec_set in self.execution_sets:
+            for node in current_exec_set:
+                if node._is_input:
+                    variable = inputs[node._mechanism]
+                else:
+                    variable = sum(proj_wrapper.execute(batch_outputs[proj_wrapper.sender])
+                                   for proj_wrapper in node.afferents)
+                batch_outputs[node] = node.function(variable)
+                node.input = variable[-1:]
+                node.output = batch_outputs[node][-1:]
+
+                if (node._mechanism in self._composition.get_nested_output_nodes_at_all_levels()):
+                    outputs[node._mechanism] = batch_outputs[node]
+
+        # NOTE: Context source needs to be set to COMMAND_LINE to force logs to update independently of timesteps
+        old_source = context.source
+        context.source = ContextFlags.COMMAND_LINE
+        self.log_values()
+        self.log_weights()
+        context.source = old_source
+
+        return outputs
+
     def execute_node(self, node, variable, optimization_num, context=None):
         """Execute node and store the result in the node's value attribute
         Implemented as method (and includes optimization_rep and context as args)
@@ -937,6 +1006,19 @@ class PytorchMechanismWrapper():
             raise AutodiffCompositionError(f"Function {pnl_fct} is not currently supported by AutodiffComposition")
 
 
+    def _supports_batching(self, context):
+        """Return True if the Mechanism can be executed for a batch of trials by PytorchCompositionWrapper.forward_batch
+        """
+        mechanism = self._mechanism
+        return (len(mechanism.input_ports) == 1
+                and len(mechanism.output_ports) == 1
+                and not self._is_bias
+                and not self.exclude_from_gradient_calc
+                and isinstance(mechanism.function, _BATCHABLE_FUNCTIONS)
+                and not (hasattr(self, 'integrator_function')
+                         and mechanism.parameters.integrator_mode._get(context))
+                and all(proj_wrapper._value_idx == 0 for proj_wrapper in self.afferents))
+
     def add_efferent(self, efferent):
         """Add ProjectionWrapper for efferent from MechanismWrapper.
         Implemented for completeness;  not currently used
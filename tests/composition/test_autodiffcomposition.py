@@ -3725,6 +3725,47 @@ class TestBatching:
         xor.learn(inputs=inputs_dict_1, call_after_minibatch=cam, execution_mode=pnl.ExecutionMode.PyTorch)
         assert a[0] == 4
 
+    @pytest.mark.parametrize('loss_spec', [Loss.MSE, Loss.SSE, Loss.CROSS_ENTROPY])
+    @pytest.mark.parametrize('minibatch_size', [1, 3, 4])
+    def test_batched_minibatches(self, loss_spec, minibatch_size, monkeypatch):
+        from psyneulink.library.compositions.pytorchwrappers import PytorchCompositionWrapper
+
+        def make_xor():
+            xor_in = TransferMechanism(name='xor_in', default_variable=np.zeros(2))
+            xor_hid = TransferMechanism(name='xor_hid', default_variable=np.zeros(10), function=Logistic())
+            xor_out = TransferMechanism(name='xor_out', default_variable=np.zeros(2), function=Logistic())
+            rng = np.random.default_rng(7)
+            xor = AutodiffComposition([xor_in,
+                                       MappingProjection(matrix=rng.random((2, 10))),
+                                       xor_hid,
+                                       MappingProjection(matrix=rng.random((10, 2))),
+                                       xor_out],
+                                      loss_spec=loss_spec,
+                                      learning_rate=1)
+            inputs = {"inputs": {xor_in: np.array([[0, 0], [0, 1], [1, 0], [1, 1]])},
+                      "targets": {xor_out: np.array([[1, 0], [0, 1], [0, 1], [1, 0]])},
+                      "epochs": 3}
+            return xor, xor_in, inputs
+
+        batched, xor_in, inputs = make_xor()
+        batched.learn(inputs=inputs, minibatch_size=minibatch_size, batched_minibatches=True,
+                      execution_mode=pnl.ExecutionMode.PyTorch)
+        pytorch_rep = batched.parameters.pytorch_representation.get(batched)
+        assert pytorch_rep.supports_batching({xor_in: None}, Context(execution_id=batched.default_execution_id))
+
+        # Same weight updates if the trials of each minibatch are executed one at a time
+        trial_by_trial, _, inputs = make_xor()
+        monkeypatch.setattr(PytorchCompositionWrapper, 'supports_batching', lambda self, inputs, context=None: False)
+        trial_by_trial.learn(inputs=inputs, minibatch_size=minibatch_size, batched_minibatches=True,
+                             execution_mode=pnl.ExecutionMode.PyTorch)
+
+        assert len(batched.results) == len(trial_by_trial.results) == 12
+        np.testing.assert_allclose(batched.results, trial_by_trial.results)
+        for batched_proj, trial_by_trial_proj in zip(batched.projections, trial_by_trial.projections):
+            np.testing.assert_allclose(batched_proj.parameters.matrix.get(batched),
+                                       trial_by_trial_proj.parameters.matrix.get(trial_by_trial))
+        np.testing.assert_allclose(batched.torch_losses, trial_by_trial.torch_losses)
+
     @pytest.mark.parametrize(
         'eps', (1, 5, 10, 100)
     )
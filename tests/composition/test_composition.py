@@ -44,6 +44,7 @@ from psyneulink.core.scheduling.condition import EveryNCalls
 from psyneulink.core.scheduling.scheduler import Scheduler, SchedulingMode
 from psyneulink.core.scheduling.time import TimeScale
 from psyneulink.core.globals.preferences.preferenceset import PreferenceEntry, PreferenceLevel
+from psyneulink.core.globals.utilities import extended_array_equal
 #from psyneulink.library.components.mechanisms.processing.objective.comparatormechanism import ComparatorMechanism
 from psyneulink.library.components.mechanisms.modulatory.control.agt.lccontrolmechanism import LCControlMechanism
 from psyneulink.library.components.mechanisms.processing.transfer.recurrenttransfermechanism import \
@@ -2723,6 +2724,51 @@ class TestExecutionOrder:
         output = benchmark(comp.run, inputs=inputs_dict, scheduler=sched, execution_mode=comp_mode)
         np.testing.assert_allclose(output, 320)
 
+    @pytest.mark.composition
+    def test_execution_plan_nodes_to_freeze(self):
+        from psyneulink.core.compositions.composition import _ExecutionPlan
+        # Same graph as test_3_mechanisms_frozen_values, plus E and F that are executed with B and C but not read by them
+        comp = Composition()
+        A = TransferMechanism(name="A")
+        B = TransferMechanism(name="B")
+        C = TransferMechanism(name="C")
+        D = TransferMechanism(name="D")
+        E = TransferMechanism(name="E")
+        F = TransferMechanism(name="F")
+        comp.add_linear_processing_pathway([A, D])
+        comp.add_linear_processing_pathway([B, C])
+        comp.add_linear_processing_pathway([C, B])
+        comp.add_linear_processing_pathway([A, B, D])
+        comp.add_linear_processing_pathway([A, C, D])
+        comp.add_linear_processing_pathway([A, E, F])
+        comp._analyze_graph()
+
+        plan = _ExecutionPlan(comp, report_enabled=False, animate_execution_sets=False, animate_nodes=False)
+        assert plan.nodes_to_freeze({A}) == set()
+        assert plan.nodes_to_freeze({B, C, E}) == {B, C}
+        assert plan.nodes_to_freeze({E, F}) == {E}
+        assert plan.nodes_to_freeze({D, F}) == set()
+
+    @pytest.mark.stress
+    @pytest.mark.composition
+    @pytest.mark.benchmark(group="Execution overhead")
+    @pytest.mark.parametrize("report_output", [pnl.ReportOutput.OFF, pnl.ReportOutput.TERSE],
+                             ids=["no_report", "report"])
+    def test_execute_overhead_many_nodes(self, benchmark, report_output):
+        # 50 Nodes in 10 parallel pathways, so that per-trial cost is dominated by Composition.execute bookkeeping
+        #   (compare with --benchmark-compare against a run of this test from before the change to be measured)
+        comp = Composition()
+        origins = []
+        for i in range(10):
+            pathway = [ProcessingMechanism(name=f"P{i}_{j}") for j in range(5)]
+            comp.add_linear_processing_pathway(pathway)
+            origins.append(pathway[0])
+        inputs = {origin: [[1.0]] for origin in origins}
+
+        results = benchmark(comp.run, inputs=inputs, num_trials=5,
+                            report_output=report_output, report_to_devices=pnl.ReportDevices.DIVERT)
+        np.testing.assert_allclose(results, np.ones((10, 1)))
+
     @pytest.mark.control
     @pytest.mark.composition
     @pytest.mark.benchmark(group="Control composition scalar")
@@ -3479,6 +3525,74 @@ class TestRunInputSpecifications:
         c.run(inputs=t_g, num_trials=1, execution_mode=mode)
         assert c.parameters.results.get(c) == [[np.array([0.])]]
 
+    @pytest.mark.llvm
+    @pytest.mark.composition
+    @pytest.mark.parametrize("chunk_size", [1, 3, 10, 100])
+    def test_generator_as_input_chunked(self, chunk_size):
+        c = pnl.Composition()
+
+        m1 = pnl.TransferMechanism()
+        m2 = pnl.TransferMechanism()
+
+        c.add_linear_processing_pathway([m1, m2])
+
+        def test_generator():
+            for i in range(10):
+                yield {
+                    m1: i
+                }
+
+        chunks = []
+        result = c.run(inputs=test_generator(), execution_mode=pnl.ExecutionMode.LLVMRun,
+                       chunk_size=chunk_size, call_after_chunk=lambda outputs: chunks.append(len(outputs)))
+
+        np.testing.assert_array_equal(c.parameters.results.get(c), [[[i]] for i in range(10)])
+        np.testing.assert_array_equal(result, [[9]])
+        assert chunks == [min(chunk_size, 10 - i) for i in range(0, 10, chunk_size)]
+
+    @pytest.mark.llvm
+    @pytest.mark.composition
+    def test_input_dict_chunked(self):
+        c = pnl.Composition()
+
+        m1 = pnl.TransferMechanism()
+        m2 = pnl.TransferMechanism()
+
+        c.add_linear_processing_pathway([m1, m2])
+        inputs = {m1: [[1], [2], [3]]}
+
+        c.run(inputs=inputs, num_trials=8, execution_mode=pnl.ExecutionMode.LLVMRun)
+        expected = c.parameters.results.get(c).copy()
+
+        c.run(inputs=inputs, num_trials=8, execution_mode=pnl.ExecutionMode.LLVMRun, chunk_size=3,
+              context='chunked')
+        np.testing.assert_array_equal(c.parameters.results.get('chunked'), expected)
+        np.testing.assert_array_equal(expected, [[[i % 3 + 1]] for i in range(8)])
+
+    @pytest.mark.llvm
+    @pytest.mark.composition
+    @pytest.mark.parametrize("chunk_size", [1, 3, 4])
+    def test_conditions_across_chunks(self, chunk_size):
+        c = pnl.Composition()
+
+        m1 = pnl.TransferMechanism(name='m1')
+        m2 = pnl.TransferMechanism(name='m2')
+        m3 = pnl.TransferMechanism(name='m3')
+
+        c.add_linear_processing_pathway([m1, m2])
+        c.add_linear_processing_pathway([m1, m3])
+        c.scheduler.add_condition(m2, pnl.AtTrial(5))
+        c.scheduler.add_condition(m3, pnl.AtNCalls(m1, 3, time_scale=pnl.TimeScale.RUN))
+        c.termination_processing = {pnl.TimeScale.RUN: pnl.AtTrial(7), pnl.TimeScale.TRIAL: pnl.AtPass(2)}
+        inputs = {m1: [[i + 1] for i in range(10)]}
+
+        # Trial and RUN scale conditions continue across chunk boundaries
+        c.run(inputs=inputs, execution_mode=pnl.ExecutionMode.LLVMRun, chunk_size=chunk_size, context='chunked')
+        c.run(inputs=inputs, execution_mode=pnl.ExecutionMode.Python, context='python')
+        np.testing.assert_array_equal(c.parameters.results.get('chunked'), c.parameters.results.get('python'))
+        np.testing.assert_array_equal(c.parameters.results.get('chunked'),
+                                      [[[0], [0]]] + [[[0], [2]]] * 4 + [[[6], [2]]] * 2)
+
     def test_error_on_malformed_generator(self):
         c = pnl.Composition()
 
@@ -4447,6 +4561,92 @@ class TestRun:
         res2 = C.run([5], execution_mode=comp_mode2, context=ctx)
         np.testing.assert_allclose(res2, [[4.995117]])
 
+    @pytest.mark.composition
+    @pytest.mark.parametrize("input_shapes", [(2, 2), (2, 3)], ids=["uniform", "ragged"])
+    def test_results_accumulate_across_runs(self, comp_mode, input_shapes):
+        A = pnl.ProcessingMechanism(size=input_shapes[0])
+        B = pnl.ProcessingMechanism(size=input_shapes[1])
+        C = pnl.Composition(nodes=[A, B])
+        inputs = {A: [np.arange(input_shapes[0], dtype=float) + i for i in range(5)],
+                  B: [np.arange(input_shapes[1], dtype=float) - i for i in range(5)]}
+
+        # enough trials to force the results buffer to grow more than once
+        for _ in range(8):
+            C.run(inputs, execution_mode=comp_mode)
+
+        expected = pnl.convert_to_np_array([[inputs[A][i], inputs[B][i]] for i in range(5)] * 8)
+        results = C.results
+        assert results.shape == expected.shape
+        assert results.dtype == expected.dtype
+        assert extended_array_equal(results, expected)
+
+    @pytest.mark.parametrize("trial_outputs", [
+        [[[1.0, 2.0]], [[3.0, 4.0]], [[5.0, 6.0]]],
+        [[[1, 2]], [[3.5, 4.0]], [[5.0, 6.0]]],
+        [[np.array([1.0]), np.array([2.0, 3.0])], [np.array([4.0]), np.array([5.0, 6.0])]],
+        [[[1.0, 2.0]], [[3.0, 4.0, 5.0]], [[6.0]]],
+        [[[1.0, 2.0], [3.0, 4.0]], [[5.0], [6.0, 7.0]], [[8.0, 9.0], [1.0, 2.0]]],
+    ], ids=["uniform", "dtype_promotion", "ragged_in_trial", "ragged_across_trials", "ragged_change"])
+    def test_results_buffer_matches_conversion(self, trial_outputs):
+        from psyneulink.core.compositions.composition import ResultsBuffer
+
+        results_buffer = ResultsBuffer(capacity=1)
+        for i, trial_output in enumerate(trial_outputs):
+            results_buffer.append(pnl.convert_to_np_array(trial_output))
+            expected = pnl.convert_to_np_array([pnl.convert_to_np_array(t) for t in trial_outputs[:i + 1]])
+            assert len(results_buffer) == i + 1
+            assert results_buffer.view.shape == expected.shape
+            assert results_buffer.view.dtype == expected.dtype
+            assert extended_array_equal(results_buffer.view, expected)
+
+        # initializing from existing results preserves them
+        assert extended_array_equal(ResultsBuffer(results_buffer.view).view, results_buffer.view)
+
+
+class TestRunReplications:
+
+    def _get_noisy_composition(self):
+        ddm = pnl.DDM(function=pnl.DriftDiffusionIntegrator(noise=1.0, time_step_size=0.1, threshold=100.0),
+                      execute_until_finished=False, name='ddm')
+        return Composition([ddm], name='noisy'), ddm
+
+    @pytest.mark.composition
+    @pytest.mark.parametrize("mode", [pnl.ExecutionMode.Python,
+                                      pytest.param(pnl.ExecutionMode.LLVMRun, marks=pytest.mark.llvm),
+                                     ])
+    def test_run_replications(self, mode):
+        comp, ddm = self._get_noisy_composition()
+        seeds = [3, 1, 4, 1, 5]
+
+        results = comp.run_replications(seeds=seeds, num_trials=4, n_jobs=3, execution_mode=mode)
+        assert results.shape == (len(seeds), 4, 2, 1)
+
+        # same results as when executed sequentially
+        serial_results = comp.run_replications(seeds=seeds, num_trials=4, execution_mode=mode, context='serial')
+        np.testing.assert_array_equal(results, serial_results)
+
+        # replications with the same seed are identical, ones with different seeds are not
+        np.testing.assert_array_equal(results[1], results[3])
+        assert not np.any(results[0, :, 0] == results[1, :, 0])
+
+        # results of each replication are available in its context
+        for i in range(len(seeds)):
+            np.testing.assert_array_equal(comp.parameters.results.get(f'{comp.default_execution_id}-replication-{i}'),
+                                          results[i])
+
+    @pytest.mark.composition
+    def test_run_replications_errors(self):
+        comp, ddm = self._get_noisy_composition()
+
+        with pytest.raises(CompositionError, match='At least one seed'):
+            comp.run_replications(seeds=[])
+
+        def gen():
+            yield {ddm: 0}
+
+        with pytest.raises(CompositionError, match='generator cannot be used'):
+            comp.run_replications(inputs=gen(), seeds=[1])
+
 
 class TestCallBeforeAfterTimescale:
 
@@ -3360,6 +3360,44 @@ class TestModelBasedOptimizationControlMechanisms_Execution:
         if mode == pnl.ExecutionMode.Python:
             np.testing.assert_array_equal(saved_values.flatten(), [0.75, 1.5, 2.25])
 
+    @pytest.mark.llvm
+    @pytest.mark.parametrize("num_threads, chunk_size", [(None, None), (1, None), (3, 1), (2, 4), (None, 100)])
+    def test_model_based_ocm_evaluate_threads(self, num_threads, chunk_size):
+
+        A = pnl.ProcessingMechanism(name='A')
+        B = pnl.ProcessingMechanism(name='B')
+
+        comp = pnl.Composition(name='comp')
+        comp.add_linear_processing_pathway([A, B])
+
+        search_range = pnl.SampleSpec(start=0.25, stop=2.5, step=0.25)
+        control_signal = pnl.ControlSignal(projections=[(pnl.SLOPE, A)],
+                                           variable=1.0,
+                                           allocation_samples=search_range,
+                                           cost_options=pnl.CostFunctions.INTENSITY,
+                                           intensity_cost_function=pnl.Linear(slope=0.))
+
+        objective_mech = pnl.ObjectiveMechanism(monitor=[B])
+        ocm = pnl.OptimizationControlMechanism(agent_rep=comp,
+                                               state_features=[A.input_port],
+                                               objective_mechanism=objective_mech,
+                                               function=pnl.GridSearch(),
+                                               control_signals=[control_signal],
+                                               comp_execution_mode='LLVM',
+                                               evaluate_num_threads=num_threads,
+                                               evaluate_chunk_size=chunk_size)
+
+        comp.add_controller(ocm)
+
+        comp.run(inputs={A: [[[1.0]], [[2.0]], [[3.0]]]})
+
+        np.testing.assert_array_equal(comp.results, [[[1.]], [[5.]], [[7.5]]])
+
+        with pytest.raises(pnl.ParameterError):
+            ocm.defaults.evaluate_num_threads = 0
+        with pytest.raises(pnl.ParameterError):
+            ocm.defaults.evaluate_chunk_size = 1.5
+
     def test_model_based_ocm_with_buffer(self):
 
         A = pnl.ProcessingMechanism(name='A')
@@ -3720,6 +3758,42 @@ class TestModelBasedOptimizationControlMechanisms_Execution:
         # initial 1 + each allocation sample (1, 2, 3) integrated
         assert B.parameters.value.get(comp) == 7
 
+    @pytest.mark.control
+    @pytest.mark.parametrize('num_estimates', [None, 2])
+    def test_grid_search_num_processes(self, num_estimates):
+
+        def _run_model(num_processes):
+            A = pnl.ProcessingMechanism(name='A', function=pnl.Linear(slope=2.0))
+            B = pnl.DDM(name='B', function=pnl.DriftDiffusionIntegrator(noise=0.5, threshold=5, seed=0))
+
+            comp = pnl.Composition(name='comp')
+            comp.add_linear_processing_pathway([A, B])
+
+            control_signal = pnl.ControlSignal(projections=[(pnl.SLOPE, A)],
+                                               allocation_samples=pnl.SampleSpec(start=0.25, stop=1.0, step=0.25),
+                                               intensity_cost_function=pnl.Linear(slope=0.))
+            ocm = pnl.OptimizationControlMechanism(agent_rep=comp,
+                                                   state_features=[A.input_port],
+                                                   objective_mechanism=pnl.ObjectiveMechanism(monitor=[B]),
+                                                   function=pnl.GridSearch(num_processes=num_processes,
+                                                                           save_values=True),
+                                                   num_estimates=num_estimates,
+                                                   control_signals=[control_signal])
+            comp.add_controller(ocm)
+            comp.run(inputs={A: [[1.0], [0.5]]})
+            return comp.results, ocm.function.saved_values
+
+        serial_results, serial_values = _run_model(None)
+        if num_estimates is None:
+            # Estimates of the noisy DDM are not seeded by the samples, so they can't be evaluated in parallel
+            with pytest.warns(UserWarning, match="samples will be evaluated sequentially"):
+                parallel_results, parallel_values = _run_model(2)
+        else:
+            parallel_results, parallel_values = _run_model(2)
+
+        np.testing.assert_array_equal(parallel_values, serial_values)
+        np.testing.assert_array_equal(parallel_results, serial_results)
+
     @pytest.mark.benchmark(group="Multilevel")
     def test_grid_search_random_selection(self, comp_mode, benchmark):
         A = pnl.ProcessingMechanism(name='A')
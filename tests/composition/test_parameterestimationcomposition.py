@@ -10,6 +10,7 @@ import psyneulink as pnl
 
 from psyneulink.core.components.functions.nonstateful.fitfunctions import (
     PECOptimizationFunction,
+    simulation_likelihood,
 )
 
 
@@ -419,3 +420,95 @@ def test_pec_controller_specified():
             optimization_function="differential_evolution",
             controller=pnl.ControlMechanism(),
         )
+
+
+@pytest.mark.composition
+@pytest.mark.parametrize("combine_trials", [True, False])
+def test_simulation_likelihood_batched(combine_trials):
+    """Test that evaluating the likelihood of all trials of data at once matches evaluating each trial separately."""
+    rng = np.random.default_rng(0)
+    num_trials, num_sims = 6, 200
+
+    # Simulated (response time, decision) pairs for each trial
+    sim_data = np.stack([rng.gamma(2.0 + t, 0.2, size=num_sims) for t in range(num_trials)])
+    sim_data = np.stack([sim_data, rng.integers(0, 2, size=(num_trials, num_sims)).astype(float)], axis=-1)
+    exp_data = np.stack([rng.gamma(2.5, 0.2, size=num_trials),
+                         rng.integers(0, 2, size=num_trials).astype(float)], axis=-1)
+    categorical_dims = [False, True]
+
+    like = simulation_likelihood(sim_data, exp_data, categorical_dims, combine_trials=combine_trials)
+    assert like.shape == (num_trials,)
+
+    if combine_trials:
+        expected = [simulation_likelihood(sim_data, exp_data[[t]], categorical_dims, combine_trials=True)[0]
+                    for t in range(num_trials)]
+    else:
+        expected = [simulation_likelihood(sim_data[t], exp_data[[t]], categorical_dims)[0]
+                    for t in range(num_trials)]
+    np.testing.assert_array_equal(like, expected)
+
+    # KDEs computed by a pool of worker processes are the same
+    if not combine_trials:
+        np.testing.assert_array_equal(
+            simulation_likelihood(sim_data, exp_data, categorical_dims, n_jobs=2), like
+        )
+
+
+@pytest.mark.composition
+def test_pec_compiled_evaluate_session(func_mode):
+    """Test that reusing the compiled evaluation across calls to the objective function gives the same results."""
+
+    if func_mode == "Python":
+        pytest.skip("Compiled evaluation is not used in Python mode.")
+
+    decision = pnl.DDM(
+        function=pnl.DriftDiffusionIntegrator(noise=1.0, time_step_size=0.01),
+        output_ports=[pnl.DECISION_OUTCOME, pnl.RESPONSE_TIME],
+        name="DDM",
+    )
+    comp = pnl.Composition(pathways=decision)
+
+    trial_inputs = np.array([[5.0], [-5.0], [5.0]])
+    comp.run(inputs={decision: trial_inputs})
+    data_to_fit = pd.DataFrame(
+        np.squeeze(np.array(comp.results)), columns=["decision", "response_time"]
+    )
+    data_to_fit["decision"] = data_to_fit["decision"].astype("category")
+
+    pec = pnl.ParameterEstimationComposition(
+        name="pec",
+        nodes=[comp],
+        parameters={
+            ("rate", decision): np.linspace(-0.5, 0.5, 10),
+            ("threshold", decision): np.linspace(0.5, 1.0, 10),
+        },
+        outcome_variables=[
+            decision.output_ports[pnl.DECISION_OUTCOME],
+            decision.output_ports[pnl.RESPONSE_TIME],
+        ],
+        data=data_to_fit,
+        optimization_function=PECOptimizationFunction(
+            method="differential_evolution", max_iterations=1
+        ),
+        num_estimates=20,
+        initial_seed=42,
+    )
+    pec.controller.parameters.comp_execution_mode.set(func_mode)
+    pec.run(inputs={comp: trial_inputs})
+
+    fit_function = pec.controller.function
+    context = pnl.Context(execution_id=pec.most_recent_context.execution_id, composition=pec)
+    context.execution_phase = pnl.ContextFlags.PROCESSING
+
+    params = [(0.1, 0.6), (-0.3, 0.9)]
+    expected = [fit_function._run_simulations(*p, context=context) for p in params]
+
+    fit_function._evaluate_sessions = {}
+    try:
+        results = [fit_function._run_simulations(*p, context=context) for p in params + params]
+        assert len(fit_function._evaluate_sessions) == 1
+    finally:
+        fit_function._evaluate_sessions = None
+
+    for r, e in zip(results, expected + expected):
+        np.testing.assert_array_equal(r, e)
@@ -1,3 +1,5 @@
+from collections import deque
+
 import numpy as np
 import pytest
 
@@ -91,6 +93,60 @@ class TestBuffer():
         val = benchmark(B.execute, 5.0)
         np.testing.assert_allclose(val, [np.array([3.]), np.array([4.]), np.array([5.])])
 
+    @pytest.mark.benchmark(group="BufferFunction")
+    def test_buffer_history_full(self, func_mode, benchmark):
+        B = Buffer(default_variable=[0.0, 0.0],
+                   initializer=[[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]],
+                   history=3,
+                   rate=0.5,
+                   noise=1.0)
+        ex = pytest.helpers.get_func_execution(B, func_mode)
+
+        np.testing.assert_allclose(ex([3.0, 3.0]), [[1.5, 1.5], [2.0, 2.0], [3.0, 3.0]])
+        val = benchmark(ex, [4.0, 4.0])
+        np.testing.assert_allclose(val, [[2.0, 2.0], [2.5, 2.5], [4.0, 4.0]])
+
+    @pytest.mark.parametrize("history", [None, 10, 1000])
+    def test_buffer_long_history(self, history):
+        B = Buffer(history=history, rate=0.9, noise=0.1)
+        expected = deque(maxlen=history)
+        for i in range(2500):
+            expected = deque((np.array(expected) * 0.9 + 0.1).tolist(), maxlen=history)
+            expected.append([i, -i])
+            val = B.execute([i, -i])
+
+        np.testing.assert_allclose(val, np.array(expected))
+        np.testing.assert_allclose(B.parameters.previous_value.get().array, np.array(expected))
+
+    def test_buffer_item_dtypes(self):
+        B = Buffer(history=3)
+        B.execute([1, 2])
+        assert B.parameters.previous_value.get().array.dtype == int
+        val = B.execute([3.5, 4])
+        np.testing.assert_array_equal(val, [[1, 2], [3.5, 4]])
+
+        # ragged items
+        B = Buffer(history=2, rate=0.5)
+        B.execute([[1.0, 2.0], [3.0]])
+        val = B.execute([[4.0, 5.0], [6.0]])
+        np.testing.assert_array_equal(val[0][0], [0.5, 1.0])
+        np.testing.assert_array_equal(val[0][1], [1.5])
+        np.testing.assert_array_equal(val[1][0], [4.0, 5.0])
+        np.testing.assert_array_equal(val[1][1], [6.0])
+
+    def test_buffer_reset(self):
+        B = Buffer(default_variable=[0.0], initializer=[[1.0], [2.0]], history=3)
+        B.execute([3.0])
+
+        value = B.reset()
+        assert isinstance(value, deque)
+        assert value.maxlen == 3
+        np.testing.assert_array_equal(value, [[1.0], [2.0]])
+
+        # value is not modified by later executions
+        B.execute([4.0])
+        np.testing.assert_array_equal(value, [[1.0], [2.0]])
+
     @pytest.mark.benchmark(group="BufferFunction")
     def test_buffer_as_function_of_processing_mech(self, benchmark):
 
@@ -148,3 +148,79 @@ def test_execute(func, variable, params, prng, llvm_skip, expected, benchmark, f
     res = benchmark(ex, variable)
 
     np.testing.assert_allclose(res, expected)
+
+
+ddm_parameter_grid = {
+    "drift_rate": [-0.8, -1e-9, 0.005, 0.6, 5.0],
+    "threshold": [0.5, RAND2, 10.0],
+    "starting_value": [-0.3, 0.0, RAND3],
+    "non_decision_time": [0.2, RAND4],
+    "noise": [0.1, RAND5, 1.0],
+}
+
+
+@pytest.mark.function
+@pytest.mark.benchmark(group="DriftDiffusionAnalytical vectorized")
+@pytest.mark.parametrize("shenhav_et_al_compat_mode", [False, True])
+def test_drift_diffusion_analytical_solution(shenhav_et_al_compat_mode, benchmark):
+    names = list(ddm_parameter_grid)
+    grid = np.meshgrid(*ddm_parameter_grid.values(), indexing='ij')
+    params = {name: values.reshape(-1) for name, values in zip(names, grid)}
+
+    res = benchmark(Functions.drift_diffusion_analytical_solution,
+                    shenhav_et_al_compat_mode=shenhav_et_al_compat_mode, **params)
+    assert res.shape == (8, grid[0].size)
+
+    f = Functions.DriftDiffusionAnalytical(default_variable=0.0, shenhav_et_al_compat_mode=shenhav_et_al_compat_mode)
+    for i in range(grid[0].size):
+        # drift_rate of the process is the product of the drift_rate parameter and the variable
+        f.parameters.threshold.set(params["threshold"][i])
+        f.parameters.starting_value.set(params["starting_value"][i])
+        f.parameters.non_decision_time.set(params["non_decision_time"][i])
+        f.parameters.noise.set(params["noise"][i])
+        expected = f(params["drift_rate"][i])
+
+        np.testing.assert_allclose(res[:, i], np.asarray(expected, dtype=float).reshape(-1),
+                                   rtol=1e-7, atol=1e-12)
+
+
+@pytest.mark.function
+@pytest.mark.parametrize("drift_rate, threshold, starting_value, non_decision_time, noise", [
+    (1.0, 1.0, 0.0, 0.2, 0.5),
+    (-0.5, 0.8, 0.2, 0.3, 1.0),
+    (0.2, 1.5, -0.4, 0.1, 1.0),
+])
+def test_drift_diffusion_rt_density(drift_rate, threshold, starting_value, non_decision_time, noise):
+    params = {"drift_rate": drift_rate, "threshold": threshold, "starting_value": starting_value,
+              "non_decision_time": non_decision_time, "noise": noise}
+    solution = Functions.drift_diffusion_analytical_solution(**params)
+    t = np.linspace(0, 50, 50001)
+    dt = t[1] - t[0]
+
+    def integrate(y):
+        return np.sum(y[1:] + y[:-1]) * dt / 2
+
+    lower = Functions.drift_diffusion_rt_density(t, boundary='lower', **params)
+    upper = Functions.drift_diffusion_rt_density(t, boundary='upper', **params)
+
+    assert np.all(lower[t <= non_decision_time] == 0)
+    assert np.all(upper >= 0)
+
+    # Probability of reaching each boundary
+    np.testing.assert_allclose(integrate(lower), solution[1], rtol=1e-4, atol=1e-8)
+    np.testing.assert_allclose(integrate(upper), 1 - solution[1], rtol=1e-4, atol=1e-8)
+
+    # Mean RT
+    np.testing.assert_allclose(integrate(t * (upper + lower)), solution[0], rtol=1e-4)
+
+    # Mean RTs conditional on each boundary;  DriftDiffusionAnalytical computes these using a starting point
+    # that is linear in starting_value (rather than the one used for the mean RT and ER), so they only agree
+    # with the density for an unbiased starting point
+    if starting_value == 0:
+        np.testing.assert_allclose(integrate(t * upper) / integrate(upper), solution[2], rtol=1e-4)
+        np.testing.assert_allclose(integrate(t * lower) / integrate(lower), solution[5], rtol=1e-4)
+
+    # Broadcasting times against parameters gives the same densities
+    grid_params = {k: np.full(2, v) for k, v in params.items()}
+    np.testing.assert_allclose(Functions.drift_diffusion_rt_density(t[:, None], boundary='upper', **grid_params),
+                               np.stack([upper, upper], axis=-1))
@@ -191,7 +191,7 @@ GROUP_PREFIX="IntegratorFunction "
     (pnl.DriftDiffusionIntegrator, DriftIntFun),
     (pnl.LeakyCompetingIntegrator, LeakyFun),
     (pnl.AccumulatorIntegrator, AccumulatorFun),
-    pytest.param((pnl.DriftOnASphereIntegrator, DriftOnASphereFun), marks=pytest.mark.llvm_not_implemented),
+    (pnl.DriftOnASphereIntegrator, DriftOnASphereFun),
     ], ids=lambda x: x[0])
 @pytest.mark.benchmark
 def test_execute(func, func_mode, variable, noise, params, benchmark):
@@ -232,6 +232,48 @@ def test_execute(func, func_mode, variable, noise, params, benchmark):
     np.testing.assert_allclose(res, expected, rtol=1e-5, atol=1e-8)
 
 
+test_var_signed = test_var - 0.5
+
+@pytest.mark.function
+@pytest.mark.integrator_function
+@pytest.mark.parametrize("func_class, params", [
+    (pnl.DualAdaptiveIntegrator, {'initial_short_term_avg': 0.3, 'initial_long_term_avg': 0.6,
+                                  'short_term_gain': 1.5, 'long_term_bias': 0.2, 'offset': RAND3}),
+    (pnl.DualAdaptiveIntegrator, {'initial_short_term_avg': 0.3, 'initial_long_term_avg': 0.6,
+                                  'operation': pnl.S_MINUS_L, 'offset': RAND3}),
+    (pnl.InteractiveActivationIntegrator, {'rate': RAND0_1, 'decay': 0.2, 'rest': 0.1, 'noise': RAND2}),
+    (pnl.InteractiveActivationIntegrator, {'rate': RAND0_1, 'decay': 0.2, 'noise': test_noise_arr}),
+    (pnl.OrnsteinUhlenbeckIntegrator, {'rate': RAND0_1, 'decay': 0.5, 'noise': RAND2, 'offset': RAND3,
+                                       'time_step_size': 0.1, 'seed': 12}),
+    (pnl.DriftOnASphereIntegrator, {'dimension': SIZE + 1, 'initializer': test_initializer, 'noise': RAND2,
+                                    'offset': RAND3, 'time_step_size': 0.1, 'seed': 12}),
+    ], ids=["DualAdaptive PRODUCT", "DualAdaptive S_MINUS_L", "InteractiveActivation SNOISE",
+            "InteractiveActivation VNOISE", "OrnsteinUhlenbeck", "DriftOnASphere"])
+@pytest.mark.benchmark
+def test_execute_matches_python(func_class, params, func_mode, benchmark):
+    benchmark.group = GROUP_PREFIX + func_class.componentName
+
+    f = func_class(default_variable=test_var_signed, **params)
+    ex = pytest.helpers.get_func_execution(f, func_mode)
+
+    ex(test_var_signed)
+    ex(test_var_signed)
+    res = benchmark(ex, test_var_signed)
+
+    # Identically constructed (and seeded) function executed in Python
+    ref = func_class(default_variable=test_var_signed, **params)
+    for _ in range(2):
+        ref.function(test_var_signed)
+    expected = ref.function(test_var_signed)
+
+    if isinstance(expected, tuple):
+        assert len(res) == len(expected)
+        for r, e in zip(res, expected):
+            np.testing.assert_allclose(np.squeeze(r), np.squeeze(e), rtol=1e-5, atol=1e-8)
+    else:
+        np.testing.assert_allclose(np.squeeze(res), np.squeeze(expected), rtol=1e-5, atol=1e-8)
+
+
 def test_integrator_function_no_default_variable_and_params_len_more_than_1():
     I = Functions.AdaptiveIntegrator(rate=[.1, .2, .3])
     I.defaults.variable = np.array([0,0,0])
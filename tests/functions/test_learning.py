@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+import psyneulink as pnl
+import psyneulink.core.components.functions.nonstateful.learningfunctions as Functions
+import psyneulink.core.globals.keywords as kw
+from psyneulink.core.globals.utilities import convert_all_elements_to_np_array
+
+hebbian_var = [0.1, 0.5, 0.8, -0.3]
+reinforcement_var = convert_all_elements_to_np_array([[0.1, 0.2, 0.3], [0., 0.7, 0.], [0.5]])
+backprop_var = [[0.1, 0.4, 0.9], [0.3, 0.6, 0.8], [0.2, -0.5, 0.1]]
+backprop_error_matrix = [[0.1, 0.2, 0.3], [-0.4, 0.5, 0.6], [0.7, -0.8, 0.9]]
+kohonen_var = convert_all_elements_to_np_array([[0.2, 0.7, 0.4], [0.1, 0.9, 0.3],
+                                                [[0.5, 0.1, 0.3], [0.2, 0.8, 0.4], [0.6, 0.3, 0.1]]])
+
+hebbian_expected = [[0., 0.0025, 0.004, -0.0015],
+                    [0.0025, 0., 0.02, -0.0075],
+                    [0.004, 0.02, 0., -0.012],
+                    [-0.0015, -0.0075, -0.012, 0.]]
+hebbian_vector_rate_expected = [[0., 0.01, 0.024, -0.012],
+                                [0.005, 0., 0.12, -0.06],
+                                [0.008, 0.08, 0., -0.096],
+                                [-0.003, -0.03, -0.072, 0.]]
+
+test_data = [
+    pytest.param(Functions.Hebbian, hebbian_var, {}, [hebbian_expected], id="Hebbian"),
+    pytest.param(Functions.Hebbian, hebbian_var, {'learning_rate': [0.1, 0.2, 0.3, 0.4]},
+                 [hebbian_vector_rate_expected], id="Hebbian 1d learning_rate"),
+    pytest.param(Functions.ContrastiveHebbian, hebbian_var, {}, [hebbian_expected], id="ContrastiveHebbian"),
+    pytest.param(Functions.Reinforcement, reinforcement_var, {}, [[0., 0.025, 0.], [0., 0.025, 0.]],
+                 id="Reinforcement"),
+    pytest.param(Functions.BackPropagation, backprop_var, {},
+                 [[[-5.25e-05, -3.24e-04, 5.04e-04],
+                   [-2.1e-04, -1.296e-03, 2.016e-03],
+                   [-4.725e-04, -2.916e-03, 4.536e-03]],
+                  [-0.0105, -0.0648, 0.1008]],
+                 id="BackPropagation"),
+    pytest.param(Functions.BackPropagation, backprop_var, {'loss_spec': kw.Loss.MSE},
+                 [[[-3.5e-05, -2.16e-04, 3.36e-04],
+                   [-1.4e-04, -8.64e-04, 1.344e-03],
+                   [-3.15e-04, -1.944e-03, 3.024e-03]],
+                  [-0.007, -0.0432, 0.0672]],
+                 id="BackPropagation MSE"),
+    pytest.param(Functions.BackPropagation, backprop_var, {'loss_spec': kw.Loss.SSE},
+                 [[[-1.05e-04, -6.48e-04, 1.008e-03],
+                   [-4.2e-04, -2.592e-03, 4.032e-03],
+                   [-9.45e-04, -5.832e-03, 9.072e-03]],
+                  [-0.021, -0.1296, 0.2016]],
+                 id="BackPropagation SSE"),
+    pytest.param(Functions.Kohonen, kohonen_var, {'distance_function': kw.GAUSSIAN},
+                 [[[0.011370439132, -0.003005288598, 0.003790146377],
+                   [-0.018950731887, 0.003005288598, -0.011370439132],
+                   [0.007580292755, -0.003005288598, -0.011370439132]]],
+                 id="Kohonen GAUSSIAN"),
+    pytest.param(Functions.Kohonen, kohonen_var, {'distance_function': kw.LINEAR},
+                 [[[0., -0.005, 0.], [0., 0.005, 0.], [0., -0.005, 0.]]],
+                 id="Kohonen LINEAR"),
+    pytest.param(Functions.Kohonen, kohonen_var, {'distance_function': kw.EXPONENTIAL},
+                 [[[-0.025774227427, 0., -0.008591409142],
+                   [0.042957045711, 0., 0.025774227427],
+                   [-0.017182818285, 0., 0.025774227427]]],
+                 id="Kohonen EXPONENTIAL"),
+]
+
+@pytest.mark.function
+@pytest.mark.learning_function
+@pytest.mark.benchmark
+@pytest.mark.parametrize("func, variable, params, expected", test_data)
+def test_basic(func, variable, params, expected, benchmark, func_mode):
+    benchmark.group = "LearningFunction " + func.componentName
+
+    if func is Functions.BackPropagation:
+        params = {**params, 'activation_derivative_fct': pnl.Logistic(default_variable=variable[1]).derivative}
+    f = func(default_variable=variable, **params)
+
+    EX = pytest.helpers.get_func_execution(f, func_mode)
+    if func is Functions.BackPropagation:
+        # error_matrix is passed with the variable: in params in Python, and as the last item of the compiled input
+        error_matrix = np.array(backprop_error_matrix)
+        if func_mode == 'Python':
+            EX = lambda x: f.function(x, params={'error_matrix': error_matrix})
+        else:
+            compiled_EX = EX
+            EX = lambda x: compiled_EX([*x, error_matrix])
+
+    EX(variable)
+    res = benchmark(EX, variable)
+
+    # single precision mode needs reduced accuracy
+    if func_mode != 'Python' and pytest.helpers.llvm_current_fp_precision() == 'fp32':
+        tolerance = {'rtol': 1e-5, 'atol': 1e-8}
+    else:
+        tolerance = {}
+
+    if len(expected) == 1:
+        res = [res]
+    assert len(res) == len(expected)
+    for r, e in zip(res, expected):
+        np.testing.assert_allclose(r, e, **tolerance)
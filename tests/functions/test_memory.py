@@ -72,19 +72,15 @@ test_data = [
     # ContentAddressableMemory
     pytest.param(Functions.ContentAddressableMemory, test_var, {'rate':RAND1, 'retrieval_prob':0.1, 'seed': module_seed},
                  np.zeros_like(test_var),
-                 marks=pytest.mark.llvm_not_implemented,
                  id="ContentAddressableMemory Low Retrieval"),
     pytest.param(Functions.ContentAddressableMemory, test_var, {'rate':RAND1, 'storage_prob':0.1, 'seed': module_seed},
                  np.zeros_like(test_var),
-                 marks=pytest.mark.llvm_not_implemented,
                  id="ContentAddressableMemory Low Storage"),
     pytest.param(Functions.ContentAddressableMemory, test_var, {'rate':RAND1, 'retrieval_prob':0.9, 'storage_prob':0.9, 'seed': module_seed},
                  [test_var[0], test_var[1]],
-                 marks=pytest.mark.llvm_not_implemented,
                  id="ContentAddressableMemory High Storage/Retrieval"),
     pytest.param(Functions.ContentAddressableMemory, test_var, {'initializer':test_initializer, 'rate':RAND1, 'seed': module_seed},
                  [test_var[0], test_var[1]],
-                 marks=pytest.mark.llvm_not_implemented,
                  id="ContentAddressableMemory Initializer"),
 
     # Tests using philox var
@@ -122,19 +118,15 @@ test_data = [
     # ContentAddressableMemory
     pytest.param(Functions.ContentAddressableMemory, philox_var, {'rate':RAND1, 'retrieval_prob':0.1, 'seed': module_seed},
                  np.zeros_like(philox_var),
-                 marks=pytest.mark.llvm_not_implemented,
                  id="ContentAddressableMemory Low Retrieval Philox"),
     pytest.param(Functions.ContentAddressableMemory, philox_var, {'rate':RAND1, 'storage_prob':0.01, 'seed': module_seed},
                  np.zeros_like(philox_var),
-                 marks=pytest.mark.llvm_not_implemented,
                  id="ContentAddressableMemory Low Storage Philox"),
     pytest.param(Functions.ContentAddressableMemory, philox_var, {'rate':RAND1, 'retrieval_prob':0.98, 'storage_prob':0.98, 'seed': module_seed},
                  [philox_var[0], philox_var[1]],
-                 marks=pytest.mark.llvm_not_implemented,
                  id="ContentAddressableMemory High Storage/Retrieval Philox"),
     pytest.param(Functions.ContentAddressableMemory, philox_var, {'initializer':philox_initializer, 'rate':RAND1, 'seed': module_seed},
                  [philox_var[0], philox_var[1]],
-                 marks=pytest.mark.llvm_not_implemented,
                  id="ContentAddressableMemory Initializer Philox"),
 ]
 
@@ -631,6 +623,27 @@ class TestDictionaryMemory:
             getattr(a.defaults, param_name)
             is not getattr(b.defaults, param_name)
         )
+
+    @pytest.mark.parametrize('memory_index', [FlatIndex(), LSHIndex(num_tables=4, num_bits=2)])
+    def test_DictionaryMemory_memory_index(self, memory_index):
+        np.random.seed(module_seed)
+        keys = np.random.rand(10, 5)
+        vals = np.random.rand(10, 5)
+
+        em = DictionaryMemory(initializer=[[k, v] for k, v in zip(keys[:4], vals[:4])],
+                              max_entries=8, memory_index=memory_index, seed=module_seed)
+        em.add_to_memory([[k, v] for k, v in zip(keys[4:], vals[4:])])
+        em.delete_from_memory([[keys[4], vals[4]]])
+        context = em.most_recent_context
+        index = em._get_memory_index(context, em.memory[:, 0])
+        assert index is not em.memory_index
+        assert index.size == len(em.memory) == 7
+
+        for i in [2, 5, 9]:
+            retrieved = em.get_memory(keys[i] + 0.001, context=context)
+            np.testing.assert_allclose(retrieved[0], keys[i])
+            np.testing.assert_allclose(retrieved[1], vals[i])
+        assert em._get_memory_index(context, em.memory[:, 0]) is index
 #endregion
 
 # **********************************************************************************************************************
@@ -1260,6 +1273,35 @@ class TestContentAddressableMemory:
                            [[12,22,32],[42,52,62]]]
         np.testing.assert_allclose(c.memory, expected_memory)
 
+    @pytest.mark.function
+    @pytest.mark.memory_function
+    @pytest.mark.parametrize('params, stimuli', [
+        pytest.param({'distance_field_weights': [1, 0.5], 'equidistant_entries_select': OLDEST},
+                     [[[1, 2, 3], [4, 5, 6]], [[1, 2, 5], [4, 5, 8]], [[1, 2, 3], [0, 5, 6]], [[1, 2, 4], [4, 5, 6]]],
+                     id="field weights"),
+        pytest.param({'duplicate_entries_allowed': OVERWRITE, 'distance_field_weights': [1, 0]},
+                     [[[1, 2, 3], [4, 5, 6]], [[7, 8, 9], [10, 11, 12]], [[1, 2, 3], [0, 5, 6]], [[1, 2, 3], [4, 5, 6]]],
+                     id="overwrite"),
+        pytest.param({'max_entries': 2, 'equidistant_entries_select': NEWEST},
+                     [[[1, 2, 3], [4, 5, 6]], [[3, 2, 1], [6, 5, 4]], [[1, 1, 1], [4, 4, 4]], [[1, 2, 3], [4, 5, 6]]],
+                     id="max entries"),
+        pytest.param({'selection_function': SoftMax, 'retrieval_prob': 0.5, 'storage_prob': 0.5},
+                     [[[1, 2], [4, 5, 6]], [[7, 8], [10, 11, 12]], [[1, 3], [4, 5, 7]], [[7, 8], [10, 12, 12]]],
+                     id="weighted"),
+    ])
+    def test_ContentAddressableMemory_executions_match_python(self, params, stimuli, func_mode):
+        # Compiled and Python executions of identical functions retrieve the same entries
+        c = ContentAddressableMemory(default_variable=stimuli[0], seed=module_seed, **params)
+        ref = ContentAddressableMemory(default_variable=stimuli[0], seed=module_seed, **params)
+        EX = pytest.helpers.get_func_execution(c, func_mode)
+
+        for stimulus in stimuli * 2:
+            result = EX(stimulus)
+            expected = ref.function(stimulus)
+            assert len(result) == len(expected)
+            for r, e in zip(result, expected):
+                np.testing.assert_allclose(r, e)
+
     def test_ContentAddressableMemory_errors_and_warnings(self):
 
         # Test constructor warnings and errors
@@ -1454,6 +1496,153 @@ class TestContentAddressableMemory:
             is not getattr(b.defaults, param_name)
         )
 
+    @pytest.mark.parametrize('metric', [COSINE, EUCLIDEAN, DIFFERENCE, MAX_ABS_DIFF, CORRELATION, ENERGY, DOT_PRODUCT])
+    @pytest.mark.parametrize('field_weights', [[1, 1], [2.5], [1, 0], [0.5, None], [1, 3]])
+    def test_ContentAddressableMemory_broadcast_distances(self, metric, field_weights):
+        np.random.seed(module_seed)
+        stimuli = np.random.rand(20, 2, 4)
+        cues = np.random.rand(3, 2, 4)
+        c = ContentAddressableMemory(
+            initializer=stimuli,
+            distance_function=Distance(metric=metric, normalize=True),
+            distance_field_weights=field_weights,
+            seed=module_seed,
+        )
+
+        context = c.most_recent_context
+        distances = c._get_distances_to_entries(cues, field_weights, context)
+        assert isinstance(distances, np.ndarray)
+        expected = [[c._get_distance(cue, entry, field_weights, 'full_entry', context) for entry in c.memory]
+                    for cue in cues]
+        np.testing.assert_allclose(distances, np.asarray(expected, dtype=float).reshape(distances.shape),
+                                   rtol=1e-10, atol=1e-12)
+
+    def test_ContentAddressableMemory_get_memories(self):
+        np.random.seed(module_seed)
+        stimuli = np.random.rand(20, 2, 4)
+        cues = stimuli[[3, 0, 17]] + 0.01
+
+        c = ContentAddressableMemory(initializer=stimuli, storage_prob=0, seed=module_seed)
+        retrieved = c.get_memories(cues)
+        np.testing.assert_equal(retrieved, stimuli[[3, 0, 17]])
+        np.testing.assert_equal(retrieved, [c.get_memory(cue) for cue in cues])
+
+        # Ragged fields are retrieved the same way (using _get_distance for each entry)
+        ragged = ContentAddressableMemory(initializer=[[[1, 2], [4, 5, 6]], [[7, 8], [10, 11, 12]]],
+                                          storage_prob=0, seed=module_seed)
+        for e, r in zip([[1, 2], [4, 5, 6]], ragged.get_memories([[[1, 2.5], [4, 5, 7]]])[0]):
+            np.testing.assert_equal(e, r)
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize('memory_size', [100, 1000, 10000])
+    @pytest.mark.parametrize('path', ['broadcast', 'per_entry'])
+    def test_ContentAddressableMemory_retrieval_benchmark(self, memory_size, path, benchmark):
+        benchmark.group = f"ContentAddressableMemory retrieval {memory_size} entries"
+        np.random.seed(module_seed)
+        stimuli = np.random.rand(memory_size, 2, 10)
+        cue = stimuli[memory_size // 2] + 0.001
+        c = ContentAddressableMemory(initializer=stimuli, storage_prob=0, max_entries=memory_size, seed=module_seed)
+        assert len(c.memory) == memory_size
+        field_weights = c.distance_field_weights
+        context = c.most_recent_context
+
+        if path == 'broadcast':
+            distances = benchmark(c._get_distances_to_entries, [cue], field_weights, context)[0]
+        else:
+            def per_entry_distances():
+                return [c._get_distance(cue, entry, field_weights, 'full_entry', context) for entry in c.memory]
+            distances = benchmark(per_entry_distances)
+
+        assert np.argmin(distances) == memory_size // 2
+
+    @pytest.mark.parametrize('metric', [COSINE, EUCLIDEAN])
+    def test_ContentAddressableMemory_memory_index(self, metric):
+        np.random.seed(module_seed)
+        stimuli = np.random.rand(200, 2, 10)
+        cues = stimuli[[5, 80, 199]] + 0.001
+
+        exhaustive = ContentAddressableMemory(initializer=stimuli, distance_function=Distance(metric=metric),
+                                              storage_prob=0, seed=module_seed)
+        flat = ContentAddressableMemory(initializer=stimuli, distance_function=Distance(metric=metric),
+                                        memory_index=FlatIndex(), storage_prob=0, seed=module_seed)
+        lsh = ContentAddressableMemory(initializer=stimuli, distance_function=Distance(metric=metric),
+                                       memory_index=LSHIndex(num_tables=8, num_bits=4, bucket_width=2.0),
+                                       storage_prob=0, seed=module_seed)
+
+        np.testing.assert_equal(flat.get_memories(cues), exhaustive.get_memories(cues))
+        np.testing.assert_equal(lsh.get_memories(cues), stimuli[[5, 80, 199]])
+        # Only candidate entries are compared with the cue
+        assert len(lsh.distances_to_entries) < len(stimuli)
+
+    def test_ContentAddressableMemory_memory_index_maintenance(self):
+        np.random.seed(module_seed)
+        stimuli = np.random.rand(12, 2, 4)
+        c = ContentAddressableMemory(initializer=stimuli[:6], max_entries=10,
+                                     memory_index=LSHIndex(num_tables=4, num_bits=2),
+                                     storage_prob=0, seed=module_seed)
+        c.add_to_memory(stimuli[6:])
+        c.delete_from_memory([stimuli[5]])
+        context = c.most_recent_context
+        index = c._get_memory_index(context, c.memory)
+        assert index.size == len(c.memory) == 9
+
+        # Index is maintained incrementally, so it is in sync with memory without being rebuilt
+        for i, entry in enumerate(c.memory):
+            assert i in index.candidates(c._index_vector(entry))
+        assert c._get_memory_index(context, c.memory) is index
+        for i in [2, 7, 11]:
+            np.testing.assert_equal(c.get_memory(stimuli[i] + 0.001), stimuli[i])
+
+    def test_ContentAddressableMemory_memory_index_resync(self):
+        np.random.seed(module_seed)
+        stimuli = np.random.rand(8, 2, 4)
+        c = ContentAddressableMemory(initializer=stimuli[:4], memory_index=LSHIndex(num_tables=4, num_bits=2),
+                                     storage_prob=0, seed=module_seed)
+        context = c.most_recent_context
+        index = c._get_memory_index(context, c.memory)
+        version = index.version
+
+        # Replacing the memory with one of the same size must still resync the index
+        c.reset(stimuli[4:], context=context)
+        index = c._get_memory_index(context, c.memory)
+        assert index.version != version
+        for i in range(4, 8):
+            np.testing.assert_equal(c.get_memory(stimuli[i] + 0.001, context=context), stimuli[i])
+
+        c._delete_contexts(context)
+        assert context.execution_id not in c._memory_indices
+        assert context.execution_id not in c._memory_versions
+
+    def test_ContentAddressableMemory_memory_storage(self):
+        np.random.seed(module_seed)
+        stimuli = np.random.rand(6, 2, 4)
+        c = ContentAddressableMemory(initializer=stimuli[:2], duplicate_entries_allowed=OVERWRITE,
+                                     distance_field_weights=[1, 0], max_entries=4, seed=module_seed)
+        context = c.most_recent_context
+        for stimulus in stimuli[2:]:
+            c.add_to_memory(stimulus, context=context)
+        memory = c.memory
+        np.testing.assert_equal(memory, stimuli[2:])
+
+        # Overwriting an entry must not change previously returned memories, which share storage
+        c.add_to_memory([stimuli[3][0], stimuli[0][1]], context=context)
+        np.testing.assert_equal(memory, stimuli[2:])
+        np.testing.assert_equal(c.memory[1], [stimuli[3][0], stimuli[0][1]])
+
+        # max_entries is read from the context
+        c.parameters.max_entries.set(5, context=context)
+        c.add_to_memory(stimuli[0], context=context)
+        c.add_to_memory(stimuli[1], context=context)
+        assert len(c.memory) == 5
+
+        # The storage of the previous memory is released by reset and _delete_contexts
+        storage = c._memory_storage[context.execution_id][0]
+        c.reset(context=context)
+        np.testing.assert_equal(c.memory, stimuli[:2])
+        assert c._memory_storage[context.execution_id][0] is not storage
+        c._delete_contexts(context)
+        assert context.execution_id not in c._memory_storage
+
     #
 
         # (
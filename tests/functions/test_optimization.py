@@ -2,6 +2,7 @@ import numpy as np
 import psyneulink.core.components.functions.function as Function
 import psyneulink.core.components.functions.nonstateful.objectivefunctions as Functions
 import psyneulink.core.components.functions.nonstateful.optimizationfunctions as OPTFunctions
+from psyneulink.core.components.functions.nonstateful.distributionfunctions import drift_diffusion_analytical_solution
 import psyneulink.core.globals.keywords as kw
 from psyneulink.core.globals.sampleiterator import SampleIterator, SampleSpec
 import pytest
@@ -88,3 +89,30 @@ def test_grid_search(obj_func, metric, normalize, direction, selection, benchmar
     if func_mode == 'Python':
         np.testing.assert_allclose(res[2], result[2], rtol=1e-5, atol=1e-8)
         np.testing.assert_allclose(res[3], result[3], rtol=1e-5, atol=1e-8)
+
+
+@pytest.mark.function
+@pytest.mark.optimization_function
+@pytest.mark.parametrize("direction", [OPTFunctions.MINIMIZE, OPTFunctions.MAXIMIZE])
+def test_grid_search_vectorized(direction):
+    # drift_diffusion_analytical_solution evaluates both a single sample and a 2d array of samples
+    def mean_rt(sample):
+        return drift_diffusion_analytical_solution(drift_rate=sample[0], threshold=sample[1], noise=sample[2])[0]
+
+    ddm_search_space = [SampleIterator(SampleSpec(start=0.1, stop=1.0, num=10)),
+                        SampleIterator([0.5, 1.0, 2.0]),
+                        SampleIterator(SampleSpec(start=0.2, stop=1.0, num=5))]
+
+    results = []
+    for vectorized in [False, True]:
+        f = OPTFunctions.GridSearch(objective_function=mean_rt, default_variable=[0, 0, 0],
+                                    search_space=ddm_search_space, direction=direction,
+                                    save_samples=True, save_values=True, vectorized=vectorized)
+        results.append(f([0, 0, 0]))
+
+    sequential, vectorized = results
+    np.testing.assert_allclose(vectorized[0], sequential[0])
+    np.testing.assert_allclose(vectorized[1], sequential[1])
+    np.testing.assert_allclose(vectorized[2], sequential[2])
+    np.testing.assert_allclose(vectorized[3], sequential[3])
+    assert vectorized[3].shape[-1] == 10 * 3 * 5
@@ -1,3 +1,4 @@
+import ctypes
 import numpy as np
 import pytest
 
@@ -48,3 +49,95 @@ def test_recompile():
 
     bin_f2(ct_vec, ct_mat, x, y, ct_res)
     assert np.array_equal(new_res, callable_res)
+
+
+def _gen_add_module(name):
+    module = pnlvm.ir.Module(name=name)
+    double_ty = pnlvm.ir.DoubleType()
+    func = pnlvm.ir.Function(module, pnlvm.ir.FunctionType(double_ty, [double_ty, double_ty]), name=name + "_add")
+    builder = pnlvm.ir.IRBuilder(func.append_basic_block())
+    builder.ret(builder.fadd(*func.args))
+    return module
+
+
+def _compile_and_call(engine, name):
+    engine.stage_compilation({_gen_add_module(name)})
+    engine.compile_staged()
+    ptr = engine._engine.get_function_address(name + "_add")
+    return ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_double, ctypes.c_double)(ptr)(1.5, 2.0)
+
+
+@pytest.mark.llvm
+def test_object_cache(tmp_path):
+    cache = pnlvm.LLVMObjectCache(str(tmp_path))
+
+    # Cold start compiles and stores the object
+    assert _compile_and_call(pnlvm.cpu_jit_engine(cache), "cached_mod") == 3.5
+    assert cache.stats["misses"] == 1
+    assert cache.stats["hits"] == 0
+    assert cache.stats["stores"] == 1
+    assert len(list(tmp_path.glob("*.o"))) == 1
+
+    # Warm start in a new engine (and new cache instance) reuses the object
+    warm_cache = pnlvm.LLVMObjectCache(str(tmp_path))
+    warm_engine = pnlvm.cpu_jit_engine(warm_cache)
+    assert _compile_and_call(warm_engine, "cached_mod") == 3.5
+    assert warm_cache.stats["hits"] == 1
+    assert warm_cache.stats["stores"] == 0
+
+    # Module linked on top of a cached module gets its own entry
+    assert _compile_and_call(warm_engine, "cached_mod2") == 3.5
+    assert warm_cache.stats["misses"] == 1
+    assert len(list(tmp_path.glob("*.o"))) == 2
+
+    # Different code produces a different key
+    assert _compile_and_call(pnlvm.cpu_jit_engine(cache), "other_mod") == 3.5
+    assert cache.stats["misses"] == 2
+
+    cache.clear()
+    assert len(list(tmp_path.glob("*.o"))) == 0
+
+
+@pytest.mark.composition
+def test_invalidate(comp_mode):
+    import psyneulink as pnl
+
+    if comp_mode not in {pnlvm.ExecutionMode.LLVMExec, pnlvm.ExecutionMode.LLVMRun}:
+        pytest.skip("Needs the whole composition compiled for CPU")
+
+    A = pnl.TransferMechanism(name="A", size=2)
+    B = pnl.TransferMechanism(name="B", size=2, function=pnl.Logistic)
+    C = pnl.TransferMechanism(name="C", size=2)
+    comp = pnl.Composition(pathways=[A, B, C])
+    projection = B.path_afferents[0]
+
+    inputs = {A: [[1.0, 2.0]]}
+    expected = comp.run(inputs, execution_mode=comp_mode)
+
+    ctx = pnlvm.LLVMBuilderContext.get_current()
+    assert comp in ctx._cache
+    assert C.function in ctx._cache
+    node_assemblies = list(comp._node_assemblies.values())
+
+    pnlvm.invalidate(projection)
+
+    # code that depends on the projection struct is dropped
+    assert projection not in ctx._cache
+    assert comp not in ctx._cache
+    assert all(n not in ctx._cache for n in node_assemblies)
+
+    # code of the nodes is kept and reused
+    assert C in ctx._cache
+    assert C.function in ctx._cache
+    assert B.function in ctx._cache
+    kept = {obj: dict(ctx._cache[obj]) for obj in (B, C, B.function, C.function)}
+
+    misses = ctx._stats["function_cache_misses"]
+    comp._delete_compilation_data(pnl.Context(execution_id=comp.default_execution_id))
+    result = comp.run(inputs, execution_mode=comp_mode)
+    np.testing.assert_allclose(result, expected)
+
+    assert ctx._stats["function_cache_misses"] > misses
+    assert comp in ctx._cache
+    for obj, functions in kept.items():
+        assert all(ctx._cache[obj][tags] is f for tags, f in functions.items())
@@ -1,6 +1,8 @@
+import gc
 import numpy as np
 import psyneulink as pnl
 import pytest
+import weakref
 
 from collections import OrderedDict
 
@@ -1205,6 +1207,88 @@ class TestFiltering:
             assert pnl.EID_SIMULATION not in row.replace("'", '').split(',')[0]
 
 
+class TestLogStorage:
+
+    @pytest.fixture
+    def logged_composition(self):
+        A = pnl.TransferMechanism(name='A', size=2)
+        B = pnl.TransferMechanism(name='B', size=2)
+        comp = pnl.Composition(pathways=[A, B])
+        B.set_log_conditions([pnl.VALUE, pnl.RESULT])
+        return comp, B
+
+    def test_log_buffer_entries(self, logged_composition):
+        comp, B = logged_composition
+        inputs = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+        comp.run(inputs={comp.nodes['A']: inputs})
+
+        buffer = B.parameters.value.log[comp.default_execution_id]
+        assert isinstance(buffer, pnl.LogBuffer)
+        assert len(buffer) == 3
+        np.testing.assert_array_equal(buffer.times, [[0, i, 0, 1] for i in range(3)])
+        for i, (entry, expected) in enumerate(zip(buffer, inputs)):
+            assert entry.time == (0, i, 0, 1)
+            np.testing.assert_allclose(entry.value, [expected])
+        np.testing.assert_allclose(buffer[-1].value, [inputs[-1]])
+
+        # values are returned without copying them
+        log_dict = B.log.nparray_dictionary([pnl.VALUE, pnl.RESULT])[comp.default_execution_id]
+        assert list(log_dict.keys()) == ['Run', 'Trial', 'Pass', 'Time_step', pnl.VALUE, pnl.RESULT]
+        assert log_dict['Trial'] == [[0], [1], [2]]
+        np.testing.assert_allclose(log_dict[pnl.VALUE], [[i] for i in inputs])
+        assert np.shares_memory(log_dict[pnl.VALUE], buffer.values)
+
+    def test_log_buffer_mixed_values(self):
+        buffer = pnl.LogBuffer()
+        values = [np.array([1.0, 2.0]), np.array([3.0, 4.0]), np.array([5.0]), 'done', 1.5]
+        for i, value in enumerate(values * 10):
+            buffer.append(pnl.LogEntry(pnl.core.globals.context.time(0, i, 0, 0), 'EXECUTING', value))
+        assert len(buffer) == 50
+        for entry, value in zip(buffer, values * 10):
+            np.testing.assert_array_equal(entry.value, value)
+        assert buffer.contexts == ['EXECUTING'] * 50
+
+    def test_log_buffer_owner_collected(self):
+        # values that refer to the owner of the log must not keep it alive
+        class Owner:
+            pass
+
+        owner = Owner()
+        owner.log = pnl.LogBuffer()
+        owner.log.append(pnl.LogEntry(None, 'EXECUTING', {owner: np.zeros(1)}))
+        owner.log.append(pnl.LogEntry(None, 'EXECUTING', [owner]))
+        owner_ref = weakref.ref(owner)
+        del owner
+        gc.collect()
+        assert owner_ref() is None
+
+    def test_log_max_length(self, logged_composition):
+        comp, B = logged_composition
+        B.log.set_log_storage(pnl.VALUE, max_length=2)
+        comp.run(inputs={comp.nodes['A']: [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]})
+
+        buffer = B.parameters.value.log[comp.default_execution_id]
+        assert len(buffer) == 2
+        assert [entry.time.trial for entry in buffer] == [1, 2]
+        np.testing.assert_allclose(buffer.values, [[[3.0, 4.0]], [[5.0, 6.0]]])
+        # other items are unaffected
+        assert len(B.log.nparray_dictionary(pnl.RESULT)[comp.default_execution_id][pnl.RESULT]) == 3
+
+    def test_log_stream(self, logged_composition, tmp_path):
+        comp, B = logged_composition
+        B.log.set_log_storage(pnl.VALUE, max_length=3, stream_to=str(tmp_path), chunk_size=2)
+        inputs = [[float(i), float(i + 1)] for i in range(7)]
+        comp.run(inputs={comp.nodes['A']: inputs})
+        B.log.flush_log_streams()
+
+        stream = B.parameters.value.log_stream
+        assert len(stream.files) == 4
+        streamed = pnl.LogStream.load(stream.files)
+        np.testing.assert_allclose(streamed['value'], [[i] for i in inputs])
+        np.testing.assert_array_equal(streamed['time'][:, 1], np.arange(7))
+        assert len(B.parameters.value.log[comp.default_execution_id]) == 3
+
+
 class TestFullModels:
     def test_multilayer(self):
 
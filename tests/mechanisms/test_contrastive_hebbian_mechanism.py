@@ -8,7 +8,7 @@ import psyneulink.core.components.functions.nonstateful.transferfunctions
 
 class TestContrastiveHebbian:
 
-    def test_scheduled_contrastive_hebbian(self):
+    def test_scheduled_contrastive_hebbian(self, comp_mode):
         o = pnl.TransferMechanism()
         m = pnl.ContrastiveHebbianMechanism(
                 input_size=2,
@@ -31,11 +31,55 @@ class TestContrastiveHebbian:
         c.scheduler.add_condition(o, pnl.WhenFinished(m))
         c._analyze_graph()
         print('matrix:\n', m.afferents[1].matrix)
-        c.run(inputs={m:[2, 2]}, num_trials=4)
+        c.run(inputs={m:[2, 2]}, num_trials=4, execution_mode=comp_mode)
         results = c.results
         print(results)
         np.testing.assert_allclose(results, [[np.array([2.])], [np.array([2.])], [np.array([2.])], [np.array([2.])]])
 
+    @pytest.mark.composition
+    @pytest.mark.parametrize("clamp, continuous, termination_condition", [
+        (pnl.HARD_CLAMP, False, pnl.CONVERGENCE),
+        (pnl.SOFT_CLAMP, True, pnl.CONVERGENCE),
+        (pnl.HARD_CLAMP, False, pnl.COUNT),
+    ])
+    def test_contrastive_hebbian_phases(self, comp_mode, clamp, continuous, termination_condition):
+        threshold = 0.001 if termination_condition == pnl.CONVERGENCE else 5.0
+
+        def _run(execution_mode):
+            m = pnl.ContrastiveHebbianMechanism(
+                    input_size=2,
+                    hidden_size=2,
+                    target_size=2,
+                    separated=False,
+                    clamp=clamp,
+                    continuous=continuous,
+                    function=pnl.Logistic,
+                    integrator_mode=True,
+                    integration_rate=0.5,
+                    enable_learning=False,
+                    matrix=[[0, -.5, .2, .3], [-.5, 0, .4, -.1], [.2, .4, 0, -.3], [.3, -.1, -.3, 0]],
+                    minus_phase_termination_condition=termination_condition,
+                    minus_phase_termination_threshold=threshold,
+                    plus_phase_termination_condition=termination_condition,
+                    plus_phase_termination_threshold=threshold,
+            )
+            c = pnl.Composition(pathways=[m])
+            c.run(inputs={m: [[1, 0], [0, 1], [1, 1]]}, execution_mode=execution_mode)
+            return c.results, m.parameters.minus_phase_activity.get(c), m.parameters.plus_phase_activity.get(c)
+
+        # Compiled execution of both phases matches Python
+        results, minus_phase_activity, plus_phase_activity = _run(comp_mode)
+        expected_results, expected_minus_phase_activity, expected_plus_phase_activity = _run(pnl.ExecutionMode.Python)
+
+        # OutputPorts differ in size, so results are compared by trial and OutputPort
+        assert len(results) == len(expected_results)
+        for res, expected in zip(results, expected_results):
+            assert len(res) == len(expected)
+            for port_res, port_expected in zip(res, expected):
+                np.testing.assert_allclose(np.asfarray(port_res), np.asfarray(port_expected), atol=1e-8)
+        np.testing.assert_allclose(np.asfarray(minus_phase_activity), np.asfarray(expected_minus_phase_activity), atol=1e-8)
+        np.testing.assert_allclose(np.asfarray(plus_phase_activity), np.asfarray(expected_plus_phase_activity), atol=1e-8)
+
     def test_using_Hebbian_learning_of_orthognal_inputs_without_integrator_mode(self):
         """Comparable to tests/mechanisms/test_recurrent_transfer_mechanism/test_learning_of_orthognal_inputs
 
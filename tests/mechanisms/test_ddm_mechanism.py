@@ -630,6 +630,58 @@ def test_DDM_time():
     np.testing.assert_allclose(time_12, 2.9, atol=1e-08)
 
 
+def test_DDM_simulate_population_noiseless():
+    # drift of 0.125 per time step reaches threshold in exactly 8 time steps
+    D = DDM(function=DriftDiffusionIntegrator(noise=0.0, rate=0.5, time_step_size=0.5,
+                                              threshold=1.0, non_decision_time=0.25))
+
+    decisions, rts = D.simulate_population(5, 0.5)
+    np.testing.assert_allclose(decisions, np.full(5, 1.0))
+    np.testing.assert_allclose(rts, np.full(5, 4.25))
+
+    decisions, rts = D.simulate_population(3, -0.5, max_time_steps=4)
+    np.testing.assert_allclose(decisions, np.full(3, -0.5))
+    assert np.all(np.isnan(rts))
+
+    # Sequential execution until finished gives the same results
+    D.execute(0.5)
+    np.testing.assert_allclose(D.value, [[1.0], [4.25]])
+
+
+def test_DDM_simulate_population_distribution():
+    D = DDM(function=DriftDiffusionIntegrator(noise=1.0, rate=1.0, time_step_size=0.001,
+                                              threshold=1.0, non_decision_time=0.2, seed=0))
+    previous_value = D.function.parameters.previous_value.get()
+
+    decisions, rts = D.simulate_population(5000, 1.0)
+    assert decisions.shape == rts.shape == (5000,)
+    np.testing.assert_allclose(np.abs(decisions), 1.0)
+    np.testing.assert_array_equal(D.function.parameters.previous_value.get(), previous_value)
+
+    # Compare with the analytical solution for the same parameters
+    expected_rt, expected_er = DriftDiffusionAnalytical(default_variable=1.0, drift_rate=1.0, threshold=1.0,
+                                                        noise=1.0, non_decision_time=0.2)(1.0)[:2]
+    np.testing.assert_allclose(np.mean(decisions < 0), expected_er, atol=0.02)
+    np.testing.assert_allclose(np.mean(rts), expected_rt, rtol=0.05)
+
+    # Results are reproducible from an explicit seed
+    seeded_rts = D.simulate_population(5000, 1.0, seed=0)[1]
+    np.testing.assert_array_equal(D.simulate_population(5000, 1.0, seed=0)[1], seeded_rts)
+    assert not np.array_equal(D.simulate_population(5000, 1.0, seed=1)[1], seeded_rts)
+
+    # or from resetting the seed of the function
+    D.function.parameters.seed.set(0)
+    rts = D.simulate_population(5000, 1.0)[1]
+    D.function.parameters.seed.set(0)
+    np.testing.assert_array_equal(D.simulate_population(5000, 1.0)[1], rts)
+
+
+def test_DDM_simulate_population_analytical():
+    D = DDM(function=DriftDiffusionAnalytical)
+    with pytest.raises(DDMError, match="simulate_population can only be used"):
+        D.simulate_population(10)
+
+
 def test_WhenFinished_DDM_Analytical():
     D = DDM(function=DriftDiffusionAnalytical)
     c = WhenFinished(D)
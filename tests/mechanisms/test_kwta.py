@@ -207,7 +207,7 @@ class TestKWTAMatrix:
 class TestKWTARatio:
     simple_prefs = {REPORT_OUTPUT_PREF: False, VERBOSE_PREF: False}
 
-    def test_kwta_ratio_empty(self):
+    def test_kwta_ratio_empty(self, comp_mode):
         K = KWTAMechanism(
             name='K',
             size=4
@@ -215,15 +215,15 @@ class TestKWTARatio:
         c = Composition(pathways=[K],
                         prefs=TestKWTARatio.simple_prefs)
 
-        c.run(inputs = {K: [2, 4, 1, 6]})
-        np.testing.assert_allclose(K.parameters.value.get(c), [[0.2689414213699951, 0.7310585786300049,
+        results = c.run(inputs = {K: [2, 4, 1, 6]}, execution_mode=comp_mode)
+        np.testing.assert_allclose(results, [[0.2689414213699951, 0.7310585786300049,
                                                         0.11920292202211755, 0.9525741268224334]])
-        c.run(inputs = {K: [1, 2, 3, 4]})
-        np.testing.assert_allclose(K.parameters.value.get(c), [[0.09271329298112314, 0.7368459299092773,
+        results = c.run(inputs = {K: [1, 2, 3, 4]}, execution_mode=comp_mode)
+        np.testing.assert_allclose(results, [[0.09271329298112314, 0.7368459299092773,
                                                         0.2631540700907225, 0.9842837170829899]])
 
 
-    def test_kwta_ratio_1(self):
+    def test_kwta_ratio_1(self, comp_mode):
         K = KWTAMechanism(
             name='K',
             size=4,
@@ -232,15 +232,15 @@ class TestKWTARatio:
         c = Composition(pathways=[K],
                         prefs=TestKWTARatio.simple_prefs)
 
-        c.run(inputs = {K: [2, 4, 1, 6]})
-        np.testing.assert_allclose(K.parameters.value.get(c), [[0.5, 0.8807970779778823,
+        results = c.run(inputs = {K: [2, 4, 1, 6]}, execution_mode=comp_mode)
+        np.testing.assert_allclose(results, [[0.5, 0.8807970779778823,
                                                         0.2689414213699951, 0.9820137900379085]])
-        c.run(inputs = {K: [1, 2, 3, 4]})
-        np.testing.assert_allclose(K.parameters.value.get(c), [[0.30054433998850033, 0.8868817857039745,
+        results = c.run(inputs = {K: [1, 2, 3, 4]}, execution_mode=comp_mode)
+        np.testing.assert_allclose(results, [[0.30054433998850033, 0.8868817857039745,
                                                         0.5, 0.9897010588046231]])
 
 
-    def test_kwta_ratio_0(self):
+    def test_kwta_ratio_0(self, comp_mode):
         K = KWTAMechanism(
             name='K',
             size=4,
@@ -249,16 +249,16 @@ class TestKWTARatio:
         c = Composition(pathways=[K],
                         prefs=TestKWTARatio.simple_prefs)
 
-        c.run(inputs = {K: [2, 4, 1, 6]})
-        np.testing.assert_allclose(K.parameters.value.get(c), [[0.11920292202211755, 0.5,
+        results = c.run(inputs = {K: [2, 4, 1, 6]}, execution_mode=comp_mode)
+        np.testing.assert_allclose(results, [[0.11920292202211755, 0.5,
                                                         0.04742587317756678, 0.8807970779778823]])
-        c.run(inputs = {K: [1, 2, 3, 4]})
-        np.testing.assert_allclose(K.parameters.value.get(c), [[0.051956902301427035, 0.5,
+        results = c.run(inputs = {K: [1, 2, 3, 4]}, execution_mode=comp_mode)
+        np.testing.assert_allclose(results, [[0.051956902301427035, 0.5,
                                                         0.22048012438199008, 0.9802370486903237]])
 
     # answers for this tests should be exactly 70% of the way between the answers for ratio=0 and ratio=1
     # (after taking the inverse of the Logistic function on the output)
-    def test_kwta_ratio_0_3(self):
+    def test_kwta_ratio_0_3(self, comp_mode):
         K = KWTAMechanism(
             name='K',
             size=4,
@@ -267,11 +267,11 @@ class TestKWTARatio:
         c = Composition(pathways=[K],
                         prefs=TestKWTARatio.simple_prefs)
 
-        c.run(inputs={K: [2, 4, 1, 6]})
-        np.testing.assert_allclose(K.parameters.value.get(c), [[0.19781611144141834, 0.6456563062257956,
+        results = c.run(inputs={K: [2, 4, 1, 6]}, execution_mode=comp_mode)
+        np.testing.assert_allclose(results, [[0.19781611144141834, 0.6456563062257956,
                                                         0.08317269649392241, 0.9308615796566533]])
-        c.run(inputs={K: [1, 2, 3, 4]})
-        np.testing.assert_allclose(K.parameters.value.get(c), [[0.06324086143390241, 0.6326786177649943,
+        results = c.run(inputs={K: [1, 2, 3, 4]}, execution_mode=comp_mode)
+        np.testing.assert_allclose(results, [[0.06324086143390241, 0.6326786177649943,
                                                         0.21948113371757957, 0.9814716617176014]])
 
 
@@ -431,7 +431,7 @@ class TestKWTALongTerm:
 
     simple_prefs = {REPORT_OUTPUT_PREF: False, VERBOSE_PREF: False}
 
-    def test_kwta_size_10_k_3_threshold_1(self):
+    def test_kwta_size_10_k_3_threshold_1(self, comp_mode):
         K = KWTAMechanism(
             name='K',
             size=10,
@@ -443,10 +443,10 @@ class TestKWTALongTerm:
         kwta_input = {K: [[-1, -.5, 0, 0, 0, 1, 1, 2, 3, 3]]}
         print("")
         for i in range(20):
-            c.run(inputs=kwta_input)
+            results = c.run(inputs=kwta_input, execution_mode=comp_mode)
             print('\ntrial number', i)
-            print('K.parameters.value.get(c): ', K.parameters.value.get(c))
-        np.testing.assert_allclose(K.parameters.value.get(c), [[0.012938850123312412, 0.022127587008877226,
+            print('results: ', results)
+        np.testing.assert_allclose(results, [[0.012938850123312412, 0.022127587008877226,
                                                         0.039010157367582114, 0.039010157367582114,
                                                         0.039010157367582114, 0.19055156271846602,
                                                         0.19055156271846602, 0.969124504436019,
@@ -455,10 +455,10 @@ class TestKWTALongTerm:
 
         print('\n\nturning to zero-inputs now:')
         for i in range(20):
-            c.run(inputs=kwta_input2)
+            results = c.run(inputs=kwta_input2, execution_mode=comp_mode)
             print('\ntrial number', i)
-            print('K.parameters.value.get(c): ', K.parameters.value.get(c))
-        np.testing.assert_allclose(K.parameters.value.get(c), [[0.13127237999481228, 0.13130057846907178,
+            print('results: ', results)
+        np.testing.assert_allclose(results, [[0.13127237999481228, 0.13130057846907178,
                                                         0.1313653354768465, 0.1313653354768465,
                                                         0.1313653354768465, 0.5863768938723602,
                                                         0.5863768938723602, 0.8390251365605804,
@@ -468,7 +468,7 @@ class TestKWTAAverageBased:
 
     simple_prefs = {REPORT_OUTPUT_PREF: False, VERBOSE_PREF: False}
 
-    def test_kwta_average_k_2(self):
+    def test_kwta_average_k_2(self, comp_mode):
         K = KWTAMechanism(
             name='K',
             size=4,
@@ -480,10 +480,10 @@ class TestKWTAAverageBased:
         c = Composition(pathways=[K],
                         prefs=TestKWTARatio.simple_prefs)
         kwta_input = {K: [[1, 2, 3, 4]]}
-        c.run(inputs=kwta_input)
-        np.testing.assert_allclose(K.parameters.value.get(c), [[-1.5, -0.5, 0.5, 1.5]])
+        results = c.run(inputs=kwta_input, execution_mode=comp_mode)
+        np.testing.assert_allclose(results, [[-1.5, -0.5, 0.5, 1.5]])
 
-    def test_kwta_average_k_1(self):
+    def test_kwta_average_k_1(self, comp_mode):
         K = KWTAMechanism(
             name='K',
             size=4,
@@ -495,10 +495,10 @@ class TestKWTAAverageBased:
         c = Composition(pathways=[K],
                         prefs=TestKWTARatio.simple_prefs)
         kwta_input = {K: [[1, 2, 3, 4]]}
-        c.run(inputs=kwta_input)
-        np.testing.assert_allclose(K.parameters.value.get(c), [[-2, -1, 0, 1]])
+        results = c.run(inputs=kwta_input, execution_mode=comp_mode)
+        np.testing.assert_allclose(results, [[-2, -1, 0, 1]])
 
-    def test_kwta_average_k_1_ratio_0_2(self):
+    def test_kwta_average_k_1_ratio_0_2(self, comp_mode):
         K = KWTAMechanism(
             name='K',
             size=4,
@@ -511,10 +511,10 @@ class TestKWTAAverageBased:
         c = Composition(pathways=[K],
                         prefs=TestKWTARatio.simple_prefs)
         kwta_input = {K: [[1, 2, 3, 4]]}
-        c.run(inputs=kwta_input)
-        np.testing.assert_allclose(K.parameters.value.get(c), [[-2.6, -1.6, -0.6000000000000001, 0.3999999999999999]])
+        results = c.run(inputs=kwta_input, execution_mode=comp_mode)
+        np.testing.assert_allclose(results, [[-2.6, -1.6, -0.6000000000000001, 0.3999999999999999]])
 
-    def test_kwta_average_k_1_ratio_0_8(self):
+    def test_kwta_average_k_1_ratio_0_8(self, comp_mode):
         K = KWTAMechanism(
             name='K',
             size=4,
@@ -527,8 +527,8 @@ class TestKWTAAverageBased:
         c = Composition(pathways=[K],
                         prefs=TestKWTARatio.simple_prefs)
         kwta_input = {K: [[1, 2, 3, 4]]}
-        c.run(inputs=kwta_input)
-        np.testing.assert_allclose(K.parameters.value.get(c), [[-1.4, -0.3999999999999999, 0.6000000000000001, 1.6]])
+        results = c.run(inputs=kwta_input, execution_mode=comp_mode)
+        np.testing.assert_allclose(results, [[-1.4, -0.3999999999999999, 0.6000000000000001, 1.6]])
 
 # class TestClip:
 #     def test_clip_float(self):
@@ -0,0 +1,77 @@
+import subprocess
+import sys
+
+import psyneulink as pnl
+import pytest
+
+# cumulative time, in seconds, that 'import psyneulink' may take in a fresh interpreter
+IMPORT_TIME_BUDGET = 10.0
+
+lazy_modules = [
+    'torch',
+    'optuna',
+    'pandas',
+    'psyneulink.library.compositions.autodiffcomposition',
+    'psyneulink.library.compositions.emcomposition',
+    'psyneulink.core.compositions.parameterestimationcomposition',
+    'psyneulink.core.components.functions.nonstateful.fitfunctions',
+]
+
+
+def _import_psyneulink(code=''):
+    return subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import psyneulink\n' + code],
+        capture_output=True, text=True, check=True
+    )
+
+
+def test_import_time():
+    result = _import_psyneulink()
+
+    # lines have the format 'import time: <self [us]> | <cumulative [us]> | <indented module name>'
+    cumulative = None
+    for line in result.stderr.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2] == ' psyneulink':
+            cumulative = int(fields[1]) / 1e6
+    assert cumulative is not None, result.stderr
+
+    assert cumulative < IMPORT_TIME_BUDGET
+
+
+def test_import_defers_optional_subsystems():
+    result = _import_psyneulink(
+        'import sys\n'
+        'print(",".join(m for m in {} if m in sys.modules))'.format(lazy_modules)
+    )
+    assert result.stdout.strip() == ''
+
+
+@pytest.mark.parametrize('module_name, attr_name', [
+    ('psyneulink', 'AutodiffComposition'),
+    ('psyneulink', 'EMComposition'),
+    ('psyneulink', 'ParameterEstimationComposition'),
+    ('psyneulink', 'PECOptimizationFunction'),
+    ('psyneulink', 'torch_available'),
+    ('psyneulink.library.compositions', 'autodiffcomposition'),
+    ('psyneulink.core.components.functions', 'fitfunctions'),
+])
+def test_import_lazy_attribute(module_name, attr_name):
+    result = _import_psyneulink(
+        'import importlib\n'
+        'getattr(importlib.import_module("{}"), "{}")'.format(module_name, attr_name)
+    )
+    assert result.returncode == 0
+
+
+def test_lazy_attributes_in_all():
+    # 'from psyneulink import *' imports the lazy attributes too
+    for name in pnl.__all__:
+        getattr(pnl, name)
+    assert 'AutodiffComposition' in dir(pnl)
+
+    from psyneulink.core.compositions.parameterestimationcomposition import ParameterEstimationComposition
+    assert pnl.ParameterEstimationComposition is ParameterEstimationComposition
+
+    with pytest.raises(AttributeError):
+        pnl.NotAPsyNeuLinkAttribute
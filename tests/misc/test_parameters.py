@@ -257,6 +257,44 @@ def test_copy():
     assert g.parameters.additive_param.source is g.parameters.intercept
 
 
+def test_initialize_from_context_copy_on_write():
+    t = pnl.TransferMechanism(default_variable=[[0, 0]])
+    base = pnl.Context(execution_id='base')
+    sim = pnl.Context(execution_id='sim')
+    t._initialize_from_context(base)
+
+    t.execute([[1, 2]], context=base)
+    base_value = t.parameters.value._get(base)
+    base_history = t.parameters.value.history[base.execution_id]
+
+    t._initialize_from_context(sim, base, copy_on_write=True)
+    assert t.parameters.value._get(sim) is base_value
+    assert t.parameters.value.history[sim.execution_id] is base_history
+
+    t.execute([[3, 4]], context=sim)
+    np.testing.assert_array_equal(t.parameters.value._get(sim), [[3, 4]])
+    assert t.parameters.value.history[sim.execution_id] is not base_history
+
+    assert t.parameters.value._get(base) is base_value
+    assert len(t.parameters.value.history[base.execution_id]) == 1
+    np.testing.assert_array_equal(base_value, [[1, 2]])
+
+
+@pytest.mark.parametrize(
+    'old_value, new_value, changed',
+    [
+        (np.zeros((2, 2)), np.ones((2, 2)), False),
+        (np.zeros((2, 2)), np.ones((2, 3)), True),
+        (np.zeros(2), 1.0, True),
+        (1.0, 2.0, False),
+        (pnl.convert_to_np_array([[0], [0, 0]]), pnl.convert_to_np_array([[1], [1, 1]]), False),
+        (pnl.convert_to_np_array([[0], [0, 0]]), pnl.convert_to_np_array([[1, 1], [1]]), True),
+    ],
+)
+def test_is_structure_changed(old_value, new_value, changed):
+    assert pnl.core.globals.parameters._is_structure_changed(old_value, new_value) == changed
+
+
 @pytest.mark.parametrize(
     'cls_, kwargs, parameter, is_user_specified',
     [
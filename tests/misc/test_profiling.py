@@ -0,0 +1,152 @@
+import pstats
+import time
+
+import numpy as np
+import psyneulink as pnl
+import pytest
+
+from psyneulink.core.globals.profiling import get_active_profiler
+
+
+class _Timer:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+def test_profiler_sections(tmp_path):
+    timer = _Timer()
+    profiler = pnl.Profiler(timer=timer)
+
+    with profiler:
+        assert get_active_profiler() is profiler
+        with profiler.section('Mechanism', 'A'):
+            timer.time += 1
+            with profiler.section('Function', 'f'):
+                timer.time += 2
+                # recursive calls are counted once in inclusive time
+                with profiler.section('Function', 'f'):
+                    timer.time += 3
+            timer.time += 4
+    assert get_active_profiler() is None
+
+    mech = profiler.stats[('Mechanism', 'A')]
+    assert mech.calls == 1
+    assert mech.inclusive_time == 10
+    assert mech.exclusive_time == 5
+
+    func = profiler.stats[('Function', 'f')]
+    assert func.calls == 2
+    assert func.inclusive_time == 5
+    assert func.exclusive_time == 5
+
+    assert profiler.call_stacks == {
+        (('Mechanism', 'A'),): 5,
+        (('Mechanism', 'A'), ('Function', 'f')): 2,
+        (('Mechanism', 'A'), ('Function', 'f'), ('Function', 'f')): 3,
+    }
+
+    report = profiler.report(sort_by='inclusive_time').splitlines()
+    assert len(report) == 3
+    assert report[1].endswith('Mechanism: A')
+    assert len(profiler.report(limit=1).splitlines()) == 2
+
+    with pytest.raises(ValueError):
+        profiler.report(sort_by='name')
+
+    stats_file = tmp_path / 'profile.pstats'
+    profiler.dump_stats(stats_file)
+    stats = pstats.Stats(str(stats_file))
+    assert stats.stats[('Mechanism', 0, 'A')][:4] == (1, 1, 5, 10)
+    assert ('Mechanism', 0, 'A') in stats.stats[('Function', 0, 'f')][4]
+
+    stacks_file = tmp_path / 'profile.folded'
+    profiler.write_collapsed_stacks(stacks_file, unit=1)
+    assert stacks_file.read_text().splitlines() == [
+        'Mechanism: A 5',
+        'Mechanism: A;Function: f 2',
+        'Mechanism: A;Function: f;Function: f 3',
+    ]
+
+
+def test_profiler_exception():
+    profiler = pnl.Profiler()
+
+    with pytest.raises(RuntimeError):
+        with profiler:
+            profiler._enter(('Mechanism', 'A'))
+            raise RuntimeError()
+
+    assert get_active_profiler() is None
+    assert profiler.stats[('Mechanism', 'A')].calls == 1
+
+
+@pytest.mark.composition
+def test_composition_run_profile(comp_mode):
+    A = pnl.TransferMechanism(name='A')
+    B = pnl.TransferMechanism(name='B', function=pnl.Logistic)
+    comp = pnl.Composition(pathways=[A, B])
+
+    expected = comp.run(inputs={A: [[1], [2], [3]]}, execution_mode=comp_mode)
+    assert comp.profiler is None
+
+    result = comp.run(inputs={A: [[1], [2], [3]]}, execution_mode=comp_mode, profile=True)
+    np.testing.assert_allclose(result, expected)
+    assert get_active_profiler() is None
+
+    stats = comp.profiler.stats
+    if comp_mode is pnl.ExecutionMode.Python:
+        assert stats[('Mechanism', 'A')].calls == 3
+        assert stats[('Mechanism', 'B')].calls == 3
+        assert stats[('Composition', comp.name)].calls == 3
+        assert stats[('Scheduler', comp.name)].calls > 0
+        assert stats[('Function', B.function.name)].calls >= 3
+        assert any(category == 'Port' for category, _ in stats)
+
+        mech = stats[('Mechanism', 'B')]
+        assert 0 <= mech.exclusive_time <= mech.inclusive_time
+    else:
+        assert any(category == 'Compiled' for category, _ in stats)
+
+    # a Profiler can be reused to aggregate several runs
+    profiler = comp.profiler
+    comp.run(inputs={A: [[1], [2], [3]]}, execution_mode=comp_mode, profile=profiler)
+    if comp_mode is pnl.ExecutionMode.Python:
+        assert profiler.stats[('Mechanism', 'A')].calls == 6
+
+
+def test_profiling_wrappers_installed_only_when_enabled():
+    execute = pnl.Mechanism_Base.__dict__['execute']
+    function = pnl.Function_Base.__dict__['function']
+
+    with pnl.Profiler():
+        assert pnl.Mechanism_Base.__dict__['execute'] is not execute
+        assert pnl.Mechanism_Base.__dict__['execute'].__wrapped__ is execute
+        assert pnl.Function_Base.__dict__['function'] is not function
+
+    assert pnl.Mechanism_Base.__dict__['execute'] is execute
+    assert pnl.Function_Base.__dict__['function'] is function
+
+
+@pytest.mark.stress
+def test_profiling_overhead():
+    comp = pnl.Composition()
+    origins = []
+    for i in range(4):
+        pathway = [pnl.TransferMechanism(name=f'P{i}_{j}') for j in range(3)]
+        comp.add_linear_processing_pathway(pathway)
+        origins.append(pathway[0])
+    inputs = {origin: [[1.0]] * 10 for origin in origins}
+    comp.run(inputs=inputs)
+
+    # interleave the runs, and compare the fastest of each, to reduce the effect of other load
+    times = {False: [], True: []}
+    for i in range(10):
+        for profile in times:
+            start = time.perf_counter()
+            comp.run(inputs=inputs, profile=profile)
+            times[profile].append(time.perf_counter() - start)
+
+    assert min(times[True]) <= 1.05 * min(times[False])